@@ -1,83 +1,150 @@
 """Calculator API endpoints."""
-from fastapi import APIRouter, HTTPException, Query
-from domain.models.request import CalculationRequest
-from domain.models.response import CalculationResponse
+from typing import Union
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from domain.models.request import BatchCalculationRequest, CalculationRequest
+from domain.models.response import (
+    BatchCalculationResponse,
+    BatchItemResult,
+    CalculationResponse,
+)
+from domain.services.calculator import CalculationCancelledError
+from app.core.config import settings
 from app.core.dependencies import get_calculator_service
+from app.core.errors import error_response
 
 router = APIRouter()
 
 # Get singleton calculator service
 _calculator = get_calculator_service()
 
+# Non-standard status (from nginx) for a request its client abandoned
+CLIENT_CLOSED_REQUEST = 499
+
 
 @router.get("/add", response_model=CalculationResponse)
 async def add(
     x: float = Query(..., description="First number"),
     y: float = Query(..., description="Second number"),
-) -> CalculationResponse:
+) -> Union[CalculationResponse, Response]:
     """Add two numbers."""
-    try:
-        result = _calculator.calculate("add", x, y)
-        return CalculationResponse(operation="add", x=x, y=y, result=result)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    outcome = _calculator.try_calculate("add", x, y)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="add", x=x, y=y, result=outcome.value)
 
 
 @router.get("/subtract", response_model=CalculationResponse)
 async def subtract(
     x: float = Query(..., description="First number"),
     y: float = Query(..., description="Second number"),
-) -> CalculationResponse:
+) -> Union[CalculationResponse, Response]:
     """Subtract y from x."""
-    try:
-        result = _calculator.calculate("subtract", x, y)
-        return CalculationResponse(operation="subtract", x=x, y=y, result=result)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    outcome = _calculator.try_calculate("subtract", x, y)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="subtract", x=x, y=y, result=outcome.value)
 
 
 @router.get("/multiply", response_model=CalculationResponse)
 async def multiply(
     x: float = Query(..., description="First number"),
     y: float = Query(..., description="Second number"),
-) -> CalculationResponse:
+) -> Union[CalculationResponse, Response]:
     """Multiply two numbers."""
-    try:
-        result = _calculator.calculate("multiply", x, y)
-        return CalculationResponse(operation="multiply", x=x, y=y, result=result)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    outcome = _calculator.try_calculate("multiply", x, y)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="multiply", x=x, y=y, result=outcome.value)
 
 
 @router.get("/divide", response_model=CalculationResponse)
 async def divide(
     x: float = Query(..., description="First number"),
     y: float = Query(..., description="Second number"),
-) -> CalculationResponse:
+) -> Union[CalculationResponse, Response]:
     """Divide x by y."""
-    try:
-        result = _calculator.calculate("divide", x, y)
-        return CalculationResponse(operation="divide", x=x, y=y, result=result)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    outcome = _calculator.try_calculate("divide", x, y)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="divide", x=x, y=y, result=outcome.value)
 
 
 @router.post("/calc", response_model=CalculationResponse)
 async def calculate(
     request: CalculationRequest,
-) -> CalculationResponse:
+) -> Union[CalculationResponse, Response]:
     """
     Perform calculation based on operation type.
 
     Supports: add, subtract, multiply, divide
     """
+    outcome = _calculator.try_calculate(request.operation, request.x, request.y)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(
+        operation=request.operation,
+        x=request.x,
+        y=request.y,
+        result=outcome.value,
+    )
+
+
+@router.post("/calc/batch", response_model=BatchCalculationResponse)
+async def calculate_batch(
+    batch: BatchCalculationRequest,
+    request: Request,
+) -> BatchCalculationResponse:
+    """
+    Perform many calculations in one request.
+
+    Work yields to the event loop periodically, stops when the client
+    disconnects, and is bounded by a per-job deadline. Failed items are
+    reported individually instead of failing the whole batch.
+    """
+    if len(batch.items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds the limit of {settings.batch_max_items} items",
+        )
+
+    # Clients may shorten the server deadline but never extend it
+    timeout = min(
+        batch.timeout or settings.batch_timeout_seconds,
+        settings.batch_timeout_seconds,
+    )
     try:
-        result = _calculator.calculate(request.operation, request.x, request.y)
-        return CalculationResponse(
-            operation=request.operation,
-            x=request.x,
-            y=request.y,
-            result=result,
+        outcomes = await _calculator.acalculate_many(
+            ((item.operation, item.x, item.y) for item in batch.items),
+            timeout=timeout,
+            yield_interval=settings.batch_yield_interval_ms / 1000,
+            is_cancelled=request.is_disconnected,
+            return_exceptions=True,
         )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except CalculationCancelledError as e:
+        # The client is gone; the status only shows up in access logs
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail=str(e))
+
+    results = []
+    failed = 0
+    for item, outcome in zip(batch.items, outcomes):
+        if isinstance(outcome, ValueError):
+            failed += 1
+            results.append(
+                BatchItemResult(
+                    operation=item.operation, x=item.x, y=item.y, error=str(outcome)
+                )
+            )
+        else:
+            results.append(
+                BatchItemResult(
+                    operation=item.operation, x=item.x, y=item.y, result=outcome
+                )
+            )
+
+    return BatchCalculationResponse(
+        results=results,
+        succeeded=len(results) - failed,
+        failed=failed,
+    )
@@ -0,0 +1,131 @@
+"""Admin-only memory diagnostics endpoints.
+
+The router is only mounted when ``DIAGNOSTICS_ENABLED`` is set, so a
+disabled deployment has no routes, no dependency and no tracing overhead.
+"""
+import hmac
+import os
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+from domain.models.request import GcThresholdsRequest
+from domain.models.response import (
+    AllocationSite,
+    GcStatusResponse,
+    MemoryStatusResponse,
+    TypeCount,
+)
+from app.core.config import settings
+from app.core.dependencies import get_logger, get_memory_diagnostics
+
+_diagnostics = get_memory_diagnostics()
+_logger = get_logger()
+
+GROUP_BY_DESCRIPTION = "lineno, filename or traceback"
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Reject requests without the configured admin token."""
+    expected = settings.diagnostics_admin_token
+    if not expected:
+        raise HTTPException(
+            status_code=403, detail="Diagnostics admin token is not configured"
+        )
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+router = APIRouter(prefix="/admin/memory", dependencies=[Depends(require_admin)])
+
+
+@router.get("", response_model=MemoryStatusResponse)
+async def memory_status() -> MemoryStatusResponse:
+    """Report resident memory and allocation tracing state of this worker."""
+    return MemoryStatusResponse(pid=os.getpid(), **_diagnostics.status())
+
+
+@router.post("/tracing/start", response_model=MemoryStatusResponse)
+async def start_tracing(
+    frames: Optional[int] = Query(None, ge=1, le=100, description="Traceback depth")
+) -> MemoryStatusResponse:
+    """Start tracing allocations; slows allocation-heavy code while running."""
+    try:
+        _diagnostics.start_tracing(frames)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    _logger.warning("Allocation tracing started", pid=os.getpid())
+    return MemoryStatusResponse(pid=os.getpid(), **_diagnostics.status())
+
+
+@router.post("/tracing/stop", response_model=MemoryStatusResponse)
+async def stop_tracing() -> MemoryStatusResponse:
+    """Stop tracing and free the trace data."""
+    _diagnostics.stop_tracing()
+    _logger.info("Allocation tracing stopped", pid=os.getpid())
+    return MemoryStatusResponse(pid=os.getpid(), **_diagnostics.status())
+
+
+@router.get("/top", response_model=List[AllocationSite])
+async def top_allocations(
+    limit: int = Query(20, ge=1, le=1000),
+    group_by: str = Query("lineno", description=GROUP_BY_DESCRIPTION),
+) -> List[AllocationSite]:
+    """List the allocation sites holding the most memory."""
+    try:
+        sites = await run_in_threadpool(_diagnostics.top, limit, group_by)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [AllocationSite(**site) for site in sites]
+
+
+@router.post("/baseline", status_code=204)
+async def take_baseline() -> None:
+    """Record the snapshot that diffs compare against."""
+    try:
+        await run_in_threadpool(_diagnostics.take_baseline)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/diff", response_model=List[AllocationSite])
+async def diff_allocations(
+    limit: int = Query(20, ge=1, le=1000),
+    group_by: str = Query("lineno", description=GROUP_BY_DESCRIPTION),
+) -> List[AllocationSite]:
+    """List the sites whose memory changed most since the baseline."""
+    try:
+        sites = await run_in_threadpool(_diagnostics.diff, limit, group_by)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [AllocationSite(**site) for site in sites]
+
+
+@router.get("/gc", response_model=GcStatusResponse)
+async def gc_status() -> GcStatusResponse:
+    """Report garbage collector thresholds and generation statistics."""
+    return GcStatusResponse(**_diagnostics.gc_status())
+
+
+@router.put("/gc/thresholds", response_model=GcStatusResponse)
+async def set_gc_thresholds(request: GcThresholdsRequest) -> GcStatusResponse:
+    """Tune the collection thresholds of this worker."""
+    thresholds = (request.threshold0, request.threshold1, request.threshold2)
+    try:
+        _diagnostics.set_gc_thresholds(thresholds)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    _logger.warning("GC thresholds changed", thresholds=list(thresholds))
+    return GcStatusResponse(**_diagnostics.gc_status())
+
+
+@router.post("/gc/collect")
+async def collect(generation: int = Query(2, ge=0, le=2)) -> Dict[str, int]:
+    """Run a collection and report the unreachable objects found."""
+    return {"collected": _diagnostics.collect(generation)}
+
+
+@router.get("/objects", response_model=List[TypeCount])
+async def object_counts(limit: int = Query(20, ge=1, le=1000)) -> List[TypeCount]:
+    """Count live GC-tracked objects per type."""
+    counts = await run_in_threadpool(_diagnostics.object_counts, limit)
+    return [TypeCount(type=name, count=count) for name, count in counts]
@@ -0,0 +1,182 @@
+"""Reactive calculation graph endpoints."""
+import asyncio
+import json
+from typing import Dict, Iterator, List, Optional, Set
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from domain.models.request import GraphDefineRequest, GraphInputRequest
+from domain.models.response import GraphNodeValue, GraphResponse
+from domain.services.graph import (
+    CalculationGraph,
+    Change,
+    GraphElsewhereError,
+    NodeSpec,
+)
+from app.core.dependencies import get_graph_registry, get_logger
+
+router = APIRouter()
+
+_graphs = get_graph_registry()
+_logger = get_logger()
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Changes serialized per streamed chunk
+LINES_PER_CHUNK = 1000
+# Update batches buffered per subscriber before it is dropped
+SUBSCRIBER_QUEUE_SIZE = 64
+
+_subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+
+def _get_graph(graph_id: str) -> CalculationGraph:
+    try:
+        return _graphs.get(graph_id)
+    except GraphElsewhereError:
+        raise HTTPException(
+            status_code=421,
+            detail=(
+                f"Graph {graph_id} is held by another worker process; "
+                "graphs need a single worker or sticky routing"
+            ),
+        )
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Graph not found: {graph_id}")
+    finally:
+        _end_evicted()
+
+
+def _end_evicted() -> None:
+    """End the event streams of graphs the registry evicted as idle."""
+    for graph_id in [key for key in _subscribers if key not in _graphs]:
+        _publish(graph_id, None)
+
+
+def _ndjson(changes: List[Change]) -> Iterator[bytes]:
+    for start in range(0, len(changes), LINES_PER_CHUNK):
+        yield "".join(
+            json.dumps({"name": name, "value": value, "error": error}) + "\n"
+            for name, value, error in changes[start : start + LINES_PER_CHUNK]
+        ).encode()
+
+
+def _publish(graph_id: str, changes: Optional[List[Change]]) -> None:
+    """Hand an update batch (None closes the stream) to every subscriber."""
+    for queue in list(_subscribers.get(graph_id, ())):
+        try:
+            queue.put_nowait(changes)
+        except asyncio.QueueFull:
+            # Slow consumer: replace its oldest batch with an end marker
+            _subscribers[graph_id].discard(queue)
+            queue.get_nowait()
+            queue.put_nowait(None)
+            _logger.warning("Graph subscriber dropped", graph_id=graph_id)
+    if changes is None:
+        _subscribers.pop(graph_id, None)
+
+
+def _changes_response(graph_id: str, changes: List[Change]) -> StreamingResponse:
+    if changes:
+        _publish(graph_id, changes)
+    return StreamingResponse(_ndjson(changes), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post("/graphs", response_model=GraphResponse, status_code=201)
+async def create_graph() -> GraphResponse:
+    """Create an empty calculation graph."""
+    try:
+        graph = _graphs.create()
+    except ValueError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return GraphResponse(graph_id=graph.id, nodes=0)
+
+
+@router.get("/graphs/{graph_id}", response_model=GraphResponse)
+async def get_graph(graph_id: str) -> GraphResponse:
+    """Get the size of a graph."""
+    return GraphResponse(graph_id=graph_id, nodes=len(_get_graph(graph_id)))
+
+
+@router.delete("/graphs/{graph_id}", status_code=204)
+async def delete_graph(graph_id: str) -> None:
+    """Delete a graph and end its event streams."""
+    _get_graph(graph_id)
+    _graphs.delete(graph_id)
+    _publish(graph_id, None)
+
+
+@router.put("/graphs/{graph_id}/nodes")
+async def define_nodes(graph_id: str, request: GraphDefineRequest) -> StreamingResponse:
+    """
+    Add or redefine nodes.
+
+    All nodes are validated together (operations, references, cycles) and
+    either all or none are applied. Streams the computed values as NDJSON.
+    """
+    graph = _get_graph(graph_id)
+    specs = [
+        NodeSpec(node.name, node.value, node.operation, node.args)
+        for node in request.nodes
+    ]
+    try:
+        changes = await run_in_threadpool(graph.define, specs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    _logger.info(
+        "Graph nodes defined", graph_id=graph_id, nodes=len(specs), changed=len(changes)
+    )
+    return _changes_response(graph_id, changes)
+
+
+@router.post("/graphs/{graph_id}/inputs")
+async def update_inputs(graph_id: str, request: GraphInputRequest) -> StreamingResponse:
+    """
+    Update input values.
+
+    Only nodes downstream of the changed inputs are recomputed. Streams the
+    nodes whose value or error changed as NDJSON, in dependency order.
+    """
+    graph = _get_graph(graph_id)
+    try:
+        changes = await run_in_threadpool(graph.set_inputs, request.values)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    _logger.info(
+        "Graph inputs updated",
+        graph_id=graph_id,
+        inputs=len(request.values),
+        changed=len(changes),
+    )
+    return _changes_response(graph_id, changes)
+
+
+@router.get("/graphs/{graph_id}/nodes/{name}", response_model=GraphNodeValue)
+async def get_node(graph_id: str, name: str) -> GraphNodeValue:
+    """Get the current value of a node."""
+    graph = _get_graph(graph_id)
+    try:
+        value, error = graph.get(name)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Node not found: {name}")
+    return GraphNodeValue(name=name, value=value, error=error)
+
+
+@router.get("/graphs/{graph_id}/events")
+async def subscribe(graph_id: str) -> StreamingResponse:
+    """Stream every future change of the graph as NDJSON."""
+    _get_graph(graph_id)
+    queue: asyncio.Queue = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+    _subscribers.setdefault(graph_id, set()).add(queue)
+
+    async def events():
+        try:
+            while True:
+                changes = await queue.get()
+                if changes is None:
+                    return
+                for chunk in _ndjson(changes):
+                    yield chunk
+        finally:
+            _subscribers.get(graph_id, set()).discard(queue)
+
+    return StreamingResponse(events(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,73 @@
+"""Number-theory API endpoints."""
+from fastapi import APIRouter, HTTPException, Path
+from starlette.concurrency import run_in_threadpool
+from domain.models.request import IntegerBatchRequest, IntegerRequest
+from domain.models.response import (
+    IntegerBatchResponse,
+    IntegerItemResult,
+    IntegerResponse,
+    PrimeTablesResponse,
+)
+from app.core.dependencies import get_number_theory_service
+
+router = APIRouter()
+
+_integers = get_number_theory_service()
+
+OPERATION_DESCRIPTION = "gcd, lcm, modpow, modinv, is_prime or factorize"
+
+
+@router.get("/integer/tables", response_model=PrimeTablesResponse)
+async def prime_tables() -> PrimeTablesResponse:
+    """Report how far the shared prime tables have grown."""
+    return PrimeTablesResponse(**_integers.tables_status())
+
+
+@router.post("/integer/{operation}", response_model=IntegerResponse)
+async def integer_calculate(
+    request: IntegerRequest,
+    operation: str = Path(..., description=OPERATION_DESCRIPTION),
+) -> IntegerResponse:
+    """
+    Perform a number-theory operation on integers.
+
+    ``modpow`` takes base, exponent and modulus; ``factorize`` returns
+    ``[prime, exponent]`` pairs.
+    """
+    try:
+        result = await run_in_threadpool(_integers.calculate, operation, request.args)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return IntegerResponse(
+        operation=operation.lower(), args=request.args, result=result
+    )
+
+
+@router.post("/integer/{operation}/batch", response_model=IntegerBatchResponse)
+async def integer_calculate_batch(
+    request: IntegerBatchRequest,
+    operation: str = Path(..., description=OPERATION_DESCRIPTION),
+) -> IntegerBatchResponse:
+    """
+    Perform one number-theory operation on many argument lists.
+
+    The prime tables are grown once for the whole batch and stay warm for
+    later requests. Failed items carry an error instead of a result;
+    items not reached within ``NUMBER_THEORY_MAX_BATCH_SECONDS`` fail with a
+    time-limit error.
+    """
+    try:
+        results = await run_in_threadpool(
+            _integers.calculate_batch, operation, request.items
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return IntegerBatchResponse(
+        operation=operation.lower(),
+        results=[
+            IntegerItemResult(error=str(result))
+            if isinstance(result, ValueError)
+            else IntegerItemResult(result=result)
+            for result in results
+        ],
+    )
@@ -0,0 +1,107 @@
+"""Background job endpoints and bulk file calculation jobs."""
+import uuid
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+from domain.models.response import JobResponse
+from domain.services.jobs import Job, JobStatus
+from app.core.config import settings
+from app.core.dependencies import get_bulk_job_service, get_job_registry
+
+router = APIRouter()
+
+_jobs = get_bulk_job_service()
+_registry = get_job_registry()
+
+
+def to_job_response(job: Job) -> JobResponse:
+    """Build the API view of a job."""
+    return JobResponse(
+        job_id=job.id,
+        kind=job.kind,
+        status=job.status.value,
+        progress=job.progress,
+        stats=job.stats,
+        error=job.error,
+    )
+
+
+def _get_job(job_id: str) -> Job:
+    try:
+        return _registry.get(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def create_job(
+    request: Request,
+    operation: str = Query(..., description="Operation applied to every row"),
+    format: str = Query("csv", description="Input format (csv or parquet)"),
+    header: bool = Query(False, description="Skip the first line of a CSV file"),
+) -> JobResponse:
+    """
+    Upload an operand file and start a bulk calculation job.
+
+    The request body is the raw file. CSV rows are ``x,y`` (``x`` for unary
+    operations), after a header line if ``header`` is set; Parquet uses the
+    first columns. The result file has one ``result,error`` line per input
+    row, blank and malformed rows included.
+    """
+    path = _jobs.input_path(uuid.uuid4().hex)
+    received = 0
+    try:
+        with open(path, "wb") as upload:
+            async for chunk in request.stream():
+                received += len(chunk)
+                if received > settings.bulk_max_upload_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail="Upload exceeds "
+                        f"{settings.bulk_max_upload_bytes} bytes",
+                    )
+                await run_in_threadpool(upload.write, chunk)
+        job = _jobs.submit(path, operation, format, header)
+    except ValueError as e:
+        path.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        path.unlink(missing_ok=True)
+        raise
+    return to_job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str) -> JobResponse:
+    """Poll the status and progress of a job."""
+    return to_job_response(_get_job(job_id))
+
+
+@router.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str) -> FileResponse:
+    """Download the result file of a completed bulk job."""
+    job = _get_job(job_id)
+    if job.kind != "bulk":
+        raise HTTPException(
+            status_code=404,
+            detail=f"{job.kind} jobs have no result file; see stats.value",
+        )
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(
+            status_code=409, detail=f"Job is {job.status.value}, not completed"
+        )
+    return FileResponse(
+        _jobs.result_path(job),
+        media_type="text/csv",
+        filename=f"{job.id}.csv",
+    )
+
+
+@router.delete("/jobs/{job_id}", status_code=204)
+async def delete_job(job_id: str) -> None:
+    """Delete a finished job and its result file."""
+    _get_job(job_id)
+    try:
+        _jobs.delete(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
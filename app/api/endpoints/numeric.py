@@ -0,0 +1,111 @@
+"""Numerical integration, summation and simulation endpoints."""
+import json
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from domain.models.request import (
+    IntegrationRequest,
+    SimulationRequest,
+    SummationRequest,
+)
+from domain.models.response import JobResponse
+from domain.services.simulation import SimulationBusyError
+from app.api.endpoints.graph import NDJSON_MEDIA_TYPE
+from app.api.endpoints.jobs import to_job_response
+from app.core.dependencies import get_numeric_job_service, get_simulation_service
+
+router = APIRouter()
+
+_numeric = get_numeric_job_service()
+_simulations = get_simulation_service()
+
+
+def _summaries(summaries: Iterator[Dict[str, Any]]) -> Iterator[bytes]:
+    try:
+        for summary in summaries:
+            yield (json.dumps(summary) + "\n").encode()
+    except ValueError as e:
+        yield (json.dumps({"done": True, "error": str(e)}) + "\n").encode()
+    except BrokenProcessPool:
+        # The response has started, so the failure can only be reported inline
+        error = "A simulation worker process died; retry the simulation"
+        yield (json.dumps({"done": True, "error": error}) + "\n").encode()
+
+
+@router.post("/numeric/integrate", response_model=JobResponse, status_code=202)
+async def integrate(request: IntegrationRequest) -> JobResponse:
+    """
+    Start a definite integral job.
+
+    ``gauss`` applies fixed-order Gauss-Legendre quadrature on equal panels;
+    ``simpson`` refines adaptively until the tolerance is met and reports
+    an error estimate. Poll ``GET /jobs/{job_id}``; the integral is in
+    ``stats.value`` once the job completes.
+    """
+    try:
+        job = _numeric.submit_integral(
+            request.expression,
+            request.lower,
+            request.upper,
+            method=request.method,
+            order=request.order,
+            panels=request.panels,
+            tolerance=request.tolerance,
+            time_budget=request.time_budget,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return to_job_response(job)
+
+
+@router.post("/numeric/sum", response_model=JobResponse, status_code=202)
+async def summation(request: SummationRequest) -> JobResponse:
+    """
+    Start a job summing a term over the integers ``start`` to ``stop``.
+
+    Terms are added with exactly rounded summation. Poll
+    ``GET /jobs/{job_id}``; the sum is in ``stats.value``.
+    """
+    try:
+        job = _numeric.submit_sum(
+            request.expression,
+            request.start,
+            request.stop,
+            time_budget=request.time_budget,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return to_job_response(job)
+
+
+@router.post("/numeric/simulate")
+async def simulate(request: SimulationRequest) -> StreamingResponse:
+    """
+    Run a Monte Carlo simulation, streaming statistics as chunks complete.
+
+    Each NDJSON line summarizes every trial so far: mean, standard
+    deviation, confidence interval of the mean, min, max and, per
+    threshold, ``P(result <= threshold)`` with a Wilson interval. The last
+    line has ``done`` set. The same ``seed`` reproduces the same numbers
+    whatever the worker count; a failure ends the stream with an ``error``.
+    Returns 503 while ``SIMULATION_MAX_CONCURRENT`` simulations are running.
+    """
+    try:
+        simulation = _simulations.prepare(
+            request.expression,
+            request.distributions,
+            request.trials,
+            seed=request.seed,
+            confidence=request.confidence,
+            thresholds=request.thresholds,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        summaries = _simulations.run(simulation)
+    except SimulationBusyError as e:
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
+        )
+    return StreamingResponse(_summaries(summaries), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,87 @@
+"""Polynomial API endpoints."""
+import io
+import numpy as np
+from fastapi import APIRouter, HTTPException, Path, Request, Response
+from starlette.concurrency import run_in_threadpool
+from domain.models.request import PolynomialRequest
+from domain.models.response import PolynomialResponse
+from app.core.body import body_limit_route
+from app.core.config import settings
+from app.core.dependencies import get_polynomial_service
+
+# JSON bodies are capped too, before they are decoded and validated
+router = APIRouter(
+    route_class=body_limit_route(lambda: settings.polynomial_max_body_bytes)
+)
+
+_polynomials = get_polynomial_service()
+
+NPY_MEDIA_TYPE = "application/x-npy"
+OPERATION_DESCRIPTION = "evaluate, derivative, multiply or roots"
+
+
+@router.post("/polynomial/{operation}", response_model=PolynomialResponse)
+async def polynomial_calculate(
+    request: PolynomialRequest,
+    operation: str = Path(..., description=OPERATION_DESCRIPTION),
+) -> PolynomialResponse:
+    """
+    Perform a polynomial operation on JSON arrays.
+
+    Coefficients are in ascending order: ``[1, 2, 3]`` is ``1 + 2x + 3x^2``.
+    """
+    try:
+        result = await run_in_threadpool(
+            _polynomials.calculate, operation, request.coefficients, request.operand
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not np.all(np.isfinite(result)):
+        raise HTTPException(status_code=400, detail="Result contains non-finite values")
+    return PolynomialResponse(
+        operation=operation.lower(),
+        shape=list(result.shape),
+        result=result.tolist(),
+    )
+
+
+@router.post("/polynomial/{operation}/binary")
+async def polynomial_calculate_binary(
+    request: Request,
+    operation: str = Path(..., description=OPERATION_DESCRIPTION),
+) -> Response:
+    """
+    Perform a polynomial operation on binary arrays.
+
+    The body is an ``.npz`` archive with array ``coefficients`` and, for
+    evaluate and multiply, ``operand``; the response is the result in
+    ``.npy`` format. Non-finite values are returned as they are.
+    """
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > settings.polynomial_max_body_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Body exceeds {settings.polynomial_max_body_bytes} bytes",
+            )
+    try:
+        with np.load(io.BytesIO(bytes(body)), allow_pickle=False) as archive:
+            coefficients = archive["coefficients"]
+            operand = archive["operand"] if "operand" in archive.files else None
+    except (KeyError, OSError, ValueError):
+        raise HTTPException(
+            status_code=400,
+            detail="Body must be an .npz archive containing array coefficients",
+        )
+
+    try:
+        result = await run_in_threadpool(
+            _polynomials.calculate, operation, coefficients, operand
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    output = io.BytesIO()
+    np.save(output, result, allow_pickle=False)
+    return Response(content=output.getvalue(), media_type=NPY_MEDIA_TYPE)
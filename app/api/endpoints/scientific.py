@@ -0,0 +1,100 @@
+"""Scientific calculator API endpoints."""
+from typing import Union
+from fastapi import APIRouter, Query, Response
+from domain.models.response import CalculationResponse
+from app.core.dependencies import get_calculator_service
+from app.core.errors import error_response
+
+router = APIRouter()
+
+# Get singleton calculator service
+_calculator = get_calculator_service()
+
+
+@router.get("/pow", response_model=CalculationResponse)
+async def power(
+    x: float = Query(..., description="Base"),
+    y: float = Query(..., description="Exponent"),
+) -> Union[CalculationResponse, Response]:
+    """Raise x to the power y."""
+    outcome = _calculator.try_calculate("pow", x, y)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="pow", x=x, y=y, result=outcome.value)
+
+
+@router.get("/sqrt", response_model=CalculationResponse)
+async def sqrt(
+    x: float = Query(..., description="Number"),
+) -> Union[CalculationResponse, Response]:
+    """Compute the square root of x."""
+    outcome = _calculator.try_calculate("sqrt", x)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="sqrt", x=x, result=outcome.value)
+
+
+@router.get("/log", response_model=CalculationResponse)
+async def log(
+    x: float = Query(..., description="Positive number"),
+) -> Union[CalculationResponse, Response]:
+    """Compute the natural logarithm of x."""
+    outcome = _calculator.try_calculate("log", x)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="log", x=x, result=outcome.value)
+
+
+@router.get("/exp", response_model=CalculationResponse)
+async def exp(
+    x: float = Query(..., description="Exponent"),
+) -> Union[CalculationResponse, Response]:
+    """Raise e to the power x."""
+    outcome = _calculator.try_calculate("exp", x)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="exp", x=x, result=outcome.value)
+
+
+@router.get("/sin", response_model=CalculationResponse)
+async def sin(
+    x: float = Query(..., description="Angle in radians"),
+) -> Union[CalculationResponse, Response]:
+    """Compute the sine of x (radians)."""
+    outcome = _calculator.try_calculate("sin", x)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="sin", x=x, result=outcome.value)
+
+
+@router.get("/cos", response_model=CalculationResponse)
+async def cos(
+    x: float = Query(..., description="Angle in radians"),
+) -> Union[CalculationResponse, Response]:
+    """Compute the cosine of x (radians)."""
+    outcome = _calculator.try_calculate("cos", x)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="cos", x=x, result=outcome.value)
+
+
+@router.get("/tan", response_model=CalculationResponse)
+async def tan(
+    x: float = Query(..., description="Angle in radians"),
+) -> Union[CalculationResponse, Response]:
+    """Compute the tangent of x (radians)."""
+    outcome = _calculator.try_calculate("tan", x)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="tan", x=x, result=outcome.value)
+
+
+@router.get("/factorial", response_model=CalculationResponse)
+async def factorial(
+    x: float = Query(..., description="Non-negative integer"),
+) -> Union[CalculationResponse, Response]:
+    """Compute the factorial of a non-negative integer x."""
+    outcome = _calculator.try_calculate("factorial", x)
+    if outcome.error is not None:
+        return error_response(outcome)
+    return CalculationResponse(operation="factorial", x=x, result=outcome.value)
@@ -0,0 +1,30 @@
+"""Calculation statistics aggregated across worker processes.
+
+The router is only mounted when ``STATS_ENABLED`` is set; any worker serves
+the totals of all workers, past and present, from the shared file.
+"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from domain.models.response import RuntimeStatsResponse
+from domain.services.stats import prometheus_text
+from app.core.dependencies import get_stats_recorder
+
+router = APIRouter(prefix="/stats")
+
+_stats = get_stats_recorder()
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4"
+
+
+@router.get("", response_model=RuntimeStatsResponse)
+async def get_stats() -> RuntimeStatsResponse:
+    """Get per-operation counts, errors and duration histograms."""
+    return RuntimeStatsResponse(**_stats.snapshot())
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Get the same statistics in the Prometheus text format."""
+    return PlainTextResponse(
+        prometheus_text(_stats.snapshot()), media_type=PROMETHEUS_MEDIA_TYPE
+    )
@@ -0,0 +1,140 @@
+"""Streaming session endpoints with rolling-window aggregates."""
+import json
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from domain.models.request import StreamCreateRequest, StreamValuesRequest
+from domain.models.response import (
+    StreamRegistryResponse,
+    StreamSessionResponse,
+    StreamStatsResponse,
+)
+from domain.services.streaming import (
+    StreamCapacityError,
+    StreamElsewhereError,
+    StreamSession,
+)
+from app.core.dependencies import get_stream_registry
+
+router = APIRouter()
+
+_streams = get_stream_registry()
+
+# Close code for a WebSocket opened on an unknown or evicted session
+POLICY_VIOLATION = 1008
+
+
+def _get_session(session_id: str) -> StreamSession:
+    try:
+        return _streams.get(session_id)
+    except StreamElsewhereError:
+        raise HTTPException(
+            status_code=421,
+            detail=(
+                f"Stream session {session_id} is held by another worker process; "
+                "streaming needs a single worker or sticky routing"
+            ),
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=404, detail=f"Stream session not found: {session_id}"
+        )
+
+
+def _stats(session: StreamSession) -> StreamStatsResponse:
+    return StreamStatsResponse(session_id=session.id, **session.window.stats())
+
+
+def _push(session: StreamSession, message: str) -> str:
+    try:
+        values = json.loads(message)
+        session.window.push(values if isinstance(values, list) else [values])
+    except ValueError as e:
+        return json.dumps({"error": str(e)})
+    return _stats(session).model_dump_json()
+
+
+@router.post("/streams", response_model=StreamSessionResponse, status_code=201)
+async def create_stream(request: StreamCreateRequest) -> StreamSessionResponse:
+    """
+    Create a session aggregating the last ``window`` values or ``seconds``.
+
+    Returns 503 when the sessions' memory cap has no room for the window.
+    """
+    try:
+        session = _streams.create(request.window, request.seconds, request.capacity)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except StreamCapacityError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return StreamSessionResponse(
+        session_id=session.id,
+        capacity=session.window.capacity,
+        seconds=session.window.seconds,
+    )
+
+
+@router.get("/streams", response_model=StreamRegistryResponse)
+async def get_streams() -> StreamRegistryResponse:
+    """Get the number of live sessions and the memory they reserve."""
+    _streams.evict_idle()
+    return StreamRegistryResponse(**_streams.status())
+
+
+@router.get("/streams/{session_id}", response_model=StreamStatsResponse)
+async def get_stream(session_id: str) -> StreamStatsResponse:
+    """Get the current aggregates of a session."""
+    return _stats(_get_session(session_id))
+
+
+@router.post("/streams/{session_id}/values", response_model=StreamStatsResponse)
+async def push_values(
+    session_id: str, request: StreamValuesRequest
+) -> StreamStatsResponse:
+    """Push values into a session and return its aggregates."""
+    session = _get_session(session_id)
+    try:
+        session.window.push(request.values)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _stats(session)
+
+
+@router.delete("/streams/{session_id}", status_code=204)
+async def delete_stream(session_id: str) -> None:
+    """Delete a session and release its memory."""
+    _get_session(session_id)
+    _streams.delete(session_id)
+
+
+@router.websocket("/streams/{session_id}/ws")
+async def stream_socket(websocket: WebSocket, session_id: str) -> None:
+    """
+    Push values over a WebSocket.
+
+    Every text message is a JSON number or list of numbers and is answered
+    with the session's aggregates, or ``{"error": ...}`` if it is invalid.
+    The socket is closed once the session is deleted or evicted.
+    """
+    await websocket.accept()
+    try:
+        message = None
+        while True:
+            # Looked up for every message, so eviction is noticed promptly
+            try:
+                session = _streams.get(session_id)
+            except StreamElsewhereError:
+                await websocket.close(
+                    code=POLICY_VIOLATION,
+                    reason="Stream session is held by another worker process",
+                )
+                return
+            except KeyError:
+                await websocket.close(
+                    code=POLICY_VIOLATION,
+                    reason=f"Stream session not found: {session_id}",
+                )
+                return
+            if message is not None:
+                await websocket.send_text(_push(session, message))
+            message = await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
@@ -0,0 +1,81 @@
+"""Vector and matrix API endpoints."""
+import io
+import numpy as np
+from fastapi import APIRouter, HTTPException, Path, Request, Response
+from starlette.concurrency import run_in_threadpool
+from domain.models.request import TensorRequest
+from domain.models.response import TensorResponse
+from app.core.body import body_limit_route
+from app.core.config import settings
+from app.core.dependencies import get_tensor_service
+
+# JSON bodies are capped too, before they are decoded and validated
+router = APIRouter(route_class=body_limit_route(lambda: settings.tensor_max_body_bytes))
+
+_tensor = get_tensor_service()
+
+NPY_MEDIA_TYPE = "application/x-npy"
+OPERATION_DESCRIPTION = "add, subtract, multiply, divide, dot, matmul or solve"
+
+
+@router.post("/tensor/{operation}", response_model=TensorResponse)
+async def tensor_calculate(
+    request: TensorRequest,
+    operation: str = Path(..., description=OPERATION_DESCRIPTION),
+) -> TensorResponse:
+    """
+    Perform a vector/matrix calculation on JSON arrays.
+
+    Element-wise operations broadcast like NumPy.
+    """
+    try:
+        result = await run_in_threadpool(
+            _tensor.calculate, operation, request.x, request.y
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not np.all(np.isfinite(result)):
+        raise HTTPException(status_code=400, detail="Result contains non-finite values")
+    return TensorResponse(
+        operation=operation.lower(),
+        shape=list(result.shape),
+        result=result.tolist(),
+    )
+
+
+@router.post("/tensor/{operation}/binary")
+async def tensor_calculate_binary(
+    request: Request,
+    operation: str = Path(..., description=OPERATION_DESCRIPTION),
+) -> Response:
+    """
+    Perform a vector/matrix calculation on binary arrays.
+
+    The body is an ``.npz`` archive with arrays ``x`` and ``y`` (as written
+    by ``numpy.savez``); the response is the result in ``.npy`` format.
+    """
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > settings.tensor_max_body_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Body exceeds {settings.tensor_max_body_bytes} bytes",
+            )
+    try:
+        with np.load(io.BytesIO(bytes(body)), allow_pickle=False) as archive:
+            x, y = archive["x"], archive["y"]
+    except (KeyError, OSError, ValueError):
+        raise HTTPException(
+            status_code=400,
+            detail="Body must be an .npz archive containing arrays x and y",
+        )
+
+    try:
+        result = await run_in_threadpool(_tensor.calculate, operation, x, y)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    output = io.BytesIO()
+    np.save(output, result, allow_pickle=False)
+    return Response(content=output.getvalue(), media_type=NPY_MEDIA_TYPE)
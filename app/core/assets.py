@@ -0,0 +1,130 @@
+"""In-memory, fingerprinted and precompressed static assets."""
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {encoding: quality}."""
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.lower()] = quality
+    return accepted
+
+
+class Asset:
+    """A static file held in memory with its compressed variants."""
+
+    def __init__(self, content: bytes, media_type: str, cache_control: str):
+        """
+        Compress and fingerprint content.
+
+        Args:
+            content: Raw file bytes
+            media_type: Content-Type of the file
+            cache_control: Cache-Control header served with it
+        """
+        self.digest = hashlib.sha256(content).hexdigest()
+        self.etag = f'"{self.digest[:16]}"'
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.variants: Dict[str, bytes] = {"identity": content}
+        compressed = gzip.compress(content, compresslevel=9, mtime=0)
+        if len(compressed) < len(content):
+            self.variants["gzip"] = compressed
+        if brotli is not None:
+            compressed = brotli.compress(content, quality=11)
+            if len(compressed) < len(content):
+                self.variants["br"] = compressed
+
+    def respond(self, accept_encoding: str, if_none_match: Optional[str]) -> Response:
+        """Build a response, choosing the smallest acceptable encoding."""
+        headers = {
+            "Cache-Control": self.cache_control,
+            "ETag": self.etag,
+            "Vary": "Accept-Encoding",
+        }
+        if if_none_match is not None and self.etag in if_none_match:
+            return Response(status_code=304, headers=headers)
+
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and accepted.get(encoding, 0.0) > 0:
+                headers["Content-Encoding"] = encoding
+                return Response(
+                    self.variants[encoding], media_type=self.media_type, headers=headers
+                )
+        return Response(
+            self.variants["identity"], media_type=self.media_type, headers=headers
+        )
+
+
+class AssetPipeline:
+    """Loads static files once and serves them from memory."""
+
+    def __init__(
+        self,
+        static_dir: Path,
+        fingerprinted: Iterable[str] = ("script.js", "style.css"),
+        static_prefix: str = "/static",
+        assets_prefix: str = "/assets",
+        index: str = "index.html",
+    ):
+        """
+        Read, fingerprint and compress static files.
+
+        Args:
+            static_dir: Directory holding the UI files
+            fingerprinted: Files renamed to ``name.<hash>.ext``
+            static_prefix: URL prefix used by references in the index
+            assets_prefix: URL prefix fingerprinted files are served under
+            index: Page whose references are rewritten
+        """
+        self._assets: Dict[str, Asset] = {}
+        self.urls: Dict[str, str] = {}
+
+        for name in fingerprinted:
+            path = static_dir / name
+            if not path.is_file():
+                continue
+            media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            asset = Asset(path.read_bytes(), media_type, IMMUTABLE)
+            stem, dot, suffix = name.rpartition(".")
+            hashed = f"{stem}.{asset.digest[:12]}{dot}{suffix}"
+            self._assets[hashed] = asset
+            self.urls[name] = f"{assets_prefix}/{hashed}"
+
+        self.index: Optional[Asset] = None
+        index_path = static_dir / index
+        if index_path.is_file():
+            html = index_path.read_text(encoding="utf-8")
+            for name, url in self.urls.items():
+                html = html.replace(f"{static_prefix}/{name}", url)
+            self.index = Asset(
+                html.encode("utf-8"), "text/html; charset=utf-8", REVALIDATE
+            )
+
+    def get(self, name: str) -> Optional[Asset]:
+        """Return a fingerprinted asset by file name."""
+        return self._assets.get(name)
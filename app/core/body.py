@@ -0,0 +1,57 @@
+"""Request body size limits enforced before the body is parsed."""
+from typing import Callable, Type
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from starlette.types import Receive, Scope
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"Body exceeds {max_bytes} bytes")
+
+
+class _LimitedRequest(Request):
+    """Request whose buffered body stops growing past a limit."""
+
+    def __init__(self, scope: Scope, receive: Receive, max_bytes: int):
+        super().__init__(scope, receive)
+        self._max_bytes = max_bytes
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            body = bytearray()
+            async for chunk in self.stream():
+                body += chunk
+                if len(body) > self._max_bytes:
+                    raise _too_large(self._max_bytes)
+            self._body = bytes(body)
+        return self._body
+
+
+def body_limit_route(max_bytes: Callable[[], int]) -> Type[APIRoute]:
+    """
+    Build a route class that rejects bodies over ``max_bytes()`` with 413.
+
+    A larger ``Content-Length`` is refused before anything is read, and a
+    body without one (chunked) is cut off once it passes the limit, so JSON
+    bodies are capped before FastAPI decodes and validates them.
+
+    Args:
+        max_bytes: Returns the current limit, read on every request
+    """
+
+    class BodyLimitRoute(APIRoute):
+        def get_route_handler(self) -> Callable[[Request], Response]:
+            handler = super().get_route_handler()
+
+            async def limited_handler(request: Request) -> Response:
+                limit = max_bytes()
+                length = request.headers.get("content-length", "")
+                if length.isdigit() and int(length) > limit:
+                    raise _too_large(limit)
+                return await handler(
+                    _LimitedRequest(request.scope, request.receive, limit)
+                )
+
+            return limited_handler
+
+    return BodyLimitRoute
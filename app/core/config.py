@@ -1,6 +1,45 @@
 """Application configuration."""
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
+# uvicorn tuning presets, selected with SERVER_PROFILE
+SERVER_PROFILES: Dict[str, Dict[str, Any]] = {
+    "development": {
+        "reload": True,
+        "workers": 1,
+        "loop": "auto",
+        "http": "auto",
+        "timeout_keep_alive": 5,
+        "backlog": 2048,
+        "limit_concurrency": None,
+        "limit_max_requests": None,
+    },
+    "compat": {
+        "reload": False,
+        "workers": 1,
+        "loop": "asyncio",
+        "http": "h11",
+        "timeout_keep_alive": 5,
+        "backlog": 2048,
+        "limit_concurrency": None,
+        "limit_max_requests": None,
+    },
+    "production": {
+        "reload": False,
+        "workers": 4,
+        "loop": "uvloop",
+        "http": "httptools",
+        "timeout_keep_alive": 30,
+        "backlog": 4096,
+        "limit_concurrency": 2000,
+        # uvicorn's multiprocess supervisor does not replace exited workers
+        "limit_max_requests": None,
+    },
+}
+
 
 class Settings(BaseSettings):
     """Application settings."""
@@ -9,10 +48,200 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     debug: bool = False
 
+    # Batch calculation jobs
+    batch_max_items: int = 1_000_000
+    batch_timeout_seconds: float = 30.0
+    batch_yield_interval_ms: float = 5.0
+
+    # Bulk file jobs
+    bulk_jobs_dir: str = str(Path(tempfile.gettempdir()) / "fastapi-calculator-jobs")
+    bulk_workers: Optional[int] = None  # defaults to CPU count - 1
+    bulk_chunk_bytes: int = 8 * 1024 * 1024
+    bulk_max_upload_bytes: int = 10 * 1024**3
+    bulk_max_concurrent_jobs: int = 2
+
+    # Numerical integration and summation jobs
+    numeric_workers: Optional[int] = None  # defaults to CPU count - 1
+    numeric_max_concurrent_jobs: int = 2
+    numeric_chunk_panels: int = 4096
+    numeric_chunk_terms: int = 1_000_000
+    numeric_simpson_segments: int = 64
+    numeric_max_panels: int = 100_000_000
+    numeric_max_terms: int = 10_000_000_000
+    numeric_default_time_budget: float = 60.0
+    numeric_max_time_budget: float = 600.0
+
+    # Monte Carlo simulations (workers come from numeric_workers)
+    simulation_chunk_trials: int = 1 << 18
+    simulation_max_trials: int = 100_000_000
+    simulation_max_concurrent: int = 2
+    simulation_max_thresholds: int = 16
+
+    # Vector/matrix operations
+    tensor_max_elements: int = 1_000_000
+    tensor_max_body_bytes: int = 64 * 1024 * 1024
+    tensor_max_threads: int = 1
+
+    # Polynomial operations
+    polynomial_max_coefficients: int = 100_000
+    polynomial_max_points: int = 10_000_000
+    polynomial_max_work: int = 2_000_000_000
+    polynomial_max_roots_degree: int = 1000
+    polynomial_max_body_bytes: int = 128 * 1024 * 1024
+
+    # Number theory (prime tables grow lazily up to these ceilings)
+    number_theory_max_sieve_bytes: int = 16 * 1024 * 1024
+    number_theory_max_spf_bytes: int = 16 * 1024 * 1024
+    number_theory_max_bits: int = 4096
+    number_theory_max_factor_bits: int = 64
+    number_theory_max_batch_items: int = 10_000
+    number_theory_max_batch_seconds: float = 10.0
+
+    # Admin memory diagnostics (routes exist only when enabled)
+    diagnostics_enabled: bool = False
+    diagnostics_admin_token: Optional[str] = None
+    diagnostics_traceback_frames: int = 1
+
+    # Reactive calculation graphs
+    graph_max_graphs: int = 100
+    graph_max_nodes: int = 200_000
+    graph_idle_timeout: float = 300.0
+
+    # Streaming sessions with rolling-window aggregates
+    stream_max_bytes: int = 256 * 1024 * 1024
+    stream_idle_timeout: float = 300.0
+    stream_max_window: int = 1_000_000
+    stream_default_time_capacity: int = 65_536
+
+    # Cross-worker result cache (memory-mapped file shared by all workers)
+    result_cache_enabled: bool = False
+    result_cache_path: str = str(
+        Path("/dev/shm" if Path("/dev/shm").is_dir() else tempfile.gettempdir())
+        / "fastapi-calculator-results"
+    )
+    result_cache_slots: int = 65536
+
+    # Cross-worker calculation statistics (memory-mapped file, a slot per worker)
+    stats_enabled: bool = False
+    stats_path: str = str(
+        Path("/dev/shm" if Path("/dev/shm").is_dir() else tempfile.gettempdir())
+        / "fastapi-calculator-stats"
+    )
+    stats_slots: int = 64
+    stats_max_operations: int = 128
+
+    # Request priority lanes (X-Priority: interactive, standard or bulk)
+    scheduler_enabled: bool = True
+    scheduler_max_concurrent: int = 64
+    scheduler_interactive_reserved: int = 4
+    scheduler_max_queue_depth: int = 1000
+    scheduler_queue_timeout_seconds: float = 30.0
+    scheduler_interactive_weight: int = 8
+    scheduler_standard_weight: int = 3
+    scheduler_bulk_weight: int = 1
+    scheduler_interactive_slo_ms: float = 50.0
+    scheduler_standard_slo_ms: float = 250.0
+    scheduler_bulk_slo_ms: float = 2000.0
+    scheduler_bulk_routes: List[str] = ["/calc/batch", "/jobs", "/numeric"]
+
+    # Binary socket server for co-located callers (see app/core/socket_server.py)
+    socket_enabled: bool = False
+    socket_host: str = "127.0.0.1"
+    socket_port: int = 9000
+    socket_path: Optional[str] = None  # Unix socket; replaces TCP when set
+
+    # Readiness thresholds (GET /health/ready)
+    health_lag_sample_interval_ms: float = 100.0
+    health_max_loop_lag_ms: float = 250.0
+    health_max_in_flight: int = 1000
+    health_max_executor_backlog: int = 32
+
+    # Server tuning: a profile plus optional per-field overrides
+    server_profile: str = "development"
+    host: str = "0.0.0.0"
+    port: int = 8000
+    server_workers: Optional[int] = None
+    server_loop: Optional[str] = None
+    server_http: Optional[str] = None
+    server_keep_alive_timeout: Optional[int] = None
+    server_backlog: Optional[int] = None
+    server_limit_concurrency: Optional[int] = None
+    server_limit_max_requests: Optional[int] = None
+
     model_config = {
         "env_file": ".env",
         "case_sensitive": False,
+        "extra": "ignore",
     }
 
+    @field_validator("server_profile")
+    @classmethod
+    def _validate_profile(cls, value: str) -> str:
+        value = value.lower()
+        if value not in SERVER_PROFILES:
+            raise ValueError(
+                f"Unknown server profile: {value}. "
+                f"Available profiles: {', '.join(SERVER_PROFILES)}"
+            )
+        return value
+
+    @field_validator("server_loop")
+    @classmethod
+    def _validate_loop(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None and value not in ("auto", "asyncio", "uvloop"):
+            raise ValueError(f"Unsupported event loop: {value}")
+        return value
+
+    @field_validator("server_http")
+    @classmethod
+    def _validate_http(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None and value not in ("auto", "h11", "httptools"):
+            raise ValueError(f"Unsupported HTTP implementation: {value}")
+        return value
+
+    def uvicorn_options(self) -> Dict[str, Any]:
+        """
+        Build keyword arguments for ``uvicorn.run`` from the active profile.
+
+        Returns:
+            Profile values with any explicit ``SERVER_*`` overrides applied
+
+        Raises:
+            ValueError: If ``limit_max_requests`` (which would leave the
+                server without workers) or ``socket_path`` is combined with
+                several workers
+        """
+        options = dict(SERVER_PROFILES[self.server_profile])
+        overrides = {
+            "workers": self.server_workers,
+            "loop": self.server_loop,
+            "http": self.server_http,
+            "timeout_keep_alive": self.server_keep_alive_timeout,
+            "backlog": self.server_backlog,
+            "limit_concurrency": self.server_limit_concurrency,
+            "limit_max_requests": self.server_limit_max_requests,
+        }
+        options.update({k: v for k, v in overrides.items() if v is not None})
+        options["host"] = self.host
+        options["port"] = self.port
+        # uvicorn ignores workers when reloading; make that explicit
+        if options["reload"]:
+            options["workers"] = 1
+        # A worker that reaches limit_max_requests exits and uvicorn 0.24
+        # never starts a replacement, so the pool would drain to nothing
+        if options["limit_max_requests"] is not None and options["workers"] > 1:
+            raise ValueError(
+                "SERVER_LIMIT_MAX_REQUESTS needs a single worker: uvicorn does "
+                "not replace workers that exit after reaching the limit"
+            )
+        # Workers cannot share a Unix socket path; each would replace the
+        # previous worker's socket
+        if self.socket_enabled and self.socket_path and options["workers"] > 1:
+            raise ValueError(
+                "SOCKET_PATH needs a single worker; use the TCP socket "
+                "(shared with SO_REUSEPORT) with several workers"
+            )
+        return options
+
 
 settings = Settings()
@@ -1,9 +1,30 @@
 """Dependency injection setup."""
 from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from app.core.config import settings
+from app.core.load import LoadMonitor
+from app.core.memory import MemoryDiagnostics
+from app.core.scheduler import LANES, RequestScheduler
+from app.core.socket_server import BinaryCalculatorServer
+from domain.services.bulk import BulkJobService
+from domain.services.cache import SharedResultCache
 from domain.services.calculator import CalculatorService
+from domain.services.graph import GraphRegistry
+from domain.services.jobs import JobRegistry, default_workers
+from domain.services.number_theory import NumberTheoryService
+from domain.services.numeric import NumericJobService
+from domain.services.polynomial import PolynomialService
+from domain.services.simulation import SimulationService
+from domain.services.stats import SharedStatsRecorder
+from domain.services.streaming import StreamRegistry
+from domain.services.tensor import TensorCalculatorService
 from domain.services.logger import StructuredLogger
 from domain.operations.factory import OperationFactory
+from domain.operations.number_theory import PrimeTables
 from domain.interfaces.logger import ILogger
+from domain.interfaces.cache import IResultCache
+from domain.interfaces.stats import IStatsRecorder
 
 
 @lru_cache()
@@ -15,12 +36,42 @@ def get_logger() -> ILogger:
 @lru_cache()
 def get_operation_factory() -> OperationFactory:
     """Get singleton operation factory instance."""
-    return OperationFactory()
+    return OperationFactory(
+        PrimeTables(
+            max_sieve_bytes=settings.number_theory_max_sieve_bytes,
+            max_spf_bytes=settings.number_theory_max_spf_bytes,
+        )
+    )
+
+
+@lru_cache()
+def get_result_cache() -> Optional[IResultCache]:
+    """Get singleton shared result cache, or None when disabled."""
+    if not settings.result_cache_enabled:
+        return None
+    return SharedResultCache(
+        settings.result_cache_path, slots=settings.result_cache_slots
+    )
+
+
+@lru_cache()
+def get_stats_recorder() -> Optional[SharedStatsRecorder]:
+    """Get singleton cross-worker statistics, or None when disabled."""
+    if not settings.stats_enabled:
+        return None
+    return SharedStatsRecorder(
+        settings.stats_path,
+        slots=settings.stats_slots,
+        max_operations=settings.stats_max_operations,
+        logger=get_logger(),
+    )
 
 
 def get_calculator_service(
     factory: OperationFactory = None,
     logger: ILogger = None,
+    cache: IResultCache = None,
+    stats: IStatsRecorder = None,
 ) -> CalculatorService:
     """
     Get calculator service instance with dependencies.
@@ -28,6 +79,8 @@ def get_calculator_service(
     Args:
         factory: Operation factory (uses default if not provided)
         logger: Logger instance (uses default if not provided)
+        cache: Result cache (uses the configured shared cache if not provided)
+        stats: Statistics recorder (uses the configured one if not provided)
 
     Returns:
         CalculatorService instance
@@ -36,5 +89,156 @@ def get_calculator_service(
         factory = get_operation_factory()
     if logger is None:
         logger = get_logger()
+    if cache is None:
+        cache = get_result_cache()
+    if stats is None:
+        stats = get_stats_recorder()
+
+    return CalculatorService(factory, logger, cache, stats)
+
+
+@lru_cache()
+def get_number_theory_service() -> NumberTheoryService:
+    """Get singleton number-theory service."""
+    return NumberTheoryService(
+        get_operation_factory(),
+        get_logger(),
+        max_bits=settings.number_theory_max_bits,
+        max_factor_bits=settings.number_theory_max_factor_bits,
+        max_batch_items=settings.number_theory_max_batch_items,
+        max_batch_seconds=settings.number_theory_max_batch_seconds,
+    )
+
+
+@lru_cache()
+def get_job_registry() -> JobRegistry:
+    """Get singleton background job registry, shared by workers via the jobs dir."""
+    return JobRegistry(Path(settings.bulk_jobs_dir))
+
+
+@lru_cache()
+def get_bulk_job_service() -> BulkJobService:
+    """Get singleton bulk file job service."""
+    return BulkJobService(
+        get_operation_factory(),
+        get_logger(),
+        get_job_registry(),
+        workdir=Path(settings.bulk_jobs_dir),
+        workers=settings.bulk_workers or default_workers(),
+        chunk_bytes=settings.bulk_chunk_bytes,
+        max_concurrent_jobs=settings.bulk_max_concurrent_jobs,
+    )
+
+
+@lru_cache()
+def get_numeric_job_service() -> NumericJobService:
+    """Get singleton numerical integration and summation job service."""
+    return NumericJobService(
+        get_operation_factory(),
+        get_logger(),
+        get_job_registry(),
+        workers=settings.numeric_workers or default_workers(),
+        max_concurrent_jobs=settings.numeric_max_concurrent_jobs,
+        chunk_panels=settings.numeric_chunk_panels,
+        chunk_terms=settings.numeric_chunk_terms,
+        simpson_segments=settings.numeric_simpson_segments,
+        max_panels=settings.numeric_max_panels,
+        max_terms=settings.numeric_max_terms,
+        default_time_budget=settings.numeric_default_time_budget,
+        max_time_budget=settings.numeric_max_time_budget,
+    )
+
+
+@lru_cache()
+def get_simulation_service() -> SimulationService:
+    """Get singleton Monte Carlo simulation service."""
+    return SimulationService(
+        get_operation_factory(),
+        get_logger(),
+        workers=settings.numeric_workers or default_workers(),
+        chunk_trials=settings.simulation_chunk_trials,
+        max_trials=settings.simulation_max_trials,
+        max_concurrent=settings.simulation_max_concurrent,
+        max_thresholds=settings.simulation_max_thresholds,
+    )
+
 
-    return CalculatorService(factory, logger)
+@lru_cache()
+def get_request_scheduler() -> RequestScheduler:
+    """Get singleton request scheduler."""
+    return RequestScheduler(
+        max_concurrent=settings.scheduler_max_concurrent,
+        weights={lane: getattr(settings, f"scheduler_{lane}_weight") for lane in LANES},
+        slos={
+            lane: getattr(settings, f"scheduler_{lane}_slo_ms") / 1000 for lane in LANES
+        },
+        interactive_reserved=settings.scheduler_interactive_reserved,
+        max_queue_depth=settings.scheduler_max_queue_depth,
+        queue_timeout=settings.scheduler_queue_timeout_seconds,
+    )
+
+
+@lru_cache()
+def get_binary_server() -> BinaryCalculatorServer:
+    """Get singleton binary socket server."""
+    return BinaryCalculatorServer(get_calculator_service(), get_logger())
+
+
+@lru_cache()
+def get_load_monitor() -> LoadMonitor:
+    """Get singleton load monitor."""
+    return LoadMonitor(sample_interval=settings.health_lag_sample_interval_ms / 1000)
+
+
+@lru_cache()
+def get_tensor_service() -> TensorCalculatorService:
+    """Get singleton vector/matrix calculator service."""
+    return TensorCalculatorService(
+        get_operation_factory(),
+        get_logger(),
+        max_elements=settings.tensor_max_elements,
+        max_threads=settings.tensor_max_threads,
+    )
+
+
+@lru_cache()
+def get_graph_registry() -> GraphRegistry:
+    """Get singleton calculation graph registry."""
+    return GraphRegistry(
+        get_operation_factory(),
+        get_logger(),
+        max_graphs=settings.graph_max_graphs,
+        max_nodes=settings.graph_max_nodes,
+        idle_timeout=settings.graph_idle_timeout,
+    )
+
+
+@lru_cache()
+def get_stream_registry() -> StreamRegistry:
+    """Get singleton streaming session registry."""
+    return StreamRegistry(
+        get_logger(),
+        max_bytes=settings.stream_max_bytes,
+        idle_timeout=settings.stream_idle_timeout,
+        max_capacity=settings.stream_max_window,
+        default_time_capacity=settings.stream_default_time_capacity,
+    )
+
+
+@lru_cache()
+def get_memory_diagnostics() -> MemoryDiagnostics:
+    """Get singleton memory diagnostics."""
+    return MemoryDiagnostics(default_frames=settings.diagnostics_traceback_frames)
+
+
+@lru_cache()
+def get_polynomial_service() -> PolynomialService:
+    """Get singleton polynomial service."""
+    return PolynomialService(
+        get_operation_factory(),
+        get_logger(),
+        max_coefficients=settings.polynomial_max_coefficients,
+        max_points=settings.polynomial_max_points,
+        max_work=settings.polynomial_max_work,
+        max_roots_degree=settings.polynomial_max_roots_degree,
+    )
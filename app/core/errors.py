@@ -0,0 +1,27 @@
+"""Pre-encoded responses for failed calculations."""
+import json
+from typing import Dict
+from fastapi import Response
+from domain.interfaces.result import CalculationResult
+
+# Encoded error bodies by message. Invalid-operation messages echo the
+# requested name, so the cache stops growing once it holds this many.
+ERROR_BODY_CACHE_SIZE = 1024
+_error_bodies: Dict[str, bytes] = {}
+
+
+def error_response(outcome: CalculationResult) -> Response:
+    """
+    Build the 400 response for a failed calculation.
+
+    The body is what ``HTTPException`` produces plus the error code, and is
+    encoded once per distinct message.
+    """
+    body = _error_bodies.get(outcome.message)
+    if body is None:
+        body = json.dumps(
+            {"detail": outcome.message, "code": outcome.error.value}
+        ).encode()
+        if len(_error_bodies) < ERROR_BODY_CACHE_SIZE:
+            _error_bodies[outcome.message] = body
+    return Response(body, status_code=400, media_type="application/json")
@@ -0,0 +1,69 @@
+"""Cheap load signals for readiness probes."""
+import asyncio
+from typing import Optional
+
+
+class LoadMonitor:
+    """Tracks event-loop lag and in-flight requests."""
+
+    def __init__(self, sample_interval: float = 0.1):
+        """
+        Initialize load monitor.
+
+        Args:
+            sample_interval: Seconds between event-loop lag samples
+        """
+        self._sample_interval = sample_interval
+        self._task: Optional[asyncio.Task] = None
+        self.in_flight = 0
+        self.loop_lag = 0.0
+
+    def start(self) -> None:
+        """Start sampling event-loop lag on the running loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._sample())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sample(self) -> None:
+        """Measure how late the loop wakes a sleeping task."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._sample_interval
+            await asyncio.sleep(self._sample_interval)
+            self.loop_lag = max(0.0, loop.time() - expected)
+
+
+class InFlightMiddleware:
+    """ASGI middleware counting HTTP requests currently being served."""
+
+    def __init__(self, app, monitor: LoadMonitor, exclude_prefix: str = "/health"):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            monitor: Monitor whose in-flight counter is maintained
+            exclude_prefix: Paths not counted (the probes themselves)
+        """
+        self.app = app
+        self.monitor = monitor
+        self.exclude_prefix = exclude_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_prefix):
+            await self.app(scope, receive, send)
+            return
+        self.monitor.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.in_flight -= 1
@@ -0,0 +1,197 @@
+"""Memory and allocation diagnostics for a single worker process."""
+import gc
+import os
+import resource
+import sys
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Allocation sites grouped by one of these tracemalloc keys
+GROUP_BY = ("lineno", "filename", "traceback")
+
+# Frames of the diagnostics machinery itself, hidden from reports
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _rss_bytes() -> Optional[int]:
+    """Return the current resident set size, where /proc is available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _location(trace: tracemalloc.Traceback, group_by: str) -> str:
+    if group_by == "traceback":
+        return " <- ".join(f"{f.filename}:{f.lineno}" for f in trace)
+    frame = trace[0]
+    if group_by == "filename":
+        return frame.filename
+    return f"{frame.filename}:{frame.lineno}"
+
+
+class MemoryDiagnostics:
+    """
+    Inspect allocations, garbage collector state and live objects.
+
+    Nothing runs until a method is called; tracemalloc in particular only
+    costs time and memory between ``start_tracing`` and ``stop_tracing``.
+    Results describe the calling process only, i.e. one server worker.
+    """
+
+    def __init__(self, default_frames: int = 1):
+        """
+        Initialize diagnostics.
+
+        Args:
+            default_frames: Traceback depth recorded when tracing starts
+        """
+        self._default_frames = default_frames
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+
+    def status(self) -> Dict[str, Any]:
+        """Return process memory and tracing state."""
+        tracing = tracemalloc.is_tracing()
+        current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        return {
+            "rss_bytes": _rss_bytes(),
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "tracing": tracing,
+            "traceback_frames": tracemalloc.get_traceback_limit() if tracing else 0,
+            "traced_bytes": current,
+            "traced_peak_bytes": peak,
+            "tracing_overhead_bytes": (
+                tracemalloc.get_tracemalloc_memory() if tracing else 0
+            ),
+            "has_baseline": self._baseline is not None,
+        }
+
+    def start_tracing(self, frames: Optional[int] = None) -> None:
+        """
+        Start tracing allocations.
+
+        Raises:
+            ValueError: If tracing is already running
+        """
+        if tracemalloc.is_tracing():
+            raise ValueError("Allocation tracing is already running")
+        tracemalloc.start(frames or self._default_frames)
+
+    def stop_tracing(self) -> None:
+        """Stop tracing and release all trace data, including the baseline."""
+        tracemalloc.stop()
+        self._baseline = None
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        if not tracemalloc.is_tracing():
+            raise ValueError("Allocation tracing is not running")
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+    def top(self, limit: int = 20, group_by: str = "lineno") -> List[Dict[str, Any]]:
+        """
+        Return the allocation sites holding the most memory.
+
+        Raises:
+            ValueError: If tracing is not running or group_by is unknown
+        """
+        if group_by not in GROUP_BY:
+            raise ValueError(
+                f"Unknown grouping: {group_by}. Available: {', '.join(GROUP_BY)}"
+            )
+        return [
+            {
+                "location": _location(stat.traceback, group_by),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in self._snapshot().statistics(group_by)[:limit]
+        ]
+
+    def take_baseline(self) -> None:
+        """
+        Record a snapshot that later diffs compare against.
+
+        Raises:
+            ValueError: If tracing is not running
+        """
+        self._baseline = self._snapshot()
+
+    def diff(self, limit: int = 20, group_by: str = "lineno") -> List[Dict[str, Any]]:
+        """
+        Return the sites whose memory grew or shrank most since the baseline.
+
+        Raises:
+            ValueError: If tracing is not running, no baseline was taken or
+                group_by is unknown
+        """
+        if group_by not in GROUP_BY:
+            raise ValueError(
+                f"Unknown grouping: {group_by}. Available: {', '.join(GROUP_BY)}"
+            )
+        if self._baseline is None:
+            raise ValueError("No baseline snapshot; take one first")
+        stats = self._snapshot().compare_to(self._baseline, group_by)
+        return [
+            {
+                "location": _location(stat.traceback, group_by),
+                "size_bytes": stat.size,
+                "count": stat.count,
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:limit]
+        ]
+
+    def gc_status(self) -> Dict[str, Any]:
+        """Return collector state and per-generation statistics."""
+        return {
+            "enabled": gc.isenabled(),
+            "thresholds": list(gc.get_threshold()),
+            "counts": list(gc.get_count()),
+            "generations": gc.get_stats(),
+            "frozen": gc.get_freeze_count(),
+            "uncollectable": len(gc.garbage),
+        }
+
+    def set_gc_thresholds(self, thresholds: Tuple[int, int, int]) -> None:
+        """
+        Set the collection thresholds of the three generations.
+
+        Raises:
+            ValueError: If a threshold is negative
+        """
+        if any(value < 0 for value in thresholds):
+            raise ValueError("GC thresholds must not be negative")
+        gc.set_threshold(*thresholds)
+
+    def collect(self, generation: int = 2) -> int:
+        """
+        Run a collection and return the number of unreachable objects found.
+
+        Raises:
+            ValueError: If generation is not 0, 1 or 2
+        """
+        if generation not in (0, 1, 2):
+            raise ValueError("Generation must be 0, 1 or 2")
+        return gc.collect(generation)
+
+    def object_counts(self, limit: int = 20) -> List[Tuple[str, int]]:
+        """Return the most common types among objects tracked by the GC."""
+        counts = Counter(
+            f"{type(obj).__module__}.{type(obj).__qualname__}"
+            for obj in gc.get_objects()
+        )
+        return counts.most_common(limit)
@@ -0,0 +1,286 @@
+"""Priority lanes for HTTP requests: interactive, standard and bulk."""
+import asyncio
+import json
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+LANES = ("interactive", "standard", "bulk")
+PRIORITY_HEADER = b"x-priority"
+# Recent queue waits kept per lane for percentiles
+WAIT_SAMPLES = 1024
+
+
+class SchedulerRejectedError(Exception):
+    """Raised when a request cannot be queued or waited too long."""
+
+
+class Lane:
+    """Queue and counters of one priority class."""
+
+    def __init__(self, name: str, weight: int, slo: float):
+        """
+        Initialize lane.
+
+        Args:
+            name: Lane name
+            weight: Share of dispatches relative to other busy lanes
+            slo: Target queue wait in seconds
+        """
+        self.name = name
+        self.weight = weight
+        self.slo = slo
+        self.waiters: Deque[Tuple[asyncio.Future, float]] = deque()
+        self.current = 0  # smooth weighted round-robin credit
+        self.running = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.slo_misses = 0
+        self.waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+
+    def has_waiters(self) -> bool:
+        """Drop abandoned requests from the head and report whether any wait."""
+        while self.waiters and self.waiters[0][0].done():
+            self.waiters.popleft()
+        return bool(self.waiters)
+
+    def oldest_wait(self, now: float) -> float:
+        """Return how long the head of the queue has waited."""
+        return now - self.waiters[0][1] if self.has_waiters() else 0.0
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return queue depth, counters and recent wait percentiles."""
+        waits = sorted(self.waits)
+
+        def percentile(fraction: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(fraction * len(waits)))] * 1000
+
+        return {
+            "weight": self.weight,
+            "slo_ms": self.slo * 1000,
+            "queued": sum(1 for future, _ in self.waiters if not future.done()),
+            "running": self.running,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "slo_misses": self.slo_misses,
+            "wait_p50_ms": percentile(0.5),
+            "wait_p95_ms": percentile(0.95),
+            "wait_max_ms": waits[-1] * 1000 if waits else 0.0,
+        }
+
+
+class RequestScheduler:
+    """
+    Admits requests into a fixed number of slots, lane by lane.
+
+    A request starts at once when a slot is free and its lane has no queue;
+    otherwise it waits in its lane. Freed slots go to busy lanes by smooth
+    weighted round-robin. Standard and bulk requests never take the last
+    ``interactive_reserved`` slots, and while the oldest interactive request
+    has waited longer than its SLO, only interactive requests are started.
+    Requests already running are never interrupted.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 64,
+        weights: Optional[Dict[str, int]] = None,
+        slos: Optional[Dict[str, float]] = None,
+        interactive_reserved: int = 4,
+        max_queue_depth: int = 1000,
+        queue_timeout: float = 30.0,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrent: Requests served at once across all lanes
+            weights: Dispatch weight per lane
+            slos: Target queue wait per lane, in seconds
+            interactive_reserved: Slots only interactive requests may use
+            max_queue_depth: Waiting requests per lane before rejecting
+            queue_timeout: Seconds a request may wait before being rejected
+        """
+        weights = weights or {"interactive": 8, "standard": 3, "bulk": 1}
+        slos = slos or {"interactive": 0.05, "standard": 0.25, "bulk": 2.0}
+        self.max_concurrent = max_concurrent
+        self._lanes = {name: Lane(name, weights[name], slos[name]) for name in LANES}
+        self._reserved = min(interactive_reserved, max_concurrent - 1)
+        self._max_queue_depth = max_queue_depth
+        self._queue_timeout = queue_timeout
+        self.running = 0
+
+    @property
+    def under_pressure(self) -> bool:
+        """Whether interactive requests are waiting longer than their SLO."""
+        interactive = self._lanes["interactive"]
+        now = asyncio.get_running_loop().time()
+        return interactive.oldest_wait(now) > interactive.slo
+
+    async def acquire(self, lane_name: str) -> None:
+        """
+        Wait for a slot in the given lane.
+
+        Raises:
+            SchedulerRejectedError: If the lane's queue is full or the wait times out
+        """
+        lane = self._lanes[lane_name]
+        loop = asyncio.get_running_loop()
+        if not lane.has_waiters() and self._can_start(lane):
+            self._start(lane, 0.0)
+            return
+        if len(lane.waiters) >= self._max_queue_depth:
+            lane.rejected += 1
+            raise SchedulerRejectedError(f"The {lane.name} queue is full")
+
+        future = loop.create_future()
+        entry = (future, loop.time())
+        lane.waiters.append(entry)
+        try:
+            await asyncio.wait_for(future, self._queue_timeout)
+        except BaseException as e:
+            if future.done() and not future.cancelled():
+                self.release(lane_name)  # granted just as the caller gave up
+            elif entry in lane.waiters:
+                lane.waiters.remove(entry)
+                self._dispatch()  # lower lanes may have waited behind this one
+            if isinstance(e, asyncio.TimeoutError):
+                lane.timed_out += 1
+                raise SchedulerRejectedError(
+                    f"Waited over {self._queue_timeout:g}s in the {lane.name} queue"
+                ) from None
+            raise
+
+    def release(self, lane_name: str) -> None:
+        """Free a slot and hand it to the next waiting request."""
+        self.running -= 1
+        self._lanes[lane_name].running -= 1
+        self._dispatch()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return scheduler-wide state and per-lane metrics."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": self.running,
+            "under_pressure": self.under_pressure,
+            "lanes": {name: lane.metrics() for name, lane in self._lanes.items()},
+        }
+
+    def _can_start(self, lane: Lane) -> bool:
+        if lane.name == "interactive":
+            return self.running < self.max_concurrent
+        return (
+            self.running < self.max_concurrent - self._reserved
+            and not self.under_pressure
+        )
+
+    def _start(self, lane: Lane, waited: float) -> None:
+        self.running += 1
+        lane.running += 1
+        lane.admitted += 1
+        lane.waits.append(waited)
+        if waited > lane.slo:
+            lane.slo_misses += 1
+
+    def _dispatch(self) -> None:
+        now = asyncio.get_running_loop().time()
+        while self.running < self.max_concurrent:
+            ready: List[Lane] = [
+                lane
+                for lane in self._lanes.values()
+                if lane.has_waiters() and self._can_start(lane)
+            ]
+            if not ready:
+                return
+            # Smooth weighted round-robin: every busy lane earns its weight,
+            # the richest is served and pays back the total.
+            for lane in ready:
+                lane.current += lane.weight
+            chosen = max(ready, key=lambda lane: lane.current)
+            chosen.current -= sum(lane.weight for lane in ready)
+            future, enqueued = chosen.waiters.popleft()
+            self._start(chosen, now - enqueued)
+            future.set_result(None)
+
+
+class SchedulerMiddleware:
+    """
+    ASGI middleware routing HTTP requests through a RequestScheduler.
+
+    OPTIONS requests (CORS preflights) are never queued.
+    """
+
+    def __init__(
+        self,
+        app,
+        scheduler: RequestScheduler,
+        bulk_routes: Iterable[str] = (),
+        exempt_prefixes: Tuple[str, ...] = ("/health", "/static", "/assets", "/admin"),
+        exempt_suffixes: Tuple[str, ...] = ("/events",),
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            scheduler: Scheduler admitting requests
+            bulk_routes: Path prefixes served in the bulk lane by default
+            exempt_prefixes: Paths never queued (probes, assets, admin)
+            exempt_suffixes: Long-lived streams that would pin a slot
+        """
+        self.app = app
+        self.scheduler = scheduler
+        self.bulk_routes = tuple(bulk_routes)
+        self.exempt_prefixes = exempt_prefixes
+        self.exempt_suffixes = exempt_suffixes
+
+    def lane_for(self, scope) -> str:
+        """Pick the lane from the X-Priority header, else from the route."""
+        for name, value in scope["headers"]:
+            if name == PRIORITY_HEADER:
+                lane = value.decode("latin-1").strip().lower()
+                if lane in LANES:
+                    return lane
+        if scope["path"].startswith(self.bulk_routes):
+            return "bulk"
+        return "standard"
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or path.startswith(self.exempt_prefixes)
+            or path.endswith(self.exempt_suffixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+        lane = self.lane_for(scope)
+        try:
+            await self.scheduler.acquire(lane)
+        except SchedulerRejectedError as e:
+            await self._reject(send, str(e))
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.scheduler.release(lane)
+
+    @staticmethod
+    async def _reject(send, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", b"1"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
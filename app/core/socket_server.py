@@ -0,0 +1,216 @@
+"""
+Binary socket server for co-located callers.
+
+Frames are little-endian and length-prefixed::
+
+    request:  u32 length | u32 id | u8 opcode | u8 count | count x f64
+    response: u32 length | u32 id | u8 status | f64 result or UTF-8 message
+
+``length`` counts the bytes after itself. Status is ``STATUS_OK``,
+``STATUS_ERROR`` (the calculation failed, the message is the one ``/calc``
+returns) or ``STATUS_BAD_REQUEST``. Clients may pipeline: responses come back
+in request order, and the id lets them match responses without relying on it.
+"""
+import asyncio
+import errno
+import os
+import socket
+import struct
+from typing import Dict, Optional, Set, Tuple
+from domain.interfaces.logger import ILogger
+from domain.services.calculator import CalculatorService
+
+OPCODES: Dict[int, str] = {
+    1: "add",
+    2: "subtract",
+    3: "multiply",
+    4: "divide",
+    5: "sqrt",
+    6: "pow",
+    7: "log",
+    8: "exp",
+    9: "sin",
+    10: "cos",
+    11: "tan",
+    12: "factorial",
+}
+STATUS_OK = 0
+STATUS_ERROR = 1
+STATUS_BAD_REQUEST = 2
+
+LENGTH = struct.Struct("<I")
+REQUEST_HEADER = struct.Struct("<IBB")
+RESPONSE_HEADER = struct.Struct("<IB")
+OK_RESPONSE = struct.Struct("<IIBd")
+MAX_OPERANDS = 2
+MAX_REQUEST_BYTES = REQUEST_HEADER.size + 8 * MAX_OPERANDS
+
+
+def error_frame(request_id: int, status: int, message: str) -> bytes:
+    """Encode an error response frame."""
+    body = message.encode()
+    return (
+        LENGTH.pack(RESPONSE_HEADER.size + len(body))
+        + RESPONSE_HEADER.pack(request_id, status)
+        + body
+    )
+
+
+class _CalculatorProtocol(asyncio.Protocol):
+    """One connection; every complete frame of a read is answered in one write."""
+
+    def __init__(self, server: "BinaryCalculatorServer"):
+        self._server = server
+        self._buffer = bytearray()
+        self._transport: Optional[asyncio.Transport] = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport
+        self._server._connections.add(transport)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._server._connections.discard(self._transport)
+
+    def data_received(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+        replies = bytearray()
+        offset = 0
+        while len(buffer) - offset >= LENGTH.size:
+            (length,) = LENGTH.unpack_from(buffer, offset)
+            if length > MAX_REQUEST_BYTES:
+                self._transport.write(bytes(replies))
+                self._transport.write(
+                    error_frame(0, STATUS_BAD_REQUEST, "Frame too large")
+                )
+                self._transport.close()
+                return
+            end = offset + LENGTH.size + length
+            if end > len(buffer):
+                break
+            replies += self._server.handle(buffer[offset + LENGTH.size : end])
+            offset = end
+        del buffer[:offset]
+        if replies:
+            self._transport.write(bytes(replies))
+
+    # Stop reading while the peer is not consuming replies
+    def pause_writing(self) -> None:
+        self._transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        self._transport.resume_reading()
+
+
+def _listening(path: str) -> bool:
+    """Return whether a process accepts connections on the Unix socket."""
+    if not os.path.exists(path):
+        return False
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+class BinaryCalculatorServer:
+    """Serves ``CalculatorService`` over TCP or a Unix domain socket."""
+
+    def __init__(self, calculator: CalculatorService, logger: ILogger):
+        """
+        Initialize server.
+
+        Args:
+            calculator: Service performing every calculation
+            logger: Logger for structured logging
+        """
+        self._calculator = calculator
+        self._logger = logger
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.BaseTransport] = set()
+        self._path: Optional[str] = None
+        self._inode: Optional[Tuple[int, int]] = None
+        self.address: Optional[Tuple] = None
+
+    def handle(self, frame: bytes) -> bytes:
+        """Answer one request frame (without its length prefix)."""
+        if len(frame) < REQUEST_HEADER.size:
+            return error_frame(0, STATUS_BAD_REQUEST, "Truncated request")
+        request_id, opcode, count = REQUEST_HEADER.unpack_from(frame)
+        if len(frame) != REQUEST_HEADER.size + 8 * count:
+            return error_frame(
+                request_id, STATUS_BAD_REQUEST, "Length does not match operand count"
+            )
+        name = OPCODES.get(opcode)
+        if name is None:
+            return error_frame(
+                request_id, STATUS_BAD_REQUEST, f"Unknown opcode {opcode}"
+            )
+        if count == 0:
+            return error_frame(request_id, STATUS_BAD_REQUEST, "Missing operands")
+        operands = struct.unpack_from(f"<{count}d", frame, REQUEST_HEADER.size)
+        outcome = self._calculator.try_calculate(name, *operands)
+        if outcome.error is not None:
+            return error_frame(request_id, STATUS_ERROR, outcome.message)
+        return OK_RESPONSE.pack(
+            OK_RESPONSE.size - LENGTH.size, request_id, STATUS_OK, outcome.value
+        )
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None
+    ) -> None:
+        """
+        Start listening on a Unix socket if ``path`` is given, else on TCP.
+
+        TCP uses ``SO_REUSEPORT`` where available so every uvicorn worker can
+        bind the same port and the kernel spreads connections between them.
+        A Unix socket has no such sharing, so binding a path another process
+        is listening on fails instead of replacing its socket.
+
+        Raises:
+            OSError: If another server is listening on ``path``
+        """
+        loop = asyncio.get_running_loop()
+        if path:
+            if _listening(path):
+                raise OSError(
+                    errno.EADDRINUSE, f"A server is already listening on {path}"
+                )
+            self._server = await loop.create_unix_server(
+                lambda: _CalculatorProtocol(self), path
+            )
+            stat = os.stat(path)
+            self._path = path
+            self._inode = (stat.st_dev, stat.st_ino)
+            self.address = (path,)
+        else:
+            self._server = await loop.create_server(
+                lambda: _CalculatorProtocol(self),
+                host,
+                port,
+                reuse_port=hasattr(socket, "SO_REUSEPORT"),
+            )
+            self.address = self._server.sockets[0].getsockname()
+        self._logger.info("Binary socket server listening", address=str(self.address))
+
+    async def stop(self) -> None:
+        """Stop listening and close open connections."""
+        if self._server is None:
+            return
+        self._server.close()
+        for transport in list(self._connections):
+            transport.close()
+        await self._server.wait_closed()
+        self._server = None
+        if self._path:
+            # Only remove the socket file this server created
+            try:
+                stat = os.stat(self._path)
+                if (stat.st_dev, stat.st_ino) == self._inode:
+                    os.unlink(self._path)
+            except FileNotFoundError:
+                pass
+            self._path = self._inode = None
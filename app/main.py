@@ -1,21 +1,75 @@
 """FastAPI application entry point."""
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 from app.core.config import settings
-from app.api.endpoints import calculator
-from domain.models.response import HealthResponse
+from app.api.endpoints import (
+    calculator,
+    graph,
+    integer,
+    jobs,
+    numeric,
+    polynomial,
+    scientific,
+    streams,
+    tensor,
+)
+from app.core.dependencies import (
+    get_binary_server,
+    get_bulk_job_service,
+    get_load_monitor,
+    get_numeric_job_service,
+    get_request_scheduler,
+    get_simulation_service,
+)
+from app.core.assets import AssetPipeline
+from app.core.load import InFlightMiddleware
+from app.core.scheduler import SchedulerMiddleware
+from domain.models.response import (
+    HealthResponse,
+    LoadCheck,
+    ReadinessResponse,
+    SchedulerResponse,
+)
+
+_monitor = get_load_monitor()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the load monitor and optional socket server with the application."""
+    _monitor.start()
+    if settings.socket_enabled:
+        await get_binary_server().start(
+            settings.socket_host, settings.socket_port, settings.socket_path
+        )
+    yield
+    await get_binary_server().stop()
+    await anyio.to_thread.run_sync(get_simulation_service().shutdown)
+    await anyio.to_thread.run_sync(get_bulk_job_service().shutdown)
+    await anyio.to_thread.run_sync(get_numeric_job_service().shutdown)
+    await _monitor.stop()
+
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="A calculator API with SOLID design principles",
+    lifespan=lifespan,
 )
 
-# Add CORS middleware
+# Middleware added later wraps the earlier ones. CORS wraps the scheduler,
+# so preflights are answered without queueing and 503s carry CORS headers.
+if settings.scheduler_enabled:
+    app.add_middleware(
+        SchedulerMiddleware,
+        scheduler=get_request_scheduler(),
+        bulk_routes=settings.scheduler_bulk_routes,
+    )
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Allows all origins
@@ -23,25 +77,59 @@ app.add_middleware(
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
 )
+app.add_middleware(InFlightMiddleware, monitor=_monitor)
 
 # Include routers
 app.include_router(calculator.router, tags=["calculator"])
+app.include_router(scientific.router, tags=["scientific"])
+app.include_router(jobs.router, tags=["jobs"])
+app.include_router(numeric.router, tags=["jobs"])
+app.include_router(tensor.router, tags=["tensor"])
+app.include_router(polynomial.router, tags=["polynomial"])
+app.include_router(graph.router, tags=["graph"])
+app.include_router(integer.router, tags=["integer"])
+app.include_router(streams.router, tags=["streams"])
+if settings.stats_enabled:
+    from app.api.endpoints import stats
+
+    app.include_router(stats.router, tags=["stats"])
+if settings.diagnostics_enabled:
+    from app.api.endpoints import diagnostics
+
+    app.include_router(diagnostics.router, tags=["diagnostics"])
 
 # Mount static files
 static_path = Path(__file__).parent / "static"
 if static_path.exists():
     app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
+# Fingerprinted, precompressed copies of the UI held in memory
+assets = AssetPipeline(static_path)
+
 
 @app.get("/", include_in_schema=False)
-async def root():
-    """Serve the calculator UI."""
-    static_file = static_path / "index.html"
-    if static_file.exists():
-        return FileResponse(static_file)
+async def root(request: Request):
+    """Serve the calculator UI from memory."""
+    if assets.index is not None:
+        return assets.index.respond(
+            request.headers.get("accept-encoding", ""),
+            request.headers.get("if-none-match"),
+        )
     return {"message": "FastAPI Calculator API", "docs": "/docs"}
 
 
+@app.get("/assets/{name}", include_in_schema=False)
+async def asset(name: str, request: Request) -> Response:
+    """Serve a fingerprinted asset with immutable caching."""
+    found = assets.get(name)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    return found.respond(
+        request.headers.get("accept-encoding", ""),
+        request.headers.get("if-none-match"),
+    )
+
+
 @app.get("/health", response_model=HealthResponse, tags=["health"])
 async def health_check() -> HealthResponse:
     """Health check endpoint."""
@@ -50,3 +138,59 @@ async def health_check() -> HealthResponse:
         service="calculator",
         version=settings.app_version,
     )
+
+
+@app.get("/health/live", response_model=HealthResponse, tags=["health"])
+async def liveness() -> HealthResponse:
+    """Liveness probe: the process is up and its event loop responds."""
+    return HealthResponse(
+        status="alive",
+        service="calculator",
+        version=settings.app_version,
+    )
+
+
+@app.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    tags=["health"],
+    responses={503: {"model": ReadinessResponse}},
+)
+async def readiness(response: Response) -> ReadinessResponse:
+    """
+    Readiness probe reflecting current load.
+
+    Returns 503 when any signal exceeds its threshold so load balancers
+    shift traffic away before latency collapses. Every signal is a counter
+    read, cheap enough to poll every 100ms.
+    """
+    thread_backlog = (
+        anyio.to_thread.current_default_thread_limiter().statistics().tasks_waiting
+    )
+    signals = {
+        "loop_lag_ms": (_monitor.loop_lag * 1000, settings.health_max_loop_lag_ms),
+        "in_flight": (_monitor.in_flight, settings.health_max_in_flight),
+        "executor_backlog": (
+            thread_backlog + get_bulk_job_service().backlog(),
+            settings.health_max_executor_backlog,
+        ),
+    }
+    checks = {
+        name: LoadCheck(value=value, threshold=threshold, ok=value <= threshold)
+        for name, (value, threshold) in signals.items()
+    }
+    ready = all(check.ok for check in checks.values())
+    if not ready:
+        response.status_code = 503
+    return ReadinessResponse(status="ready" if ready else "not_ready", checks=checks)
+
+
+@app.get("/health/scheduler", response_model=SchedulerResponse, tags=["health"])
+async def scheduler_metrics() -> SchedulerResponse:
+    """
+    Per-lane queue depth and wait times of the request scheduler.
+
+    Requests pick a lane with ``X-Priority: interactive|standard|bulk``;
+    without the header, bulk routes use the bulk lane and the rest standard.
+    """
+    return SchedulerResponse(**get_request_scheduler().metrics())
@@ -0,0 +1,23 @@
+"""Server launcher applying the configured tuning profile."""
+import os
+import uvicorn
+from app.core.config import settings
+
+# BLAS libraries read these once at load time, so they must be set before
+# any worker imports NumPy.
+BLAS_THREAD_VARIABLES = (
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OMP_NUM_THREADS",
+)
+
+
+def main() -> None:
+    """Run uvicorn with the options of the active server profile."""
+    for variable in BLAS_THREAD_VARIABLES:
+        os.environ.setdefault(variable, str(settings.tensor_max_threads))
+    uvicorn.run("app.main:app", **settings.uvicorn_options())
+
+
+if __name__ == "__main__":
+    main()
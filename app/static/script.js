@@ -35,6 +35,7 @@ form.addEventListener('submit', async (e) => {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
+                'X-Priority': 'interactive',
             },
             body: JSON.stringify({
                 operation: operation,
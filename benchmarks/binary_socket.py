@@ -0,0 +1,142 @@
+"""
+Binary socket protocol versus POST /calc.
+
+Runs ``app.main:app`` with uvicorn and the binary socket server (over TCP
+and a Unix socket) in background threads of this process, then measures:
+
+- latency: one call at a time, reporting p50 and p99 round trips
+- throughput: ``--concurrency`` callers at once; HTTP spreads them over a
+  keep-alive pool, the socket client pipelines them on one connection
+
+The server logs every calculation on both paths, so the difference is the
+transport: HTTP parsing, headers and Pydantic validation versus a fixed
+22-byte frame.
+
+Usage:
+    python -m benchmarks.binary_socket --calls 5000 --concurrency 64
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import tempfile
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+from app.core.dependencies import get_calculator_service, get_logger
+from app.core.socket_server import BinaryCalculatorServer
+from benchmarks.client import _server as _http_server
+from client import BinaryCalculatorClient
+
+Call = Callable[[int], Awaitable[float]]
+
+
+@contextlib.contextmanager
+def _socket_servers(path: str):
+    """Serve the socket protocol on TCP and ``path`` from a background loop."""
+    loop = asyncio.new_event_loop()
+    servers = [
+        BinaryCalculatorServer(get_calculator_service(), get_logger()) for _ in range(2)
+    ]
+    ready = threading.Event()
+
+    def serve() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(servers[0].start("127.0.0.1", 0))
+        loop.run_until_complete(servers[1].start(path=path))
+        ready.set()
+        loop.run_forever()
+        for server in servers:
+            loop.run_until_complete(server.stop())
+        loop.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    ready.wait()
+    try:
+        yield servers[0].address[:2]
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+
+async def _measure(call: Call, calls: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    for i in range(calls):
+        started = time.perf_counter()
+        await call(i)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(i: int) -> None:
+        async with semaphore:
+            await call(i)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(limited(i) for i in range(calls)))
+    elapsed = time.perf_counter() - started
+    return {
+        "p50": latencies[len(latencies) // 2] * 1e6,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1e6,
+        "throughput": calls / elapsed,
+    }
+
+
+async def _http(base_url: str, calls: int, concurrency: int) -> Dict[str, float]:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as http:
+
+        async def call(i: int) -> float:
+            response = await http.post(
+                "/calc", json={"operation": "add", "x": i, "y": 1}
+            )
+            response.raise_for_status()
+            return response.json()["result"]
+
+        return await _measure(call, calls, concurrency)
+
+
+async def _binary(calls: int, concurrency: int, **address) -> Dict[str, float]:
+    async with BinaryCalculatorClient(**address) as calc:
+        return await _measure(lambda i: calc.calculate("add", i, 1), calls, concurrency)
+
+
+def run(calls: int, concurrency: int) -> None:
+    """Print round-trip latency and throughput for each transport."""
+    path = os.path.join(tempfile.mkdtemp(), "calc.sock")
+    # The structured logger prints every calculation; keep the table readable
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        with _http_server() as base_url, _socket_servers(path) as (host, port):
+            results = {
+                "http": asyncio.run(_http(base_url, calls, concurrency)),
+                "tcp": asyncio.run(_binary(calls, concurrency, host=host, port=port)),
+                "unix": asyncio.run(_binary(calls, concurrency, path=path)),
+            }
+
+    print(
+        f"{'transport':<10} {'p50 us':>8} {'p99 us':>8} {'calls/s':>10} "
+        f"{'speedup':>8}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<10} {result['p50']:>8.0f} {result['p99']:>8.0f} "
+            f"{result['throughput']:>10.0f} "
+            f"{result['throughput'] / results['http']['throughput']:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    run(args.calls, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
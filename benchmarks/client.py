@@ -0,0 +1,114 @@
+"""
+Naive versus pooled versus batched client usage.
+
+Runs ``app.main:app`` with uvicorn in a background thread of this process
+and performs the same calculations three ways:
+
+- naive: a new connection per call (``httpx.post``), as ad-hoc code does
+- pooled: ``CalculatorClient`` reusing keep-alive connections
+- batched: ``AsyncCalculatorClient`` with auto-batching, concurrent callers
+
+The local memo cache is disabled so every call reaches the server.
+
+Usage:
+    python -m benchmarks.client --calls 2000
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import socket
+import threading
+import time
+
+import httpx
+import uvicorn
+
+from client import AsyncCalculatorClient, CalculatorClient
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def _server():
+    port = _free_port()
+    config = uvicorn.Config("app.main:app", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def _naive(base_url: str, calls: int) -> None:
+    for i in range(calls):
+        response = httpx.post(
+            f"{base_url}/calc", json={"operation": "add", "x": i, "y": 1}
+        )
+        response.raise_for_status()
+
+
+def _pooled(base_url: str, calls: int) -> None:
+    with CalculatorClient(base_url, cache_size=0) as calc:
+        for i in range(calls):
+            calc.calculate("add", i, 1)
+
+
+async def _batched(base_url: str, calls: int, concurrency: int) -> None:
+    async with AsyncCalculatorClient(
+        base_url, cache_size=0, batch_window=0.002, max_parallel_batches=4
+    ) as calc:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(i: int) -> None:
+            async with semaphore:
+                await calc.calculate("add", i, 1)
+
+        await asyncio.gather(*(call(i) for i in range(calls)))
+
+
+def run(calls: int, concurrency: int) -> None:
+    """Print calls/second for each usage pattern."""
+    timings = {}
+    # The structured logger prints every calculation; keep the table readable
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        with _server() as base_url:
+            for name, function in (
+                ("naive", lambda: _naive(base_url, calls)),
+                ("pooled", lambda: _pooled(base_url, calls)),
+                (
+                    "batched",
+                    lambda: asyncio.run(_batched(base_url, calls, concurrency)),
+                ),
+            ):
+                started = time.perf_counter()
+                function()
+                timings[name] = time.perf_counter() - started
+
+    print(f"{'mode':<10} {'calls/s':>10} {'speedup':>8}")
+    for name, seconds in timings.items():
+        print(
+            f"{name:<10} {calls / seconds:>10.0f} "
+            f"{timings['naive'] / seconds:>7.1f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=256)
+    args = parser.parse_args()
+    run(args.calls, args.concurrency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Raising versus result-returning error path for calculations.
+
+Replays a mix of valid calls, invalid operation names and zero divisors
+through two implementations of the same behaviour:
+
+- raise: the previous path; the factory and ``DivideOperation`` raise
+  ``ValueError``, the service logs and re-raises, and the handler turns it
+  into ``HTTPException``
+- result: ``try_calculate`` returns an error code and the handler serves a
+  pre-encoded body
+
+Both are measured in the service alone (per call) and behind a bare FastAPI
+app over an in-process ASGI transport (per request). A no-op logger keeps
+log formatting, which both paths do identically, out of the numbers.
+
+Usage:
+    python -m benchmarks.error_path --calls 20000 --error-rates 0.05,0.5,1
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from fastapi import FastAPI, HTTPException, Response
+
+from app.core.errors import error_response
+from domain.interfaces.logger import ILogger
+from domain.models.request import CalculationRequest
+from domain.models.response import CalculationResponse
+from domain.operations.factory import OperationFactory
+from domain.services.calculator import CalculatorService
+
+Call = Tuple[str, float, float]
+
+
+class _NullLogger(ILogger):
+    def info(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    def warning(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    def error(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    def debug(self, message: str, **kwargs: Any) -> None:
+        pass
+
+
+def _raising_calculate(
+    factory: OperationFactory, logger: ILogger, name: str, x: float, y: Optional[float]
+) -> float:
+    """The service's calculate as it was before the result path."""
+    logger.info("Calculation requested", operation=name, x=x, y=y)
+    try:
+        operation = factory.get_operation(name)
+        if y is None and operation.arity == 2:
+            raise ValueError(f"Operation {operation.name} requires two operands")
+        result = operation.execute(x, y)
+        logger.info("Calculation completed", operation=name, x=x, y=y, result=result)
+        return result
+    except ValueError as e:
+        logger.error("Calculation failed", operation=name, x=x, y=y, error=str(e))
+        raise
+
+
+def _traffic(calls: int, error_rate: float) -> List[Call]:
+    rng = random.Random(42)
+    traffic = []
+    for i in range(calls):
+        if rng.random() >= error_rate:
+            traffic.append((rng.choice(["add", "divide"]), float(i), 3.0))
+        elif rng.random() < 0.5:
+            traffic.append(("modulo", float(i), 3.0))
+        else:
+            traffic.append(("divide", float(i), 0.0))
+    return traffic
+
+
+def _per_call(
+    function: Callable[[Call], object], traffic: List[Call], rounds: int
+) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for call in traffic:
+            function(call)
+        best = min(best, time.perf_counter() - started)
+    return best / len(traffic)
+
+
+def _service(traffic: List[Call], rounds: int) -> Dict[str, float]:
+    factory = OperationFactory()
+    logger = _NullLogger()
+    service = CalculatorService(factory, logger)
+
+    def raising(call: Call) -> object:
+        try:
+            return _raising_calculate(factory, logger, *call)
+        except ValueError as e:
+            return HTTPException(status_code=400, detail=str(e))
+
+    def result(call: Call) -> object:
+        return service.try_calculate(*call)
+
+    return {
+        "raise": _per_call(raising, traffic, rounds),
+        "result": _per_call(result, traffic, rounds),
+    }
+
+
+def _app() -> FastAPI:
+    factory = OperationFactory()
+    logger = _NullLogger()
+    service = CalculatorService(factory, logger)
+
+    async def raising_handler(request: CalculationRequest) -> CalculationResponse:
+        try:
+            result = _raising_calculate(
+                factory, logger, request.operation, request.x, request.y
+            )
+            return CalculationResponse(
+                operation=request.operation, x=request.x, y=request.y, result=result
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    # Same as POST /calc, but with the no-op logger
+    async def result_handler(request: CalculationRequest) -> Response:
+        outcome = service.try_calculate(request.operation, request.x, request.y)
+        if outcome.error is not None:
+            return error_response(outcome)
+        return CalculationResponse(
+            operation=request.operation, x=request.x, y=request.y, result=outcome.value
+        )
+
+    app = FastAPI()
+    app.add_api_route(
+        "/raise", raising_handler, methods=["POST"], response_model=CalculationResponse
+    )
+    app.add_api_route(
+        "/result", result_handler, methods=["POST"], response_model=CalculationResponse
+    )
+    return app
+
+
+async def _http(traffic: List[Call], rounds: int) -> Dict[str, float]:
+    transport = httpx.ASGITransport(app=_app())
+    timings = {"raise": float("inf"), "result": float("inf")}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        # Alternate the paths so drift in machine load affects both alike
+        for _ in range(rounds):
+            for path in timings:
+                started = time.perf_counter()
+                for operation, x, y in traffic:
+                    await http.post(
+                        f"/{path}", json={"operation": operation, "x": x, "y": y}
+                    )
+                timings[path] = min(timings[path], time.perf_counter() - started)
+    return {path: elapsed / len(traffic) for path, elapsed in timings.items()}
+
+
+def run(calls: int, error_rates: List[float], rounds: int) -> None:
+    """Print microseconds per call (best of ``rounds``) for each path."""
+    print(
+        f"{'errors':>7} {'layer':<8} {'raise us':>9} {'result us':>10} "
+        f"{'speedup':>8}"
+    )
+    for error_rate in error_rates:
+        traffic = _traffic(calls, error_rate)
+        layers = {
+            "service": _service(traffic, rounds),
+            # The HTTP layer is slower; a tenth of the calls is enough
+            "http": asyncio.run(_http(traffic[: max(1, calls // 10)], rounds)),
+        }
+        for layer, timings in layers.items():
+            print(
+                f"{error_rate:>7.0%} {layer:<8} {timings['raise'] * 1e6:>9.2f} "
+                f"{timings['result'] * 1e6:>10.2f} "
+                f"{timings['raise'] / timings['result']:>7.2f}x"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--error-rates", default="0.05,0.5,1")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    run(
+        args.calls,
+        [float(rate) for rate in args.error_rates.split(",")],
+        args.rounds,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,484 @@
+"""
+Replay recorded production traffic from StructuredLogger output.
+
+Reads the "Calculation requested" log lines, pairs each with its
+"Calculation completed" or "Calculation failed" line, and re-issues the
+calls as ``POST /calc`` against ``app.main:app`` in-process or against a
+running server. Calls are sent at their recorded arrival times (optionally
+sped up or slowed down) or as fast as the concurrency limit allows. The
+report compares replayed latencies with the recorded service times and
+replayed results with the recorded ones.
+
+Logs are parsed as a stream: memory stays constant however long the log is.
+
+Usage:
+    python -m benchmarks.replay calculator.log --speed original
+    python -m benchmarks.replay calculator.log.gz --speed 10 --url http://host:8000
+    python -m benchmarks.replay calculator.log --speed max --output after.json \\
+        --baseline before.json
+"""
+import argparse
+import asyncio
+import contextlib
+import gzip
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import httpx
+
+REQUESTED = "Calculation requested"
+COMPLETED = "Calculation completed"
+FAILED = "Calculation failed"
+
+CallKey = Tuple[str, float, Optional[float]]
+
+
+def _timestamp(value: str) -> float:
+    """Convert a logger timestamp (UTC ISO 8601 with Z) to epoch seconds."""
+    parsed = datetime.fromisoformat(value.rstrip("Z"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _operand(value) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+class RecordedCall:
+    """A calculation reconstructed from the log, with its recorded outcome."""
+
+    __slots__ = ("timestamp", "operation", "x", "y", "result", "error", "finished_at")
+
+    def __init__(self, timestamp: float, operation: str, x: float, y: Optional[float]):
+        self.timestamp = timestamp
+        self.operation = operation
+        self.x = x
+        self.y = y
+        self.result: Optional[float] = None
+        self.error: Optional[str] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def key(self) -> CallKey:
+        return self.operation, self.x, self.y
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the recorded outcome was found in the log."""
+        return self.finished_at is not None
+
+    @property
+    def service_time(self) -> Optional[float]:
+        """Seconds between the recorded request and outcome lines."""
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.timestamp
+
+
+def read_calls(lines: Iterable[str], window: int = 10_000) -> Iterator[RecordedCall]:
+    """
+    Reconstruct the call stream from structured log lines.
+
+    Outcomes are matched to the oldest pending request with the same
+    operation and operands, so logs from several workers may interleave.
+    Calls are yielded in request order once their outcome is known; a call
+    still unresolved after ``window`` newer requests is yielded without one.
+    Lines that are not calculation log entries are skipped.
+
+    Args:
+        lines: Log lines, e.g. an open file
+        window: Largest number of calls held while waiting for outcomes
+
+    Yields:
+        Calls in the order they were requested
+    """
+    pending: Deque[RecordedCall] = deque()
+    waiting: Dict[CallKey, Deque[RecordedCall]] = {}
+
+    for line in lines:
+        line = line.strip()
+        if not line.startswith("{"):
+            continue
+        try:
+            entry = json.loads(line)
+            message = entry.get("message")
+            if message == REQUESTED:
+                call = RecordedCall(
+                    _timestamp(entry["timestamp"]),
+                    str(entry["operation"]),
+                    float(entry["x"]),
+                    _operand(entry.get("y")),
+                )
+                pending.append(call)
+                waiting.setdefault(call.key, deque()).append(call)
+            elif message in (COMPLETED, FAILED):
+                key = (
+                    str(entry["operation"]),
+                    float(entry["x"]),
+                    _operand(entry.get("y")),
+                )
+                calls = waiting.get(key)
+                if calls:
+                    call = calls.popleft()
+                    if not calls:
+                        del waiting[key]
+                    call.result = _operand(entry.get("result"))
+                    call.error = entry.get("error")
+                    call.finished_at = _timestamp(entry["timestamp"])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            continue
+
+        while pending and (pending[0].resolved or len(pending) > window):
+            call = pending.popleft()
+            if not call.resolved:
+                calls = waiting[call.key]
+                calls.popleft()
+                if not calls:
+                    del waiting[call.key]
+            yield call
+
+    yield from pending
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (about 5% resolution, fixed memory)."""
+
+    BUCKETS_PER_DECADE = 50
+    MIN_SECONDS = 1e-6
+    DECADES = 8  # 1 µs to 100 s
+
+    def __init__(self):
+        self.buckets = [0] * (self.BUCKETS_PER_DECADE * self.DECADES + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if seconds <= self.MIN_SECONDS:
+            index = 0
+        else:
+            index = math.ceil(
+                math.log10(seconds / self.MIN_SECONDS) * self.BUCKETS_PER_DECADE
+            )
+        self.buckets[min(index, len(self.buckets) - 1)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Return the bucket upper bound below which ``fraction`` falls."""
+        if self.count == 0:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                bound = self.MIN_SECONDS * 10 ** (index / self.BUCKETS_PER_DECADE)
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Return count, mean and percentiles in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": 1000 * self.total / self.count if self.count else 0.0,
+            "p50_ms": 1000 * self.percentile(0.50),
+            "p90_ms": 1000 * self.percentile(0.90),
+            "p99_ms": 1000 * self.percentile(0.99),
+            "p999_ms": 1000 * self.percentile(0.999),
+            "max_ms": 1000 * self.max,
+        }
+
+
+def _same_outcome(call: RecordedCall, result: Optional[float], error: Optional[str]):
+    if call.error is not None or error is not None:
+        return call.error == error
+    if call.result is None or result is None:
+        return call.result is result
+    if math.isnan(call.result) and math.isnan(result):
+        return True
+    return math.isclose(call.result, result, rel_tol=1e-12, abs_tol=0.0)
+
+
+class ReplayReport:
+    """Latency distributions and result equivalence of a replay."""
+
+    MAX_EXAMPLES = 10
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.recorded_service_time = LatencyHistogram()
+        self.schedule_lag = LatencyHistogram()
+        self.replayed = 0
+        self.matched = 0
+        self.mismatched = 0
+        self.unverified = 0
+        self.transport_errors = 0
+        self.statuses: Dict[int, int] = {}
+        self.mismatches: List[dict] = []
+        self.duration = 0.0
+        self.recorded_duration = 0.0
+
+    def add(
+        self,
+        call: RecordedCall,
+        latency: float,
+        status: int,
+        result: Optional[float],
+        error: Optional[str],
+    ) -> None:
+        """Record the outcome of one replayed call."""
+        self.replayed += 1
+        self.latency.record(latency)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if not call.resolved:
+            self.unverified += 1
+            return
+        self.recorded_service_time.record(max(0.0, call.service_time))
+        if _same_outcome(call, result, error):
+            self.matched += 1
+            return
+        self.mismatched += 1
+        if len(self.mismatches) < self.MAX_EXAMPLES:
+            self.mismatches.append(
+                {
+                    "operation": call.operation,
+                    "x": call.x,
+                    "y": call.y,
+                    "recorded": call.error if call.error is not None else call.result,
+                    "replayed": error if error is not None else result,
+                }
+            )
+
+    def to_dict(self) -> dict:
+        """Return the report as JSON-serializable data."""
+        return {
+            "replayed": self.replayed,
+            "matched": self.matched,
+            "mismatched": self.mismatched,
+            "unverified": self.unverified,
+            "transport_errors": self.transport_errors,
+            "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+            "duration_s": self.duration,
+            "recorded_duration_s": self.recorded_duration,
+            "throughput_per_s": self.replayed / self.duration if self.duration else 0,
+            "latency": self.latency.summary(),
+            "recorded_service_time": self.recorded_service_time.summary(),
+            "schedule_lag": self.schedule_lag.summary(),
+            "mismatch_examples": self.mismatches,
+        }
+
+
+async def _send(
+    client: httpx.AsyncClient, call: RecordedCall, report: ReplayReport
+) -> None:
+    payload = {"operation": call.operation, "x": call.x}
+    if call.y is not None:
+        payload["y"] = call.y
+    started = time.perf_counter()
+    try:
+        response = await client.post("/calc", json=payload)
+    except httpx.HTTPError:
+        report.transport_errors += 1
+        return
+    latency = time.perf_counter() - started
+
+    result = error = None
+    try:
+        body = response.json()
+    except ValueError:
+        body = {}
+    if response.status_code == 200:
+        result = body.get("result")
+    else:
+        detail = body.get("detail", response.text)
+        error = detail if isinstance(detail, str) else json.dumps(detail)
+    report.add(call, latency, response.status_code, result, error)
+
+
+async def replay(
+    calls: Iterable[RecordedCall],
+    client: httpx.AsyncClient,
+    speed: Optional[float] = 1.0,
+    concurrency: int = 64,
+) -> ReplayReport:
+    """
+    Re-issue recorded calls and compare them with the recording.
+
+    Calls are scheduled open-loop at their recorded offsets divided by
+    ``speed``; when ``concurrency`` calls are already in flight the next one
+    waits, which shows up as schedule lag.
+
+    Args:
+        calls: Recorded calls in request order
+        client: HTTP client whose base URL points at the target
+        speed: Time compression factor (2 replays twice as fast); None sends
+            every call as soon as a concurrency slot is free
+        concurrency: Largest number of calls in flight
+
+    Returns:
+        Replay report
+    """
+    report = ReplayReport()
+    slots = asyncio.Semaphore(concurrency)
+    tasks = set()
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    first = last = None
+
+    async def run(call: RecordedCall) -> None:
+        try:
+            await _send(client, call, report)
+        finally:
+            slots.release()
+
+    for call in calls:
+        if first is None:
+            first = call.timestamp
+        last = call.timestamp
+        due = started
+        if speed is not None:
+            due += (call.timestamp - first) / speed
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await slots.acquire()
+        if speed is not None:
+            report.schedule_lag.record(max(0.0, loop.time() - due))
+        task = asyncio.create_task(run(call))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    report.duration = loop.time() - started
+    if first is not None:
+        report.recorded_duration = last - first
+    return report
+
+
+def _open_log(path: str) -> TextIO:
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _speed(value: str) -> Optional[float]:
+    if value == "max":
+        return None
+    if value == "original":
+        return 1.0
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive")
+    return speed
+
+
+def _client(url: Optional[str], concurrency: int) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=concurrency)
+    if url:
+        return httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0)
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://replay")
+
+
+async def _run(args: argparse.Namespace) -> ReplayReport:
+    with _open_log(args.log) as log:
+        calls: Iterable[RecordedCall] = read_calls(log, window=args.window)
+        if args.limit:
+            calls = itertools.islice(calls, args.limit)
+        async with _client(args.url, args.concurrency) as client:
+            return await replay(calls, client, args.speed, args.concurrency)
+
+
+def _print_report(data: dict, baseline: Optional[dict]) -> None:
+    print(
+        f"replayed {data['replayed']} calls in {data['duration_s']:.2f}s "
+        f"(recorded span {data['recorded_duration_s']:.2f}s, "
+        f"{data['throughput_per_s']:.0f}/s)"
+    )
+    print(
+        f"results: {data['matched']} matched, {data['mismatched']} mismatched, "
+        f"{data['unverified']} without recorded outcome, "
+        f"{data['transport_errors']} transport errors"
+    )
+    columns = ("p50_ms", "p90_ms", "p99_ms", "p999_ms", "max_ms")
+    print(f"{'ms':<22}" + "".join(f"{name[:-3]:>10}" for name in columns))
+    rows = [
+        ("replay latency", data["latency"]),
+        ("recorded service", data["recorded_service_time"]),
+    ]
+    if data["schedule_lag"]["count"]:
+        rows.append(("schedule lag", data["schedule_lag"]))
+    if baseline is not None:
+        rows.append(("baseline latency", baseline["latency"]))
+    for label, summary in rows:
+        print(f"{label:<22}" + "".join(f"{summary[c]:>10.3f}" for c in columns))
+    if baseline is not None:
+        print(
+            f"{'change vs baseline':<22}"
+            + "".join(
+                f"{_change(baseline['latency'][c], data['latency'][c]):>10}"
+                for c in columns
+            )
+        )
+    for example in data["mismatch_examples"]:
+        print(f"mismatch: {example}")
+
+
+def _change(before: float, after: float) -> str:
+    if before == 0:
+        return "n/a"
+    return f"{100 * (after - before) / before:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("log", help="Logger output (.gz allowed, - for stdin)")
+    parser.add_argument("--url", help="Target server (default: in-process app)")
+    parser.add_argument(
+        "--speed",
+        type=_speed,
+        default=1.0,
+        help="original, max or a time compression factor (default: original)",
+    )
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--limit", type=int, help="Replay only the first N calls")
+    parser.add_argument("--window", type=int, default=10_000)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report of an earlier replay")
+    args = parser.parse_args()
+
+    # In-process, the app logs every calculation; keep the report readable
+    with open(os.devnull, "w") as devnull:
+        quiet = contextlib.redirect_stdout(devnull)
+        with contextlib.nullcontext() if args.url else quiet:
+            report = asyncio.run(_run(args))
+
+    data = report.to_dict()
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+    _print_report(data, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(data, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Hit latency of the result caches versus recomputation.
+
+Measures, per lookup, the cost of executing the operation strategy,
+a hit in the per-process dict cache, and a hit in the shared
+memory-mapped cache, plus the shared cache's miss-and-insert path.
+
+Usage:
+    python -m benchmarks.result_cache --keys 10000 --rounds 20
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from domain.operations.factory import OperationFactory
+from domain.services.cache import LocalResultCache, SharedResultCache
+
+Key = Tuple[str, float, float]
+
+
+def _time_per_call(
+    function: Callable[[Key], object], keys: List[Key], rounds: int
+) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for key in keys:
+            function(key)
+    return (time.perf_counter() - started) / (rounds * len(keys))
+
+
+def run(key_count: int, rounds: int, slots: int) -> None:
+    """Print nanoseconds per call for each strategy."""
+    factory = OperationFactory()
+    rng = random.Random(42)
+    operations = ["add", "divide", "pow"]
+    keys = [
+        (rng.choice(operations), float(rng.randint(1, 50)), float(rng.randint(1, 12)))
+        for _ in range(key_count)
+    ]
+
+    local = LocalResultCache(max_entries=slots)
+    with tempfile.TemporaryDirectory() as directory:
+        shared = SharedResultCache(str(Path(directory) / "cache"), slots=slots)
+        insert_ns = _time_per_call(
+            lambda k: shared.put(*k, factory.get_operation(k[0]).execute(k[1], k[2])),
+            keys,
+            1,
+        )
+        for op, x, y in keys:
+            local.put(op, x, y, factory.get_operation(op).execute(x, y))
+
+        results = {
+            "recompute": _time_per_call(
+                lambda k: factory.get_operation(k[0]).execute(k[1], k[2]), keys, rounds
+            ),
+            "local dict hit": _time_per_call(lambda k: local.get(*k), keys, rounds),
+            "shared mmap hit": _time_per_call(lambda k: shared.get(*k), keys, rounds),
+            "shared miss+insert": insert_ns,
+        }
+        shared.close()
+
+    print(f"{'strategy':<20} {'ns/call':>10}")
+    for name, seconds in results.items():
+        print(f"{name:<20} {seconds * 1e9:>10.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--slots", type=int, default=65536)
+    args = parser.parse_args()
+    run(args.keys, args.rounds, args.slots)
+
+
+if __name__ == "__main__":
+    main()
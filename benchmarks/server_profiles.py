@@ -0,0 +1,144 @@
+"""
+Throughput matrix for the server tuning profiles.
+
+Starts the application once per profile with ``python -m app.server`` and
+drives the calculator endpoints with a fixed number of concurrent
+keep-alive clients, then prints requests/second and latency percentiles.
+
+Usage:
+    python -m benchmarks.server_profiles --duration 10 --concurrency 64
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+from app.core.config import SERVER_PROFILES
+
+ENDPOINTS = {
+    "GET /add": ("GET", "/add?x=5&y=3", None),
+    "POST /calc": ("POST", "/calc", {"operation": "multiply", "x": 6, "y": 7}),
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(profile: str, port: int, workers: int) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        SERVER_PROFILE=profile,
+        HOST="127.0.0.1",
+        PORT=str(port),
+        SERVER_WORKERS=str(workers),
+    )
+    if SERVER_PROFILES[profile]["reload"]:
+        # The reloader would only add a file watcher to the measurement
+        env["SERVER_PROFILE"] = "compat"
+        env["SERVER_LOOP"] = "auto"
+        env["SERVER_HTTP"] = "auto"
+    return subprocess.Popen(
+        [sys.executable, "-m", "app.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+async def _drive(
+    base_url: str, method: str, path: str, body, duration: float, concurrency: int
+) -> List[float]:
+    latencies: List[float] = []
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        stop_at = time.perf_counter() + duration
+
+        async def worker() -> None:
+            while time.perf_counter() < stop_at:
+                started = time.perf_counter()
+                response = await client.request(method, path, json=body)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run(profiles: List[str], duration: float, concurrency: int, workers: int) -> None:
+    """Benchmark every profile against every endpoint and print a table."""
+    rows: List[Dict[str, object]] = []
+    for profile in profiles:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        process = _start_server(profile, port, workers)
+        try:
+            _wait_ready(base_url)
+            for label, (method, path, body) in ENDPOINTS.items():
+                latencies = asyncio.run(
+                    _drive(base_url, method, path, body, duration, concurrency)
+                )
+                latencies.sort()
+                rows.append(
+                    {
+                        "profile": profile,
+                        "endpoint": label,
+                        "rps": len(latencies) / duration,
+                        "p50": _percentile(latencies, 0.50) * 1000,
+                        "p99": _percentile(latencies, 0.99) * 1000,
+                    }
+                )
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f"{'profile':<12} {'endpoint':<11} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for row in rows:
+        print(
+            f"{row['profile']:<12} {row['endpoint']:<11} {row['rps']:>10.0f} "
+            f"{row['p50']:>8.2f} {row['p99']:>8.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", nargs="+", default=list(SERVER_PROFILES))
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes per profile (1 isolates per-process tuning)",
+    )
+    args = parser.parse_args()
+    run(args.profiles, args.duration, args.concurrency, args.workers)
+
+
+if __name__ == "__main__":
+    main()
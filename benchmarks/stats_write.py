@@ -0,0 +1,119 @@
+"""
+Write-path overhead of the cross-worker calculation statistics.
+
+Measures, per call:
+
+- record: ``SharedStatsRecorder.record`` alone, for a success and a failure
+- service: ``CalculatorService.try_calculate`` without and with a recorder
+- processes: ``record`` in several forked processes writing at once, after
+  which the aggregated count is checked against the calls made
+
+A no-op logger keeps log formatting out of the service numbers.
+
+Usage:
+    python -m benchmarks.stats_write --calls 200000 --processes 4
+"""
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from domain.interfaces.logger import ILogger
+from domain.interfaces.result import ErrorCode
+from domain.operations.factory import OperationFactory
+from domain.services.calculator import CalculatorService
+from domain.services.stats import SharedStatsRecorder
+
+
+class _NullLogger(ILogger):
+    def info(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    def warning(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    def error(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    def debug(self, message: str, **kwargs: Any) -> None:
+        pass
+
+
+def _per_call(function: Callable[[], object], calls: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, time.perf_counter() - started)
+    return best / calls
+
+
+def _writer(path: str, calls: int) -> None:
+    recorder = SharedStatsRecorder(path)
+    for _ in range(calls):
+        recorder.record("add", 3e-6, None)
+
+
+def _processes(path: str, processes: int, calls: int) -> float:
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_writer, args=(path, calls)) for _ in range(processes)
+    ]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    recorded = SharedStatsRecorder(path).snapshot()["operations"][0]["calls"]
+    if recorded != processes * calls:
+        raise RuntimeError(f"Recorded {recorded} of {processes * calls} calls")
+    return elapsed / calls
+
+
+def run(calls: int, rounds: int, processes: int) -> None:
+    """Print nanoseconds per call (best of ``rounds``) for each write path."""
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = SharedStatsRecorder(str(Path(directory) / "stats"))
+        plain = CalculatorService(OperationFactory(), _NullLogger())
+        recorded = CalculatorService(OperationFactory(), _NullLogger(), stats=recorder)
+        results: Dict[str, float] = {
+            "record ok": _per_call(
+                lambda: recorder.record("add", 3e-6, None), calls, rounds
+            ),
+            "record error": _per_call(
+                lambda: recorder.record("divide", 3e-6, ErrorCode.DIVISION_BY_ZERO),
+                calls,
+                rounds,
+            ),
+            "service": _per_call(
+                lambda: plain.try_calculate("add", 1.0, 2.0), calls, rounds
+            ),
+            "service + stats": _per_call(
+                lambda: recorded.try_calculate("add", 1.0, 2.0), calls, rounds
+            ),
+            f"record x{processes} procs": _processes(
+                str(Path(directory) / "concurrent"), processes, calls
+            ),
+        }
+        recorder.close()
+
+    print(f"{'path':<22} {'ns/call':>10}")
+    for name, seconds in results.items():
+        print(f"{name:<22} {seconds * 1e9:>10.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+    run(args.calls, args.rounds, args.processes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""Python client for the FastAPI Calculator API."""
+from client.errors import CalculatorError
+from client.sync_client import CalculatorClient
+from client.async_client import AsyncCalculatorClient
+from client.binary_client import BinaryCalculatorClient
+
+__all__ = [
+    "CalculatorClient",
+    "AsyncCalculatorClient",
+    "BinaryCalculatorClient",
+    "CalculatorError",
+]
@@ -0,0 +1,182 @@
+"""Asynchronous calculator client with automatic request batching."""
+import asyncio
+from typing import Dict, Iterable, List, Optional
+import httpx
+from client.cache import CacheKey, MemoCache, cache_key
+from client.errors import CalculatorError
+from client.protocol import (
+    Item,
+    Outcome,
+    batch_payload,
+    calc_payload,
+    chunked,
+    parse_batch,
+    parse_result,
+)
+
+
+class AsyncCalculatorClient:
+    """
+    Async client reusing keep-alive connections across calls.
+
+    With ``batch_window`` set, ``calculate`` calls made within the window are
+    coalesced into one ``POST /calc/batch`` request; identical calculations
+    in the same window share a single item.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        *,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        cache_size: int = 1024,
+        batch_window: Optional[float] = None,
+        max_batch_size: int = 1000,
+        max_parallel_batches: int = 4,
+        priority: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            base_url: API root URL
+            timeout: Per-request timeout in seconds
+            max_connections: Size of the keep-alive connection pool
+            cache_size: Results memoized locally; 0 disables the cache
+            batch_window: Seconds to collect calls before sending them as
+                one batch; None sends every call immediately
+            max_batch_size: Items per ``POST /calc/batch`` request
+            max_parallel_batches: Batch requests in flight at once
+            priority: Server priority lane sent as ``X-Priority``
+                (interactive, standard or bulk); None lets the route decide
+            transport: Custom httpx transport (e.g. ``httpx.ASGITransport``)
+        """
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        headers = {"X-Priority": priority} if priority else None
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout,
+            limits=limits,
+            headers=headers,
+            transport=transport,
+        )
+        self._cache = MemoCache(cache_size)
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._semaphore = asyncio.Semaphore(max_parallel_batches)
+        self._pending: Dict[CacheKey, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._in_flight: set = set()
+
+    async def calculate(
+        self, operation: str, x: float, y: Optional[float] = None
+    ) -> float:
+        """
+        Perform one calculation.
+
+        Raises:
+            CalculatorError: If the API rejects the calculation
+        """
+        key = cache_key(operation, x, y)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        if self._batch_window is None:
+            response = await self._http.post("/calc", json=calc_payload(*key))
+            result = parse_result(response)
+            self._cache.put(key, result)
+            return result
+        # Shield: other callers may be waiting on the same coalesced future
+        return await asyncio.shield(self._enqueue(key))
+
+    async def calculate_many(self, items: Iterable[Item]) -> List[Outcome]:
+        """
+        Perform many calculations through batched requests.
+
+        Returns:
+            Results in input order, with a CalculatorError for failed items
+        """
+        keys = [cache_key(*item) for item in items]
+        outcomes: List[Optional[Outcome]] = [self._cache.get(key) for key in keys]
+        missing = list(
+            dict.fromkeys(key for key, o in zip(keys, outcomes) if o is None)
+        )
+        if missing:
+            batches = chunked(missing, self._max_batch_size)
+            responses = await asyncio.gather(*(self._send(b) for b in batches))
+            resolved = {}
+            for batch, results in zip(batches, responses):
+                resolved.update(zip(batch, results))
+            outcomes = [
+                resolved[key] if outcome is None else outcome
+                for key, outcome in zip(keys, outcomes)
+            ]
+        return outcomes
+
+    async def _send(self, batch: List[CacheKey]) -> List[Outcome]:
+        async with self._semaphore:
+            response = await self._http.post("/calc/batch", json=batch_payload(batch))
+        results = parse_batch(response)
+        for key, outcome in zip(batch, results):
+            if not isinstance(outcome, Exception):
+                self._cache.put(key, outcome)
+        return results
+
+    def _enqueue(self, key: CacheKey) -> "asyncio.Future[float]":
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self._batch_window, self._flush
+            )
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            task = asyncio.get_running_loop().create_task(self._resolve(pending))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _resolve(self, pending: Dict[CacheKey, asyncio.Future]) -> None:
+        keys = list(pending)
+        try:
+            results = await self._send(keys)
+        except (CalculatorError, httpx.HTTPError) as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, outcome in zip(keys, results):
+            future = pending[key]
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def aclose(self) -> None:
+        """Send any pending batch, then close pooled connections."""
+        self._flush()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncCalculatorClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
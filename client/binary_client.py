@@ -0,0 +1,138 @@
+"""Asyncio client for the binary socket protocol."""
+import asyncio
+import itertools
+import struct
+from typing import Dict, Optional
+from client.errors import CalculatorError
+
+# Mirrors app.core.socket_server; see that module for the frame layout
+OPCODES: Dict[str, int] = {
+    "add": 1,
+    "subtract": 2,
+    "multiply": 3,
+    "divide": 4,
+    "sqrt": 5,
+    "pow": 6,
+    "log": 7,
+    "exp": 8,
+    "sin": 9,
+    "cos": 10,
+    "tan": 11,
+    "factorial": 12,
+}
+STATUS_OK = 0
+
+_LENGTH = struct.Struct("<I")
+_UNARY = struct.Struct("<IIBBd")
+_BINARY = struct.Struct("<IIBBdd")
+_RESPONSE_HEADER = struct.Struct("<IB")
+_RESULT = struct.Struct("<d")
+
+
+class BinaryCalculatorClient:
+    """
+    Pipelining client for the socket server, over TCP or a Unix socket.
+
+    Concurrent ``calculate`` calls share one connection: each request is
+    written immediately and matched to its response by id, so many calls can
+    be in flight without waiting for one another.
+    """
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 9000, *, path: Optional[str] = None
+    ):
+        """
+        Initialize client.
+
+        Args:
+            host: Server host for TCP
+            port: Server port for TCP
+            path: Unix socket path; used instead of TCP when given
+        """
+        self._host = host
+        self._port = port
+        self._path = path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._ids = itertools.count()
+        self._waiting: Dict[int, asyncio.Future] = {}
+        self._receiver: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        """Open the connection (``calculate`` does this on first use)."""
+        if self._path:
+            self._reader, self._writer = await asyncio.open_unix_connection(self._path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(
+                self._host, self._port
+            )
+        self._receiver = asyncio.get_running_loop().create_task(self._receive())
+
+    async def calculate(
+        self, operation: str, x: float, y: Optional[float] = None
+    ) -> float:
+        """
+        Perform one calculation.
+
+        Raises:
+            CalculatorError: If the server rejects the calculation
+            ConnectionError: If the connection is lost
+        """
+        opcode = OPCODES.get(operation.lower())
+        if opcode is None:
+            raise CalculatorError(f"Invalid operation: {operation}")
+        if self._writer is None:
+            await self.connect()
+        request_id = next(self._ids) & 0xFFFFFFFF
+        if y is None:
+            frame = _UNARY.pack(_UNARY.size - 4, request_id, opcode, 1, x)
+        else:
+            frame = _BINARY.pack(_BINARY.size - 4, request_id, opcode, 2, x, y)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(frame)
+        await self._writer.drain()
+        return await future
+
+    async def _receive(self) -> None:
+        error: Exception = ConnectionError("Connection closed by server")
+        try:
+            while True:
+                (length,) = _LENGTH.unpack(await self._reader.readexactly(4))
+                body = await self._reader.readexactly(length)
+                request_id, status = _RESPONSE_HEADER.unpack_from(body)
+                future = self._waiting.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if status == STATUS_OK:
+                    future.set_result(_RESULT.unpack_from(body, 5)[0])
+                else:
+                    future.set_exception(CalculatorError(body[5:].decode()))
+        except asyncio.IncompleteReadError:
+            pass
+        except OSError as e:
+            error = e
+        for future in self._waiting.values():
+            if not future.done():
+                future.set_exception(error)
+        self._waiting.clear()
+
+    async def aclose(self) -> None:
+        """Close the connection."""
+        if self._writer is None:
+            return
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except OSError:
+            pass
+        if self._receiver is not None:
+            await self._receiver
+        self._writer = None
+
+    async def __aenter__(self) -> "BinaryCalculatorClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,40 @@
+"""Local memo cache for calculation results."""
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+CacheKey = Tuple[str, float, Optional[float]]
+
+
+def cache_key(operation: str, x: float, y: Optional[float]) -> CacheKey:
+    """Return the normalized cache key of a calculation."""
+    return (operation.lower(), float(x), None if y is None else float(y))
+
+
+class MemoCache:
+    """Least-recently-used cache of successful results."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Entries kept; 0 disables caching
+        """
+        self._entries: "OrderedDict[CacheKey, float]" = OrderedDict()
+        self._max_entries = max_entries
+
+    def get(self, key: CacheKey) -> Optional[float]:
+        """Return the cached result, or None on a miss."""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: CacheKey, result: float) -> None:
+        """Store a result, evicting the least recently used entry."""
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
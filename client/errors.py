@@ -0,0 +1,18 @@
+"""Client exceptions."""
+from typing import Optional
+
+
+class CalculatorError(ValueError):
+    """Raised when the API rejects a calculation (e.g. division by zero)."""
+
+    def __init__(self, detail: str, status_code: Optional[int] = None):
+        """
+        Initialize error.
+
+        Args:
+            detail: Error message returned by the API
+            status_code: HTTP status of the response, if any
+        """
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
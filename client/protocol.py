@@ -0,0 +1,51 @@
+"""Request/response helpers shared by the sync and async clients."""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import httpx
+from client.errors import CalculatorError
+
+Item = Tuple[str, float, Optional[float]]
+Outcome = Union[float, CalculatorError]
+
+
+def calc_payload(operation: str, x: float, y: Optional[float]) -> Dict[str, Any]:
+    """Return the JSON body of a single calculation."""
+    payload: Dict[str, Any] = {"operation": operation, "x": x}
+    if y is not None:
+        payload["y"] = y
+    return payload
+
+
+def batch_payload(items: Iterable[Item]) -> Dict[str, Any]:
+    """Return the JSON body of a batch calculation."""
+    return {"items": [calc_payload(*item) for item in items]}
+
+
+def chunked(items: Sequence[Item], size: int) -> List[Sequence[Item]]:
+    """Split items into consecutive chunks of at most ``size``."""
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.status_code >= 400:
+        try:
+            detail = response.json().get("detail", response.text)
+        except ValueError:
+            detail = response.text
+        raise CalculatorError(str(detail), response.status_code)
+
+
+def parse_result(response: httpx.Response) -> float:
+    """Return the result of a ``POST /calc`` response."""
+    _raise_for_status(response)
+    return response.json()["result"]
+
+
+def parse_batch(response: httpx.Response) -> List[Outcome]:
+    """Return per-item outcomes of a ``POST /calc/batch`` response."""
+    _raise_for_status(response)
+    return [
+        CalculatorError(item["error"], 400)
+        if item["error"] is not None
+        else item["result"]
+        for item in response.json()["results"]
+    ]
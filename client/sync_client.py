@@ -0,0 +1,121 @@
+"""Synchronous calculator client with pooled connections."""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+import httpx
+from client.cache import MemoCache, cache_key
+from client.protocol import (
+    Item,
+    Outcome,
+    batch_payload,
+    calc_payload,
+    chunked,
+    parse_batch,
+    parse_result,
+)
+
+
+class CalculatorClient:
+    """Blocking client reusing keep-alive connections across calls."""
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        *,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        cache_size: int = 1024,
+        max_batch_size: int = 1000,
+        max_parallel_batches: int = 4,
+        priority: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        """
+        Initialize client.
+
+        Args:
+            base_url: API root URL
+            timeout: Per-request timeout in seconds
+            max_connections: Size of the keep-alive connection pool
+            cache_size: Results memoized locally; 0 disables the cache
+            max_batch_size: Items per ``POST /calc/batch`` request
+            max_parallel_batches: Batch requests in flight at once
+            priority: Server priority lane sent as ``X-Priority``
+                (interactive, standard or bulk); None lets the route decide
+            transport: Custom httpx transport (e.g. for tests)
+        """
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        headers = {"X-Priority": priority} if priority else None
+        self._http = httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            limits=limits,
+            headers=headers,
+            transport=transport,
+        )
+        self._cache = MemoCache(cache_size)
+        self._max_batch_size = max_batch_size
+        self._max_parallel_batches = max_parallel_batches
+
+    def calculate(self, operation: str, x: float, y: Optional[float] = None) -> float:
+        """
+        Perform one calculation.
+
+        Raises:
+            CalculatorError: If the API rejects the calculation
+        """
+        key = cache_key(operation, x, y)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        result = parse_result(self._http.post("/calc", json=calc_payload(*key)))
+        self._cache.put(key, result)
+        return result
+
+    def calculate_many(self, items: Iterable[Item]) -> List[Outcome]:
+        """
+        Perform many calculations through batched requests.
+
+        Cached items are answered locally; the rest are split into batches
+        sent concurrently, at most ``max_parallel_batches`` at a time.
+
+        Returns:
+            Results in input order, with a CalculatorError for failed items
+        """
+        keys = [cache_key(*item) for item in items]
+        outcomes: List[Optional[Outcome]] = [self._cache.get(key) for key in keys]
+        missing = list(
+            dict.fromkeys(key for key, o in zip(keys, outcomes) if o is None)
+        )
+        if missing:
+            batches = chunked(missing, self._max_batch_size)
+            with ThreadPoolExecutor(self._max_parallel_batches) as pool:
+                responses = pool.map(
+                    lambda batch: parse_batch(
+                        self._http.post("/calc/batch", json=batch_payload(batch))
+                    ),
+                    batches,
+                )
+                resolved = {}
+                for batch, results in zip(batches, responses):
+                    resolved.update(zip(batch, results))
+            for key, outcome in resolved.items():
+                if not isinstance(outcome, Exception):
+                    self._cache.put(key, outcome)
+            outcomes = [
+                resolved[key] if outcome is None else outcome
+                for key, outcome in zip(keys, outcomes)
+            ]
+        return outcomes
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._http.close()
+
+    def __enter__(self) -> "CalculatorClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
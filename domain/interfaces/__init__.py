@@ -1,5 +1,25 @@
 """Interfaces for dependency inversion."""
-from domain.interfaces.operations import IOperation
+from domain.interfaces.operations import (
+    IIntegerOperation,
+    IOperation,
+    IPolynomialOperation,
+    ITensorOperation,
+    IUnaryOperation,
+)
 from domain.interfaces.logger import ILogger
+from domain.interfaces.cache import IResultCache
+from domain.interfaces.result import CalculationResult, ErrorCode
+from domain.interfaces.stats import IStatsRecorder
 
-__all__ = ["IOperation", "ILogger"]
+__all__ = [
+    "CalculationResult",
+    "ErrorCode",
+    "IIntegerOperation",
+    "IOperation",
+    "IPolynomialOperation",
+    "ITensorOperation",
+    "IUnaryOperation",
+    "ILogger",
+    "IResultCache",
+    "IStatsRecorder",
+]
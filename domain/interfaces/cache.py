@@ -0,0 +1,17 @@
+"""Result cache interface for dependency inversion."""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class IResultCache(ABC):
+    """Interface for caching calculation results."""
+
+    @abstractmethod
+    def get(self, operation: str, x: float, y: Optional[float]) -> Optional[float]:
+        """Return the cached result, or None on a miss."""
+        pass
+
+    @abstractmethod
+    def put(self, operation: str, x: float, y: Optional[float], result: float) -> None:
+        """Store a result."""
+        pass
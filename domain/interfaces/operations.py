@@ -1,5 +1,8 @@
 """Operation interface for Strategy pattern."""
 from abc import ABC, abstractmethod
+from typing import Any, Optional, Tuple
+import numpy as np
+from domain.interfaces.result import CalculationResult, ErrorCode
 
 
 class IOperation(ABC):
@@ -27,3 +30,166 @@ class IOperation(ABC):
     def name(self) -> str:
         """Return the operation name."""
         pass
+
+    @property
+    def arity(self) -> int:
+        """Return the number of operands the operation consumes."""
+        return 2
+
+    def try_execute(self, x: float, y: Optional[float]) -> CalculationResult:
+        """
+        Execute the operation, returning failures instead of raising them.
+
+        The default wraps ``execute``; strategies whose common failures are
+        cheap to detect up front override it to skip the exception.
+
+        Args:
+            x: First operand
+            y: Second operand
+
+        Returns:
+            The result, or the error ``execute`` would have raised
+        """
+        try:
+            return CalculationResult(self.execute(x, y))
+        except ValueError as e:
+            return CalculationResult.failure(ErrorCode.DOMAIN_ERROR, str(e))
+
+
+class IUnaryOperation(IOperation):
+    """Interface for operations taking a single operand."""
+
+    @abstractmethod
+    def apply(self, x: float) -> float:
+        """
+        Execute the operation on one operand.
+
+        Args:
+            x: Operand
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            ValueError: If x is outside the operation's domain
+        """
+        pass
+
+    @property
+    def arity(self) -> int:
+        return 1
+
+    def execute(self, x: float, y: Optional[float] = None) -> float:
+        """Execute the operation on x; y is ignored."""
+        return self.apply(x)
+
+
+class ITensorOperation(ABC):
+    """Interface for operations over vectors and matrices."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return the operation name."""
+        pass
+
+    @abstractmethod
+    def result_shape(
+        self, x_shape: Tuple[int, ...], y_shape: Tuple[int, ...]
+    ) -> Tuple[int, ...]:
+        """
+        Validate operand shapes without computing anything.
+
+        Args:
+            x_shape: Shape of the first operand
+            y_shape: Shape of the second operand
+
+        Returns:
+            Shape of the result
+
+        Raises:
+            ValueError: If the shapes are incompatible
+        """
+        pass
+
+    @abstractmethod
+    def execute(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Execute the operation.
+
+        Raises:
+            ValueError: If the operation cannot be performed
+        """
+        pass
+
+
+class IPolynomialOperation(ABC):
+    """
+    Interface for operations on polynomials.
+
+    Polynomials are coefficient arrays in ascending order: ``c[i]``
+    multiplies ``x**i``.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return the operation name."""
+        pass
+
+    @property
+    def requires_operand(self) -> bool:
+        """Return whether execute needs a second array."""
+        return False
+
+    @abstractmethod
+    def result_size(self, coefficients: int, operand: int) -> int:
+        """
+        Return the largest result size without computing anything.
+
+        Args:
+            coefficients: Number of coefficients
+            operand: Size of the second array (0 if none)
+        """
+        pass
+
+    @abstractmethod
+    def execute(
+        self, coefficients: np.ndarray, operand: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Execute the operation.
+
+        Raises:
+            ValueError: If the operation cannot be performed
+        """
+        pass
+
+
+class IIntegerOperation(ABC):
+    """Interface for number-theory operations on arbitrary-size integers."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Return the operation name."""
+        pass
+
+    @property
+    @abstractmethod
+    def arity(self) -> int:
+        """Return the number of integer arguments the operation consumes."""
+        pass
+
+    @abstractmethod
+    def execute(self, *args: int) -> Any:
+        """
+        Execute the operation.
+
+        Returns:
+            An integer, a boolean or a list of ``[prime, exponent]`` pairs
+
+        Raises:
+            ValueError: If an argument is outside the operation's domain
+        """
+        pass
@@ -0,0 +1,49 @@
+"""Value-or-error result of a calculation, for paths that avoid exceptions."""
+from enum import Enum
+from typing import Optional
+
+
+class ErrorCode(str, Enum):
+    """Reason a calculation failed."""
+
+    INVALID_OPERATION = "invalid_operation"
+    MISSING_OPERAND = "missing_operand"
+    DIVISION_BY_ZERO = "division_by_zero"
+    DOMAIN_ERROR = "domain_error"
+
+
+class CalculationResult:
+    """
+    Either a value or an error code with its message.
+
+    Expected failures are returned as values instead of raised, so no
+    traceback is built for them. ``message`` is the text the raising path
+    puts in its ``ValueError``.
+    """
+
+    __slots__ = ("value", "error", "message")
+
+    def __init__(
+        self,
+        value: Optional[float] = None,
+        error: Optional[ErrorCode] = None,
+        message: Optional[str] = None,
+    ):
+        self.value = value
+        self.error = error
+        self.message = message
+
+    @classmethod
+    def failure(cls, error: ErrorCode, message: str) -> "CalculationResult":
+        """Build a failed result."""
+        return cls(None, error, message)
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the calculation succeeded."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.error is None:
+            return f"CalculationResult({self.value!r})"
+        return f"CalculationResult.failure({self.error}, {self.message!r})"
@@ -0,0 +1,22 @@
+"""Runtime statistics interface for dependency inversion."""
+from abc import ABC, abstractmethod
+from typing import Optional
+from domain.interfaces.result import ErrorCode
+
+
+class IStatsRecorder(ABC):
+    """Interface for recording per-operation calculation statistics."""
+
+    @abstractmethod
+    def record(
+        self, operation: Optional[str], seconds: float, error: Optional[ErrorCode]
+    ) -> None:
+        """
+        Record one calculation.
+
+        Args:
+            operation: Operation name, or None if the name was not recognized
+            seconds: Time taken to resolve and execute the operation
+            error: Error code if the calculation failed
+        """
+        pass
@@ -1,10 +1,94 @@
 """Pydantic models for requests and responses."""
-from domain.models.request import CalculationRequest
-from domain.models.response import CalculationResponse, ErrorResponse, HealthResponse
+from domain.models.request import (
+    BatchCalculationRequest,
+    CalculationRequest,
+    GcThresholdsRequest,
+    GraphDefineRequest,
+    GraphInputRequest,
+    GraphNodeSpec,
+    IntegerBatchRequest,
+    IntegerRequest,
+    IntegrationRequest,
+    PolynomialRequest,
+    SimulationRequest,
+    StreamCreateRequest,
+    StreamValuesRequest,
+    SummationRequest,
+    TensorRequest,
+)
+from domain.models.response import (
+    AllocationSite,
+    BatchCalculationResponse,
+    BatchItemResult,
+    CalculationResponse,
+    ErrorResponse,
+    GcStatusResponse,
+    GraphNodeValue,
+    GraphResponse,
+    HealthResponse,
+    HistogramBucket,
+    IntegerBatchResponse,
+    IntegerItemResult,
+    IntegerResponse,
+    JobResponse,
+    LaneMetrics,
+    LoadCheck,
+    MemoryStatusResponse,
+    OperationStats,
+    PolynomialResponse,
+    PrimeTablesResponse,
+    ReadinessResponse,
+    RuntimeStatsResponse,
+    SchedulerResponse,
+    StreamRegistryResponse,
+    StreamSessionResponse,
+    StreamStatsResponse,
+    TensorResponse,
+    TypeCount,
+)
 
 __all__ = [
+    "AllocationSite",
+    "BatchCalculationRequest",
+    "BatchCalculationResponse",
+    "BatchItemResult",
     "CalculationRequest",
     "CalculationResponse",
     "ErrorResponse",
+    "GcStatusResponse",
+    "GcThresholdsRequest",
+    "GraphDefineRequest",
+    "GraphInputRequest",
+    "GraphNodeSpec",
+    "GraphNodeValue",
+    "GraphResponse",
     "HealthResponse",
+    "HistogramBucket",
+    "IntegerBatchRequest",
+    "IntegerBatchResponse",
+    "IntegerItemResult",
+    "IntegerRequest",
+    "IntegerResponse",
+    "IntegrationRequest",
+    "JobResponse",
+    "LaneMetrics",
+    "LoadCheck",
+    "MemoryStatusResponse",
+    "OperationStats",
+    "PolynomialRequest",
+    "PolynomialResponse",
+    "PrimeTablesResponse",
+    "ReadinessResponse",
+    "RuntimeStatsResponse",
+    "SchedulerResponse",
+    "SimulationRequest",
+    "StreamCreateRequest",
+    "StreamRegistryResponse",
+    "StreamSessionResponse",
+    "StreamStatsResponse",
+    "StreamValuesRequest",
+    "SummationRequest",
+    "TensorRequest",
+    "TensorResponse",
+    "TypeCount",
 ]
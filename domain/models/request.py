@@ -1,5 +1,10 @@
 """Request models."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StrictInt, model_validator
+from typing import Any, Dict, List, Optional, Union
+from domain.operations.factory import OperationFactory
+
+# Used only to look up operation arity
+_operations = OperationFactory()
 
 
 class CalculationRequest(BaseModel):
@@ -7,17 +12,292 @@ class CalculationRequest(BaseModel):
 
     operation: str = Field(
         ...,
-        description="Operation to perform (add, subtract, multiply, divide)",
+        description="Operation to perform (add, subtract, multiply, divide, "
+        "pow, sqrt, log, exp, sin, cos, tan, factorial)",
         examples=["add"],
     )
     x: float = Field(..., description="First operand", examples=[10.0])
-    y: float = Field(..., description="Second operand", examples=[5.0])
+    y: Optional[float] = Field(
+        default=None,
+        description="Second operand (omit for unary operations)",
+        examples=[5.0],
+    )
 
     model_config = {
         "json_schema_extra": {
             "examples": [
                 {"operation": "add", "x": 10, "y": 5},
                 {"operation": "multiply", "x": 6, "y": 7},
+                {"operation": "sqrt", "x": 16},
+            ]
+        }
+    }
+
+    @model_validator(mode="after")
+    def check_operand(self) -> "CalculationRequest":
+        """Require y for operations that take two operands."""
+        operation = _operations.try_get_operation(self.operation)
+        if self.y is None and operation is not None and operation.arity == 2:
+            raise ValueError("y is required for binary operations")
+        return self
+
+
+class BatchCalculationRequest(BaseModel):
+    """Request model for batch calculation endpoint."""
+
+    items: list[CalculationRequest] = Field(
+        ..., description="Calculations to perform, in order"
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Job deadline in seconds (server default if omitted)",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "items": [
+                        {"operation": "add", "x": 10, "y": 5},
+                        {"operation": "divide", "x": 1, "y": 0},
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class TensorRequest(BaseModel):
+    """Request model for vector/matrix endpoints."""
+
+    x: Any = Field(..., description="First operand (number or nested list)")
+    y: Any = Field(..., description="Second operand (number or nested list)")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {"x": [[1, 2], [3, 4]], "y": [[5, 6], [7, 8]]},
+                {"x": [1, 2, 3], "y": 2},
+            ]
+        }
+    }
+
+
+class GraphNodeSpec(BaseModel):
+    """Definition of one calculation graph node."""
+
+    name: str = Field(..., min_length=1, description="Unique node name")
+    value: Optional[float] = Field(default=None, description="Value of an input node")
+    operation: Optional[str] = Field(
+        default=None, description="Operation of a computed node"
+    )
+    args: list[Union[str, float]] = Field(
+        default_factory=list, description="Node names or constants"
+    )
+
+    @model_validator(mode="after")
+    def check_kind(self) -> "GraphNodeSpec":
+        """Require exactly one of value and operation."""
+        if (self.value is None) == (self.operation is None):
+            raise ValueError("Node needs either a value or an operation")
+        return self
+
+
+class GraphDefineRequest(BaseModel):
+    """Request model for adding or redefining graph nodes."""
+
+    nodes: list[GraphNodeSpec] = Field(..., description="Nodes, in any order")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "nodes": [
+                        {"name": "a", "value": 2},
+                        {"name": "b", "value": 3},
+                        {"name": "sum", "operation": "add", "args": ["a", "b"]},
+                        {"name": "root", "operation": "sqrt", "args": ["sum"]},
+                    ]
+                }
+            ]
+        }
+    }
+
+
+class GraphInputRequest(BaseModel):
+    """Request model for updating graph inputs."""
+
+    values: Dict[str, float] = Field(..., description="New input values by name")
+
+
+class StreamCreateRequest(BaseModel):
+    """Request model for creating a streaming session."""
+
+    window: Optional[int] = Field(
+        default=None, description="Aggregate over the last this many values"
+    )
+    seconds: Optional[float] = Field(
+        default=None, description="Aggregate over the values of the last seconds"
+    )
+    capacity: Optional[int] = Field(
+        default=None, description="Most values a time window holds"
+    )
+
+
+class StreamValuesRequest(BaseModel):
+    """Request model for pushing values into a streaming session."""
+
+    values: List[float] = Field(..., description="Values in arrival order")
+
+
+class GcThresholdsRequest(BaseModel):
+    """Request model for tuning garbage collector thresholds."""
+
+    threshold0: int = Field(..., ge=0, description="Allocations before a gen 0 run")
+    threshold1: int = Field(..., ge=0, description="Gen 0 runs before a gen 1 run")
+    threshold2: int = Field(..., ge=0, description="Gen 1 runs before a gen 2 run")
+
+
+class PolynomialRequest(BaseModel):
+    """Request model for polynomial endpoints."""
+
+    coefficients: list[float] = Field(
+        ..., description="Coefficients in ascending order (c[i] multiplies x**i)"
+    )
+    operand: Any = Field(
+        default=None,
+        description="Points (evaluate) or second factor's coefficients (multiply)",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {"coefficients": [1, 2, 3], "operand": [0, 0.5, 1]},
+                {"coefficients": [-6, 11, -6, 1]},
+            ]
+        }
+    }
+
+
+class IntegrationRequest(BaseModel):
+    """Request model for numerical integration jobs."""
+
+    expression: Any = Field(
+        ..., description='Integrand tree, e.g. {"op": "sin", "args": ["x"]}'
+    )
+    lower: float = Field(..., description="Lower bound")
+    upper: float = Field(..., description="Upper bound")
+    method: str = Field(default="gauss", description="gauss or simpson")
+    order: int = Field(default=16, description="Gauss-Legendre points per panel")
+    panels: int = Field(default=1024, description="Gauss-Legendre panels")
+    tolerance: float = Field(
+        default=1e-10, description="Absolute error target for adaptive Simpson"
+    )
+    time_budget: Optional[float] = Field(
+        default=None, description="Seconds before the job is abandoned"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "expression": {"op": "sin", "args": ["x"]},
+                    "lower": 0,
+                    "upper": 3.141592653589793,
+                }
+            ]
+        }
+    }
+
+
+class SummationRequest(BaseModel):
+    """Request model for series summation jobs."""
+
+    expression: Any = Field(..., description="Term tree over one integer variable")
+    start: int = Field(..., description="First index (inclusive)")
+    stop: int = Field(..., description="Last index (inclusive)")
+    time_budget: Optional[float] = Field(
+        default=None, description="Seconds before the job is abandoned"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "expression": {
+                        "op": "divide",
+                        "args": [1, {"op": "multiply", "args": ["n", "n"]}],
+                    },
+                    "start": 1,
+                    "stop": 1000000,
+                }
             ]
         }
     }
+
+
+class SimulationRequest(BaseModel):
+    """Request model for Monte Carlo simulations."""
+
+    expression: Any = Field(..., description="Expression tree over the variables")
+    distributions: Dict[str, Dict[str, Any]] = Field(
+        ...,
+        description='Per variable, e.g. {"dist": "normal", "loc": 0, "scale": 1}; '
+        "dist is normal, lognormal, uniform, exponential, triangular, beta or "
+        "gamma with numpy's parameter names",
+    )
+    trials: int = Field(..., description="Number of trials")
+    seed: Optional[int] = Field(
+        default=None, description="Root seed; chosen at random if omitted"
+    )
+    confidence: float = Field(
+        default=0.95, description="Level of the confidence intervals"
+    )
+    thresholds: List[float] = Field(
+        default=[], description="Values at which to estimate P(result <= value)"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "expression": {
+                        "op": "multiply",
+                        "args": ["units", {"op": "subtract", "args": ["price", 90]}],
+                    },
+                    "distributions": {
+                        "units": {"dist": "uniform", "low": 800, "high": 1200},
+                        "price": {"dist": "normal", "loc": 100, "scale": 15},
+                    },
+                    "trials": 1000000,
+                    "seed": 42,
+                    "thresholds": [0],
+                }
+            ]
+        }
+    }
+
+
+class IntegerRequest(BaseModel):
+    """Request model for number-theory endpoints."""
+
+    args: List[StrictInt] = Field(..., description="Integer arguments")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [{"args": [84, 36]}, {"args": [600851475143]}]
+        }
+    }
+
+
+class IntegerBatchRequest(BaseModel):
+    """Request model for batched number-theory calculations."""
+
+    items: List[List[StrictInt]] = Field(
+        ..., description="Argument lists, one per calculation"
+    )
+
+    model_config = {
+        "json_schema_extra": {"examples": [{"items": [[97], [561], [7919]]}]}
+    }
@@ -1,6 +1,6 @@
 """Response models."""
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 
 class CalculationResponse(BaseModel):
@@ -8,7 +8,7 @@ class CalculationResponse(BaseModel):
 
     operation: str = Field(..., description="Operation performed")
     x: float = Field(..., description="First operand")
-    y: float = Field(..., description="Second operand")
+    y: Optional[float] = Field(default=None, description="Second operand")
     result: float = Field(..., description="Calculation result")
 
     model_config = {
@@ -30,3 +30,241 @@ class HealthResponse(BaseModel):
     status: str = Field(default="healthy", description="Service status")
     service: str = Field(default="calculator", description="Service name")
     version: Optional[str] = Field(default="1.0.0", description="API version")
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of a single calculation within a batch."""
+
+    operation: str = Field(..., description="Operation performed")
+    x: float = Field(..., description="First operand")
+    y: Optional[float] = Field(default=None, description="Second operand")
+    result: Optional[float] = Field(default=None, description="Calculation result")
+    error: Optional[str] = Field(default=None, description="Error message, if any")
+
+
+class BatchCalculationResponse(BaseModel):
+    """Response model for batch calculation endpoint."""
+
+    results: list[BatchItemResult] = Field(..., description="Results in input order")
+    succeeded: int = Field(..., description="Number of successful calculations")
+    failed: int = Field(..., description="Number of failed calculations")
+
+
+class JobResponse(BaseModel):
+    """Response model for background job status."""
+
+    job_id: str = Field(..., description="Job identifier")
+    kind: str = Field(..., description="Job type")
+    status: str = Field(..., description="pending, running, completed or failed")
+    progress: float = Field(..., description="Completed fraction between 0 and 1")
+    stats: Dict[str, Any] = Field(default_factory=dict, description="Job counters")
+    error: Optional[str] = Field(default=None, description="Failure reason, if any")
+
+
+class LoadCheck(BaseModel):
+    """A single load signal compared against its threshold."""
+
+    value: float = Field(..., description="Current value")
+    threshold: float = Field(..., description="Maximum value while ready")
+    ok: bool = Field(..., description="Whether the value is within threshold")
+
+
+class LaneMetrics(BaseModel):
+    """Queue depth and latency of one request priority lane."""
+
+    weight: int = Field(..., description="Dispatch weight relative to other lanes")
+    slo_ms: float = Field(..., description="Target queue wait")
+    queued: int = Field(..., description="Requests waiting")
+    running: int = Field(..., description="Requests being served")
+    admitted: int = Field(..., description="Requests started since startup")
+    rejected: int = Field(..., description="Requests refused with a full queue")
+    timed_out: int = Field(..., description="Requests that waited too long")
+    slo_misses: int = Field(..., description="Requests that waited past the SLO")
+    wait_p50_ms: float = Field(..., description="Median recent queue wait")
+    wait_p95_ms: float = Field(..., description="95th percentile recent queue wait")
+    wait_max_ms: float = Field(..., description="Longest recent queue wait")
+
+
+class SchedulerResponse(BaseModel):
+    """Response model for request scheduler metrics."""
+
+    max_concurrent: int = Field(..., description="Requests served at once")
+    running: int = Field(..., description="Requests being served")
+    under_pressure: bool = Field(
+        ..., description="Whether lower lanes are deferred for interactive traffic"
+    )
+    lanes: Dict[str, LaneMetrics] = Field(..., description="Metrics per lane")
+
+
+class HistogramBucket(BaseModel):
+    """Cumulative count of a duration histogram bucket."""
+
+    le: float = Field(..., description="Upper bound in seconds")
+    count: int = Field(..., description="Calculations at or under the bound")
+
+
+class OperationStats(BaseModel):
+    """Counts and timings of one operation across all workers."""
+
+    operation: str = Field(..., description="Operation name, or (other)")
+    calls: int = Field(..., description="Calculations recorded")
+    errors: Dict[str, int] = Field(..., description="Failures per error code")
+    seconds_sum: float = Field(..., description="Total time spent calculating")
+    buckets: List[HistogramBucket] = Field(..., description="Duration histogram")
+
+
+class RuntimeStatsResponse(BaseModel):
+    """Response model for calculation statistics of all workers."""
+
+    workers: int = Field(..., description="Running workers holding a slot")
+    slots_claimed: int = Field(..., description="Slots written by any worker")
+    slots: int = Field(..., description="Slots in the statistics file")
+    operations: List[OperationStats] = Field(..., description="Per operation")
+
+
+class ReadinessResponse(BaseModel):
+    """Response model for readiness probe."""
+
+    status: str = Field(..., description="ready or not_ready")
+    checks: Dict[str, LoadCheck] = Field(..., description="Load signals")
+
+
+class TensorResponse(BaseModel):
+    """Response model for vector/matrix endpoints."""
+
+    operation: str = Field(..., description="Operation performed")
+    shape: list[int] = Field(..., description="Shape of the result")
+    result: Any = Field(..., description="Result (number or nested list)")
+
+
+class GraphResponse(BaseModel):
+    """Response model for a calculation graph."""
+
+    graph_id: str = Field(..., description="Graph identifier")
+    nodes: int = Field(..., description="Number of nodes")
+
+
+class StreamSessionResponse(BaseModel):
+    """Response model for a streaming session."""
+
+    session_id: str = Field(..., description="Session identifier")
+    capacity: int = Field(..., description="Most values held")
+    seconds: Optional[float] = Field(default=None, description="Time window length")
+
+
+class StreamStatsResponse(BaseModel):
+    """Rolling-window aggregates of a streaming session."""
+
+    session_id: str = Field(..., description="Session identifier")
+    count: int = Field(..., description="Values in the window")
+    sum: float = Field(..., description="Sum of the window")
+    mean: Optional[float] = Field(default=None, description="Mean of the window")
+    variance: Optional[float] = Field(default=None, description="Sample variance")
+    std: Optional[float] = Field(default=None, description="Sample standard deviation")
+    min: Optional[float] = Field(default=None, description="Smallest value")
+    max: Optional[float] = Field(default=None, description="Largest value")
+
+
+class StreamRegistryResponse(BaseModel):
+    """Live streaming sessions and the memory they reserve."""
+
+    sessions: int = Field(..., description="Live sessions")
+    reserved_bytes: int = Field(..., description="Memory reserved by sessions")
+    max_bytes: int = Field(..., description="Memory cap for all sessions")
+
+
+class GraphNodeValue(BaseModel):
+    """Current outcome of a graph node."""
+
+    name: str = Field(..., description="Node name")
+    value: Optional[float] = Field(default=None, description="Node value")
+    error: Optional[str] = Field(default=None, description="Error message, if any")
+
+
+class MemoryStatusResponse(BaseModel):
+    """Process memory and allocation tracing state of one worker."""
+
+    pid: int = Field(..., description="Worker process ID")
+    rss_bytes: Optional[int] = Field(default=None, description="Resident set size")
+    peak_rss_bytes: int = Field(..., description="Peak resident set size")
+    tracing: bool = Field(..., description="Whether tracemalloc is running")
+    traceback_frames: int = Field(..., description="Frames recorded per allocation")
+    traced_bytes: int = Field(..., description="Memory held by traced blocks")
+    traced_peak_bytes: int = Field(..., description="Peak of traced memory")
+    tracing_overhead_bytes: int = Field(..., description="Memory used by tracemalloc")
+    has_baseline: bool = Field(..., description="Whether a diff baseline exists")
+
+
+class AllocationSite(BaseModel):
+    """Memory held by one allocation site."""
+
+    location: str = Field(..., description="file:line, file or traceback")
+    size_bytes: int = Field(..., description="Memory currently held")
+    count: int = Field(..., description="Blocks currently held")
+    size_diff_bytes: Optional[int] = Field(
+        default=None, description="Change since the baseline"
+    )
+    count_diff: Optional[int] = Field(
+        default=None, description="Block count change since the baseline"
+    )
+
+
+class GcStatusResponse(BaseModel):
+    """Garbage collector state."""
+
+    enabled: bool = Field(..., description="Whether automatic collection is on")
+    thresholds: list[int] = Field(..., description="Thresholds per generation")
+    counts: list[int] = Field(..., description="Current counts per generation")
+    generations: list[Dict[str, int]] = Field(
+        ..., description="Collections, collected and uncollectable per generation"
+    )
+    frozen: int = Field(..., description="Objects in the permanent generation")
+    uncollectable: int = Field(..., description="Objects in gc.garbage")
+
+
+class TypeCount(BaseModel):
+    """Number of live GC-tracked objects of one type."""
+
+    type: str = Field(..., description="Qualified type name")
+    count: int = Field(..., description="Live objects")
+
+
+class PolynomialResponse(BaseModel):
+    """Response model for polynomial endpoints."""
+
+    operation: str = Field(..., description="Operation performed")
+    shape: list[int] = Field(..., description="Shape of the result")
+    result: Any = Field(..., description="Values, coefficients or roots")
+
+
+class IntegerResponse(BaseModel):
+    """Response model for number-theory endpoints."""
+
+    operation: str = Field(..., description="Operation performed")
+    args: List[int] = Field(..., description="Integer arguments")
+    result: Any = Field(..., description="Integer, boolean or [prime, exponent] pairs")
+
+
+class IntegerItemResult(BaseModel):
+    """Outcome of a single item in a number-theory batch."""
+
+    result: Any = Field(default=None, description="Result, if successful")
+    error: Optional[str] = Field(default=None, description="Error, if failed")
+
+
+class IntegerBatchResponse(BaseModel):
+    """Response model for batched number-theory calculations."""
+
+    operation: str = Field(..., description="Operation performed")
+    results: List[IntegerItemResult] = Field(..., description="Results in order")
+
+
+class PrimeTablesResponse(BaseModel):
+    """Coverage and memory use of the shared prime tables."""
+
+    sieve_limit: int = Field(..., description="Numbers below this use the sieve")
+    sieve_bytes: int = Field(..., description="Sieve memory")
+    max_sieve_limit: int = Field(..., description="Sieve coverage ceiling")
+    spf_limit: int = Field(..., description="Numbers below this use the SPF table")
+    spf_bytes: int = Field(..., description="SPF table memory")
+    max_spf_limit: int = Field(..., description="SPF coverage ceiling")
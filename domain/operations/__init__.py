@@ -1,16 +1,74 @@
-"""Arithmetic operations implementing Strategy pattern."""
+"""Arithmetic and scientific operations implementing Strategy pattern."""
 from domain.operations.basic import (
     AddOperation,
     SubtractOperation,
     MultiplyOperation,
     DivideOperation,
 )
+from domain.operations.scientific import (
+    SqrtOperation,
+    PowerOperation,
+    LogOperation,
+    ExpOperation,
+    SinOperation,
+    CosOperation,
+    TanOperation,
+    FactorialOperation,
+)
+from domain.operations.number_theory import (
+    GcdOperation,
+    LcmOperation,
+    ModPowOperation,
+    ModInverseOperation,
+    IsPrimeOperation,
+    FactorizeOperation,
+    PrimeTables,
+)
+from domain.operations.polynomial import (
+    PolynomialEvaluateOperation,
+    PolynomialDerivativeOperation,
+    PolynomialMultiplyOperation,
+    PolynomialRootsOperation,
+)
+from domain.operations.tensor import (
+    ElementwiseOperation,
+    ElementwiseDivideOperation,
+    DotOperation,
+    MatmulOperation,
+    SolveOperation,
+)
 from domain.operations.factory import OperationFactory
+from domain.operations.expression import Expression
 
 __all__ = [
     "AddOperation",
     "SubtractOperation",
     "MultiplyOperation",
     "DivideOperation",
+    "SqrtOperation",
+    "PowerOperation",
+    "LogOperation",
+    "ExpOperation",
+    "SinOperation",
+    "CosOperation",
+    "TanOperation",
+    "FactorialOperation",
+    "ElementwiseOperation",
+    "ElementwiseDivideOperation",
+    "DotOperation",
+    "MatmulOperation",
+    "SolveOperation",
+    "PolynomialEvaluateOperation",
+    "PolynomialDerivativeOperation",
+    "PolynomialMultiplyOperation",
+    "PolynomialRootsOperation",
+    "GcdOperation",
+    "LcmOperation",
+    "ModPowOperation",
+    "ModInverseOperation",
+    "IsPrimeOperation",
+    "FactorizeOperation",
+    "PrimeTables",
     "OperationFactory",
+    "Expression",
 ]
@@ -1,5 +1,11 @@
 """Concrete implementations of arithmetic operations."""
+from typing import Optional
 from domain.interfaces.operations import IOperation
+from domain.interfaces.result import CalculationResult, ErrorCode
+
+DIVISION_BY_ZERO = CalculationResult.failure(
+    ErrorCode.DIVISION_BY_ZERO, "Division by zero is not allowed"
+)
 
 
 class AddOperation(IOperation):
@@ -53,5 +59,11 @@ class DivideOperation(IOperation):
             ValueError: If y is zero
         """
         if y == 0:
-            raise ValueError("Division by zero is not allowed")
+            raise ValueError(DIVISION_BY_ZERO.message)
         return x / y
+
+    def try_execute(self, x: float, y: Optional[float]) -> CalculationResult:
+        """Divide x by y, returning ``DIVISION_BY_ZERO`` if y is zero."""
+        if y == 0:
+            return DIVISION_BY_ZERO
+        return CalculationResult(x / y)
@@ -0,0 +1,139 @@
+"""Expressions built from operation strategies, for scalars or arrays."""
+from typing import Any, Dict, Mapping, Tuple
+import numpy as np
+from domain.operations.factory import OperationFactory
+from domain.operations.vectorized import execute_vectorized
+
+MAX_NODES = 1000
+MAX_DEPTH = 64
+
+# Compiled node: ("const", value) | ("var", name) | ("op", operation, args)
+Node = Tuple[Any, ...]
+
+
+class Expression:
+    """
+    A formula over named variables built from factory operations.
+
+    The JSON form is a tree: a number is a constant, a string is a
+    variable, and ``{"op": "<operation>", "args": [...]}`` applies an
+    operation strategy (``add``, ``multiply``, ``sqrt``, ...) to its
+    arguments. For example ``x * x + 1`` is::
+
+        {"op": "add", "args": [{"op": "multiply", "args": ["x", "x"]}, 1]}
+
+    Evaluation goes through the same strategies as ``/calc``, so results and
+    error messages match it exactly.
+    """
+
+    def __init__(self, tree: Any, factory: OperationFactory):
+        """
+        Compile an expression tree.
+
+        Args:
+            tree: JSON expression tree
+            factory: Factory resolving operation names
+
+        Raises:
+            ValueError: If the tree is malformed, too large or uses unknown
+                operations or wrong argument counts
+        """
+        self.tree = tree
+        self.variables: set = set()
+        self._nodes = 0
+        self._root = self._compile(tree, factory, 0)
+
+    def _compile(self, tree: Any, factory: OperationFactory, depth: int) -> Node:
+        self._nodes += 1
+        if self._nodes > MAX_NODES:
+            raise ValueError(f"Expression exceeds {MAX_NODES} nodes")
+        if depth > MAX_DEPTH:
+            raise ValueError(f"Expression is nested deeper than {MAX_DEPTH} levels")
+        if isinstance(tree, bool):
+            raise ValueError("Expression constants must be numbers")
+        if isinstance(tree, (int, float)):
+            return ("const", float(tree))
+        if isinstance(tree, str):
+            if not tree:
+                raise ValueError("Expression variables need a name")
+            self.variables.add(tree)
+            return ("var", tree)
+        if not isinstance(tree, dict) or set(tree) != {"op", "args"}:
+            raise ValueError(
+                'Expression nodes must be numbers, variable names or {"op", "args"}'
+            )
+        if not isinstance(tree["args"], list):
+            raise ValueError("Expression args must be a list")
+        operation = factory.get_operation(str(tree["op"]))
+        if len(tree["args"]) != operation.arity:
+            raise ValueError(
+                f"{operation.name} takes {operation.arity} arguments, "
+                f"got {len(tree['args'])}"
+            )
+        args = tuple(self._compile(arg, factory, depth + 1) for arg in tree["args"])
+        return ("op", operation, args)
+
+    def evaluate(self, values: Mapping[str, float]) -> float:
+        """
+        Evaluate at one point.
+
+        Raises:
+            ValueError: If an operation fails or a variable is missing
+        """
+        return self._scalar(self._root, values)
+
+    def _scalar(self, node: Node, values: Mapping[str, float]) -> float:
+        kind = node[0]
+        if kind == "const":
+            return node[1]
+        if kind == "var":
+            try:
+                return float(values[node[1]])
+            except KeyError:
+                raise ValueError(f"No value for variable {node[1]}") from None
+        operation, args = node[1], node[2]
+        return operation.execute(*(self._scalar(arg, values) for arg in args))
+
+    def evaluate_array(self, values: Mapping[str, np.ndarray]) -> np.ndarray:
+        """
+        Evaluate at many points at once.
+
+        Args:
+            values: Equal-length 1-D arrays per variable
+
+        Returns:
+            Result per point
+
+        Raises:
+            ValueError: At the first point where an operation fails, naming
+                that point
+        """
+        arrays = {
+            name: np.asarray(array, dtype=np.float64) for name, array in values.items()
+        }
+        shape = next(iter(arrays.values())).shape if arrays else (1,)
+        return self._vector(self._root, arrays, shape)
+
+    def _vector(
+        self, node: Node, values: Dict[str, np.ndarray], shape: Tuple[int, ...]
+    ) -> np.ndarray:
+        kind = node[0]
+        if kind == "const":
+            return np.full(shape, node[1])
+        if kind == "var":
+            try:
+                return values[node[1]]
+            except KeyError:
+                raise ValueError(f"No value for variable {node[1]}") from None
+        operation, args = node[1], node[2]
+        operands = [self._vector(arg, values, shape) for arg in args]
+        results, errors = execute_vectorized(operation, *operands)
+        if errors:
+            index = min(errors)
+            if not values:
+                raise ValueError(errors[index])
+            point = ", ".join(
+                f"{name}={float(values[name][index])!r}" for name in sorted(values)
+            )
+            raise ValueError(f"{errors[index]} (at {point})")
+        return results
@@ -1,24 +1,101 @@
 """Factory for resolving operations by name."""
-from typing import Dict
-from domain.interfaces.operations import IOperation
+from typing import Dict, Optional
+import numpy as np
+from domain.interfaces.operations import (
+    IIntegerOperation,
+    IOperation,
+    IPolynomialOperation,
+    ITensorOperation,
+)
+from domain.interfaces.result import CalculationResult, ErrorCode
 from domain.operations.basic import (
     AddOperation,
     SubtractOperation,
     MultiplyOperation,
     DivideOperation,
 )
+from domain.operations.scientific import (
+    SqrtOperation,
+    PowerOperation,
+    LogOperation,
+    ExpOperation,
+    SinOperation,
+    CosOperation,
+    TanOperation,
+    FactorialOperation,
+)
+from domain.operations.number_theory import (
+    FactorizeOperation,
+    GcdOperation,
+    IsPrimeOperation,
+    LcmOperation,
+    ModInverseOperation,
+    ModPowOperation,
+    PrimeTables,
+)
+from domain.operations.polynomial import (
+    PolynomialEvaluateOperation,
+    PolynomialDerivativeOperation,
+    PolynomialMultiplyOperation,
+    PolynomialRootsOperation,
+)
+from domain.operations.tensor import (
+    ElementwiseOperation,
+    ElementwiseDivideOperation,
+    DotOperation,
+    MatmulOperation,
+    SolveOperation,
+)
 
 
 class OperationFactory:
     """Factory to resolve operation strategies by name."""
 
-    def __init__(self):
-        """Initialize factory with available operations."""
+    def __init__(self, prime_tables: Optional[PrimeTables] = None):
+        """
+        Initialize factory with available operations.
+
+        Args:
+            prime_tables: Tables shared by primality and factorization;
+                default-sized ones are created if omitted
+        """
         self._operations: Dict[str, IOperation] = {
             "add": AddOperation(),
             "subtract": SubtractOperation(),
             "multiply": MultiplyOperation(),
             "divide": DivideOperation(),
+            "sqrt": SqrtOperation(),
+            "pow": PowerOperation(),
+            "log": LogOperation(),
+            "exp": ExpOperation(),
+            "sin": SinOperation(),
+            "cos": CosOperation(),
+            "tan": TanOperation(),
+            "factorial": FactorialOperation(),
+        }
+        self._tensor_operations: Dict[str, ITensorOperation] = {
+            "add": ElementwiseOperation("add", np.add),
+            "subtract": ElementwiseOperation("subtract", np.subtract),
+            "multiply": ElementwiseOperation("multiply", np.multiply),
+            "divide": ElementwiseDivideOperation(),
+            "dot": DotOperation(),
+            "matmul": MatmulOperation(),
+            "solve": SolveOperation(),
+        }
+        self._polynomial_operations: Dict[str, IPolynomialOperation] = {
+            "evaluate": PolynomialEvaluateOperation(),
+            "derivative": PolynomialDerivativeOperation(),
+            "multiply": PolynomialMultiplyOperation(),
+            "roots": PolynomialRootsOperation(),
+        }
+        self.prime_tables = prime_tables or PrimeTables()
+        self._integer_operations: Dict[str, IIntegerOperation] = {
+            "gcd": GcdOperation(),
+            "lcm": LcmOperation(),
+            "modpow": ModPowOperation(),
+            "modinv": ModInverseOperation(),
+            "is_prime": IsPrimeOperation(self.prime_tables),
+            "factorize": FactorizeOperation(self.prime_tables),
         }
 
     def get_operation(self, name: str) -> IOperation:
@@ -26,7 +103,7 @@ class OperationFactory:
         Get operation by name.
 
         Args:
-            name: Operation name (add, subtract, multiply, divide)
+            name: Operation name (e.g. add, divide, sqrt, pow)
 
         Returns:
             Operation instance
@@ -34,14 +111,108 @@ class OperationFactory:
         Raises:
             ValueError: If operation name is not supported
         """
-        operation = self._operations.get(name.lower())
+        operation = self.try_get_operation(name)
         if operation is None:
-            raise ValueError(
-                f"Invalid operation: {name}. "
-                f"Supported operations: {', '.join(self._operations.keys())}"
-            )
+            raise ValueError(self.unknown_operation(name).message)
         return operation
 
+    def try_get_operation(self, name: str) -> Optional[IOperation]:
+        """
+        Get operation by name without raising.
+
+        Args:
+            name: Operation name (e.g. add, divide, sqrt, pow)
+
+        Returns:
+            Operation instance, or None if the name is not supported
+        """
+        return self._operations.get(name.lower())
+
+    def unknown_operation(self, name: str) -> CalculationResult:
+        """Return the failed result for an unsupported operation name."""
+        return CalculationResult.failure(
+            ErrorCode.INVALID_OPERATION,
+            f"Invalid operation: {name}. "
+            f"Supported operations: {', '.join(self._operations.keys())}",
+        )
+
     def get_available_operations(self) -> list[str]:
         """Return list of available operation names."""
         return list(self._operations.keys())
+
+    def get_tensor_operation(self, name: str) -> ITensorOperation:
+        """
+        Get vector/matrix operation by name.
+
+        Args:
+            name: Operation name (add, subtract, multiply, divide, dot,
+                matmul, solve)
+
+        Returns:
+            Tensor operation instance
+
+        Raises:
+            ValueError: If operation name is not supported
+        """
+        operation = self._tensor_operations.get(name.lower())
+        if operation is None:
+            raise ValueError(
+                f"Invalid tensor operation: {name}. "
+                f"Supported operations: {', '.join(self._tensor_operations.keys())}"
+            )
+        return operation
+
+    def get_available_tensor_operations(self) -> list[str]:
+        """Return list of available vector/matrix operation names."""
+        return list(self._tensor_operations.keys())
+
+    def get_polynomial_operation(self, name: str) -> IPolynomialOperation:
+        """
+        Get polynomial operation by name.
+
+        Args:
+            name: Operation name (evaluate, derivative, multiply, roots)
+
+        Returns:
+            Polynomial operation instance
+
+        Raises:
+            ValueError: If operation name is not supported
+        """
+        operation = self._polynomial_operations.get(name.lower())
+        if operation is None:
+            raise ValueError(
+                f"Invalid polynomial operation: {name}. Supported operations: "
+                f"{', '.join(self._polynomial_operations.keys())}"
+            )
+        return operation
+
+    def get_available_polynomial_operations(self) -> list[str]:
+        """Return list of available polynomial operation names."""
+        return list(self._polynomial_operations.keys())
+
+    def get_integer_operation(self, name: str) -> IIntegerOperation:
+        """
+        Get number-theory operation by name.
+
+        Args:
+            name: Operation name (gcd, lcm, modpow, modinv, is_prime,
+                factorize)
+
+        Returns:
+            Integer operation instance
+
+        Raises:
+            ValueError: If operation name is not supported
+        """
+        operation = self._integer_operations.get(name.lower())
+        if operation is None:
+            raise ValueError(
+                f"Invalid integer operation: {name}. Supported operations: "
+                f"{', '.join(self._integer_operations.keys())}"
+            )
+        return operation
+
+    def get_available_integer_operations(self) -> list[str]:
+        """Return list of available number-theory operation names."""
+        return list(self._integer_operations.keys())
@@ -0,0 +1,343 @@
+"""Number-theory operations backed by lazily grown prime tables."""
+import itertools
+import math
+import threading
+from math import isqrt
+from typing import Any, Dict, List
+import numpy as np
+from domain.interfaces.operations import IIntegerOperation
+
+# Miller-Rabin with the first 13 prime bases is exact below this bound and a
+# strong probable-prime test above it
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+MILLER_RABIN_EXACT_BELOW = 3_317_044_064_679_887_385_961_981
+
+# Numbers a table covers at least, once first used
+MIN_GROWTH = 1 << 16
+# Primes tried by division before Pollard's rho
+TRIAL_DIVISION_LIMIT = 1000
+# Iterations between gcd checks in Brent's cycle search
+RHO_BATCH = 128
+
+
+def primes_up_to(n: int) -> List[int]:
+    """Return the primes up to ``n`` with a plain sieve (for small ``n``)."""
+    flags = np.ones(n + 1, dtype=bool)
+    flags[:2] = False
+    for p in range(2, isqrt(n) + 1):
+        if flags[p]:
+            flags[p * p :: p] = False
+    return np.flatnonzero(flags).tolist()
+
+
+def miller_rabin(n: int) -> bool:
+    """Return whether an odd ``n > 3`` passes Miller-Rabin for every base."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in MILLER_RABIN_BASES:
+        if base % n == 0:
+            continue
+        x = pow(base, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_brent(n: int) -> int:
+    """
+    Find a non-trivial factor of a composite ``n`` with Brent's variant
+    of Pollard's rho.
+
+    Polynomial constants are tried in order from 1, so results are
+    reproducible.
+    """
+    if n % 2 == 0:
+        return 2
+    for c in itertools.count(1):
+        y, r, q, g = 2, 1, 1, 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(RHO_BATCH, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += RHO_BATCH
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+    raise AssertionError("unreachable")
+
+
+SMALL_PRIMES = primes_up_to(TRIAL_DIVISION_LIMIT)
+
+
+class PrimeTables:
+    """
+    Prime sieve and smallest-prime-factor table, grown on demand.
+
+    The sieve is a bytearray with one byte per odd number and answers
+    primality below its limit with a single lookup. The SPF table stores the
+    smallest prime factor of every integer below its limit as uint32, so
+    factorizing a covered number takes at most log2(n) lookups. Each table
+    grows by sieving only the new segment, at least doubling every time, up
+    to its memory ceiling. Numbers beyond the ceilings use Miller-Rabin and
+    Pollard's rho instead.
+
+    Lookups take no lock: growth only appends, under a lock, and publishes
+    the new limit last.
+    """
+
+    def __init__(
+        self, max_sieve_bytes: int = 16 * 1024**2, max_spf_bytes: int = 16 * 1024**2
+    ):
+        """
+        Initialize empty tables.
+
+        Args:
+            max_sieve_bytes: Memory ceiling of the sieve (covers twice as
+                many numbers)
+            max_spf_bytes: Memory ceiling of the SPF table (4 bytes per number)
+        """
+        self.max_sieve_limit = 2 * max_sieve_bytes
+        self.max_spf_limit = max_spf_bytes // 4
+        self._sieve = bytearray()  # index i is the odd number 2i + 1
+        self.sieve_limit = 0
+        self._spf = np.zeros(0, dtype=np.uint32)
+        self.spf_limit = 0
+        self._lock = threading.Lock()
+
+    def is_prime(self, n: int) -> bool:
+        """Return whether n is prime, from the sieve when it can cover n."""
+        if n < 4:
+            return n >= 2
+        if n % 2 == 0:
+            return False
+        if n < self.max_sieve_limit:
+            if n >= self.sieve_limit:
+                self.reserve(n)
+            return bool(self._sieve[n >> 1])
+        return miller_rabin(n)
+
+    def factorize(self, n: int) -> List[List[int]]:
+        """
+        Return the prime factorization of ``n >= 1`` as ``[prime, exponent]``
+        pairs in ascending order.
+        """
+        factors: Dict[int, int] = {}
+        if n >= self.max_spf_limit:
+            n = self._trial_divide(n, factors)
+        pending = [n] if n > 1 else []
+        while pending:
+            m = pending.pop()
+            if m < self.max_spf_limit:
+                self._walk_spf(m, factors)
+            elif self.is_prime(m):
+                factors[m] = factors.get(m, 0) + 1
+            else:
+                d = pollard_brent(m)
+                pending += [d, m // d]
+        return [[p, factors[p]] for p in sorted(factors)]
+
+    def reserve(self, n: int, factorization: bool = False) -> None:
+        """
+        Grow the sieve, and the SPF table if asked, to cover ``n`` now.
+
+        Coverage is capped by the memory ceilings.
+        """
+        with self._lock:
+            self._grow_sieve(min(n, self.max_sieve_limit - 1))
+            if factorization:
+                self._grow_spf(min(n, self.max_spf_limit - 1))
+
+    def status(self) -> Dict[str, int]:
+        """Return current coverage, memory use and ceilings."""
+        return {
+            "sieve_limit": self.sieve_limit,
+            "sieve_bytes": len(self._sieve),
+            "max_sieve_limit": self.max_sieve_limit,
+            "spf_limit": self.spf_limit,
+            "spf_bytes": self._spf.nbytes,
+            "max_spf_limit": self.max_spf_limit,
+        }
+
+    def _walk_spf(self, n: int, factors: Dict[int, int]) -> None:
+        if n >= self.spf_limit:
+            self.reserve(n, factorization=True)
+        spf = self._spf
+        while n > 1:
+            p = int(spf[n])
+            n //= p
+            factors[p] = factors.get(p, 0) + 1
+
+    def _trial_divide(self, n: int, factors: Dict[int, int]) -> int:
+        for p in SMALL_PRIMES:
+            while n % p == 0:
+                n //= p
+                factors[p] = factors.get(p, 0) + 1
+        return n
+
+    def _grow_sieve(self, target: int) -> None:
+        if target < self.sieve_limit:
+            return
+        low = self.sieve_limit
+        high = min(max(target + 1, 2 * low, MIN_GROWTH), self.max_sieve_limit)
+        high += high % 2
+        # Odd numbers low + 1, low + 3, ..., high - 1
+        segment = np.ones((high - low) // 2, dtype=bool)
+        if low == 0:
+            segment[0] = False  # 1 is not prime
+        for p in primes_up_to(isqrt(high - 1))[1:]:
+            start = max(p * p, -(-(low + 1) // p) * p)
+            if start % 2 == 0:
+                start += p
+            segment[(start - low - 1) // 2 :: p] = False
+        self._sieve += segment.view(np.uint8).tobytes()
+        self.sieve_limit = high
+
+    def _grow_spf(self, target: int) -> None:
+        if target < self.spf_limit:
+            return
+        low = self.spf_limit
+        high = min(max(target + 1, 2 * low, MIN_GROWTH), self.max_spf_limit)
+        segment = np.zeros(high - low, dtype=np.uint32)
+        for p in primes_up_to(isqrt(high - 1)):
+            start = max(p * p, -(-low // p) * p)
+            multiples = segment[start - low :: p]
+            multiples[multiples == 0] = p
+        unmarked = segment == 0
+        segment[unmarked] = np.arange(low, high, dtype=np.uint32)[unmarked]
+        self._spf = np.concatenate((self._spf, segment))
+        self.spf_limit = high
+
+
+class GcdOperation(IIntegerOperation):
+    """Greatest common divisor."""
+
+    @property
+    def name(self) -> str:
+        return "gcd"
+
+    @property
+    def arity(self) -> int:
+        return 2
+
+    def execute(self, a: int, b: int) -> int:
+        return math.gcd(a, b)
+
+
+class LcmOperation(IIntegerOperation):
+    """Least common multiple."""
+
+    @property
+    def name(self) -> str:
+        return "lcm"
+
+    @property
+    def arity(self) -> int:
+        return 2
+
+    def execute(self, a: int, b: int) -> int:
+        return math.lcm(a, b)
+
+
+class ModPowOperation(IIntegerOperation):
+    """Modular exponentiation; negative exponents use the modular inverse."""
+
+    @property
+    def name(self) -> str:
+        return "modpow"
+
+    @property
+    def arity(self) -> int:
+        return 3
+
+    def execute(self, base: int, exponent: int, modulus: int) -> int:
+        if modulus < 1:
+            raise ValueError("Modulus must be positive")
+        if exponent < 0 and math.gcd(base, modulus) != 1:
+            raise ValueError(f"{base} has no inverse modulo {modulus}")
+        return pow(base, exponent, modulus)
+
+
+class ModInverseOperation(IIntegerOperation):
+    """Modular multiplicative inverse."""
+
+    @property
+    def name(self) -> str:
+        return "modinv"
+
+    @property
+    def arity(self) -> int:
+        return 2
+
+    def execute(self, a: int, modulus: int) -> int:
+        return ModPowOperation().execute(a, -1, modulus)
+
+
+class IsPrimeOperation(IIntegerOperation):
+    """Primality test."""
+
+    def __init__(self, tables: PrimeTables):
+        """
+        Initialize operation.
+
+        Args:
+            tables: Shared prime tables
+        """
+        self._tables = tables
+
+    @property
+    def name(self) -> str:
+        return "is_prime"
+
+    @property
+    def arity(self) -> int:
+        return 1
+
+    def execute(self, n: int) -> bool:
+        return self._tables.is_prime(n)
+
+
+class FactorizeOperation(IIntegerOperation):
+    """Prime factorization as ``[prime, exponent]`` pairs."""
+
+    def __init__(self, tables: PrimeTables):
+        """
+        Initialize operation.
+
+        Args:
+            tables: Shared prime tables
+        """
+        self._tables = tables
+
+    @property
+    def name(self) -> str:
+        return "factorize"
+
+    @property
+    def arity(self) -> int:
+        return 1
+
+    def execute(self, n: int) -> Any:
+        if n < 1:
+            raise ValueError("Only positive integers can be factorized")
+        return self._tables.factorize(n)
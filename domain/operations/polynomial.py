@@ -0,0 +1,183 @@
+"""Polynomial operations on coefficient arrays (ascending powers)."""
+from typing import Optional
+import numpy as np
+from domain.interfaces.operations import IPolynomialOperation
+
+# Points evaluated per pass over the coefficients; small enough that the
+# working slice stays in cache while every coefficient is applied to it
+EVALUATION_CHUNK = 4096
+
+# Shorter factor length from which products use FFT instead of convolution
+FFT_THRESHOLD = 64
+
+# Relative imaginary part below which an eigenvalue counts as a real root
+REAL_ROOT_TOLERANCE = 1e-7
+NEWTON_STEPS = 3
+
+
+def horner(coefficients: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a polynomial at every point with Horner's method.
+
+    Works chunk by chunk in place on the output array, so no temporaries
+    proportional to the number of points are allocated.
+
+    Args:
+        coefficients: Coefficients in ascending order (non-empty)
+        points: Points of any shape
+
+    Returns:
+        Values with the shape of points
+    """
+    out = np.empty(points.shape, dtype=np.float64)
+    flat_points = points.reshape(-1)
+    flat_out = out.reshape(-1)
+    highest = coefficients[-1]
+    lower = coefficients[-2::-1].tolist()
+    for start in range(0, flat_points.size, EVALUATION_CHUNK):
+        x = flat_points[start : start + EVALUATION_CHUNK]
+        acc = flat_out[start : start + EVALUATION_CHUNK]
+        acc.fill(highest)
+        for coefficient in lower:
+            np.multiply(acc, x, out=acc)
+            np.add(acc, coefficient, out=acc)
+    return out
+
+
+def _derivative(coefficients: np.ndarray) -> np.ndarray:
+    if coefficients.size == 1:
+        return np.zeros(1)
+    return coefficients[1:] * np.arange(1, coefficients.size)
+
+
+class PolynomialEvaluateOperation(IPolynomialOperation):
+    """Evaluate a polynomial at many points."""
+
+    @property
+    def name(self) -> str:
+        return "evaluate"
+
+    @property
+    def requires_operand(self) -> bool:
+        return True
+
+    def result_size(self, coefficients: int, operand: int) -> int:
+        return operand
+
+    def execute(
+        self, coefficients: np.ndarray, operand: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Return the polynomial's value at each point of operand."""
+        return horner(coefficients, operand)
+
+
+class PolynomialDerivativeOperation(IPolynomialOperation):
+    """Differentiate a polynomial."""
+
+    @property
+    def name(self) -> str:
+        return "derivative"
+
+    def result_size(self, coefficients: int, operand: int) -> int:
+        return max(1, coefficients - 1)
+
+    def execute(
+        self, coefficients: np.ndarray, operand: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Return the coefficients of the derivative."""
+        return _derivative(coefficients)
+
+
+class PolynomialMultiplyOperation(IPolynomialOperation):
+    """
+    Multiply two polynomials.
+
+    Short factors use direct convolution (exact for integer coefficients);
+    when both factors have at least ``FFT_THRESHOLD`` coefficients the
+    product goes through a real FFT in O(n log n), with rounding error of
+    order ``n * eps * max|a| * max|b|``.
+    """
+
+    @property
+    def name(self) -> str:
+        return "multiply"
+
+    @property
+    def requires_operand(self) -> bool:
+        return True
+
+    def result_size(self, coefficients: int, operand: int) -> int:
+        return coefficients + operand - 1
+
+    def execute(
+        self, coefficients: np.ndarray, operand: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Return the coefficients of the product."""
+        size = coefficients.size + operand.size - 1
+        if min(coefficients.size, operand.size) < FFT_THRESHOLD:
+            return np.convolve(coefficients, operand)
+        fft_size = 1 << (size - 1).bit_length()
+        spectrum = np.fft.rfft(coefficients, fft_size) * np.fft.rfft(operand, fft_size)
+        return np.fft.irfft(spectrum, fft_size)[:size]
+
+
+class PolynomialRootsOperation(IPolynomialOperation):
+    """
+    Find the distinct real roots of a polynomial.
+
+    Roots are eigenvalues of the companion matrix (O(n^3)), kept when their
+    imaginary part is negligible and refined with Newton steps.
+    """
+
+    @property
+    def name(self) -> str:
+        return "roots"
+
+    def result_size(self, coefficients: int, operand: int) -> int:
+        return max(0, coefficients - 1)
+
+    def execute(
+        self, coefficients: np.ndarray, operand: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Return the real roots in ascending order.
+
+        Raises:
+            ValueError: If every coefficient is zero
+        """
+        trimmed = np.trim_zeros(coefficients, "b")
+        if trimmed.size == 0:
+            raise ValueError("The zero polynomial has infinitely many roots")
+        nonzero = np.trim_zeros(trimmed, "f")
+        has_zero_root = nonzero.size < trimmed.size
+        if nonzero.size == 1:
+            roots = np.empty(0)
+        else:
+            candidates = np.roots(nonzero[::-1])
+            real = np.abs(candidates.imag) <= REAL_ROOT_TOLERANCE * np.maximum(
+                1.0, np.abs(candidates)
+            )
+            roots = self._polish(nonzero, candidates[real].real)
+        if has_zero_root:
+            roots = np.append(roots, 0.0)
+        return self._distinct(np.sort(roots))
+
+    @staticmethod
+    def _polish(coefficients: np.ndarray, roots: np.ndarray) -> np.ndarray:
+        slope_coefficients = _derivative(coefficients)
+        with np.errstate(all="ignore"):
+            for _ in range(NEWTON_STEPS):
+                values = horner(coefficients, roots)
+                slopes = horner(slope_coefficients, roots)
+                step = np.where(slopes != 0, values / slopes, 0.0)
+                candidate = roots - step
+                better = np.abs(horner(coefficients, candidate)) < np.abs(values)
+                roots = np.where(better & np.isfinite(candidate), candidate, roots)
+        return roots
+
+    @staticmethod
+    def _distinct(roots: np.ndarray) -> np.ndarray:
+        if roots.size < 2:
+            return roots
+        gaps = np.diff(roots) > REAL_ROOT_TOLERANCE * np.maximum(1.0, np.abs(roots[1:]))
+        return roots[np.concatenate(([True], gaps))]
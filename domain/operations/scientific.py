@@ -0,0 +1,283 @@
+"""Scientific operations with precomputed fast paths for small integers."""
+import math
+import sys
+from typing import Dict, Optional, Tuple
+from domain.interfaces.operations import IOperation, IUnaryOperation
+from domain.interfaces.result import CalculationResult, ErrorCode
+
+# Largest n whose factorial is representable as a float
+MAX_FLOAT_FACTORIAL = 170
+# Arguments above this overflow math.exp
+_MAX_EXP_ARGUMENT = math.log(sys.float_info.max)
+
+NEGATIVE_SQUARE_ROOT = CalculationResult.failure(
+    ErrorCode.DOMAIN_ERROR, "Square root of a negative number is not allowed"
+)
+NON_POSITIVE_LOGARITHM = CalculationResult.failure(
+    ErrorCode.DOMAIN_ERROR, "Logarithm is only defined for positive numbers"
+)
+INVALID_FACTORIAL = CalculationResult.failure(
+    ErrorCode.DOMAIN_ERROR, "Factorial is only defined for non-negative integers"
+)
+ZERO_TO_NEGATIVE_POWER = CalculationResult.failure(
+    ErrorCode.DOMAIN_ERROR, "Zero cannot be raised to a negative power"
+)
+NEGATIVE_BASE_POWER = CalculationResult.failure(
+    ErrorCode.DOMAIN_ERROR, "Negative base requires an integer exponent"
+)
+RESULT_TOO_LARGE = CalculationResult.failure(
+    ErrorCode.DOMAIN_ERROR, "Result is too large"
+)
+
+
+def _is_integral(value: float) -> bool:
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _from_integer(value: int) -> CalculationResult:
+    """Convert an exact integer result, mapping overflow to ``RESULT_TOO_LARGE``."""
+    if abs(value) > sys.float_info.max:
+        return RESULT_TOO_LARGE
+    return CalculationResult(float(value))
+
+
+def _product_range(low: int, high: int) -> int:
+    """
+    Return the product of all integers in [low, high].
+
+    Splits the range in halves so the big-integer multiplications stay
+    balanced; short ranges are handed to ``math.prod``.
+    """
+    if high - low < 32:
+        return math.prod(range(low, high + 1))
+    mid = (low + high) // 2
+    return _product_range(low, mid) * _product_range(mid + 1, high)
+
+
+class SqrtOperation(IUnaryOperation):
+    """Square root operation strategy."""
+
+    @property
+    def name(self) -> str:
+        return "sqrt"
+
+    def apply(self, x: float) -> float:
+        """
+        Return the square root of x.
+
+        Raises:
+            ValueError: If x is negative
+        """
+        if x < 0:
+            raise ValueError(NEGATIVE_SQUARE_ROOT.message)
+        return math.sqrt(x)
+
+    def try_execute(self, x: float, y: Optional[float]) -> CalculationResult:
+        """Return the square root of x, or ``NEGATIVE_SQUARE_ROOT`` if x < 0."""
+        if x < 0:
+            return NEGATIVE_SQUARE_ROOT
+        return CalculationResult(math.sqrt(x))
+
+
+class LogOperation(IUnaryOperation):
+    """Natural logarithm operation strategy."""
+
+    @property
+    def name(self) -> str:
+        return "log"
+
+    def apply(self, x: float) -> float:
+        """
+        Return the natural logarithm of x.
+
+        Raises:
+            ValueError: If x is not positive
+        """
+        if x <= 0:
+            raise ValueError(NON_POSITIVE_LOGARITHM.message)
+        return math.log(x)
+
+    def try_execute(self, x: float, y: Optional[float]) -> CalculationResult:
+        """Return the logarithm of x, or ``NON_POSITIVE_LOGARITHM`` if x <= 0."""
+        if x <= 0:
+            return NON_POSITIVE_LOGARITHM
+        return CalculationResult(math.log(x))
+
+
+class ExpOperation(IUnaryOperation):
+    """Exponential operation strategy."""
+
+    @property
+    def name(self) -> str:
+        return "exp"
+
+    def apply(self, x: float) -> float:
+        """
+        Return e raised to the power x.
+
+        Raises:
+            ValueError: If the result overflows
+        """
+        outcome = self.try_execute(x, None)
+        if outcome.error is not None:
+            raise ValueError(outcome.message)
+        return outcome.value
+
+    def try_execute(self, x: float, y: Optional[float]) -> CalculationResult:
+        """Return e raised to the power x, or ``RESULT_TOO_LARGE``."""
+        if x > _MAX_EXP_ARGUMENT:
+            return RESULT_TOO_LARGE
+        try:
+            return CalculationResult(math.exp(x))
+        except OverflowError:
+            # Rounding right at the limit
+            return RESULT_TOO_LARGE
+
+
+class SinOperation(IUnaryOperation):
+    """Sine operation strategy (radians)."""
+
+    @property
+    def name(self) -> str:
+        return "sin"
+
+    def apply(self, x: float) -> float:
+        """Return the sine of x."""
+        return math.sin(x)
+
+
+class CosOperation(IUnaryOperation):
+    """Cosine operation strategy (radians)."""
+
+    @property
+    def name(self) -> str:
+        return "cos"
+
+    def apply(self, x: float) -> float:
+        """Return the cosine of x."""
+        return math.cos(x)
+
+
+class TanOperation(IUnaryOperation):
+    """Tangent operation strategy (radians)."""
+
+    @property
+    def name(self) -> str:
+        return "tan"
+
+    def apply(self, x: float) -> float:
+        """Return the tangent of x."""
+        return math.tan(x)
+
+
+class FactorialOperation(IUnaryOperation):
+    """Factorial operation strategy backed by a precomputed table."""
+
+    def __init__(self, table_size: int = MAX_FLOAT_FACTORIAL):
+        """
+        Initialize the factorial lookup table.
+
+        Args:
+            table_size: Largest n served from the table; larger inputs
+                are computed exactly by range splitting
+        """
+        table_size = min(table_size, MAX_FLOAT_FACTORIAL)
+        self._table = [1.0] * (table_size + 1)
+        exact = 1
+        for n in range(2, table_size + 1):
+            exact *= n
+            self._table[n] = float(exact)
+
+    @property
+    def name(self) -> str:
+        return "factorial"
+
+    def apply(self, x: float) -> float:
+        """
+        Return x! for a non-negative integer x.
+
+        Raises:
+            ValueError: If x is negative, not an integer, or x! overflows
+        """
+        outcome = self.try_execute(x, None)
+        if outcome.error is not None:
+            raise ValueError(outcome.message)
+        return outcome.value
+
+    def try_execute(self, x: float, y: Optional[float]) -> CalculationResult:
+        """Return x!, or ``INVALID_FACTORIAL`` / ``RESULT_TOO_LARGE``."""
+        if not _is_integral(x) or x < 0:
+            return INVALID_FACTORIAL
+        n = int(x)
+        if n < len(self._table):
+            return CalculationResult(self._table[n])
+        if n > MAX_FLOAT_FACTORIAL:
+            return RESULT_TOO_LARGE
+        return CalculationResult(float(_product_range(2, n)))
+
+
+class PowerOperation(IOperation):
+    """Exponentiation operation strategy with a small-integer power table."""
+
+    def __init__(self, max_base: int = 16, max_exponent: int = 64):
+        """
+        Initialize the power lookup table.
+
+        Args:
+            max_base: Bases in [-max_base, max_base] are precomputed
+            max_exponent: Exponents in [0, max_exponent] are precomputed
+        """
+        self._table: Dict[Tuple[int, int], float] = {
+            (base, exponent): float(base**exponent)
+            for base in range(-max_base, max_base + 1)
+            for exponent in range(max_exponent + 1)
+        }
+
+    @property
+    def name(self) -> str:
+        return "pow"
+
+    def execute(self, x: float, y: float) -> float:
+        """
+        Raise x to the power y.
+
+        Integral operands outside the table are computed exactly with
+        integer binary exponentiation; everything else uses ``math.pow``.
+
+        Raises:
+            ValueError: If the result is undefined or overflows
+        """
+        outcome = self.try_execute(x, y)
+        if outcome.error is not None:
+            raise ValueError(outcome.message)
+        return outcome.value
+
+    def try_execute(self, x: float, y: Optional[float]) -> CalculationResult:
+        """Raise x to the power y, returning undefined and overflowing results."""
+        if _is_integral(x) and _is_integral(y):
+            base, exponent = int(x), int(y)
+            cached = self._table.get((base, exponent))
+            if cached is not None:
+                return CalculationResult(cached)
+            if exponent >= 0:
+                # Reject certain overflows before building a huge integer
+                if abs(base) > 1 and exponent * math.log2(abs(base)) > 1024:
+                    return RESULT_TOO_LARGE
+                return _from_integer(base**exponent)
+
+        if x == 0 and y < 0:
+            return ZERO_TO_NEGATIVE_POWER
+        if x < 0 and not _is_integral(y):
+            return NEGATIVE_BASE_POWER
+        if (
+            x != 0
+            and math.isfinite(x)
+            and math.isfinite(y)
+            and y * math.log2(abs(x)) > 1024
+        ):
+            return RESULT_TOO_LARGE
+        try:
+            return CalculationResult(math.pow(x, y))
+        except OverflowError:
+            # Rounding right at the limit
+            return RESULT_TOO_LARGE
@@ -0,0 +1,142 @@
+"""Vector and matrix operations executed with NumPy/BLAS."""
+from typing import Tuple
+import numpy as np
+from domain.interfaces.operations import ITensorOperation
+
+Shape = Tuple[int, ...]
+
+
+def _broadcast_shape(x_shape: Shape, y_shape: Shape) -> Shape:
+    try:
+        return tuple(np.broadcast_shapes(x_shape, y_shape))
+    except ValueError:
+        raise ValueError(
+            f"Shapes {x_shape} and {y_shape} cannot be broadcast together"
+        ) from None
+
+
+class ElementwiseOperation(ITensorOperation):
+    """Element-wise arithmetic with NumPy broadcasting rules."""
+
+    def __init__(self, name: str, ufunc: np.ufunc):
+        """
+        Initialize element-wise operation.
+
+        Args:
+            name: Operation name (add, subtract, multiply, divide)
+            ufunc: NumPy ufunc implementing it
+        """
+        self._name = name
+        self._ufunc = ufunc
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def result_shape(self, x_shape: Shape, y_shape: Shape) -> Shape:
+        """Return the broadcast shape of the operands."""
+        return _broadcast_shape(x_shape, y_shape)
+
+    def execute(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Apply the operation element by element."""
+        return self._ufunc(x, y)
+
+
+class ElementwiseDivideOperation(ElementwiseOperation):
+    """Element-wise division rejecting zero divisors like the scalar strategy."""
+
+    def __init__(self):
+        super().__init__("divide", np.divide)
+
+    def execute(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Divide x by y element by element.
+
+        Raises:
+            ValueError: If any divisor is zero
+        """
+        if not np.all(y):
+            raise ValueError("Division by zero is not allowed")
+        return np.divide(x, y)
+
+
+class DotOperation(ITensorOperation):
+    """Dot product of two vectors."""
+
+    @property
+    def name(self) -> str:
+        return "dot"
+
+    def result_shape(self, x_shape: Shape, y_shape: Shape) -> Shape:
+        """Require two vectors of equal length; the result is a scalar."""
+        if len(x_shape) != 1 or len(y_shape) != 1:
+            raise ValueError("dot requires two vectors")
+        if x_shape != y_shape:
+            raise ValueError(
+                f"dot requires vectors of equal length, got {x_shape[0]} "
+                f"and {y_shape[0]}"
+            )
+        return ()
+
+    def execute(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Return the dot product as a 0-d array."""
+        return np.asarray(np.dot(x, y))
+
+
+class MatmulOperation(ITensorOperation):
+    """Matrix product following ``numpy.matmul`` rules."""
+
+    @property
+    def name(self) -> str:
+        return "matmul"
+
+    def result_shape(self, x_shape: Shape, y_shape: Shape) -> Shape:
+        """Require matching inner dimensions and broadcastable stacks."""
+        if not x_shape or not y_shape:
+            raise ValueError("matmul does not accept scalars")
+        x_core = x_shape if len(x_shape) > 1 else (1,) + x_shape
+        y_core = y_shape if len(y_shape) > 1 else y_shape + (1,)
+        if x_core[-1] != y_core[-2]:
+            raise ValueError(f"matmul inner dimensions differ: {x_shape} @ {y_shape}")
+        stack = _broadcast_shape(x_core[:-2], y_core[:-2])
+        shape = stack + (x_core[-2], y_core[-1])
+        if len(x_shape) == 1:
+            shape = shape[:-2] + shape[-1:]
+        if len(y_shape) == 1:
+            shape = shape[:-1]
+        return shape
+
+    def execute(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Return x @ y."""
+        return np.matmul(x, y)
+
+
+class SolveOperation(ITensorOperation):
+    """Solve the linear system a @ result = b."""
+
+    @property
+    def name(self) -> str:
+        return "solve"
+
+    def result_shape(self, x_shape: Shape, y_shape: Shape) -> Shape:
+        """Require a square matrix and a right-hand side with matching rows."""
+        if len(x_shape) != 2 or x_shape[0] != x_shape[1]:
+            raise ValueError("solve requires a square coefficient matrix")
+        if len(y_shape) not in (1, 2) or y_shape[0] != x_shape[0]:
+            raise ValueError(
+                f"solve right-hand side must have {x_shape[0]} rows, "
+                f"got shape {y_shape}"
+            )
+        return y_shape
+
+    def execute(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Return the solution of x @ result = y.
+
+        Raises:
+            ValueError: If the matrix is singular
+        """
+        try:
+            return np.linalg.solve(x, y)
+        except np.linalg.LinAlgError:
+            raise ValueError("Matrix is singular") from None
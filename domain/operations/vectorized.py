@@ -0,0 +1,80 @@
+"""Vectorized execution of operation strategies over NumPy arrays."""
+from typing import Callable, Dict, Optional, Tuple
+import numpy as np
+from domain.interfaces.operations import IOperation
+
+# A kernel returns the element-wise results plus a mask of rows whose
+# result must be confirmed by the scalar strategy (potential errors).
+Kernel = Callable[[np.ndarray, Optional[np.ndarray]], Tuple[np.ndarray, np.ndarray]]
+
+
+def _no_errors(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return values, np.zeros(values.shape, dtype=bool)
+
+
+def _exp(x: np.ndarray, y: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    values = np.exp(x)
+    return values, np.isinf(values) & np.isfinite(x)
+
+
+def _trig(ufunc: np.ufunc) -> Kernel:
+    def kernel(x: np.ndarray, y: Optional[np.ndarray]):
+        return ufunc(x), np.isinf(x)
+
+    return kernel
+
+
+KERNELS: Dict[str, Kernel] = {
+    "add": lambda x, y: _no_errors(np.add(x, y)),
+    "subtract": lambda x, y: _no_errors(np.subtract(x, y)),
+    "multiply": lambda x, y: _no_errors(np.multiply(x, y)),
+    "divide": lambda x, y: (np.divide(x, y), y == 0),
+    "sqrt": lambda x, y: (np.sqrt(x), x < 0),
+    "log": lambda x, y: (np.log(x), x <= 0),
+    "exp": _exp,
+    "sin": _trig(np.sin),
+    "cos": _trig(np.cos),
+    "tan": _trig(np.tan),
+}
+
+
+def execute_vectorized(
+    operation: IOperation, x: np.ndarray, y: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, Dict[int, str]]:
+    """
+    Execute an operation element-wise over arrays.
+
+    Operations with a NumPy kernel run vectorized; rows the kernel flags as
+    suspect, and every row of operations without a kernel, go through the
+    scalar strategy so results and error messages match ``execute`` exactly.
+
+    Args:
+        operation: Operation strategy
+        x: First operands
+        y: Second operands (None for unary operations)
+
+    Returns:
+        Tuple of (results with NaN for failed rows, {row index: error message})
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if y is not None:
+        y = np.asarray(y, dtype=np.float64)
+
+    kernel = KERNELS.get(operation.name)
+    if kernel is None:
+        values = np.empty(x.shape, dtype=np.float64)
+        suspect = np.ones(x.shape, dtype=bool)
+    else:
+        with np.errstate(all="ignore"):
+            values, suspect = kernel(x, y)
+
+    errors: Dict[int, str] = {}
+    for index in np.flatnonzero(suspect).tolist():
+        try:
+            values[index] = operation.execute(
+                float(x[index]), None if y is None else float(y[index])
+            )
+        except ValueError as e:
+            values[index] = np.nan
+            errors[index] = str(e)
+    return values, errors
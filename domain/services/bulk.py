@@ -0,0 +1,345 @@
+"""Bulk calculation jobs over memory-mapped CSV and Parquet files."""
+import csv
+import io
+import mmap
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import List, Optional, Tuple
+import numpy as np
+from domain.interfaces.logger import ILogger
+from domain.operations.factory import OperationFactory
+from domain.operations.vectorized import execute_vectorized
+from domain.services.jobs import Job, JobRegistry, execute_ordered, process_pool
+
+SUPPORTED_FORMATS = ("csv", "parquet")
+INVALID_ROW = "Invalid row"
+RESULT_HEADER = b"result,error\n"
+
+ChunkOutput = Tuple[bytes, int, int]
+
+# Per-process factory, created on first use inside each pool worker
+_worker_factory: Optional[OperationFactory] = None
+
+
+def _get_worker_factory() -> OperationFactory:
+    global _worker_factory
+    if _worker_factory is None:
+        _worker_factory = OperationFactory()
+    return _worker_factory
+
+
+def _parse_rows(data: bytes, columns: int) -> Tuple[np.ndarray, List[int]]:
+    """
+    Parse CSV rows into a (rows, columns) float array.
+
+    Uses NumPy's C parser for the whole chunk and only falls back to
+    line-by-line parsing when the chunk contains a malformed or blank row.
+    Every line is a row, so blank lines come back as bad rows.
+
+    Returns:
+        Tuple of (values with NaN in bad rows, indexes of bad rows)
+    """
+    usecols = tuple(range(columns))
+    lines = data.count(b"\n") + (not data.endswith(b"\n"))
+    try:
+        values = np.loadtxt(
+            io.BytesIO(data),
+            delimiter=",",
+            dtype=np.float64,
+            ndmin=2,
+            comments=None,
+            usecols=usecols,
+        )
+        # loadtxt skips blank lines, which must keep their place
+        if len(values) == lines:
+            return values, []
+    except ValueError:
+        pass
+
+    rows = data.split(b"\n")
+    if not rows[-1]:
+        rows.pop()
+    values = np.full((len(rows), columns), np.nan)
+    invalid: List[int] = []
+    for index, line in enumerate(rows):
+        fields = line.split(b",")
+        try:
+            values[index] = [float(fields[col]) for col in usecols]
+        except (ValueError, IndexError):
+            invalid.append(index)
+    return values, invalid
+
+
+def _format_results(values: np.ndarray, errors: dict) -> bytes:
+    """Render results as ``result,error`` CSV lines, quoting error text."""
+    if not errors:
+        lines = [f"{value!r}," for value in values.tolist()]
+        return ("\n".join(lines) + "\n").encode() if lines else b""
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerows(
+        ("", errors[index]) if index in errors else (repr(value), "")
+        for index, value in enumerate(values.tolist())
+    )
+    return output.getvalue().encode()
+
+
+def _compute_chunk(
+    operation_name: str, values: np.ndarray, invalid: List[int]
+) -> ChunkOutput:
+    operation = _get_worker_factory().get_operation(operation_name)
+    x = values[:, 0]
+    y = values[:, 1] if operation.arity == 2 else None
+    results, errors = execute_vectorized(operation, x, y)
+    for index in invalid:
+        results[index] = np.nan
+        errors[index] = INVALID_ROW
+    return _format_results(results, errors), len(results), len(errors)
+
+
+def process_csv_chunk(
+    path: str, start: int, end: int, operation_name: str, columns: int
+) -> ChunkOutput:
+    """
+    Calculate one byte range of a CSV file.
+
+    Runs inside pool workers: each worker maps the file itself so only
+    offsets, never row data, cross the process boundary.
+
+    Returns:
+        Tuple of (result CSV bytes, row count, failed row count)
+    """
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = mapped[start:end]
+    values, invalid = _parse_rows(data, columns)
+    return _compute_chunk(operation_name, values, invalid)
+
+
+def process_parquet_chunk(
+    path: str, row_group: int, operation_name: str, columns: int
+) -> ChunkOutput:
+    """Calculate one row group of a memory-mapped Parquet file."""
+    import pyarrow.parquet as pq
+
+    table = pq.ParquetFile(path, memory_map=True).read_row_group(row_group)
+    values = np.column_stack(
+        [
+            table.column(col).to_numpy(zero_copy_only=False).astype(np.float64)
+            for col in range(columns)
+        ]
+    )
+    return _compute_chunk(operation_name, values, [])
+
+
+def _csv_chunks(
+    path: Path, chunk_bytes: int, header: bool = False
+) -> List[Tuple[int, int]]:
+    """Split a CSV file into newline-aligned byte ranges after any header."""
+    size = path.stat().st_size
+    if size == 0:
+        return []
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            if header:
+                first_end = mapped.find(b"\n")
+                start = size if first_end < 0 else first_end + 1
+
+            chunks = []
+            while start < size:
+                end = min(start + chunk_bytes, size)
+                if end < size:
+                    newline = mapped.find(b"\n", end)
+                    end = size if newline < 0 else newline + 1
+                chunks.append((start, end))
+                start = end
+    return chunks
+
+
+class BulkJobService:
+    """
+    Runs file-based calculation jobs in the background.
+
+    Chunks of all jobs run in one process pool that lives as long as the
+    service, so jobs do not pay for starting worker processes.
+    """
+
+    def __init__(
+        self,
+        operation_factory: OperationFactory,
+        logger: ILogger,
+        registry: JobRegistry,
+        workdir: Path,
+        workers: int = 1,
+        chunk_bytes: int = 8 * 1024 * 1024,
+        max_concurrent_jobs: int = 2,
+    ):
+        """
+        Initialize bulk job service.
+
+        Args:
+            operation_factory: Factory used to validate operation names
+            logger: Logger for structured logging
+            registry: Registry that tracks job state
+            workdir: Directory for uploaded inputs and result files
+            workers: Processes shared by all jobs; 1 computes in the job
+                thread
+            chunk_bytes: Target size of each CSV chunk
+            max_concurrent_jobs: Jobs running at once; the rest queue
+        """
+        self._factory = operation_factory
+        self._logger = logger
+        self._registry = registry
+        self._workdir = Path(workdir)
+        self._workdir.mkdir(parents=True, exist_ok=True)
+        self._workers = max(1, workers)
+        self._chunk_bytes = chunk_bytes
+        self._runner = ThreadPoolExecutor(
+            max_workers=max_concurrent_jobs, thread_name_prefix="bulk-job"
+        )
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def workdir(self) -> Path:
+        """Return the directory holding job inputs and results."""
+        return self._workdir
+
+    def input_path(self, name: str) -> Path:
+        """Return a fresh path for an uploaded input file."""
+        return self._workdir / f"{name}.input"
+
+    def backlog(self) -> int:
+        """Return the number of jobs queued or running."""
+        return self._registry.pending_count()
+
+    def submit(
+        self,
+        input_path: Path,
+        operation_name: str,
+        file_format: str,
+        header: bool = False,
+    ) -> Job:
+        """
+        Validate and queue a job for an already stored input file.
+
+        Args:
+            input_path: Stored upload, deleted once the job finishes
+            operation_name: Operation applied to every row
+            file_format: "csv" or "parquet"
+            header: Whether the first CSV line is a header to skip
+
+        Raises:
+            ValueError: If the operation or format is not supported
+        """
+        operation = self._factory.get_operation(operation_name)
+        file_format = file_format.lower()
+        if file_format not in SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Unsupported format: {file_format}. "
+                f"Supported formats: {', '.join(SUPPORTED_FORMATS)}"
+            )
+        if file_format == "parquet":
+            try:
+                import pyarrow.parquet  # noqa: F401
+            except ImportError:
+                raise ValueError("Parquet input requires the pyarrow package")
+
+        job = self._registry.add(Job("bulk"))
+        job.stats.update(operation=operation.name, format=file_format, rows=0, failed=0)
+        self._logger.info("Bulk job submitted", job_id=job.id, operation=operation.name)
+        self._runner.submit(self._run, job, Path(input_path), operation, header)
+        return job
+
+    def result_path(self, job: Job) -> Path:
+        """Return the result file location of a job."""
+        return self._workdir / f"{job.id}.result.csv"
+
+    def delete(self, job_id: str) -> None:
+        """
+        Forget a finished job and delete its result file.
+
+        Raises:
+            KeyError: If no job has this ID
+            ValueError: If the job is still running
+        """
+        job = self._registry.get(job_id)
+        if not job.finished:
+            raise ValueError("Job is still running")
+        self._registry.remove(job_id)
+        self.result_path(job).unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs, wait for running ones and stop the pool."""
+        self._runner.shutdown(wait=True)
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _run(self, job: Job, input_path: Path, operation, header: bool) -> None:
+        job.start()
+        columns = operation.arity
+        pool = self._get_pool()
+        try:
+            if job.stats["format"] == "csv":
+                chunks = _csv_chunks(input_path, self._chunk_bytes, header)
+                tasks = [
+                    (
+                        process_csv_chunk,
+                        (str(input_path), start, end, operation.name, columns),
+                        end - start,
+                    )
+                    for start, end in chunks
+                ]
+            else:
+                import pyarrow.parquet as pq
+
+                metadata = pq.ParquetFile(input_path).metadata
+                tasks = [
+                    (
+                        process_parquet_chunk,
+                        (str(input_path), group, operation.name, columns),
+                        metadata.row_group(group).num_rows,
+                    )
+                    for group in range(metadata.num_row_groups)
+                ]
+            job.total = sum(weight for _, _, weight in tasks)
+
+            with open(self.result_path(job), "wb") as output:
+                output.write(RESULT_HEADER)
+                outputs = execute_ordered(tasks, self._workers, pool)
+                for (payload, rows, failed), weight in outputs:
+                    output.write(payload)
+                    job.stats["rows"] += rows
+                    job.stats["failed"] += failed
+                    job.advance(weight)
+
+            job.complete(str(self.result_path(job)))
+            self._logger.info("Bulk job completed", job_id=job.id, **job.stats)
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # A worker process died; the next job gets a fresh pool
+                self._discard_pool(pool)
+            job.fail(str(e))
+            self._logger.error("Bulk job failed", job_id=job.id, error=str(e))
+        finally:
+            input_path.unlink(missing_ok=True)
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self._workers == 1:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = process_pool(self._workers)
+            return self._pool
+
+    def _discard_pool(self, pool: Optional[ProcessPoolExecutor]) -> None:
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=False)
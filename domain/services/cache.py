@@ -0,0 +1,182 @@
+"""Result caches: per-process dict and cross-process shared memory."""
+import fcntl
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from domain.interfaces.cache import IResultCache
+
+CacheKey = Tuple[str, float, Optional[float]]
+
+# File layout: a header followed by fixed-size slots.
+_MAGIC = b"FCRCACHE"
+_VERSION = 1
+_HEADER = struct.Struct("<8sII")  # magic, version, slot count
+_HEADER_SIZE = 64
+
+# Slot: seq, used, ref, op id, x, y, result. The 24 key bytes (op id, x, y)
+# are compared as raw bytes, which also makes NaN operands cacheable.
+_SLOT = struct.Struct("<IBBxxIxxxxddd")
+_SLOT_SIZE = _SLOT.size
+_KEY = struct.Struct("<Ixxxxdd")
+_KEY_OFFSET = 8
+_RESULT = struct.Struct("<d")
+_RESULT_OFFSET = 32
+_SEQ = struct.Struct("<I")
+_SEQ_USED = struct.Struct("<IB")
+_USED_OFFSET = 4
+_REF_OFFSET = 5
+
+
+def _operation_id(operation: str) -> int:
+    return zlib.crc32(operation.encode())
+
+
+class LocalResultCache(IResultCache):
+    """Bounded per-process result cache backed by a dict."""
+
+    def __init__(self, max_entries: int = 65536):
+        """
+        Initialize local cache.
+
+        Args:
+            max_entries: Entries kept before the oldest is evicted
+        """
+        self._entries: Dict[CacheKey, float] = {}
+        self._max_entries = max_entries
+
+    def get(self, operation: str, x: float, y: Optional[float]) -> Optional[float]:
+        """Return the cached result, or None on a miss."""
+        return self._entries.get((operation, x, y))
+
+    def put(self, operation: str, x: float, y: Optional[float], result: float) -> None:
+        """Store a result, evicting the oldest entry when full."""
+        if len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[(operation, x, y)] = result
+
+
+class SharedResultCache(IResultCache):
+    """
+    Fixed-size open-addressed result table in a memory-mapped file.
+
+    Every worker process that opens the same path shares one table. Reads
+    are lock-free and validated with a per-slot sequence lock: a writer makes
+    the sequence odd while it updates a slot, so a reader that sees an odd or
+    changed sequence treats the lookup as a miss. Writers serialize on an
+    ``flock`` of the file, which is only taken on cache misses.
+
+    Each key may live in one of ``max_probe`` consecutive slots. When all of
+    them are taken, CLOCK (second chance) picks the victim: hits set a
+    slot's reference bit and the eviction sweep clears bits until it finds
+    an unreferenced slot.
+
+    Slot updates rely on the platform ordering plain stores (x86-64 and
+    most Linux deployments); torn reads are still caught by the sequence.
+    """
+
+    def __init__(self, path: str, slots: int = 65536, max_probe: int = 8):
+        """
+        Open or create the shared table.
+
+        Args:
+            path: File backing the table (e.g. under /dev/shm)
+            slots: Number of slots; must match existing files
+            max_probe: Slots probed per key
+
+        Raises:
+            ValueError: If the file exists with a different layout
+        """
+        self._slots = slots
+        self._max_probe = min(max_probe, slots)
+        size = _HEADER_SIZE + slots * _SLOT_SIZE
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, _HEADER.pack(_MAGIC, _VERSION, slots), 0)
+            header = os.pread(self._fd, _HEADER.size, 0)
+            magic, version, existing_slots = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION or existing_slots != slots:
+                raise ValueError(
+                    f"Cache file {path} has an incompatible layout "
+                    f"({existing_slots} slots, version {version})"
+                )
+        except BaseException:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            raise
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+
+    def _slot_offset(self, index: int) -> int:
+        return _HEADER_SIZE + index * _SLOT_SIZE
+
+    def _probe(self, key: bytes):
+        start = zlib.crc32(key) % self._slots
+        for step in range(self._max_probe):
+            yield self._slot_offset((start + step) % self._slots)
+
+    def get(self, operation: str, x: float, y: Optional[float]) -> Optional[float]:
+        """Return the cached result, or None on a miss or a racing write."""
+        key = _KEY.pack(_operation_id(operation), x, 0.0 if y is None else y)
+        buffer = self._map
+        index = zlib.crc32(key) % self._slots
+        for _ in range(self._max_probe):
+            offset = _HEADER_SIZE + index * _SLOT_SIZE
+            seq, used = _SEQ_USED.unpack_from(buffer, offset)
+            if seq & 1 or not used:
+                return None
+            if buffer[offset + _KEY_OFFSET : offset + _RESULT_OFFSET] == key:
+                (result,) = _RESULT.unpack_from(buffer, offset + _RESULT_OFFSET)
+                if _SEQ.unpack_from(buffer, offset)[0] != seq:
+                    return None
+                buffer[offset + _REF_OFFSET] = 1
+                return result
+            index = (index + 1) % self._slots
+        return None
+
+    def put(self, operation: str, x: float, y: Optional[float], result: float) -> None:
+        """Store a result, evicting with CLOCK when the probe window is full."""
+        op_id = _operation_id(operation)
+        y = 0.0 if y is None else y
+        key = _KEY.pack(op_id, x, y)
+        buffer = self._map
+
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            offsets = list(self._probe(key))
+            target = None
+            for offset in offsets:
+                if not buffer[offset + _USED_OFFSET]:
+                    target = offset
+                    break
+                if buffer[offset + _KEY_OFFSET : offset + _RESULT_OFFSET] == key:
+                    target = offset
+                    break
+            if target is None:
+                for offset in offsets:
+                    if not buffer[offset + _REF_OFFSET]:
+                        target = offset
+                        break
+                    buffer[offset + _REF_OFFSET] = 0
+                else:
+                    target = offsets[0]
+
+            # Odd sequence marks the slot as being written
+            odd = (_SEQ.unpack_from(buffer, target)[0] + 1) & 0xFFFFFFFF
+            _SEQ.pack_into(buffer, target, odd)
+            _SLOT.pack_into(buffer, target, odd, 1, 0, op_id, x, y, result)
+            _SEQ.pack_into(buffer, target, (odd + 1) & 0xFFFFFFFF)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Unmap the table and close the file."""
+        self._map.close()
+        os.close(self._fd)
@@ -1,31 +1,55 @@
 """Calculator service orchestrating operations."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple, Union
 from domain.interfaces.operations import IOperation
 from domain.interfaces.logger import ILogger
+from domain.interfaces.cache import IResultCache
+from domain.interfaces.result import CalculationResult, ErrorCode
+from domain.interfaces.stats import IStatsRecorder
 from domain.operations.factory import OperationFactory
 
+CalculationItem = Tuple[str, float, Optional[float]]
+
+
+class CalculationCancelledError(Exception):
+    """Raised when a calculation job is cancelled through its predicate."""
+
 
 class CalculatorService:
     """Service to perform calculations using operation strategies."""
 
-    def __init__(self, operation_factory: OperationFactory, logger: ILogger):
+    def __init__(
+        self,
+        operation_factory: OperationFactory,
+        logger: ILogger,
+        cache: Optional[IResultCache] = None,
+        stats: Optional[IStatsRecorder] = None,
+    ):
         """
         Initialize calculator service.
 
         Args:
             operation_factory: Factory to resolve operations
             logger: Logger for structured logging
+            cache: Optional result cache consulted before executing
+            stats: Optional recorder of per-operation counts and timings
         """
         self._factory = operation_factory
         self._logger = logger
+        self._cache = cache
+        self._stats = stats
 
-    def calculate(self, operation_name: str, x: float, y: float) -> float:
+    def calculate(
+        self, operation_name: str, x: float, y: Optional[float] = None
+    ) -> float:
         """
         Perform calculation.
 
         Args:
             operation_name: Name of operation to perform
             x: First operand
-            y: Second operand
+            y: Second operand (omitted for unary operations)
 
         Returns:
             Calculation result
@@ -33,6 +57,30 @@ class CalculatorService:
         Raises:
             ValueError: If operation is invalid or execution fails
         """
+        outcome = self.try_calculate(operation_name, x, y)
+        if outcome.error is not None:
+            raise ValueError(outcome.message)
+        return outcome.value
+
+    def try_calculate(
+        self, operation_name: str, x: float, y: Optional[float] = None
+    ) -> CalculationResult:
+        """
+        Perform calculation, returning failures instead of raising them.
+
+        Invalid operations, missing operands and zero divisors are detected
+        without an exception; other domain errors are caught once inside
+        the operation.
+
+        Args:
+            operation_name: Name of operation to perform
+            x: First operand
+            y: Second operand (omitted for unary operations)
+
+        Returns:
+            The result, or an error code with the message ``calculate``
+            would raise
+        """
         self._logger.info(
             "Calculation requested",
             operation=operation_name,
@@ -40,29 +88,143 @@ class CalculatorService:
             y=y,
         )
 
-        try:
-            operation = self._factory.get_operation(operation_name)
-            result = operation.execute(x, y)
+        stats = self._stats
+        started = time.perf_counter() if stats is not None else 0.0
+        operation = self._factory.try_get_operation(operation_name)
+        if operation is None:
+            outcome = self._factory.unknown_operation(operation_name)
+        elif y is None and operation.arity == 2:
+            outcome = CalculationResult.failure(
+                ErrorCode.MISSING_OPERAND,
+                f"Operation {operation.name} requires two operands",
+            )
+        else:
+            outcome = self._try_execute(operation, x, y)
+        if stats is not None:
+            stats.record(
+                None if operation is None else operation.name,
+                time.perf_counter() - started,
+                outcome.error,
+            )
 
+        if outcome.error is None:
             self._logger.info(
                 "Calculation completed",
                 operation=operation_name,
                 x=x,
                 y=y,
-                result=result,
+                result=outcome.value,
             )
-
-            return result
-
-        except ValueError as e:
+        else:
             self._logger.error(
                 "Calculation failed",
                 operation=operation_name,
                 x=x,
                 y=y,
-                error=str(e),
+                error=outcome.message,
+                code=outcome.error.value,
             )
-            raise
+        return outcome
+
+    def _try_execute(
+        self, operation: IOperation, x: float, y: Optional[float]
+    ) -> CalculationResult:
+        """Execute an operation, going through the result cache if configured."""
+        if self._cache is None:
+            return operation.try_execute(x, y)
+        result = self._cache.get(operation.name, x, y)
+        if result is not None:
+            return CalculationResult(result)
+        outcome = operation.try_execute(x, y)
+        if outcome.error is None:
+            self._cache.put(operation.name, x, y, outcome.value)
+        return outcome
+
+    async def acalculate(
+        self, operation_name: str, x: float, y: Optional[float] = None
+    ) -> float:
+        """
+        Perform calculation from async code.
+
+        A single calculation is constant time, so it runs inline without
+        leaving the event loop.
+
+        Raises:
+            ValueError: If operation is invalid or execution fails
+        """
+        return self.calculate(operation_name, x, y)
+
+    async def acalculate_many(
+        self,
+        items: Iterable[CalculationItem],
+        *,
+        timeout: Optional[float] = None,
+        yield_interval: float = 0.005,
+        is_cancelled: Optional[Callable[[], Awaitable[bool]]] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[float, ValueError]]:
+        """
+        Perform many calculations, cooperatively yielding to the event loop.
+
+        Control is handed back to the loop whenever more than
+        ``yield_interval`` seconds of work ran since the last yield, so other
+        requests keep being served during large jobs.
+
+        Args:
+            items: Iterable of (operation_name, x, y) tuples
+            timeout: Job deadline in seconds, measured from the call
+            yield_interval: Maximum seconds of work between yields
+            is_cancelled: Async predicate checked at every yield point;
+                the job is cancelled once it returns True (e.g. the
+                client disconnected)
+            return_exceptions: Place ValueErrors in the result list
+                instead of raising the first one
+
+        Returns:
+            Results in input order
+
+        Raises:
+            ValueError: If an item fails and return_exceptions is False
+            TimeoutError: If the job exceeds its deadline
+            CalculationCancelledError: If ``is_cancelled`` returned True
+        """
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        slice_started = started
+        results: List[Union[float, ValueError]] = []
+
+        for operation_name, x, y in items:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                self._logger.warning(
+                    "Calculation job timed out",
+                    completed=len(results),
+                    timeout=timeout,
+                )
+                raise TimeoutError(
+                    f"Calculation job exceeded its {timeout}s deadline "
+                    f"after {len(results)} items"
+                )
+            if now - slice_started >= yield_interval:
+                await asyncio.sleep(0)
+                if is_cancelled is not None and await is_cancelled():
+                    self._logger.warning(
+                        "Calculation job cancelled", completed=len(results)
+                    )
+                    raise CalculationCancelledError(
+                        f"Calculation job cancelled after {len(results)} items"
+                    )
+                slice_started = time.monotonic()
+
+            outcome = self.try_calculate(operation_name, x, y)
+            if outcome.error is None:
+                results.append(outcome.value)
+            elif return_exceptions:
+                results.append(ValueError(outcome.message))
+            else:
+                raise ValueError(outcome.message)
+
+        return results
 
     def get_available_operations(self) -> list[str]:
         """Return list of available operations."""
@@ -0,0 +1,382 @@
+"""Reactive calculation graphs with incremental recomputation."""
+import heapq
+import math
+import os
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from domain.interfaces.logger import ILogger
+from domain.operations.factory import OperationFactory
+
+Argument = Union[str, float]
+# (node name, value, error) for every node whose outcome changed
+Change = Tuple[str, Optional[float], Optional[str]]
+# Graph IDs: the creating process's pid, then a random UUID (both hex)
+_GRAPH_ID = re.compile(r"([0-9a-f]+)-[0-9a-f]{32}")
+
+
+class GraphElsewhereError(KeyError):
+    """Raised for a graph created by another worker process."""
+
+
+class NodeSpec:
+    """Definition of a graph node: an input value or an operation."""
+
+    __slots__ = ("name", "value", "operation", "args", "references")
+
+    def __init__(
+        self,
+        name: str,
+        value: Optional[float] = None,
+        operation: Optional[str] = None,
+        args: Iterable[Argument] = (),
+    ):
+        """
+        Initialize node definition.
+
+        Args:
+            name: Unique node name
+            value: Value of an input node
+            operation: Operation applied by a computed node
+            args: Node names or constants passed to the operation
+        """
+        self.name = name
+        self.value = value
+        self.operation = operation
+        self.args = tuple(args)
+        # Names of the nodes this node reads
+        self.references = tuple(arg for arg in self.args if isinstance(arg, str))
+
+    @property
+    def is_input(self) -> bool:
+        return self.operation is None
+
+
+class _Node:
+    __slots__ = ("spec", "operation", "value", "error", "dependents", "order")
+
+    def __init__(self, spec: NodeSpec, operation):
+        self.spec = spec
+        self.operation = operation
+        self.value: Optional[float] = spec.value
+        self.error: Optional[str] = None
+        self.dependents: List[str] = []
+        self.order = 0
+
+
+def _same(a: Optional[float], b: Optional[float]) -> bool:
+    if a is None or b is None:
+        return a is b
+    return a == b or (math.isnan(a) and math.isnan(b))
+
+
+class CalculationGraph:
+    """
+    Named nodes computed from inputs through operation strategies.
+
+    Nodes keep a topological rank, refreshed whenever the structure changes.
+    Updating inputs recomputes only their downstream nodes, in rank order
+    via a heap, and stops propagating through nodes whose value did not
+    change.
+    """
+
+    def __init__(self, operation_factory: OperationFactory, max_nodes: int = 200_000):
+        """
+        Initialize an empty graph.
+
+        Args:
+            operation_factory: Factory resolving node operations
+            max_nodes: Largest number of nodes the graph may hold
+        """
+        # Prefixed with the owning process so other workers can tell a
+        # graph they do not hold from one that does not exist
+        self.id = f"{os.getpid():x}-{uuid.uuid4().hex}"
+        self.last_used = 0.0
+        self._factory = operation_factory
+        self._max_nodes = max_nodes
+        self._nodes: Dict[str, _Node] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def define(self, specs: Iterable[NodeSpec]) -> List[Change]:
+        """
+        Add or redefine nodes atomically and compute their values.
+
+        Nodes may reference each other in any order within one call.
+
+        Returns:
+            Outcomes of every node whose value was (re)computed
+
+        Raises:
+            ValueError: On unknown operations or references, wrong argument
+                counts, cycles, or exceeding max_nodes; the graph is unchanged
+        """
+        with self._lock:
+            incoming: Dict[str, _Node] = {}
+            for spec in specs:
+                operation = None
+                if not spec.is_input:
+                    operation = self._factory.get_operation(spec.operation)
+                    if len(spec.args) != operation.arity:
+                        raise ValueError(
+                            f"Node {spec.name}: {operation.name} takes "
+                            f"{operation.arity} arguments, got {len(spec.args)}"
+                        )
+                elif spec.value is None:
+                    raise ValueError(f"Node {spec.name}: input nodes need a value")
+                incoming[spec.name] = _Node(spec, operation)
+
+            nodes = {**self._nodes, **incoming}
+            if len(nodes) > self._max_nodes:
+                raise ValueError(f"Graph exceeds the limit of {self._max_nodes} nodes")
+            for node in incoming.values():
+                for reference in node.spec.references:
+                    if reference not in nodes:
+                        raise ValueError(
+                            f"Node {node.spec.name} references unknown node "
+                            f"{reference}"
+                        )
+
+            self._rank(nodes)
+            self._nodes = nodes
+            return self._propagate(incoming, force=True)
+
+    def set_inputs(self, values: Dict[str, float]) -> List[Change]:
+        """
+        Update input values and recompute the affected subgraph.
+
+        Returns:
+            Outcomes of nodes that changed, in topological order
+
+        Raises:
+            ValueError: If a name is unknown or not an input node
+        """
+        with self._lock:
+            for name in values:
+                node = self._nodes.get(name)
+                if node is None:
+                    raise ValueError(f"Unknown node: {name}")
+                if not node.spec.is_input:
+                    raise ValueError(f"Node {name} is computed, not an input")
+            dirty = {}
+            for name, value in values.items():
+                node = self._nodes[name]
+                if not _same(node.value, value):
+                    node.value = value
+                    dirty[name] = node
+            return self._propagate(dirty, force=False)
+
+    def get(self, name: str) -> Tuple[Optional[float], Optional[str]]:
+        """
+        Return (value, error) of a node.
+
+        Raises:
+            KeyError: If the node does not exist
+        """
+        node = self._nodes[name]
+        return node.value, node.error
+
+    def _rank(self, nodes: Dict[str, _Node]) -> None:
+        """
+        Assign topological ranks with Kahn's algorithm.
+
+        Raises:
+            ValueError: If the nodes contain a cycle
+        """
+        pending = {name: 0 for name in nodes}
+        dependents: Dict[str, List[str]] = {name: [] for name in nodes}
+        for name, node in nodes.items():
+            for reference in node.spec.references:
+                dependents[reference].append(name)
+                pending[name] += 1
+
+        ready = deque(name for name, count in pending.items() if count == 0)
+        order: Dict[str, int] = {}
+        while ready:
+            name = ready.popleft()
+            order[name] = len(order)
+            for dependent in dependents[name]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(nodes):
+            # Strip nodes that merely depend on a cycle to name its members
+            remaining = {name for name in nodes if name not in order}
+            outgoing = {
+                name: sum(1 for d in dependents[name] if d in remaining)
+                for name in remaining
+            }
+            sinks = deque(name for name, count in outgoing.items() if count == 0)
+            while sinks:
+                name = sinks.popleft()
+                remaining.discard(name)
+                for reference in nodes[name].spec.references:
+                    if reference in remaining:
+                        outgoing[reference] -= 1
+                        if outgoing[reference] == 0:
+                            sinks.append(reference)
+            cycle = sorted(remaining)
+            raise ValueError(
+                f"Cycle detected among nodes: {', '.join(cycle[:10])}"
+                + (" ..." if len(cycle) > 10 else "")
+            )
+        for name, node in nodes.items():
+            node.order = order[name]
+            node.dependents = dependents[name]
+
+    def _evaluate(self, node: _Node) -> None:
+        operands = []
+        for arg in node.spec.args:
+            if isinstance(arg, str):
+                source = self._nodes[arg]
+                if source.error is not None:
+                    node.value, node.error = None, f"Depends on failed node {arg}"
+                    return
+                operands.append(source.value)
+            else:
+                operands.append(arg)
+        try:
+            result = node.operation.execute(*operands)
+        except ValueError as e:
+            node.value, node.error = None, str(e)
+            return
+        if math.isfinite(result):
+            node.value, node.error = result, None
+        else:
+            node.value, node.error = None, "Result is not finite"
+
+    def _propagate(self, dirty: Dict[str, _Node], force: bool) -> List[Change]:
+        heap = [(node.order, name) for name, node in dirty.items()]
+        heapq.heapify(heap)
+        queued = set(dirty)
+        changes: List[Change] = []
+
+        while heap:
+            _, name = heapq.heappop(heap)
+            node = self._nodes[name]
+            before = (node.value, node.error)
+            if not node.spec.is_input:
+                self._evaluate(node)
+            changed = (
+                name in dirty
+                if node.spec.is_input
+                else not (_same(before[0], node.value) and before[1] == node.error)
+            )
+            if not (changed or (force and name in dirty)):
+                continue
+            changes.append((name, node.value, node.error))
+            for dependent in node.dependents:
+                if dependent not in queued:
+                    queued.add(dependent)
+                    heapq.heappush(heap, (self._nodes[dependent].order, dependent))
+        return changes
+
+
+class GraphRegistry:
+    """
+    Holds the graphs of all clients.
+
+    Graphs unused for ``idle_timeout`` seconds are evicted, oldest first, so
+    abandoned graphs do not hold on to the graph limit.
+
+    Graphs live in the memory of the worker process that created them, so
+    with several workers every request of a graph must reach that worker
+    (a single worker or sticky routing). Lookups of another worker's graph
+    raise ``GraphElsewhereError`` rather than a plain ``KeyError``.
+    """
+
+    def __init__(
+        self,
+        operation_factory: OperationFactory,
+        logger: ILogger,
+        max_graphs: int = 100,
+        max_nodes: int = 200_000,
+        idle_timeout: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            operation_factory: Factory resolving node operations
+            logger: Logger for structured logging
+            max_graphs: Largest number of live graphs
+            max_nodes: Node limit of each graph
+            idle_timeout: Seconds after which an unused graph is evicted
+            clock: Time source for idle tracking
+        """
+        self._factory = operation_factory
+        self._logger = logger
+        self._max_graphs = max_graphs
+        self._max_nodes = max_nodes
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        self._graphs: "OrderedDict[str, CalculationGraph]" = OrderedDict()
+
+    def __contains__(self, graph_id: str) -> bool:
+        return graph_id in self._graphs
+
+    def create(self) -> CalculationGraph:
+        """
+        Create an empty graph.
+
+        Raises:
+            ValueError: If the graph limit is reached
+        """
+        self.evict_idle()
+        if len(self._graphs) >= self._max_graphs:
+            raise ValueError(f"Graph limit of {self._max_graphs} reached")
+        graph = CalculationGraph(self._factory, self._max_nodes)
+        graph.last_used = self._clock()
+        self._graphs[graph.id] = graph
+        self._logger.info("Graph created", graph_id=graph.id)
+        return graph
+
+    def get(self, graph_id: str) -> CalculationGraph:
+        """
+        Get graph by ID and mark it as used.
+
+        Raises:
+            GraphElsewhereError: If another worker process created the graph
+            KeyError: If no live graph has this ID
+        """
+        self.evict_idle()
+        graph = self._graphs.get(graph_id)
+        if graph is None:
+            match = _GRAPH_ID.fullmatch(graph_id)
+            if match and int(match.group(1), 16) != os.getpid():
+                raise GraphElsewhereError(graph_id)
+            raise KeyError(graph_id)
+        graph.last_used = self._clock()
+        self._graphs.move_to_end(graph_id)
+        return graph
+
+    def delete(self, graph_id: str) -> None:
+        """
+        Delete a graph.
+
+        Raises:
+            KeyError: If no graph has this ID
+        """
+        del self._graphs[graph_id]
+        self._logger.info("Graph deleted", graph_id=graph_id)
+
+    def evict_idle(self) -> int:
+        """Evict graphs idle for longer than the timeout; return how many."""
+        cutoff = self._clock() - self._idle_timeout
+        evicted = 0
+        while self._graphs:
+            graph = next(iter(self._graphs.values()))
+            if graph.last_used > cutoff:
+                break
+            del self._graphs[graph.id]
+            evicted += 1
+        if evicted:
+            self._logger.info("Idle graphs evicted", graphs=evicted)
+        return evicted
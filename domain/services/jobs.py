@@ -0,0 +1,284 @@
+"""Job registry shared by workers and process-pool execution for jobs."""
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import Future, ProcessPoolExecutor
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Sequence, Tuple
+
+# (function, args, weight): one chunk of a job, weighted for progress
+Task = Tuple[Callable[..., Any], tuple, int]
+
+_JOB_ID = re.compile(r"[0-9a-f]{32}")
+# Attributes stored in a job's metadata file
+_JOB_FIELDS = (
+    "id",
+    "kind",
+    "status",
+    "total",
+    "done",
+    "error",
+    "result",
+    "stats",
+    "created_at",
+    "finished_at",
+)
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a background job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class Job:
+    """State of a single background job, updated by its worker thread."""
+
+    def __init__(self, kind: str, total: int = 0):
+        """
+        Initialize a pending job.
+
+        Args:
+            kind: Job type (e.g. "bulk")
+            total: Units of work to do; progress is done / total
+        """
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = JobStatus.PENDING
+        self.total = total
+        self.done = 0
+        self.error: Optional[str] = None
+        self.result: Any = None
+        self.stats: Dict[str, Any] = {}
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._registry: Optional["JobRegistry"] = None
+
+    @property
+    def progress(self) -> float:
+        """Return completed fraction in [0, 1]."""
+        if self.status == JobStatus.COMPLETED:
+            return 1.0
+        if self.total <= 0:
+            return 0.0
+        return min(1.0, self.done / self.total)
+
+    @property
+    def finished(self) -> bool:
+        """Return True once the job completed or failed."""
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+    def start(self) -> None:
+        """Mark the job as running."""
+        self.status = JobStatus.RUNNING
+        self._changed(force=True)
+
+    def advance(self, done: int) -> None:
+        """Record ``done`` more units of completed work (and any new stats)."""
+        self.done += done
+        self._changed()
+
+    def complete(self, result: Any = None) -> None:
+        """Mark the job as completed with an optional result."""
+        self.result = result
+        self.done = self.total
+        self.status = JobStatus.COMPLETED
+        self.finished_at = time.time()
+        self._changed(force=True)
+
+    def fail(self, error: str) -> None:
+        """Mark the job as failed."""
+        self.error = error
+        self.status = JobStatus.FAILED
+        self.finished_at = time.time()
+        self._changed(force=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job's state as JSON-compatible values."""
+        state = {field: getattr(self, field) for field in _JOB_FIELDS}
+        state["status"] = self.status.value
+        return state
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "Job":
+        """Rebuild a job from ``to_dict`` output."""
+        job = cls(state["kind"])
+        for field in _JOB_FIELDS:
+            setattr(job, field, state[field])
+        job.status = JobStatus(state["status"])
+        return job
+
+    def _changed(self, force: bool = False) -> None:
+        if self._registry is not None:
+            self._registry.save(self, force)
+
+
+class JobRegistry:
+    """
+    Thread-safe registry of jobs keyed by ID.
+
+    Jobs run in the worker process that accepted them. With a ``directory``
+    the registry also writes each job's state to ``<id>.job.json`` there
+    (atomically, on every status change and at most every
+    ``save_interval`` seconds while it progresses), so every worker sharing
+    the directory can report any job; finished jobs are then read from
+    their file only. Without one, jobs are only visible in this process.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, save_interval: float = 0.5):
+        """
+        Initialize an empty registry.
+
+        Args:
+            directory: Directory shared by all workers for job metadata
+            save_interval: Least time between progress saves of a job
+        """
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._directory = Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+        self._save_interval = save_interval
+        self._saved_at: Dict[str, float] = {}
+
+    def add(self, job: Job) -> Job:
+        """Register a job and return it."""
+        with self._lock:
+            self._jobs[job.id] = job
+        if self._directory is not None:
+            job._registry = self
+            self.save(job, force=True)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        """
+        Get job by ID, from this process or the shared directory.
+
+        Raises:
+            KeyError: If no job has this ID
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        path = self._metadata_path(job_id)
+        try:
+            return Job.from_dict(json.loads(path.read_text()))
+        except FileNotFoundError:
+            raise KeyError(job_id) from None
+
+    def remove(self, job_id: str) -> Job:
+        """
+        Remove a job from the registry.
+
+        Raises:
+            KeyError: If no job has this ID
+        """
+        job = self.get(job_id)
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            self._saved_at.pop(job_id, None)
+        if self._directory is not None:
+            self._metadata_path(job_id).unlink(missing_ok=True)
+        return job
+
+    def save(self, job: Job, force: bool = False) -> None:
+        """Write a job's state to the shared directory, throttled unless forced."""
+        if self._directory is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if job.id not in self._jobs:
+                return
+            if not force and now - self._saved_at.get(job.id, 0.0) < (
+                self._save_interval
+            ):
+                return
+            self._saved_at[job.id] = now
+            path = self._metadata_path(job.id)
+            temporary = path.with_name(f"{path.name}.{os.getpid()}")
+            temporary.write_text(json.dumps(job.to_dict()))
+            os.replace(temporary, path)
+            if job.finished:
+                # From now on the file is the job, so a delete by any worker
+                # is seen by all of them
+                del self._jobs[job.id]
+                del self._saved_at[job.id]
+
+    def _metadata_path(self, job_id: str) -> Path:
+        if self._directory is None or not _JOB_ID.fullmatch(job_id):
+            raise KeyError(job_id)
+        return self._directory / f"{job_id}.job.json"
+
+    def pending_count(self) -> int:
+        """Return the number of jobs that have not finished yet."""
+        with self._lock:
+            return sum(1 for job in self._jobs.values() if not job.finished)
+
+
+def process_pool(workers: int) -> ProcessPoolExecutor:
+    """Create a process pool safe to use from a server process."""
+    # spawn: forking a process that runs an event loop and threads is unsafe
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(workers, mp_context=context)
+
+
+def execute_ordered(
+    tasks: Sequence[Task],
+    workers: int,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> Iterator[Tuple[Any, int]]:
+    """
+    Run job chunks and yield (output, weight) in task order.
+
+    With more than one worker, chunks run in a process pool with at most
+    ``2 * workers`` in flight, so memory stays bounded however many chunks
+    there are. Closing the generator early cancels chunks not yet started.
+
+    Args:
+        tasks: Chunks as (module-level function, args, weight)
+        workers: Processes to use; 1 runs chunks in the calling thread
+        pool: Long-lived pool of ``workers`` processes to run chunks in;
+            without one a pool is created for this call
+    """
+    if workers == 1 or len(tasks) <= 1:
+        for function, args, weight in tasks:
+            yield function(*args), weight
+        return
+
+    with ExitStack() as stack:
+        if pool is None:
+            pool = stack.enter_context(process_pool(workers))
+        window: Deque[Tuple[Future, int]] = deque()
+        pending = iter(tasks)
+        try:
+            for function, args, weight in pending:
+                window.append((pool.submit(function, *args), weight))
+                if len(window) >= 2 * workers:
+                    break
+            while window:
+                future, weight = window.popleft()
+                output = future.result()
+                next_task = next(pending, None)
+                if next_task is not None:
+                    function, args, next_weight = next_task
+                    window.append((pool.submit(function, *args), next_weight))
+                yield output, weight
+        finally:
+            for future, _ in window:
+                future.cancel()
+
+
+def default_workers() -> int:
+    """Return a worker count suited to this machine."""
+    return max(1, (os.cpu_count() or 1) - 1)
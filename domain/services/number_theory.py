@@ -0,0 +1,143 @@
+"""Number-theory calculator service with operand size and batch limits."""
+import time
+from typing import Any, Dict, List, Sequence, Union
+from domain.interfaces.logger import ILogger
+from domain.interfaces.operations import IIntegerOperation
+from domain.operations.factory import OperationFactory
+
+# Operations served from the prime tables, and whether they use the SPF table
+TABLE_OPERATIONS = {"is_prime": False, "factorize": True}
+
+
+class NumberTheoryService:
+    """Service for integer operations sharing one set of warm prime tables."""
+
+    def __init__(
+        self,
+        operation_factory: OperationFactory,
+        logger: ILogger,
+        max_bits: int = 4096,
+        max_factor_bits: int = 64,
+        max_batch_items: int = 10_000,
+        max_batch_seconds: float = 10.0,
+    ):
+        """
+        Initialize number-theory service.
+
+        Args:
+            operation_factory: Factory to resolve integer operations
+            logger: Logger for structured logging
+            max_bits: Largest operand size accepted, in bits
+            max_factor_bits: Largest number factorize accepts, in bits
+                (Pollard's rho slows down quickly beyond 64)
+            max_batch_items: Largest batch accepted
+            max_batch_seconds: Time a batch may run; items not started by
+                then fail instead of being computed
+        """
+        self._factory = operation_factory
+        self._logger = logger
+        self._max_bits = max_bits
+        self._max_factor_bits = max_factor_bits
+        self._max_batch_items = max_batch_items
+        self._max_batch_seconds = max_batch_seconds
+
+    def calculate(self, operation_name: str, args: Sequence[int]) -> Any:
+        """
+        Perform one integer operation.
+
+        Raises:
+            ValueError: If the operation or arguments are invalid
+        """
+        operation = self._factory.get_integer_operation(operation_name)
+        self._logger.info(
+            "Integer calculation requested", operation=operation.name, args=len(args)
+        )
+        try:
+            self._validate(operation, args)
+            result = operation.execute(*args)
+        except ValueError as e:
+            self._logger.error(
+                "Integer calculation failed", operation=operation.name, error=str(e)
+            )
+            raise
+        self._logger.info("Integer calculation completed", operation=operation.name)
+        return result
+
+    def calculate_batch(
+        self, operation_name: str, items: Sequence[Sequence[int]]
+    ) -> List[Union[Any, ValueError]]:
+        """
+        Perform one integer operation on many argument lists.
+
+        The prime tables are grown once up front to cover the largest
+        argument, so the items themselves are pure lookups. Items left when
+        ``max_batch_seconds`` has passed fail with a time-limit error.
+
+        Returns:
+            Results in input order, with a ValueError for failed items
+
+        Raises:
+            ValueError: If the operation is invalid or the batch too large
+        """
+        operation = self._factory.get_integer_operation(operation_name)
+        if len(items) > self._max_batch_items:
+            raise ValueError(
+                f"Batch has {len(items)} items; limit is {self._max_batch_items}"
+            )
+        if operation.name in TABLE_OPERATIONS:
+            candidates = [
+                args[0]
+                for args in items
+                if len(args) == 1 and isinstance(args[0], int) and args[0] > 0
+            ]
+            if candidates:
+                self._factory.prime_tables.reserve(
+                    max(candidates), factorization=TABLE_OPERATIONS[operation.name]
+                )
+
+        deadline = time.monotonic() + self._max_batch_seconds
+        results: List[Union[Any, ValueError]] = []
+        for args in items:
+            if time.monotonic() > deadline:
+                timeout = ValueError(
+                    f"Batch time limit of {self._max_batch_seconds:g}s exceeded"
+                )
+                results += [timeout] * (len(items) - len(results))
+                break
+            try:
+                self._validate(operation, args)
+                results.append(operation.execute(*args))
+            except ValueError as e:
+                results.append(e)
+        failed = sum(isinstance(result, ValueError) for result in results)
+        self._logger.info(
+            "Integer batch completed",
+            operation=operation.name,
+            items=len(items),
+            failed=failed,
+        )
+        return results
+
+    def tables_status(self) -> Dict[str, int]:
+        """Return coverage and memory use of the shared prime tables."""
+        return self._factory.prime_tables.status()
+
+    def get_available_operations(self) -> list[str]:
+        """Return list of available integer operations."""
+        return self._factory.get_available_integer_operations()
+
+    def _validate(self, operation: IIntegerOperation, args: Sequence[int]) -> None:
+        if len(args) != operation.arity:
+            raise ValueError(
+                f"{operation.name} takes {operation.arity} arguments, got {len(args)}"
+            )
+        for value in args:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ValueError("Arguments must be integers")
+            if value.bit_length() > self._max_bits:
+                raise ValueError(f"Arguments are limited to {self._max_bits} bits")
+        too_large = args[0].bit_length() > self._max_factor_bits
+        if operation.name == "factorize" and too_large:
+            raise ValueError(
+                f"factorize is limited to {self._max_factor_bits}-bit numbers"
+            )
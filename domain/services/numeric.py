@@ -0,0 +1,366 @@
+"""Numerical integration and series summation jobs."""
+import math
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, List, Optional, Tuple
+import numpy as np
+from domain.interfaces.logger import ILogger
+from domain.operations.expression import Expression
+from domain.operations.factory import OperationFactory
+from domain.services.jobs import Job, JobRegistry, Task, execute_ordered, process_pool
+
+INTEGRATION_METHODS = ("gauss", "simpson")
+# Refinement levels after which an adaptive Simpson interval is accepted
+SIMPSON_MAX_DEPTH = 50
+# Function evaluations allowed per adaptive Simpson segment
+SIMPSON_MAX_EVALUATIONS = 2_000_000
+# Integers are exact in float64 up to this magnitude
+MAX_EXACT_INTEGER = 2**53
+
+# (value, error estimate, evaluations) computed by one chunk
+ChunkOutput = Tuple[float, float, int]
+
+# Per-process factory, created on first use inside each pool worker
+_worker_factory: Optional[OperationFactory] = None
+
+
+def worker_expression(tree: Any) -> Expression:
+    """Compile an expression tree inside a pool worker (or the job thread)."""
+    global _worker_factory
+    if _worker_factory is None:
+        _worker_factory = OperationFactory()
+    return Expression(tree, _worker_factory)
+
+
+def _function(tree: Any, variable: str):
+    expression = worker_expression(tree)
+    return lambda points: expression.evaluate_array({variable: points})
+
+
+def gauss_legendre_chunk(
+    tree: Any,
+    variable: str,
+    lower: float,
+    step: float,
+    first_panel: int,
+    panels: int,
+    order: int,
+) -> ChunkOutput:
+    """
+    Integrate panels ``first_panel`` to ``first_panel + panels`` of a grid.
+
+    Each panel of width ``step`` uses ``order``-point Gauss-Legendre
+    quadrature; all nodes of the chunk are evaluated in one vectorized call.
+    Panel positions derive from the global index, so the grid does not
+    depend on how panels are split into chunks.
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    half = step / 2
+    middles = lower + (np.arange(first_panel, first_panel + panels) + 0.5) * step
+    points = (middles[:, None] + half * nodes[None, :]).ravel()
+    values = _function(tree, variable)(points).reshape(panels, order)
+    return math.fsum((half * (values @ weights)).tolist()), 0.0, points.size
+
+
+def adaptive_simpson_chunk(
+    tree: Any, variable: str, lower: float, upper: float, tolerance: float
+) -> ChunkOutput:
+    """
+    Integrate ``[lower, upper]`` with adaptive Simpson quadrature.
+
+    Refinement is breadth-first: every interval still above its share of
+    the tolerance is split, and all new midpoints of a level are evaluated
+    in one vectorized call.
+
+    Raises:
+        ValueError: If the integrand needs more than
+            ``SIMPSON_MAX_EVALUATIONS`` evaluations
+    """
+    f = _function(tree, variable)
+    fa, fm, fb = f(np.array([lower, (lower + upper) / 2, upper])).tolist()
+    left = np.array([lower])
+    right = np.array([upper])
+    f_left, f_mid, f_right = np.array([fa]), np.array([fm]), np.array([fb])
+    whole = (upper - lower) / 6 * (f_left + 4 * f_mid + f_right)
+    tolerances = np.array([tolerance])
+    evaluations, depth = 3, 0
+    accepted: List[float] = []
+    error = 0.0
+
+    while left.size:
+        middle = (left + right) / 2
+        f_quarters = f(np.concatenate(((left + middle) / 2, (middle + right) / 2)))
+        f_lq, f_rq = np.split(f_quarters, 2)
+        evaluations += f_quarters.size
+        if evaluations > SIMPSON_MAX_EVALUATIONS:
+            raise ValueError(
+                "Adaptive Simpson did not converge within "
+                f"{SIMPSON_MAX_EVALUATIONS} evaluations per segment"
+            )
+        left_half = (middle - left) / 6 * (f_left + 4 * f_lq + f_mid)
+        right_half = (right - middle) / 6 * (f_mid + 4 * f_rq + f_right)
+        delta = left_half + right_half - whole
+        depth += 1
+        done = np.abs(delta) <= 15 * tolerances
+        if depth >= SIMPSON_MAX_DEPTH:
+            done[:] = True
+        accepted.extend((left_half + right_half + delta / 15)[done].tolist())
+        error += float(np.sum(np.abs(delta[done]))) / 15
+
+        split = ~done
+        left, middle, right = left[split], middle[split], right[split]
+        f_left, f_mid, f_right = f_left[split], f_mid[split], f_right[split]
+        f_lq, f_rq = f_lq[split], f_rq[split]
+        left_half, right_half = left_half[split], right_half[split]
+        tolerances = np.repeat(tolerances[split] / 2, 2)
+        left = np.concatenate((left, middle))
+        right = np.concatenate((middle, right))
+        f_left = np.concatenate((f_left, f_mid))
+        f_right = np.concatenate((f_mid, f_right))
+        f_mid = np.concatenate((f_lq, f_rq))
+        whole = np.concatenate((left_half, right_half))
+
+    return math.fsum(accepted), error, evaluations
+
+
+def series_chunk(tree: Any, variable: str, start: int, stop: int) -> ChunkOutput:
+    """Sum the expression over the integers ``start`` to ``stop - 1``."""
+    terms = np.arange(start, stop, dtype=np.float64)
+    values = _function(tree, variable)(terms)
+    return math.fsum(values.tolist()), 0.0, terms.size
+
+
+class NumericJobService:
+    """
+    Runs integration and summation jobs in the background.
+
+    Work is cut into chunks whose boundaries depend only on the request and
+    the chunk settings, never on the worker count, and chunk results are
+    combined in order with exactly rounded summation (``math.fsum``), so
+    the same request always produces the same bits. Chunks of all jobs run
+    in one process pool that lives as long as the service.
+    """
+
+    def __init__(
+        self,
+        operation_factory: OperationFactory,
+        logger: ILogger,
+        registry: JobRegistry,
+        workers: int = 1,
+        max_concurrent_jobs: int = 2,
+        chunk_panels: int = 4096,
+        chunk_terms: int = 1_000_000,
+        simpson_segments: int = 64,
+        max_panels: int = 100_000_000,
+        max_terms: int = 10_000_000_000,
+        default_time_budget: float = 60.0,
+        max_time_budget: float = 600.0,
+    ):
+        """
+        Initialize numeric job service.
+
+        Args:
+            operation_factory: Factory used to compile expressions
+            logger: Logger for structured logging
+            registry: Registry that tracks job state
+            workers: Processes shared by all jobs; 1 computes in the job
+                thread
+            max_concurrent_jobs: Jobs running at once; the rest queue
+            chunk_panels: Gauss-Legendre panels per chunk
+            chunk_terms: Series terms per chunk
+            simpson_segments: Chunks an adaptive Simpson interval is split into
+            max_panels: Largest Gauss-Legendre panel count accepted
+            max_terms: Largest number of series terms accepted
+            default_time_budget: Seconds a job may run if none is requested
+            max_time_budget: Largest time budget a request may ask for
+        """
+        self._factory = operation_factory
+        self._logger = logger
+        self._registry = registry
+        self._workers = max(1, workers)
+        self._chunk_panels = chunk_panels
+        self._chunk_terms = chunk_terms
+        self._simpson_segments = simpson_segments
+        self._max_panels = max_panels
+        self._max_terms = max_terms
+        self._default_time_budget = default_time_budget
+        self._max_time_budget = max_time_budget
+        self._runner = ThreadPoolExecutor(
+            max_workers=max_concurrent_jobs, thread_name_prefix="numeric-job"
+        )
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def submit_integral(
+        self,
+        expression: Any,
+        lower: float,
+        upper: float,
+        method: str = "gauss",
+        order: int = 16,
+        panels: int = 1024,
+        tolerance: float = 1e-10,
+        time_budget: Optional[float] = None,
+    ) -> Job:
+        """
+        Validate and queue a definite integral of a one-variable expression.
+
+        Raises:
+            ValueError: If the expression, bounds, method or sizes are invalid
+        """
+        variable = self._variable(expression)
+        method = method.lower()
+        if method not in INTEGRATION_METHODS:
+            raise ValueError(
+                f"Unsupported method: {method}. "
+                f"Supported methods: {', '.join(INTEGRATION_METHODS)}"
+            )
+        if not (math.isfinite(lower) and math.isfinite(upper)):
+            raise ValueError("Integration bounds must be finite")
+        budget = self._budget(time_budget)
+
+        if method == "gauss":
+            if not 1 <= order <= 128:
+                raise ValueError("Gauss-Legendre order must be between 1 and 128")
+            if not 1 <= panels <= self._max_panels:
+                raise ValueError(f"Panels must be between 1 and {self._max_panels}")
+            step = (upper - lower) / panels
+            tasks: List[Task] = []
+            for first in range(0, panels, self._chunk_panels):
+                count = min(self._chunk_panels, panels - first)
+                args = (expression, variable, lower, step, first, count, order)
+                tasks.append((gauss_legendre_chunk, args, 1))
+        else:
+            if not tolerance > 0:
+                raise ValueError("Tolerance must be positive")
+            segments = self._simpson_segments
+            edges = np.linspace(lower, upper, segments + 1).tolist()
+            share = tolerance / segments
+            tasks = [
+                (adaptive_simpson_chunk, (expression, variable, a, b, share), 1)
+                for a, b in zip(edges, edges[1:])
+            ]
+
+        job = self._registry.add(Job("integral", total=len(tasks)))
+        job.stats.update(
+            method=method, lower=lower, upper=upper, chunks=len(tasks), evaluations=0
+        )
+        return self._submit(job, tasks, budget)
+
+    def submit_sum(
+        self,
+        expression: Any,
+        start: int,
+        stop: int,
+        time_budget: Optional[float] = None,
+    ) -> Job:
+        """
+        Validate and queue the sum of an expression over ``start..stop``.
+
+        Both bounds are inclusive.
+
+        Raises:
+            ValueError: If the expression or range is invalid
+        """
+        variable = self._variable(expression)
+        if stop < start:
+            raise ValueError("stop must not be less than start")
+        if max(abs(start), abs(stop)) > MAX_EXACT_INTEGER:
+            raise ValueError(f"Bounds must be within ±{MAX_EXACT_INTEGER}")
+        terms = stop - start + 1
+        if terms > self._max_terms:
+            raise ValueError(f"{terms} terms exceed the limit of {self._max_terms}")
+        budget = self._budget(time_budget)
+
+        tasks: List[Task] = [
+            (series_chunk, (expression, variable, first, last), 1)
+            for first in range(start, stop + 1, self._chunk_terms)
+            for last in [min(first + self._chunk_terms, stop + 1)]
+        ]
+        job = self._registry.add(Job("sum", total=len(tasks)))
+        job.stats.update(start=start, stop=stop, chunks=len(tasks), evaluations=0)
+        return self._submit(job, tasks, budget)
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs, wait for running ones and stop the pool."""
+        self._runner.shutdown(wait=True)
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _variable(self, expression: Any) -> str:
+        variables = Expression(expression, self._factory).variables
+        if len(variables) > 1:
+            raise ValueError(
+                "Expression must use at most one variable, got: "
+                + ", ".join(sorted(variables))
+            )
+        return next(iter(variables), "x")
+
+    def _budget(self, time_budget: Optional[float]) -> float:
+        if time_budget is None:
+            return self._default_time_budget
+        if not 0 < time_budget <= self._max_time_budget:
+            raise ValueError(
+                f"Time budget must be between 0 and {self._max_time_budget} seconds"
+            )
+        return time_budget
+
+    def _submit(self, job: Job, tasks: List[Task], budget: float) -> Job:
+        job.stats["time_budget"] = budget
+        self._logger.info(
+            "Numeric job submitted", job_id=job.id, kind=job.kind, chunks=len(tasks)
+        )
+        self._runner.submit(self._run, job, tasks, budget)
+        return job
+
+    def _run(self, job: Job, tasks: List[Task], budget: float) -> None:
+        job.start()
+        deadline = time.monotonic() + budget
+        pool = self._get_pool()
+        outputs = execute_ordered(tasks, self._workers, pool)
+        parts: List[float] = []
+        error = 0.0
+        try:
+            for (value, estimate, evaluations), weight in outputs:
+                parts.append(value)
+                error += estimate
+                job.stats["evaluations"] += evaluations
+                job.advance(weight)
+                if time.monotonic() > deadline and job.done < job.total:
+                    raise TimeoutError(f"Time budget of {budget:g}s exceeded")
+
+            value = math.fsum(parts)
+            if not math.isfinite(value):
+                raise ValueError("Result is not finite")
+            job.stats["value"] = value
+            if job.stats.get("method") == "simpson":
+                job.stats["error_estimate"] = error
+            job.complete(value)
+            self._logger.info("Numeric job completed", job_id=job.id, **job.stats)
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # A worker process died; the next job gets a fresh pool
+                self._discard_pool(pool)
+            job.fail(str(e))
+            self._logger.error("Numeric job failed", job_id=job.id, error=str(e))
+        finally:
+            outputs.close()
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self._workers == 1:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = process_pool(self._workers)
+            return self._pool
+
+    def _discard_pool(self, pool: Optional[ProcessPoolExecutor]) -> None:
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=False)
@@ -0,0 +1,139 @@
+"""Polynomial calculator service with size and work limits."""
+from typing import Any, Optional
+import numpy as np
+from domain.interfaces.logger import ILogger
+from domain.operations.factory import OperationFactory
+
+
+def _as_array(value: Any, label: str) -> np.ndarray:
+    try:
+        array = np.asarray(value, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"{label} must be a number or a rectangular array of numbers"
+        ) from None
+    if not np.all(np.isfinite(array)):
+        raise ValueError(f"{label} must contain only finite numbers")
+    return array
+
+
+class PolynomialService:
+    """Service to evaluate and manipulate polynomials."""
+
+    def __init__(
+        self,
+        operation_factory: OperationFactory,
+        logger: ILogger,
+        max_coefficients: int = 100_000,
+        max_points: int = 10_000_000,
+        max_work: int = 2_000_000_000,
+        max_roots_degree: int = 1000,
+    ):
+        """
+        Initialize polynomial service.
+
+        Args:
+            operation_factory: Factory to resolve polynomial operations
+            logger: Logger for structured logging
+            max_coefficients: Largest coefficient array accepted
+            max_points: Largest points array or result accepted
+            max_work: Largest coefficients x points product for evaluation
+            max_roots_degree: Largest degree for root finding (O(n^3))
+        """
+        self._factory = operation_factory
+        self._logger = logger
+        self._max_coefficients = max_coefficients
+        self._max_points = max_points
+        self._max_work = max_work
+        self._max_roots_degree = max_roots_degree
+
+    def calculate(
+        self, operation_name: str, coefficients: Any, operand: Any = None
+    ) -> np.ndarray:
+        """
+        Perform a polynomial operation.
+
+        Sizes are validated before any work is done.
+
+        Args:
+            operation_name: Name of polynomial operation
+            coefficients: Coefficients in ascending order (c[i] multiplies x**i)
+            operand: Points for evaluate, second factor for multiply
+
+        Returns:
+            Result array
+
+        Raises:
+            ValueError: If the operation, operands or sizes are invalid
+        """
+        operation = self._factory.get_polynomial_operation(operation_name)
+        coefficients = _as_array(coefficients, "coefficients")
+        second: Optional[np.ndarray] = None
+        if operand is not None:
+            second = _as_array(operand, "operand")
+        self._logger.info(
+            "Polynomial calculation requested",
+            operation=operation.name,
+            coefficients=int(coefficients.size),
+            operand=0 if second is None else int(second.size),
+        )
+
+        try:
+            self._validate(operation, coefficients, second)
+            with np.errstate(all="ignore"):
+                result = operation.execute(coefficients, second)
+        except ValueError as e:
+            self._logger.error(
+                "Polynomial calculation failed", operation=operation.name, error=str(e)
+            )
+            raise
+
+        self._logger.info(
+            "Polynomial calculation completed",
+            operation=operation.name,
+            size=int(result.size),
+        )
+        return result
+
+    def _validate(self, operation, coefficients: np.ndarray, operand) -> None:
+        if coefficients.ndim != 1 or coefficients.size == 0:
+            raise ValueError("coefficients must be a non-empty 1-D array")
+        if coefficients.size > self._max_coefficients:
+            raise ValueError(
+                f"coefficients has {coefficients.size} elements; "
+                f"limit is {self._max_coefficients}"
+            )
+        if operation.requires_operand and operand is None:
+            raise ValueError(f"Operation {operation.name} requires an operand")
+        if not operation.requires_operand and operand is not None:
+            raise ValueError(f"Operation {operation.name} takes no operand")
+
+        operand_size = 0 if operand is None else operand.size
+        if operand_size > self._max_points:
+            raise ValueError(
+                f"operand has {operand_size} elements; limit is {self._max_points}"
+            )
+        if operation.name == "multiply" and (operand.ndim != 1 or operand.size == 0):
+            raise ValueError("operand must be a non-empty 1-D array")
+        if operation.name == "evaluate":
+            if coefficients.size * operand_size > self._max_work:
+                raise ValueError(
+                    f"Evaluating {coefficients.size} coefficients at "
+                    f"{operand_size} points exceeds the limit of "
+                    f"{self._max_work} terms"
+                )
+        if operation.name == "roots" and coefficients.size - 1 > self._max_roots_degree:
+            raise ValueError(
+                f"Degree {coefficients.size - 1} exceeds the root-finding limit "
+                f"of {self._max_roots_degree}"
+            )
+        size = operation.result_size(coefficients.size, operand_size)
+        if size > self._max_points:
+            raise ValueError(
+                f"Result of {size} elements exceeds the limit of "
+                f"{self._max_points} elements"
+            )
+
+    def get_available_operations(self) -> list[str]:
+        """Return list of available polynomial operations."""
+        return self._factory.get_available_polynomial_operations()
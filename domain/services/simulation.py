@@ -0,0 +1,357 @@
+"""Monte Carlo simulation of expressions over random variables."""
+import math
+import secrets
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from statistics import NormalDist
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+import numpy as np
+from domain.interfaces.logger import ILogger
+from domain.operations.expression import Expression
+from domain.operations.factory import OperationFactory
+from domain.services.jobs import Task, execute_ordered, process_pool
+from domain.services.numeric import worker_expression
+
+# Generator method and its parameters, named as in numpy.random.Generator
+DISTRIBUTIONS: Dict[str, Tuple[str, ...]] = {
+    "normal": ("loc", "scale"),
+    "lognormal": ("mean", "sigma"),
+    "uniform": ("low", "high"),
+    "exponential": ("scale",),
+    "triangular": ("left", "mode", "right"),
+    "beta": ("a", "b"),
+    "gamma": ("shape", "scale"),
+}
+
+# (variable, distribution, parameters), in variable name order
+Draw = Tuple[str, str, Tuple[float, ...]]
+# (count, mean, sum of squared deviations, min, max, counts at or below
+# each threshold) of one chunk or of several merged chunks
+Moments = Tuple[int, float, float, float, float, Tuple[int, ...]]
+
+
+def simulation_chunk(
+    tree: Any,
+    draws: Sequence[Draw],
+    seed: np.random.SeedSequence,
+    trials: int,
+    thresholds: Sequence[float],
+) -> Moments:
+    """
+    Evaluate the expression for ``trials`` random draws and summarize them.
+
+    Every chunk owns a child of the simulation's seed sequence, so its draws
+    do not depend on which process runs it or on the other chunks.
+
+    Raises:
+        ValueError: If an operation fails or a result is not finite
+    """
+    rng = np.random.Generator(np.random.PCG64(seed))
+    samples = {
+        variable: getattr(rng, distribution)(*params, size=trials)
+        for variable, distribution, params in draws
+    }
+    values = worker_expression(tree).evaluate_array(samples)
+    if values.shape != (trials,):
+        values = np.broadcast_to(values, (trials,))
+    if not np.all(np.isfinite(values)):
+        raise ValueError("Simulation produced a non-finite result")
+    mean = float(np.mean(values))
+    return (
+        trials,
+        mean,
+        float(np.sum(np.square(values - mean))),
+        float(values.min()),
+        float(values.max()),
+        tuple(int(np.count_nonzero(values <= t)) for t in thresholds),
+    )
+
+
+def merge_moments(a: Moments, b: Moments) -> Moments:
+    """Combine the summaries of two disjoint samples (Chan et al.)."""
+    count_a, mean_a, m2_a, min_a, max_a, below_a = a
+    count_b, mean_b, m2_b, min_b, max_b, below_b = b
+    count = count_a + count_b
+    delta = mean_b - mean_a
+    return (
+        count,
+        mean_a + delta * count_b / count,
+        m2_a + m2_b + delta * delta * count_a * count_b / count,
+        min(min_a, min_b),
+        max(max_a, max_b),
+        tuple(x + y for x, y in zip(below_a, below_b)),
+    )
+
+
+def wilson_interval(successes: int, count: int, z: float) -> Tuple[float, float]:
+    """Return the Wilson score interval of a binomial proportion."""
+    p = successes / count
+    denominator = 1 + z * z / count
+    centre = (p + z * z / (2 * count)) / denominator
+    half = z * math.sqrt(p * (1 - p) / count + z * z / (4 * count * count))
+    return centre - half / denominator, centre + half / denominator
+
+
+class SimulationBusyError(Exception):
+    """Raised when every simulation slot is taken."""
+
+
+class Simulation:
+    """A validated simulation: its chunks and how to summarize them."""
+
+    def __init__(
+        self,
+        tasks: List[Task],
+        trials: int,
+        seed: int,
+        confidence: float,
+        thresholds: Sequence[float],
+    ):
+        self.tasks = tasks
+        self.trials = trials
+        self.seed = seed
+        self.confidence = confidence
+        self.thresholds = list(thresholds)
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+    def summary(self, moments: Moments, chunks_done: int) -> Dict[str, Any]:
+        """Statistics and confidence intervals of the trials so far."""
+        count, mean, m2, minimum, maximum, below = moments
+        std = math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+        stderr = std / math.sqrt(count)
+        return {
+            "done": chunks_done == len(self.tasks),
+            "seed": self.seed,
+            "trials": count,
+            "chunks": chunks_done,
+            "total_chunks": len(self.tasks),
+            "mean": mean,
+            "std": std,
+            "stderr": stderr,
+            "confidence": self.confidence,
+            "ci": [mean - self.z * stderr, mean + self.z * stderr],
+            "min": minimum,
+            "max": maximum,
+            "probabilities": [
+                {
+                    "threshold": threshold,
+                    "p": successes / count,
+                    "ci": list(wilson_interval(successes, count, self.z)),
+                }
+                for threshold, successes in zip(self.thresholds, below)
+            ],
+        }
+
+
+class SimulationService:
+    """
+    Monte Carlo estimates of an expression over random variables.
+
+    Trials are cut into fixed-size chunks, each seeded by its own child of
+    one ``SeedSequence`` and run by ``execute_ordered`` in one process pool
+    that lives as long as the service. Chunk summaries are merged in chunk
+    order, so a seeded simulation gives the same bits for any worker count.
+    """
+
+    def __init__(
+        self,
+        operation_factory: OperationFactory,
+        logger: ILogger,
+        workers: int = 1,
+        chunk_trials: int = 1 << 18,
+        max_trials: int = 100_000_000,
+        max_concurrent: int = 2,
+        max_thresholds: int = 16,
+    ):
+        """
+        Initialize simulation service.
+
+        Args:
+            operation_factory: Factory used to compile expressions
+            logger: Logger for structured logging
+            workers: Processes per simulation; 1 computes in the caller
+            chunk_trials: Trials per chunk (part of what a seed reproduces)
+            max_trials: Largest trial count accepted
+            max_concurrent: Simulations running at once; more are refused
+            max_thresholds: Most thresholds accepted per simulation
+        """
+        self._factory = operation_factory
+        self._logger = logger
+        self._workers = max(1, workers)
+        self._chunk_trials = chunk_trials
+        self._max_trials = max_trials
+        self._max_thresholds = max_thresholds
+        self._max_concurrent = max_concurrent
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def prepare(
+        self,
+        expression: Any,
+        distributions: Mapping[str, Mapping[str, Any]],
+        trials: int,
+        seed: Optional[int] = None,
+        confidence: float = 0.95,
+        thresholds: Sequence[float] = (),
+    ) -> Simulation:
+        """
+        Validate a simulation request and plan its chunks.
+
+        Args:
+            expression: Expression tree over the random variables
+            distributions: Per variable, ``{"dist": name, **parameters}``
+            trials: Number of trials
+            seed: Root seed; a random one is chosen (and reported) if omitted
+            confidence: Level of the confidence intervals
+            thresholds: Values at which to estimate ``P(result <= value)``
+
+        Raises:
+            ValueError: If the expression, distributions or sizes are invalid
+        """
+        variables = Expression(expression, self._factory).variables
+        missing = variables - set(distributions)
+        if missing:
+            raise ValueError(f"No distribution for: {', '.join(sorted(missing))}")
+        unused = set(distributions) - variables
+        if unused:
+            raise ValueError(
+                f"Distribution for unused variable: {', '.join(sorted(unused))}"
+            )
+        draws = [
+            self._draw(variable, distributions[variable])
+            for variable in sorted(variables)
+        ]
+        if not 2 <= trials <= self._max_trials:
+            raise ValueError(f"Trials must be between 2 and {self._max_trials}")
+        if not 0 < confidence < 1:
+            raise ValueError("Confidence must be between 0 and 1")
+        if len(thresholds) > self._max_thresholds:
+            raise ValueError(f"At most {self._max_thresholds} thresholds are allowed")
+        if seed is None:
+            # 53 bits keep the reported seed exact as a JSON number
+            seed = secrets.randbits(53)
+        elif seed < 0:
+            raise ValueError("Seed must be non-negative")
+
+        sizes = [
+            min(self._chunk_trials, trials - first)
+            for first in range(0, trials, self._chunk_trials)
+        ]
+        children = np.random.SeedSequence(seed).spawn(len(sizes))
+        tasks: List[Task] = [
+            (simulation_chunk, (expression, draws, child, size, tuple(thresholds)), 1)
+            for child, size in zip(children, sizes)
+        ]
+        return Simulation(tasks, trials, seed, confidence, thresholds)
+
+    def run(self, simulation: Simulation) -> Iterator[Dict[str, Any]]:
+        """
+        Take a slot for a prepared simulation and return its summaries.
+
+        The iterator yields a summary after every chunk; closing it early
+        cancels chunks not yet started. The slot is freed when the iterator
+        is exhausted or closed, or once the simulation is dropped unstarted.
+
+        Raises:
+            SimulationBusyError: If ``max_concurrent`` simulations are running
+        """
+        if not self._slots.acquire(blocking=False):
+            raise SimulationBusyError(
+                f"All {self._max_concurrent} simulation slots are busy; " "retry later"
+            )
+        # Idempotent, so the iterator and the garbage collector may both call it
+        release = weakref.finalize(simulation, self._slots.release)
+        return self._summaries(simulation, release)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; a later simulation starts new ones."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _summaries(
+        self, simulation: Simulation, release: weakref.finalize
+    ) -> Iterator[Dict[str, Any]]:
+        started = time.monotonic()
+        self._logger.info(
+            "Simulation started",
+            trials=simulation.trials,
+            chunks=len(simulation.tasks),
+            seed=simulation.seed,
+        )
+        pool = self._get_pool()
+        outputs = execute_ordered(simulation.tasks, self._workers, pool)
+        moments: Optional[Moments] = None
+        try:
+            for chunks_done, (chunk, _) in enumerate(outputs, start=1):
+                if moments is not None:
+                    chunk = merge_moments(moments, chunk)
+                moments = chunk
+                yield simulation.summary(moments, chunks_done)
+        except ValueError as e:
+            self._logger.error("Simulation failed", error=str(e))
+            raise
+        except BrokenProcessPool as e:
+            # A worker process died; the next simulation gets a fresh pool
+            self._discard_pool(pool)
+            self._logger.error("Simulation failed", error=str(e))
+            raise
+        finally:
+            outputs.close()
+            release()
+        self._logger.info(
+            "Simulation completed",
+            trials=simulation.trials,
+            seconds=round(time.monotonic() - started, 3),
+        )
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self._workers == 1:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = process_pool(self._workers)
+            return self._pool
+
+    def _discard_pool(self, pool: Optional[ProcessPoolExecutor]) -> None:
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _draw(self, variable: str, spec: Mapping[str, Any]) -> Draw:
+        spec = dict(spec)
+        distribution = spec.pop("dist", None)
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(
+                f"Distribution for {variable} must set dist to one of: "
+                f"{', '.join(DISTRIBUTIONS)}"
+            )
+        names = DISTRIBUTIONS[distribution]
+        if set(spec) != set(names):
+            raise ValueError(
+                f"{distribution} distribution for {variable} takes "
+                f"{', '.join(names)}"
+            )
+        params = []
+        for name in names:
+            value = spec[name]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{name} for {variable} must be a number")
+            if not math.isfinite(value):
+                raise ValueError(f"{name} for {variable} must be finite")
+            params.append(float(value))
+        # Let numpy check parameter constraints (e.g. scale >= 0) up front
+        try:
+            getattr(np.random.default_rng(0), distribution)(*params, size=1)
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid {distribution} distribution for {variable}: {e}"
+            ) from None
+        return variable, distribution, tuple(params)
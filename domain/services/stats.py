@@ -0,0 +1,360 @@
+"""Calculation statistics aggregated across worker processes."""
+from bisect import bisect_left
+import fcntl
+import mmap
+import os
+import struct
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import numpy as np
+from domain.interfaces.logger import ILogger
+from domain.interfaces.result import ErrorCode
+from domain.interfaces.stats import IStatsRecorder
+
+# Upper bounds in seconds of the duration histogram; +Inf is implicit
+DEFAULT_BUCKETS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    1e-2,
+    1e-1,
+)
+# Row 0 counts unrecognized names and operations beyond the name table
+OTHER_OPERATION = "(other)"
+
+# File layout: a header, the bucket bounds, the operation name table, then
+# one slot per worker. A slot is the owner's pid followed by one row of
+# int64 counters per operation (the seconds column is a float64). Calls are
+# not stored; they are the sum of the histogram buckets.
+_MAGIC = b"FCSTATS\0"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIIII")  # magic, version, slots, rows, buckets, codes
+_HEADER_SIZE = 64
+_NAME_SIZE = 32
+_ERROR_CODES = tuple(ErrorCode)
+_SLOT_HEADER = 1  # owner pid
+# Row: a counter per error code, seconds, bucket counts
+_ERRORS = 0
+_SECONDS = _ERRORS + len(_ERROR_CODES)
+_BUCKETS = _SECONDS + 1
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedStatsRecorder(IStatsRecorder):
+    """
+    Per-worker calculation counters and duration histograms in a mapped file.
+
+    Every worker process that opens the same path gets its own slot, claimed
+    on its first recording, and is that slot's only writer, so recording is
+    a few plain stores without a lock. Claiming a slot and registering an
+    operation name take an ``flock`` of the file; both happen once per
+    worker (and operation). A worker may claim the slot of an exited
+    process and keeps adding to its counters, so totals survive restarts.
+
+    A worker that finds every slot held by a running process logs a warning
+    once and records nothing; calculations are never failed by statistics.
+
+    Readers sum all slots without locking. A row read mid-update may count
+    the calculation being recorded in one column but not yet in another.
+    Increments are not atomic across threads, so a calculation recorded off
+    the event loop thread may rarely be lost.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        slots: int = 64,
+        max_operations: int = 128,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        logger: Optional[ILogger] = None,
+    ):
+        """
+        Open or create the shared statistics file.
+
+        Args:
+            path: File backing the statistics (e.g. under /dev/shm)
+            slots: Most worker processes alive at once; must match existing
+                files
+            max_operations: Rows in the operation name table; must match
+                existing files
+            buckets: Upper bounds in seconds of the duration histogram; must
+                match existing files
+            logger: Where to report a worker left without a slot
+
+        Raises:
+            ValueError: If the file exists with a different layout
+        """
+        self._path = path
+        self._logger = logger
+        self._slots = slots
+        self._rows = max_operations
+        self._bounds = tuple(float(bound) for bound in buckets)
+        self._width = _BUCKETS + len(self._bounds) + 1
+        self._names_offset = _HEADER_SIZE + 8 * len(self._bounds)
+        self._data_offset = self._names_offset + max_operations * _NAME_SIZE
+        self._slot_size = _SLOT_HEADER + max_operations * self._width
+        size = self._data_offset + slots * self._slot_size * 8
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            slots,
+            max_operations,
+            len(self._bounds),
+            len(_ERROR_CODES),
+        )
+        bounds = struct.pack(f"<{len(self._bounds)}d", *self._bounds)
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._fd_pid = os.getpid()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, header.ljust(_HEADER_SIZE, b"\0") + bounds, 0)
+            existing = os.pread(self._fd, _HEADER_SIZE + len(bounds), 0)
+            if existing[: _HEADER.size] != header or existing[_HEADER_SIZE:] != bounds:
+                raise ValueError(
+                    f"Statistics file {path} has an incompatible layout; "
+                    "remove it or change the path"
+                )
+        except BaseException:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            raise
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+        self._counts = memoryview(self._map).cast("q")
+        self._seconds = memoryview(self._map).cast("d")
+        self._error_offsets = {code: _ERRORS + i for i, code in enumerate(_ERROR_CODES)}
+        # Absolute int64 index of each operation's row in this worker's slot
+        self._indices: Dict[Optional[str], int] = {}
+        self._slot: Optional[int] = None
+        # Set once no slot was free; this worker then stops recording
+        self._no_slot = False
+
+        # A forked child must not write into its parent's slot
+        recorder = weakref.ref(self)
+        os.register_at_fork(after_in_child=lambda: _after_fork(recorder))
+
+    def record(
+        self, operation: Optional[str], seconds: float, error: Optional[ErrorCode]
+    ) -> None:
+        """Add one calculation to this worker's counters."""
+        index = self._indices.get(operation)
+        if index is None:
+            index = self._index(operation)
+            if index is None:
+                return
+        if error is not None:
+            self._counts[index + self._error_offsets[error]] += 1
+        self._seconds[index + _SECONDS] += seconds
+        self._counts[index + _BUCKETS + bisect_left(self._bounds, seconds)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the totals of all slots, including those of exited workers.
+
+        Each operation reports its calls, failures per error code, total
+        seconds and cumulative histogram counts per bucket bound.
+        """
+        start = self._data_offset // 8
+        data = np.array(
+            self._counts[start : start + self._slots * self._slot_size]
+        ).reshape(self._slots, self._slot_size)
+        pids = [int(pid) for pid in data[:, 0] if pid]
+        rows = data[:, _SLOT_HEADER:].reshape(self._slots, self._rows, self._width)
+        totals = rows.sum(axis=0)
+        seconds = rows[:, :, _SECONDS].view(np.float64).sum(axis=0)
+        names = self._names()
+
+        operations: List[Dict[str, Any]] = []
+        cumulative = np.cumsum(totals[:, _BUCKETS:], axis=1)
+        for row in np.flatnonzero(cumulative[:, -1]):
+            operations.append(
+                {
+                    "operation": OTHER_OPERATION if row == 0 else names[row],
+                    "calls": int(cumulative[row, -1]),
+                    "errors": {
+                        code.value: int(totals[row, offset])
+                        for code, offset in self._error_offsets.items()
+                    },
+                    "seconds_sum": float(seconds[row]),
+                    "buckets": [
+                        {"le": bound, "count": int(count)}
+                        for bound, count in zip(self._bounds, cumulative[row])
+                    ],
+                }
+            )
+        operations.sort(key=lambda operation: operation["operation"])
+        return {
+            "workers": sum(_alive(pid) for pid in pids),
+            "slots_claimed": len(pids),
+            "slots": self._slots,
+            "operations": operations,
+        }
+
+    def close(self) -> None:
+        """Unmap the file and close it; the slot keeps its counters."""
+        self._counts.release()
+        self._seconds.release()
+        self._map.close()
+        os.close(self._fd)
+
+    def _index(self, operation: Optional[str]) -> Optional[int]:
+        if self._slot is None:
+            if self._no_slot:
+                return None
+            self._slot = self._claim()
+            if self._slot is None:
+                self._no_slot = True
+                if self._logger is not None:
+                    self._logger.warning(
+                        "Statistics slots exhausted; not recording in this worker",
+                        slots=self._slots,
+                        pid=os.getpid(),
+                    )
+                return None
+        row = 0 if operation is None else self._register(operation)
+        index = (
+            self._data_offset // 8
+            + self._slot * self._slot_size
+            + _SLOT_HEADER
+            + row * self._width
+        )
+        self._indices[operation] = index
+        return index
+
+    def _claim(self) -> Optional[int]:
+        """Take a free slot, or one whose process has exited, if any."""
+        own = os.getpid()
+        with self._locked():
+            for slot in range(self._slots):
+                index = self._data_offset // 8 + slot * self._slot_size
+                pid = self._counts[index]
+                if pid in (0, own) or not _alive(pid):
+                    self._counts[index] = own
+                    return slot
+        return None
+
+    def _register(self, operation: str) -> int:
+        """Return the row of an operation, adding it to the name table."""
+        name = operation.encode()
+        if len(name) > _NAME_SIZE:
+            return 0
+        with self._locked():
+            for row in range(1, self._rows):
+                offset = self._names_offset + row * _NAME_SIZE
+                existing = self._map[offset : offset + _NAME_SIZE].rstrip(b"\0")
+                if existing == name:
+                    return row
+                if not existing:
+                    self._map[offset : offset + len(name)] = name
+                    return row
+        return 0
+
+    def _names(self) -> List[str]:
+        table = self._map[self._names_offset : self._data_offset]
+        return [
+            table[row * _NAME_SIZE : (row + 1) * _NAME_SIZE].rstrip(b"\0").decode()
+            for row in range(self._rows)
+        ]
+
+    def _reset_after_fork(self) -> None:
+        """Drop the parent's slot; the next recording claims another."""
+        self._slot = None
+        self._no_slot = False
+        self._indices.clear()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        if self._fd_pid != os.getpid():
+            # flock locks belong to the open file, which a forked child
+            # shares with its parent, so the child locks through its own
+            os.close(self._fd)
+            self._fd = os.open(self._path, os.O_RDWR)
+            self._fd_pid = os.getpid()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+def _after_fork(reference: "weakref.ref[SharedStatsRecorder]") -> None:
+    recorder = reference()
+    if recorder is not None:
+        recorder._reset_after_fork()
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(snapshot: Dict[str, Any]) -> str:
+    """Render a ``snapshot`` in the Prometheus text exposition format."""
+    operations = snapshot["operations"]
+    lines = [
+        "# HELP calculator_workers Worker processes recording statistics.",
+        "# TYPE calculator_workers gauge",
+        f"calculator_workers {snapshot['workers']}",
+        "# HELP calculator_calculations_total Calculations by operation.",
+        "# TYPE calculator_calculations_total counter",
+    ]
+    for operation in operations:
+        name = _label(operation["operation"])
+        lines.append(
+            f'calculator_calculations_total{{operation="{name}"}} {operation["calls"]}'
+        )
+    lines += [
+        "# HELP calculator_calculation_errors_total Failed calculations by "
+        "operation and error code.",
+        "# TYPE calculator_calculation_errors_total counter",
+    ]
+    for operation in operations:
+        name = _label(operation["operation"])
+        for code, count in operation["errors"].items():
+            if count:
+                lines.append(
+                    f'calculator_calculation_errors_total{{operation="{name}",'
+                    f'code="{code}"}} {count}'
+                )
+    lines += [
+        "# HELP calculator_calculation_duration_seconds Time to resolve and "
+        "execute an operation.",
+        "# TYPE calculator_calculation_duration_seconds histogram",
+    ]
+    for operation in operations:
+        name = _label(operation["operation"])
+        for bucket in operation["buckets"]:
+            lines.append(
+                f"calculator_calculation_duration_seconds_bucket"
+                f'{{operation="{name}",le="{bucket["le"]!r}"}} {bucket["count"]}'
+            )
+        lines += [
+            f"calculator_calculation_duration_seconds_bucket"
+            f'{{operation="{name}",le="+Inf"}} {operation["calls"]}',
+            f"calculator_calculation_duration_seconds_sum"
+            f'{{operation="{name}"}} {operation["seconds_sum"]!r}',
+            f"calculator_calculation_duration_seconds_count"
+            f'{{operation="{name}"}} {operation["calls"]}',
+        ]
+    return "\n".join(lines) + "\n"
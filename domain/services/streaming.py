@@ -0,0 +1,342 @@
+"""Streaming sessions with incrementally maintained rolling-window aggregates."""
+import math
+import os
+import re
+import time
+import uuid
+from array import array
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+from domain.interfaces.logger import ILogger
+
+# Estimated bytes per window slot: the value and its timestamp plus
+# worst-case entries (a pointer and an int) in both monotonic deques
+BYTES_PER_SLOT = 96
+# Running sums are recomputed exactly after at least this many updates
+MIN_RENORMALIZE_INTERVAL = 1024
+# Session IDs: the creating process's pid, then a random UUID (both hex)
+_SESSION_ID = re.compile(r"([0-9a-f]+)-[0-9a-f]{32}")
+
+
+class StreamCapacityError(Exception):
+    """Raised when the memory cap leaves no room for a new session."""
+
+
+class StreamElsewhereError(KeyError):
+    """Raised for a session created by another worker process."""
+
+
+class RollingWindow:
+    """
+    Sum, mean, variance, min and max over the last N values or seconds.
+
+    Values live in a fixed-size ring buffer. Each push or eviction updates
+    the running sum and sum of squared deviations in O(1), and the
+    sums are recomputed exactly from the buffer once every ``capacity``
+    updates, which bounds floating-point drift at O(1) amortized cost.
+    Min and max come from monotonic deques of sequence numbers, so they
+    are O(1) amortized as well.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an empty window.
+
+        Args:
+            capacity: Most values held; the window size for count windows
+            seconds: Age after which values leave the window, if time-based
+            clock: Source of timestamps for time-based windows
+        """
+        self.capacity = capacity
+        self.seconds = seconds
+        self._clock = clock
+        self._values = array("d", bytes(8 * capacity))
+        self._times = array("d", bytes(8 * capacity)) if seconds else None
+        self._next = 0  # sequence number of the next value
+        self._count = 0
+        self._sum = 0.0
+        self._m2 = 0.0
+        self._min: Deque[int] = deque()
+        self._max: Deque[int] = deque()
+        self._updates = 0
+        self._renormalize_interval = max(capacity, MIN_RENORMALIZE_INTERVAL)
+
+    def push(self, values: Iterable[float]) -> None:
+        """
+        Append values, evicting the oldest ones as needed.
+
+        Raises:
+            ValueError: If a value is not a finite number; earlier values
+                of the call are kept
+        """
+        now = self._clock() if self.seconds else 0.0
+        if self.seconds:
+            self._expire(now)
+        buffer, capacity = self._values, self.capacity
+        for value in values:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError("Values must be numbers")
+            try:
+                value = float(value)
+            except OverflowError:
+                # Integers beyond the float range (JSON allows any length)
+                raise ValueError("Values must be finite") from None
+            if not math.isfinite(value):
+                raise ValueError("Values must be finite")
+            if self._count == capacity:
+                self._evict()
+            seq = self._next
+            self._next += 1
+            buffer[seq % capacity] = value
+            if self._times is not None:
+                self._times[seq % capacity] = now
+
+            old_mean = self._sum / self._count if self._count else 0.0
+            self._count += 1
+            self._sum += value
+            self._m2 += (value - old_mean) * (value - self._sum / self._count)
+
+            while self._min and buffer[self._min[-1] % capacity] >= value:
+                self._min.pop()
+            self._min.append(seq)
+            while self._max and buffer[self._max[-1] % capacity] <= value:
+                self._max.pop()
+            self._max.append(seq)
+
+            self._updates += 1
+            if self._updates >= self._renormalize_interval:
+                self._renormalize()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return count, sum, mean, sample variance, std, min and max."""
+        if self.seconds:
+            self._expire(self._clock())
+        count = self._count
+        if count == 0:
+            return {
+                "count": 0,
+                "sum": 0.0,
+                "mean": None,
+                "variance": None,
+                "std": None,
+                "min": None,
+                "max": None,
+            }
+        variance = max(self._m2, 0.0) / (count - 1) if count > 1 else None
+        return {
+            "count": count,
+            "sum": self._sum,
+            "mean": self._sum / count,
+            "variance": variance,
+            "std": None if variance is None else math.sqrt(variance),
+            "min": self._values[self._min[0] % self.capacity],
+            "max": self._values[self._max[0] % self.capacity],
+        }
+
+    def _evict(self) -> None:
+        seq = self._next - self._count
+        value = self._values[seq % self.capacity]
+        old_mean = self._sum / self._count
+        self._count -= 1
+        self._sum -= value
+        new_mean = self._sum / self._count if self._count else 0.0
+        self._m2 -= (value - old_mean) * (value - new_mean)
+        if self._min[0] == seq:
+            self._min.popleft()
+        if self._max[0] == seq:
+            self._max.popleft()
+        if self._count == 0:
+            self._sum = self._m2 = 0.0
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.seconds
+        times, capacity = self._times, self.capacity
+        while self._count:
+            if times[(self._next - self._count) % capacity] > cutoff:
+                break
+            self._evict()
+
+    def _renormalize(self) -> None:
+        """Recompute the running sums exactly from the buffer."""
+        self._updates = 0
+        if self._count == 0:
+            return
+        buffer, capacity = self._values, self.capacity
+        first = self._next - self._count
+        window = [buffer[seq % capacity] for seq in range(first, self._next)]
+        self._sum = math.fsum(window)
+        mean = self._sum / self._count
+        self._m2 = math.fsum((value - mean) ** 2 for value in window)
+
+
+class StreamSession:
+    """A client's rolling window and when it was last used."""
+
+    def __init__(self, window: RollingWindow, reserved_bytes: int, now: float):
+        # Prefixed with the owning process so other workers can tell a
+        # session they do not hold from one that does not exist
+        self.id = f"{os.getpid():x}-{uuid.uuid4().hex}"
+        self.window = window
+        self.reserved_bytes = reserved_bytes
+        self.last_used = now
+
+
+class StreamRegistry:
+    """
+    Holds the streaming sessions of all clients.
+
+    Each session reserves memory for its full capacity up front, so the
+    total stays under ``max_bytes`` however values arrive. Sessions unused
+    for ``idle_timeout`` seconds are evicted, oldest first.
+
+    Sessions live in the memory of the worker process that created them,
+    so with several workers every request of a session must reach that
+    worker (a single worker or sticky routing). Lookups of another worker's
+    session raise ``StreamElsewhereError`` rather than a plain ``KeyError``.
+    """
+
+    def __init__(
+        self,
+        logger: ILogger,
+        max_bytes: int = 256 * 1024**2,
+        idle_timeout: float = 300.0,
+        max_capacity: int = 1_000_000,
+        default_time_capacity: int = 65_536,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize registry.
+
+        Args:
+            logger: Logger for structured logging
+            max_bytes: Memory all sessions may reserve together
+            idle_timeout: Seconds after which an unused session is evicted
+            max_capacity: Largest window (in values) of a session
+            default_time_capacity: Values held by a time window unless the
+                client asks for another capacity
+            clock: Time source for idle tracking and time windows
+        """
+        self._logger = logger
+        self._max_bytes = max_bytes
+        self._idle_timeout = idle_timeout
+        self._max_capacity = max_capacity
+        self._default_time_capacity = default_time_capacity
+        self._clock = clock
+        self._sessions: "OrderedDict[str, StreamSession]" = OrderedDict()
+        self._reserved_bytes = 0
+
+    def create(
+        self,
+        window: Optional[int] = None,
+        seconds: Optional[float] = None,
+        capacity: Optional[int] = None,
+    ) -> StreamSession:
+        """
+        Create a session over the last ``window`` values or ``seconds``.
+
+        Args:
+            window: Size of a count-based window
+            seconds: Length of a time-based window
+            capacity: Most values a time window holds
+
+        Raises:
+            ValueError: If the window is invalid
+            StreamCapacityError: If the memory cap leaves no room for the
+                session
+        """
+        if (window is None) == (seconds is None):
+            raise ValueError("Give exactly one of window or seconds")
+        if window is not None:
+            if capacity is not None:
+                raise ValueError("capacity only applies to time windows")
+            capacity = window
+        else:
+            if not (math.isfinite(seconds) and seconds > 0):
+                raise ValueError("seconds must be positive")
+            if capacity is None:
+                capacity = min(self._default_time_capacity, self._max_capacity)
+        if not 1 <= capacity <= self._max_capacity:
+            raise ValueError(
+                f"Window must hold between 1 and {self._max_capacity} values"
+            )
+
+        self.evict_idle()
+        reserved = capacity * BYTES_PER_SLOT
+        if self._reserved_bytes + reserved > self._max_bytes:
+            raise StreamCapacityError(
+                f"Streaming sessions are using {self._reserved_bytes} of "
+                f"{self._max_bytes} bytes; a {capacity}-value window does not fit"
+            )
+        now = self._clock()
+        session = StreamSession(
+            RollingWindow(capacity, seconds, self._clock), reserved, now
+        )
+        self._sessions[session.id] = session
+        self._reserved_bytes += reserved
+        self._logger.info(
+            "Stream session created",
+            session_id=session.id,
+            capacity=capacity,
+            seconds=seconds,
+        )
+        return session
+
+    def get(self, session_id: str) -> StreamSession:
+        """
+        Get a session by ID and mark it as used.
+
+        Raises:
+            StreamElsewhereError: If another worker process created the session
+            KeyError: If no live session has this ID
+        """
+        self.evict_idle()
+        session = self._sessions.get(session_id)
+        if session is None:
+            match = _SESSION_ID.fullmatch(session_id)
+            if match and int(match.group(1), 16) != os.getpid():
+                raise StreamElsewhereError(session_id)
+            raise KeyError(session_id)
+        session.last_used = self._clock()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def delete(self, session_id: str) -> None:
+        """
+        Delete a session.
+
+        Raises:
+            KeyError: If no session has this ID
+        """
+        self._remove(session_id)
+        self._logger.info("Stream session deleted", session_id=session_id)
+
+    def evict_idle(self) -> int:
+        """Evict sessions idle for longer than the timeout; return how many."""
+        cutoff = self._clock() - self._idle_timeout
+        evicted = 0
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.last_used > cutoff:
+                break
+            self._remove(session.id)
+            evicted += 1
+        if evicted:
+            self._logger.info("Idle stream sessions evicted", sessions=evicted)
+        return evicted
+
+    def status(self) -> Dict[str, int]:
+        """Return the number of sessions and their reserved memory."""
+        return {
+            "sessions": len(self._sessions),
+            "reserved_bytes": self._reserved_bytes,
+            "max_bytes": self._max_bytes,
+        }
+
+    def _remove(self, session_id: str) -> None:
+        session = self._sessions.pop(session_id)
+        self._reserved_bytes -= session.reserved_bytes
@@ -0,0 +1,107 @@
+"""Tensor calculator service with size and thread limits."""
+from typing import Any
+import numpy as np
+from domain.interfaces.logger import ILogger
+from domain.operations.factory import OperationFactory
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # pragma: no cover - optional
+    threadpool_limits = None
+
+
+def _as_array(value: Any, label: str) -> np.ndarray:
+    try:
+        array = np.asarray(value, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"{label} must be a number or a rectangular array of numbers"
+        ) from None
+    return array
+
+
+class TensorCalculatorService:
+    """Service to perform vector and matrix calculations."""
+
+    def __init__(
+        self,
+        operation_factory: OperationFactory,
+        logger: ILogger,
+        max_elements: int = 1_000_000,
+        max_threads: int = 1,
+    ):
+        """
+        Initialize tensor calculator service.
+
+        Args:
+            operation_factory: Factory to resolve tensor operations
+            logger: Logger for structured logging
+            max_elements: Largest operand or result size accepted
+            max_threads: BLAS threads per process, so one large product
+                cannot occupy every core
+        """
+        self._factory = operation_factory
+        self._logger = logger
+        self._max_elements = max_elements
+        if threadpool_limits is not None:
+            # Process-wide: per-call limits would race between request threads
+            threadpool_limits(limits=max_threads, user_api="blas")
+
+    def calculate(self, operation_name: str, x: Any, y: Any) -> np.ndarray:
+        """
+        Perform a vector/matrix calculation.
+
+        Shapes and sizes are validated before any work is done.
+
+        Args:
+            operation_name: Name of tensor operation
+            x: First operand (array-like)
+            y: Second operand (array-like)
+
+        Returns:
+            Result array
+
+        Raises:
+            ValueError: If the operation, shapes or sizes are invalid
+        """
+        operation = self._factory.get_tensor_operation(operation_name)
+        x = _as_array(x, "x")
+        y = _as_array(y, "y")
+        self._logger.info(
+            "Tensor calculation requested",
+            operation=operation.name,
+            x_shape=list(x.shape),
+            y_shape=list(y.shape),
+        )
+
+        try:
+            for label, array in (("x", x), ("y", y)):
+                if array.size > self._max_elements:
+                    raise ValueError(
+                        f"{label} has {array.size} elements; "
+                        f"limit is {self._max_elements}"
+                    )
+            shape = operation.result_shape(x.shape, y.shape)
+            if int(np.prod(shape, dtype=np.int64)) > self._max_elements:
+                raise ValueError(
+                    f"Result shape {shape} exceeds the limit of "
+                    f"{self._max_elements} elements"
+                )
+            with np.errstate(all="ignore"):
+                result = operation.execute(x, y)
+        except ValueError as e:
+            self._logger.error(
+                "Tensor calculation failed", operation=operation.name, error=str(e)
+            )
+            raise
+
+        self._logger.info(
+            "Tensor calculation completed",
+            operation=operation.name,
+            shape=list(result.shape),
+        )
+        return result
+
+    def get_available_operations(self) -> list[str]:
+        """Return list of available tensor operations."""
+        return self._factory.get_available_tensor_operations()
@@ -23,5 +23,6 @@ echo ""
 echo "✅ Starting server..."
 echo "   Web UI: http://localhost:8000/"
 echo "   API Docs: http://localhost:8000/docs"
+echo "   Profile: ${SERVER_PROFILE:-development} (set SERVER_PROFILE=production to tune)"
 echo ""
-poetry run uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+poetry run python -m app.server
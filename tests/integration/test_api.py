@@ -1,7 +1,24 @@
 """Integration tests for FastAPI endpoints."""
+import gc
+import io
+import json
+import re
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from app.api.endpoints import calculator, diagnostics, numeric, stats
+from app.core.config import settings
+from app.core.dependencies import get_request_scheduler
+from app.core.scheduler import SchedulerRejectedError
 from app.main import app
+from domain.interfaces.result import ErrorCode
+from domain.services.calculator import CalculationCancelledError
+from domain.services.stats import SharedStatsRecorder
 
 client = TestClient(app)
 
@@ -125,6 +142,20 @@ class TestDivideEndpoint:
 class TestCalcEndpoint:
     """Test cases for POST /calc endpoint."""
 
+    def test_error_body_carries_code(self):
+        """Test that failures keep their detail and add an error code."""
+        for _ in range(2):  # second response is served from the body cache
+            response = client.post(
+                "/calc", json={"operation": "divide", "x": 1, "y": 0}
+            )
+            assert response.status_code == 400
+            assert response.json() == {
+                "detail": "Division by zero is not allowed",
+                "code": "division_by_zero",
+            }
+        response = client.post("/calc", json={"operation": "modulo", "x": 1, "y": 2})
+        assert response.json()["code"] == "invalid_operation"
+
     def test_calc_add_operation(self):
         """Test /calc endpoint with add operation."""
         response = client.post(
@@ -202,3 +233,727 @@ class TestCalcEndpoint:
             json={"operation": "add", "x": "not a number", "y": 5},
         )
         assert response.status_code == 422
+
+
+class TestBatchEndpoint:
+    """Test cases for POST /calc/batch endpoint."""
+
+    def test_batch_results_in_order(self):
+        """Test batch endpoint returns one result per item."""
+        response = client.post(
+            "/calc/batch",
+            json={
+                "items": [
+                    {"operation": "add", "x": 1, "y": 2},
+                    {"operation": "multiply", "x": 6, "y": 7},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["result"] for r in data["results"]] == [3, 42]
+        assert data["succeeded"] == 2
+        assert data["failed"] == 0
+
+    def test_batch_reports_item_errors(self):
+        """Test that failing items are reported without failing the batch."""
+        response = client.post(
+            "/calc/batch",
+            json={
+                "items": [
+                    {"operation": "divide", "x": 1, "y": 0},
+                    {"operation": "add", "x": 1, "y": 1},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert "Division by zero" in data["results"][0]["error"]
+        assert data["results"][0]["result"] is None
+        assert data["results"][1]["result"] == 2
+        assert data["failed"] == 1
+
+    def test_batch_invalid_timeout(self):
+        """Test that non-positive timeouts are rejected."""
+        response = client.post("/calc/batch", json={"items": [], "timeout": 0})
+        assert response.status_code == 422
+
+    def test_batch_cancelled_returns_499(self, monkeypatch):
+        """Test that a job cancelled by a disconnect ends with a response."""
+
+        async def cancelled(*args, **kwargs):
+            raise CalculationCancelledError("Calculation job cancelled after 3 items")
+
+        monkeypatch.setattr(calculator._calculator, "acalculate_many", cancelled)
+        response = client.post(
+            "/calc/batch", json={"items": [{"operation": "add", "x": 1, "y": 2}]}
+        )
+        assert response.status_code == 499
+        assert response.json()["detail"] == "Calculation job cancelled after 3 items"
+
+
+class TestScientificEndpoints:
+    """Test cases for scientific endpoints."""
+
+    def test_sqrt(self):
+        """Test square root endpoint."""
+        response = client.get("/sqrt?x=16")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["operation"] == "sqrt"
+        assert data["y"] is None
+        assert data["result"] == 4.0
+
+    def test_pow(self):
+        """Test power endpoint."""
+        response = client.get("/pow?x=2&y=10")
+        assert response.status_code == 200
+        assert response.json()["result"] == 1024.0
+
+    def test_factorial_invalid_returns_400(self):
+        """Test that invalid factorial input returns 400 error."""
+        response = client.get("/factorial?x=-3")
+        assert response.status_code == 400
+        assert "non-negative integers" in response.json()["detail"]
+
+    def test_calc_unary_operation(self):
+        """Test /calc endpoint with a unary operation and no y."""
+        response = client.post("/calc", json={"operation": "log", "x": 1})
+        assert response.status_code == 200
+        assert response.json()["result"] == 0.0
+
+
+class TestJobEndpoints:
+    """Test cases for bulk and numeric job endpoints."""
+
+    def _wait_for(self, job_id):
+        for _ in range(500):
+            data = client.get(f"/jobs/{job_id}").json()
+            if data["status"] in ("completed", "failed"):
+                return data
+            time.sleep(0.01)
+        raise AssertionError("Job did not finish")
+
+    def test_job_lifecycle(self):
+        """Test uploading, polling and downloading a job."""
+        response = client.post(
+            "/jobs?operation=divide&header=true",
+            content=b"x,y\n8,2\n1,0\n",
+            headers={"Content-Type": "text/csv"},
+        )
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        data = self._wait_for(job_id)
+        assert data["status"] == "completed"
+        assert data["progress"] == 1.0
+        assert data["stats"]["failed"] == 1
+
+        result = client.get(f"/jobs/{job_id}/result")
+        assert result.status_code == 200
+        assert result.text.splitlines()[1:] == [
+            "4.0,",
+            ",Division by zero is not allowed",
+        ]
+        assert client.delete(f"/jobs/{job_id}").status_code == 204
+        assert client.get(f"/jobs/{job_id}").status_code == 404
+
+    def test_job_invalid_operation(self):
+        """Test that an unknown operation returns 400."""
+        response = client.post("/jobs?operation=modulo", content=b"1,2\n")
+        assert response.status_code == 400
+        assert "Invalid operation" in response.json()["detail"]
+
+    def test_unknown_job_returns_404(self):
+        """Test polling a job that does not exist."""
+        assert client.get("/jobs/missing").status_code == 404
+
+    def test_integration_job(self):
+        """Test integrating sin(x) over [0, pi] and polling the job."""
+        response = client.post(
+            "/numeric/integrate",
+            json={
+                "expression": {"op": "sin", "args": ["x"]},
+                "lower": 0,
+                "upper": 3.141592653589793,
+                "panels": 64,
+            },
+        )
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.json()["kind"] == "integral"
+
+        data = self._wait_for(job_id)
+        assert data["status"] == "completed"
+        assert data["stats"]["value"] == pytest.approx(2.0, abs=1e-12)
+        assert client.get(f"/jobs/{job_id}/result").status_code == 404
+        assert client.delete(f"/jobs/{job_id}").status_code == 204
+
+    def test_summation_job(self):
+        """Test summing a series of integers."""
+        response = client.post(
+            "/numeric/sum", json={"expression": "n", "start": 1, "stop": 100}
+        )
+        assert response.status_code == 202
+        data = self._wait_for(response.json()["job_id"])
+        assert data["stats"]["value"] == 5050.0
+
+    def test_simulation_streams_summaries(self):
+        """Test the NDJSON stream of a seeded simulation."""
+        body = {
+            "expression": {"op": "add", "args": ["x", "y"]},
+            "distributions": {
+                "x": {"dist": "normal", "loc": 1, "scale": 1},
+                "y": {"dist": "uniform", "low": 0, "high": 2},
+            },
+            "trials": 1000,
+            "seed": 11,
+            "thresholds": [2],
+        }
+        response = client.post("/numeric/simulate", json=body)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        final = json.loads(response.text.splitlines()[-1])
+        assert final["done"] and final["trials"] == 1000
+        assert final["ci"][0] < 2 < final["ci"][1]
+        again = client.post("/numeric/simulate", json=body)
+        assert again.text == response.text
+
+    def test_simulation_errors(self):
+        """Test rejected requests and failures during the run."""
+        body = {
+            "expression": {"op": "sqrt", "args": ["x"]},
+            "distributions": {"x": {"dist": "normal", "loc": 0, "scale": 1}},
+            "trials": 100,
+            "seed": 1,
+        }
+        response = client.post("/numeric/simulate", json={**body, "distributions": {}})
+        assert response.status_code == 400
+        assert "No distribution for: x" in response.json()["detail"]
+        response = client.post("/numeric/simulate", json=body)
+        assert "Square root" in json.loads(response.text.splitlines()[-1])["error"]
+
+    def test_busy_simulations_return_503(self, monkeypatch):
+        """Test that a simulation without a free slot is refused with 503."""
+        monkeypatch.setattr(numeric._simulations, "_slots", threading.Semaphore(0))
+        body = {
+            "expression": "x",
+            "distributions": {"x": {"dist": "uniform", "low": 0, "high": 1}},
+            "trials": 100,
+        }
+        response = client.post("/numeric/simulate", json=body)
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert "slots are busy" in response.json()["detail"]
+
+    def test_simulation_worker_death_ends_stream(self, monkeypatch):
+        """Test that a broken process pool ends the stream with an error line."""
+
+        def run(simulation):
+            yield {"done": False}
+            raise BrokenProcessPool("A process in the process pool died")
+
+        monkeypatch.setattr(numeric._simulations, "run", run)
+        body = {
+            "expression": "x",
+            "distributions": {"x": {"dist": "uniform", "low": 0, "high": 1}},
+            "trials": 100,
+        }
+        response = client.post("/numeric/simulate", json=body)
+        assert response.status_code == 200
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0] == {"done": False}
+        assert lines[-1]["done"] is True
+        assert "worker process died" in lines[-1]["error"]
+
+    def test_numeric_validation_returns_400(self):
+        """Test that invalid numeric jobs are rejected."""
+        response = client.post(
+            "/numeric/integrate",
+            json={
+                "expression": {"op": "modulo", "args": ["x", 2]},
+                "lower": 0,
+                "upper": 1,
+            },
+        )
+        assert response.status_code == 400
+        assert "Invalid operation" in response.json()["detail"]
+        response = client.post(
+            "/numeric/sum", json={"expression": "n", "start": 5, "stop": 1}
+        )
+        assert response.status_code == 400
+
+
+class TestProbeEndpoints:
+    """Test cases for liveness, readiness and scheduler probes."""
+
+    def test_liveness(self):
+        """Test that liveness always reports alive."""
+        response = client.get("/health/live")
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+
+    def test_readiness_when_idle(self):
+        """Test that an idle instance is ready."""
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        assert set(data["checks"]) == {
+            "loop_lag_ms",
+            "in_flight",
+            "executor_backlog",
+        }
+
+    def test_readiness_over_threshold_returns_503(self, monkeypatch):
+        """Test that exceeding a threshold marks the instance not ready."""
+        monkeypatch.setattr(settings, "health_max_loop_lag_ms", -1.0)
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        data = response.json()
+        assert data["status"] == "not_ready"
+        assert data["checks"]["loop_lag_ms"]["ok"] is False
+        assert data["checks"]["in_flight"]["ok"] is True
+
+    def test_scheduler_rejections_carry_cors_headers(self, monkeypatch):
+        """Test that CORS wraps the scheduler and preflights are not queued."""
+
+        async def reject(lane):
+            raise SchedulerRejectedError(f"{lane} lane queue is full")
+
+        monkeypatch.setattr(get_request_scheduler(), "acquire", reject)
+        origin = {"Origin": "https://example.com"}
+        response = client.get("/add?x=1&y=2", headers=origin)
+        assert response.status_code == 503
+        assert response.headers["access-control-allow-origin"] == "*"
+        preflight = client.options(
+            "/add", headers={**origin, "Access-Control-Request-Method": "GET"}
+        )
+        assert preflight.status_code == 200
+
+    def test_scheduler_lanes(self):
+        """Test that requests are counted in the lane they select."""
+        before = client.get("/health/scheduler").json()["lanes"]
+        client.post(
+            "/calc",
+            json={"operation": "add", "x": 1, "y": 2},
+            headers={"X-Priority": "interactive"},
+        )
+        client.post(
+            "/calc/batch", json={"items": [{"operation": "add", "x": 1, "y": 2}]}
+        )
+        after = client.get("/health/scheduler").json()
+        assert after["running"] == 0
+        for lane in ("interactive", "bulk"):
+            assert after["lanes"][lane]["admitted"] == before[lane]["admitted"] + 1
+
+
+class TestTensorEndpoints:
+    """Test cases for vector/matrix endpoints."""
+
+    def test_matmul_json(self):
+        """Test matrix multiplication with JSON arrays."""
+        response = client.post(
+            "/tensor/matmul",
+            json={"x": [[1, 2], [3, 4]], "y": [[5, 6], [7, 8]]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["shape"] == [2, 2]
+        assert data["result"] == [[19, 22], [43, 50]]
+
+    def test_shape_error_returns_400(self):
+        """Test that incompatible shapes return 400."""
+        response = client.post("/tensor/dot", json={"x": [1, 2], "y": [1, 2, 3]})
+        assert response.status_code == 400
+        assert "equal length" in response.json()["detail"]
+
+    def test_binary_round_trip(self):
+        """Test the .npz request / .npy response format."""
+        body = io.BytesIO()
+        np.savez(body, x=np.eye(3), y=np.arange(3.0))
+        response = client.post("/tensor/solve/binary", content=body.getvalue())
+        assert response.status_code == 200
+        result = np.load(io.BytesIO(response.content))
+        assert result.tolist() == [0.0, 1.0, 2.0]
+
+    def test_binary_invalid_body(self):
+        """Test that a non-npz body returns 400."""
+        response = client.post("/tensor/add/binary", content=b"not numpy")
+        assert response.status_code == 400
+
+    def test_json_body_over_limit_returns_413(self, monkeypatch):
+        """Test that JSON bodies are capped, with or without Content-Length."""
+        monkeypatch.setattr(settings, "tensor_max_body_bytes", 64)
+        payload = json.dumps({"x": list(range(50)), "y": list(range(50))}).encode()
+        response = client.post(
+            "/tensor/add",
+            content=payload,
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 413
+        chunked = client.post(
+            "/tensor/add",
+            content=iter([payload[:40], payload[40:]]),
+            headers={"Content-Type": "application/json"},
+        )
+        assert chunked.status_code == 413
+        small = client.post("/tensor/add", json={"x": [1], "y": [2]})
+        assert small.status_code == 200
+
+
+class TestPolynomialEndpoints:
+    """Test cases for polynomial endpoints."""
+
+    def test_evaluate_json(self):
+        """Test evaluating 1 + 2x + 3x^2 at several points."""
+        response = client.post(
+            "/polynomial/evaluate",
+            json={"coefficients": [1, 2, 3], "operand": [0, 1, 2]},
+        )
+        assert response.status_code == 200
+        assert response.json()["result"] == [1.0, 6.0, 17.0]
+
+    def test_roots_json(self):
+        """Test real root finding."""
+        response = client.post("/polynomial/roots", json={"coefficients": [-2, 0, 1]})
+        assert response.status_code == 200
+        assert response.json()["result"] == pytest.approx([-(2**0.5), 2**0.5])
+
+    def test_missing_operand_returns_400(self):
+        """Test that multiply without a second factor returns 400."""
+        response = client.post("/polynomial/multiply", json={"coefficients": [1]})
+        assert response.status_code == 400
+        assert "requires an operand" in response.json()["detail"]
+
+    def test_json_body_over_limit_returns_413(self, monkeypatch):
+        """Test that JSON bodies are capped before they are parsed."""
+        monkeypatch.setattr(settings, "polynomial_max_body_bytes", 64)
+        response = client.post(
+            "/polynomial/roots", json={"coefficients": list(range(100))}
+        )
+        assert response.status_code == 413
+        assert response.json()["detail"] == "Body exceeds 64 bytes"
+
+    def test_binary_evaluate(self):
+        """Test the .npz request / .npy response format."""
+        body = io.BytesIO()
+        points = np.linspace(0, 1, 10_000)
+        np.savez(body, coefficients=np.array([0.0, 0.0, 1.0]), operand=points)
+        response = client.post("/polynomial/evaluate/binary", content=body.getvalue())
+        assert response.status_code == 200
+        result = np.load(io.BytesIO(response.content))
+        np.testing.assert_allclose(result, points**2)
+
+
+class TestIntegerEndpoints:
+    """Test cases for number-theory endpoints."""
+
+    def test_factorize(self):
+        """Test factorizing a single number."""
+        response = client.post("/integer/factorize", json={"args": [360]})
+        assert response.status_code == 200
+        assert response.json()["result"] == [[2, 3], [3, 2], [5, 1]]
+
+    def test_modpow_large_operands(self):
+        """Test that big integers survive the JSON round trip exactly."""
+        args = [3, 2**200 + 1, 2**127 - 1]
+        response = client.post("/integer/modpow", json={"args": args})
+        assert response.status_code == 200
+        assert response.json()["result"] == pow(*args)
+
+    def test_batch_and_tables(self):
+        """Test that a batch warms the tables and reports item errors."""
+        response = client.post(
+            "/integer/is_prime/batch", json={"items": [[97], [100], [1, 2]]}
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["result"] for r in results[:2]] == [True, False]
+        assert "takes 1 arguments" in results[2]["error"]
+        tables = client.get("/integer/tables").json()
+        assert tables["sieve_limit"] > 100
+
+    def test_invalid_operation_returns_400(self):
+        """Test that unknown operations return 400."""
+        response = client.post("/integer/sqrt", json={"args": [4]})
+        assert response.status_code == 400
+        assert "Invalid integer operation" in response.json()["detail"]
+
+    def test_non_integer_returns_422(self):
+        """Test that floats are rejected by validation."""
+        response = client.post("/integer/gcd", json={"args": [1.5, 2]})
+        assert response.status_code == 422
+
+
+class TestGraphEndpoints:
+    """Test cases for reactive calculation graph endpoints."""
+
+    def test_define_update_and_read(self):
+        """Test streaming recomputation of a small graph."""
+        graph_id = client.post("/graphs").json()["graph_id"]
+        response = client.put(
+            f"/graphs/{graph_id}/nodes",
+            json={
+                "nodes": [
+                    {"name": "a", "value": 2},
+                    {"name": "b", "value": 3},
+                    {"name": "sum", "operation": "add", "args": ["a", "b"]},
+                    {"name": "double", "operation": "multiply", "args": ["sum", 2]},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[-1] == {"name": "double", "value": 10.0, "error": None}
+
+        response = client.post(f"/graphs/{graph_id}/inputs", json={"values": {"b": 8}})
+        names = [json.loads(line)["name"] for line in response.text.splitlines()]
+        assert names == ["b", "sum", "double"]
+        node = client.get(f"/graphs/{graph_id}/nodes/double").json()
+        assert node["value"] == 20.0
+        assert client.get(f"/graphs/{graph_id}").json()["nodes"] == 4
+
+        assert client.delete(f"/graphs/{graph_id}").status_code == 204
+        assert client.get(f"/graphs/{graph_id}").status_code == 404
+
+    def test_cycle_returns_400(self):
+        """Test that cyclic definitions are rejected."""
+        graph_id = client.post("/graphs").json()["graph_id"]
+        response = client.put(
+            f"/graphs/{graph_id}/nodes",
+            json={
+                "nodes": [
+                    {"name": "a", "operation": "sqrt", "args": ["b"]},
+                    {"name": "b", "operation": "sqrt", "args": ["a"]},
+                ]
+            },
+        )
+        assert response.status_code == 400
+        assert "Cycle detected" in response.json()["detail"]
+        client.delete(f"/graphs/{graph_id}")
+
+    def test_node_needs_value_or_operation(self):
+        """Test that ambiguous node definitions return 422."""
+        graph_id = client.post("/graphs").json()["graph_id"]
+        response = client.put(
+            f"/graphs/{graph_id}/nodes",
+            json={"nodes": [{"name": "a", "value": 1, "operation": "sqrt"}]},
+        )
+        assert response.status_code == 422
+        client.delete(f"/graphs/{graph_id}")
+
+    def test_graph_of_another_worker_returns_421(self):
+        """Test that a graph created by another process is reported as such."""
+        response = client.get(f"/graphs/ffffffff-{'0' * 32}")
+        assert response.status_code == 421
+        assert "sticky routing" in response.json()["detail"]
+        assert client.get("/graphs/unknown").status_code == 404
+
+
+class TestStreamEndpoints:
+    """Test cases for streaming session endpoints."""
+
+    def test_push_and_read_over_http(self):
+        """Test rolling aggregates over a count window."""
+        response = client.post("/streams", json={"window": 3})
+        assert response.status_code == 201
+        session_id = response.json()["session_id"]
+        response = client.post(
+            f"/streams/{session_id}/values", json={"values": [1, 2, 3, 4]}
+        )
+        assert response.status_code == 200
+        stats = response.json()
+        assert (stats["count"], stats["sum"], stats["mean"]) == (3, 9.0, 3.0)
+        assert (stats["variance"], stats["min"], stats["max"]) == (1.0, 2.0, 4.0)
+        assert client.get(f"/streams/{session_id}").json() == stats
+
+        assert client.delete(f"/streams/{session_id}").status_code == 204
+        assert client.get(f"/streams/{session_id}").status_code == 404
+
+    def test_push_over_websocket(self):
+        """Test that each message is answered and deletion closes the socket."""
+        session_id = client.post("/streams", json={"seconds": 60}).json()["session_id"]
+        with client.websocket_connect(f"/streams/{session_id}/ws") as websocket:
+            websocket.send_text("[2, 4]")
+            assert websocket.receive_json()["mean"] == 3.0
+            websocket.send_text("6")
+            assert websocket.receive_json()["max"] == 6.0
+            websocket.send_text('"x"')
+            assert websocket.receive_json() == {"error": "Values must be numbers"}
+            websocket.send_text("1" + "0" * 400)
+            assert websocket.receive_json() == {"error": "Values must be finite"}
+
+            client.delete(f"/streams/{session_id}")
+            websocket.send_text("1")
+            with pytest.raises(WebSocketDisconnect) as closed:
+                websocket.receive_json()
+            assert closed.value.code == 1008
+
+    def test_session_of_another_worker_returns_421(self):
+        """Test that a session created by another process is reported as such."""
+        response = client.get(f"/streams/ffffffff-{'0' * 32}")
+        assert response.status_code == 421
+        assert "sticky routing" in response.json()["detail"]
+        assert client.get("/streams/unknown").status_code == 404
+
+    @pytest.mark.parametrize(
+        "body", [{}, {"window": 3, "seconds": 1}, {"window": 0}, {"seconds": -1}]
+    )
+    def test_invalid_window_returns_400(self, body):
+        """Test that invalid windows are rejected."""
+        assert client.post("/streams", json=body).status_code == 400
+
+    def test_status(self):
+        """Test that sessions reserve memory until deleted."""
+        before = client.get("/streams").json()
+        session_id = client.post("/streams", json={"window": 10}).json()["session_id"]
+        during = client.get("/streams").json()
+        assert during["sessions"] == before["sessions"] + 1
+        assert during["reserved_bytes"] > before["reserved_bytes"]
+        client.delete(f"/streams/{session_id}")
+        assert client.get("/streams").json() == before
+
+
+class TestStatsEndpoints:
+    """Test cases for the cross-worker statistics surface."""
+
+    @pytest.fixture
+    def stats_client(self, tmp_path, monkeypatch):
+        """Create an app with the stats router over a fresh recorder."""
+        recorder = SharedStatsRecorder(str(tmp_path / "stats"))
+        recorder.record("divide", 2e-6, None)
+        recorder.record("divide", 3e-6, ErrorCode.DIVISION_BY_ZERO)
+        monkeypatch.setattr(stats, "_stats", recorder)
+        stats_app = FastAPI()
+        stats_app.include_router(stats.router)
+        yield TestClient(stats_app)
+        recorder.close()
+
+    def test_disabled_by_default(self):
+        """Test that the main app has no stats routes."""
+        assert client.get("/stats").status_code == 404
+
+    def test_json(self, stats_client):
+        """Test the aggregated JSON view."""
+        response = stats_client.get("/stats")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["slots_claimed"] == 1
+        (divide,) = data["operations"]
+        assert (divide["operation"], divide["calls"]) == ("divide", 2)
+        assert divide["errors"]["division_by_zero"] == 1
+
+    def test_prometheus(self, stats_client):
+        """Test the Prometheus text view."""
+        response = stats_client.get("/stats/metrics")
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'calculator_calculations_total{operation="divide"} 2' in response.text
+
+
+class TestDiagnosticsEndpoints:
+    """Test cases for the admin memory diagnostics surface."""
+
+    @pytest.fixture
+    def admin_client(self, monkeypatch):
+        """Create an app with the diagnostics router and an admin token."""
+        monkeypatch.setattr(settings, "diagnostics_admin_token", "secret")
+        admin_app = FastAPI()
+        admin_app.include_router(diagnostics.router)
+        return TestClient(admin_app)
+
+    def test_disabled_by_default(self):
+        """Test that the main app has no diagnostics routes."""
+        assert client.get("/admin/memory").status_code == 404
+
+    def test_requires_admin_token(self, admin_client, monkeypatch):
+        """Test that requests need the configured token."""
+        assert admin_client.get("/admin/memory").status_code == 401
+        response = admin_client.get("/admin/memory", headers={"X-Admin-Token": "wrong"})
+        assert response.status_code == 401
+        monkeypatch.setattr(settings, "diagnostics_admin_token", None)
+        response = admin_client.get(
+            "/admin/memory", headers={"X-Admin-Token": "secret"}
+        )
+        assert response.status_code == 403
+
+    def test_tracing_round_trip(self, admin_client):
+        """Test starting tracing, diffing and stopping."""
+        headers = {"X-Admin-Token": "secret"}
+        response = admin_client.post("/admin/memory/tracing/start", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["tracing"] is True
+        try:
+            response = admin_client.get("/admin/memory/diff", headers=headers)
+            assert response.status_code == 400
+            admin_client.post("/admin/memory/baseline", headers=headers)
+            response = admin_client.get("/admin/memory/diff", headers=headers)
+            assert response.status_code == 200
+            response = admin_client.get(
+                "/admin/memory/top", params={"limit": 3}, headers=headers
+            )
+            assert len(response.json()) <= 3
+        finally:
+            response = admin_client.post("/admin/memory/tracing/stop", headers=headers)
+        assert response.json()["tracing"] is False
+
+    def test_gc_and_objects(self, admin_client):
+        """Test GC status, threshold tuning and object counts."""
+        headers = {"X-Admin-Token": "secret"}
+        original = gc.get_threshold()
+        try:
+            response = admin_client.put(
+                "/admin/memory/gc/thresholds",
+                json={"threshold0": 5000, "threshold1": 10, "threshold2": 10},
+                headers=headers,
+            )
+            assert response.json()["thresholds"] == [5000, 10, 10]
+        finally:
+            gc.set_threshold(*original)
+        response = admin_client.get("/admin/memory/objects", headers=headers)
+        assert response.json()[0]["count"] > 0
+
+
+class TestStaticAssets:
+    """Test cases for the in-memory asset pipeline."""
+
+    def _asset_url(self, html, name):
+        match = re.search(rf"/assets/{name}\.[0-9a-f]{{12}}\.\w+", html)
+        assert match, f"{name} reference not rewritten"
+        return match.group(0)
+
+    def test_index_references_fingerprinted_assets(self):
+        """Test that the index links hashed asset URLs."""
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "no-cache"
+        assert "/static/script.js" not in response.text
+        self._asset_url(response.text, "script")
+        self._asset_url(response.text, "style")
+
+    def test_asset_is_immutable_and_compressed(self):
+        """Test immutable caching and gzip negotiation."""
+        url = self._asset_url(client.get("/").text, "script")
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert "javascript" in response.headers["content-type"]
+
+    def test_identity_when_compression_refused(self):
+        """Test that q=0 encodings are not used."""
+        url = self._asset_url(client.get("/").text, "style")
+        response = client.get(url, headers={"Accept-Encoding": "gzip;q=0, br;q=0"})
+        assert "content-encoding" not in response.headers
+
+    def test_etag_revalidation(self):
+        """Test that a matching If-None-Match returns 304."""
+        etag = client.get("/").headers["etag"]
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_unknown_asset_returns_404(self):
+        """Test that unknown asset names return 404."""
+        assert client.get("/assets/missing.js").status_code == 404
@@ -0,0 +1,114 @@
+"""Integration tests for the Python client against the in-process app."""
+import asyncio
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from client import AsyncCalculatorClient, CalculatorClient, CalculatorError
+
+_app_client = TestClient(app)
+
+
+class RecordingTransport(httpx.MockTransport):
+    """Forwards requests to the app and records their paths."""
+
+    def __init__(self):
+        self.paths = []
+        super().__init__(self._forward)
+
+    def _forward(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        response = _app_client.request(
+            request.method,
+            request.url.path,
+            content=request.content,
+            headers={"content-type": "application/json"},
+        )
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=response.content
+        )
+
+
+class RecordingASGITransport(httpx.ASGITransport):
+    """ASGI transport that records request paths."""
+
+    def __init__(self):
+        super().__init__(app=app)
+        self.paths = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        return await super().handle_async_request(request)
+
+
+class TestCalculatorClient:
+    """Test cases for the synchronous client."""
+
+    def test_calculate_and_memoize(self):
+        """Test that repeated calls are answered from the local cache."""
+        transport = RecordingTransport()
+        with CalculatorClient("http://test", transport=transport) as calc:
+            assert calc.calculate("add", 2, 3) == 5
+            assert calc.calculate("add", 2, 3) == 5
+        assert transport.paths == ["/calc"]
+
+    def test_calculate_error(self):
+        """Test that API errors raise CalculatorError."""
+        with CalculatorClient("http://test", transport=RecordingTransport()) as calc:
+            with pytest.raises(CalculatorError, match="Division by zero") as info:
+                calc.calculate("divide", 1, 0)
+        assert info.value.status_code == 400
+
+    def test_calculate_many_batches(self):
+        """Test that many calls are split into batch requests."""
+        transport = RecordingTransport()
+        items = [("multiply", i, 2) for i in range(25)] + [("divide", 1, 0)]
+        with CalculatorClient(
+            "http://test", transport=transport, max_batch_size=10
+        ) as calc:
+            outcomes = calc.calculate_many(items)
+        assert outcomes[:25] == [i * 2 for i in range(25)]
+        assert isinstance(outcomes[25], CalculatorError)
+        assert transport.paths == ["/calc/batch"] * 3
+
+
+class TestAsyncCalculatorClient:
+    """Test cases for the asynchronous client."""
+
+    @pytest.mark.asyncio
+    async def test_calculate_without_batching(self):
+        """Test a single call over ASGI transport."""
+        transport = httpx.ASGITransport(app=app)
+        async with AsyncCalculatorClient("http://test", transport=transport) as calc:
+            assert await calc.calculate("sqrt", 16) == 4.0
+
+    @pytest.mark.asyncio
+    async def test_auto_batching_coalesces_calls(self):
+        """Test that concurrent calls within the window share one request."""
+        transport = RecordingASGITransport()
+        async with AsyncCalculatorClient(
+            "http://test",
+            transport=transport,
+            batch_window=0.01,
+            cache_size=0,
+        ) as calc:
+            results = await asyncio.gather(
+                calc.calculate("add", 1, 1),
+                calc.calculate("add", 1, 1),
+                calc.calculate("multiply", 3, 4),
+                calc.calculate("divide", 1, 0),
+                return_exceptions=True,
+            )
+        assert results[:3] == [2, 2, 12]
+        assert isinstance(results[3], CalculatorError)
+        assert transport.paths == ["/calc/batch"]
+
+    @pytest.mark.asyncio
+    async def test_calculate_many(self):
+        """Test batched calculate_many with bounded parallelism."""
+        transport = httpx.ASGITransport(app=app)
+        async with AsyncCalculatorClient(
+            "http://test", transport=transport, max_batch_size=4
+        ) as calc:
+            outcomes = await calc.calculate_many([("add", i, i) for i in range(10)])
+        assert outcomes == [2 * i for i in range(10)]
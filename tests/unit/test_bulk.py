@@ -0,0 +1,186 @@
+"""Unit tests for bulk file calculation jobs."""
+import time
+import numpy as np
+import pytest
+from domain.operations.basic import DivideOperation
+from domain.operations.factory import OperationFactory
+from domain.operations.vectorized import execute_vectorized
+from domain.services import bulk as bulk_module
+from domain.services.bulk import BulkJobService, _format_results
+from domain.services.jobs import Job, JobRegistry, JobStatus
+from domain.services.logger import StructuredLogger
+
+
+def _wait(job, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not job.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return job
+
+
+class TestExecuteVectorized:
+    """Test cases for vectorized operation execution."""
+
+    def test_divide_reports_zero_rows(self):
+        """Test that zero divisors fail per row with the scalar message."""
+        values, errors = execute_vectorized(
+            DivideOperation(), np.array([6.0, 1.0]), np.array([3.0, 0.0])
+        )
+        assert values[0] == 2.0
+        assert np.isnan(values[1])
+        assert errors == {1: "Division by zero is not allowed"}
+
+    def test_operation_without_kernel_uses_strategy(self):
+        """Test that operations without a kernel still run per row."""
+        factorial = OperationFactory().get_operation("factorial")
+        values, errors = execute_vectorized(factorial, np.array([5.0, -1.0]))
+        assert values[0] == 120.0
+        assert 1 in errors
+
+
+class TestJobRegistry:
+    """Test cases for job metadata shared through a directory."""
+
+    def test_other_registry_sees_progress(self, tmp_path):
+        """Test that a second worker's registry reports a job it did not run."""
+        registry = JobRegistry(tmp_path, save_interval=0.0)
+        other = JobRegistry(tmp_path)
+        job = registry.add(Job("bulk", total=4))
+        job.start()
+        job.stats["rows"] = 3
+        job.advance(3)
+        seen = other.get(job.id)
+        assert (seen.status, seen.done, seen.stats) == (
+            JobStatus.RUNNING,
+            3,
+            {"rows": 3},
+        )
+        job.complete("out.csv")
+        assert other.get(job.id).result == "out.csv"
+        other.remove(job.id)
+        with pytest.raises(KeyError):
+            registry.get(job.id)
+
+    def test_progress_saves_are_throttled(self, tmp_path):
+        """Test that progress between status changes is saved at most per interval."""
+        registry = JobRegistry(tmp_path, save_interval=60.0)
+        job = registry.add(Job("bulk", total=4))
+        job.start()
+        job.advance(1)
+        assert JobRegistry(tmp_path).get(job.id).done == 0
+
+    @pytest.mark.parametrize("job_id", ["../secret", "0" * 31, "missing"])
+    def test_unknown_ids(self, tmp_path, job_id):
+        """Test that malformed and unknown IDs are not found."""
+        with pytest.raises(KeyError):
+            JobRegistry(tmp_path).get(job_id)
+
+
+class TestBulkJobService:
+    """Test cases for BulkJobService."""
+
+    @pytest.fixture
+    def service_factory(self, tmp_path):
+        """Build services sharing one work directory."""
+
+        def build(**kwargs):
+            return BulkJobService(
+                OperationFactory(),
+                StructuredLogger(),
+                JobRegistry(tmp_path),
+                workdir=tmp_path,
+                **kwargs,
+            )
+
+        return build
+
+    def _write(self, service, content):
+        path = service.input_path("upload")
+        path.write_bytes(content)
+        return path
+
+    def test_csv_job_with_header_and_errors(self, service_factory):
+        """Test a CSV job with a header, a zero divisor and a bad row."""
+        service = service_factory()
+        path = self._write(service, b"x,y\n10,2\n1,0\nabc,1\n9,3\n")
+        job = _wait(service.submit(path, "divide", "csv", header=True))
+
+        assert job.status == JobStatus.COMPLETED
+        lines = service.result_path(job).read_text().splitlines()
+        assert lines == [
+            "result,error",
+            "5.0,",
+            ",Division by zero is not allowed",
+            ",Invalid row",
+            "3.0,",
+        ]
+        assert job.stats["rows"] == 4
+        assert job.stats["failed"] == 2
+        assert not path.exists()
+
+    def test_csv_rows_line_up_with_input(self, service_factory):
+        """Test that a bad first row and blank lines keep their result lines."""
+        service = service_factory()
+        path = self._write(service, b"x,2\n4,2\n\n\r\n6,3\n")
+        job = _wait(service.submit(path, "divide", "csv"))
+        assert service.result_path(job).read_text().splitlines()[1:] == [
+            ",Invalid row",
+            "2.0,",
+            ",Invalid row",
+            ",Invalid row",
+            "2.0,",
+        ]
+
+    def test_error_text_is_quoted(self):
+        """Test that error messages with commas and quotes stay one field."""
+        payload = _format_results(np.array([1.0, np.nan]), {1: 'bad "x", y'})
+        assert payload == b'1.0,\n,"bad ""x"", y"\n'
+
+    def test_parallel_chunks_preserve_order(self, service_factory, monkeypatch):
+        """Test that many chunks across processes are written in order."""
+        pools = []
+
+        def counting_pool(workers):
+            pools.append(workers)
+            return bulk_module.ProcessPoolExecutor(workers)
+
+        monkeypatch.setattr(bulk_module, "process_pool", counting_pool)
+        service = service_factory(workers=2, chunk_bytes=64)
+        rows = "".join(f"{i},{i}\n" for i in range(500)).encode()
+        try:
+            for _ in range(2):
+                path = self._write(service, rows)
+                job = _wait(service.submit(path, "add", "csv"), timeout=60)
+
+                assert job.status == JobStatus.COMPLETED
+                results = service.result_path(job).read_text().splitlines()[1:]
+                assert results == [f"{float(2 * i)!r}," for i in range(500)]
+                assert job.progress == 1.0
+        finally:
+            service.shutdown()
+        # One pool serves every job of the service
+        assert pools == [2]
+
+    def test_unary_operation_single_column(self, service_factory):
+        """Test that unary operations read one column."""
+        service = service_factory()
+        path = self._write(service, b"4\n9\n")
+        job = _wait(service.submit(path, "sqrt", "csv"))
+        assert service.result_path(job).read_text().splitlines()[1:] == [
+            "2.0,",
+            "3.0,",
+        ]
+
+    def test_invalid_operation_rejected(self, service_factory):
+        """Test that unknown operations are rejected at submission."""
+        service = service_factory()
+        path = self._write(service, b"1,2\n")
+        with pytest.raises(ValueError, match="Invalid operation"):
+            service.submit(path, "modulo", "csv")
+
+    def test_unsupported_format_rejected(self, service_factory):
+        """Test that unknown formats are rejected at submission."""
+        service = service_factory()
+        path = self._write(service, b"1,2\n")
+        with pytest.raises(ValueError, match="Unsupported format"):
+            service.submit(path, "add", "xlsx")
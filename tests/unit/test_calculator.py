@@ -1,8 +1,11 @@
 """Unit tests for operation factory and calculator service."""
 import pytest
+from domain.interfaces.result import ErrorCode
+from domain.interfaces.stats import IStatsRecorder
 from domain.operations.factory import OperationFactory
 from domain.operations.basic import AddOperation, SubtractOperation
-from domain.services.calculator import CalculatorService
+from domain.services.cache import LocalResultCache
+from domain.services.calculator import CalculationCancelledError, CalculatorService
 from domain.services.logger import StructuredLogger
 
 
@@ -57,7 +60,7 @@ class TestOperationFactory:
         assert "subtract" in operations
         assert "multiply" in operations
         assert "divide" in operations
-        assert len(operations) == 4
+        assert len(operations) == 12
 
 
 class TestCalculatorService:
@@ -103,5 +106,145 @@ class TestCalculatorService:
     def test_get_available_operations(self, calculator_service):
         """Test getting available operations from service."""
         operations = calculator_service.get_available_operations()
-        assert len(operations) == 4
+        assert len(operations) == 12
         assert "add" in operations
+
+
+class TestCalculatorServiceResults:
+    """Test cases for the non-raising calculation path."""
+
+    @pytest.fixture
+    def calculator_service(self):
+        """Create calculator service instance."""
+        return CalculatorService(OperationFactory(), StructuredLogger())
+
+    @pytest.mark.parametrize(
+        "operation,x,y,code",
+        [
+            ("modulo", 10, 3, ErrorCode.INVALID_OPERATION),
+            ("add", 10, None, ErrorCode.MISSING_OPERAND),
+            ("divide", 10, 0, ErrorCode.DIVISION_BY_ZERO),
+            ("sqrt", -1, None, ErrorCode.DOMAIN_ERROR),
+        ],
+    )
+    def test_try_calculate_error_codes(self, calculator_service, operation, x, y, code):
+        """Test that each failure has a code and the message calculate raises."""
+        outcome = calculator_service.try_calculate(operation, x, y)
+        assert not outcome.ok
+        assert outcome.error is code
+        with pytest.raises(ValueError) as raised:
+            calculator_service.calculate(operation, x, y)
+        assert str(raised.value) == outcome.message
+
+    def test_try_calculate_success(self, calculator_service):
+        """Test that successful results carry the value."""
+        outcome = calculator_service.try_calculate("divide", 10, 4)
+        assert outcome.ok
+        assert outcome.value == 2.5
+
+    def test_failures_are_not_cached(self):
+        """Test that only successful results reach the result cache."""
+        cache = LocalResultCache()
+        service = CalculatorService(OperationFactory(), StructuredLogger(), cache)
+        service.try_calculate("divide", 10, 0)
+        assert cache.get("divide", 10, 0) is None
+        service.try_calculate("divide", 10, 4)
+        assert cache.get("divide", 10, 4) == 2.5
+
+    def test_records_statistics(self):
+        """Test that every calculation reaches the stats recorder."""
+        recorded = []
+
+        class Recorder(IStatsRecorder):
+            def record(self, operation, seconds, error):
+                recorded.append((operation, error))
+
+        service = CalculatorService(
+            OperationFactory(), StructuredLogger(), stats=Recorder()
+        )
+        service.try_calculate("divide", 10, 0)
+        service.try_calculate("modulo", 10, 3)
+        service.calculate("add", 1, 2)
+        assert recorded == [
+            ("divide", ErrorCode.DIVISION_BY_ZERO),
+            (None, ErrorCode.INVALID_OPERATION),
+            ("add", None),
+        ]
+
+
+class TestCalculatorServiceAsync:
+    """Test cases for the async CalculatorService API."""
+
+    @pytest.fixture
+    def calculator_service(self):
+        """Create calculator service instance."""
+        factory = OperationFactory()
+        logger = StructuredLogger()
+        return CalculatorService(factory, logger)
+
+    @pytest.mark.asyncio
+    async def test_acalculate(self, calculator_service):
+        """Test async single calculation."""
+        result = await calculator_service.acalculate("multiply", 6, 7)
+        assert result == 42
+
+    @pytest.mark.asyncio
+    async def test_acalculate_many_preserves_order(self, calculator_service):
+        """Test async batch returns results in input order."""
+        items = [("add", 1, 2), ("subtract", 5, 3), ("divide", 9, 3)]
+        results = await calculator_service.acalculate_many(items)
+        assert results == [3, 2, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_acalculate_many_raises_first_error(self, calculator_service):
+        """Test that errors propagate by default."""
+        with pytest.raises(ValueError, match="Division by zero"):
+            await calculator_service.acalculate_many([("add", 1, 2), ("divide", 1, 0)])
+
+    @pytest.mark.asyncio
+    async def test_acalculate_many_return_exceptions(self, calculator_service):
+        """Test that errors are collected when requested."""
+        results = await calculator_service.acalculate_many(
+            [("divide", 1, 0), ("add", 1, 2)], return_exceptions=True
+        )
+        assert isinstance(results[0], ValueError)
+        assert results[1] == 3
+
+    @pytest.mark.asyncio
+    async def test_acalculate_many_deadline(self, calculator_service):
+        """Test that an expired deadline aborts the job."""
+        with pytest.raises(TimeoutError):
+            await calculator_service.acalculate_many([("add", 1, 2)] * 10, timeout=0)
+
+    @pytest.mark.asyncio
+    async def test_acalculate_many_yields_and_cancels(self, calculator_service):
+        """Test that the job yields and honours the cancellation predicate."""
+        checks = []
+
+        async def is_cancelled():
+            checks.append(True)
+            return True
+
+        with pytest.raises(CalculationCancelledError, match="after 0 items"):
+            await calculator_service.acalculate_many(
+                [("add", 1, 2)] * 10, yield_interval=0, is_cancelled=is_cancelled
+            )
+        assert checks
+
+
+class TestCalculatorServiceUnary:
+    """Test cases for unary operations through CalculatorService."""
+
+    @pytest.fixture
+    def calculator_service(self):
+        """Create calculator service instance."""
+        return CalculatorService(OperationFactory(), StructuredLogger())
+
+    def test_calculate_unary_without_y(self, calculator_service):
+        """Test that unary operations need only x."""
+        assert calculator_service.calculate("sqrt", 81) == 9.0
+
+    def test_calculate_binary_without_y(self, calculator_service):
+        """Test that binary operations require y."""
+        with pytest.raises(ValueError, match="requires two operands"):
+            calculator_service.calculate("add", 1)
@@ -0,0 +1,65 @@
+"""Unit tests for application settings."""
+import pytest
+from pydantic import ValidationError
+from app.core.config import SERVER_PROFILES, Settings
+
+
+class TestServerProfiles:
+    """Test cases for the server tuning profile."""
+
+    def test_default_profile_is_development(self):
+        """Test that development (reload) is the default profile."""
+        options = Settings().uvicorn_options()
+        assert options["reload"] is True
+        assert options["workers"] == 1
+
+    def test_production_profile_options(self):
+        """Test that the production profile selects uvloop and httptools."""
+        options = Settings(server_profile="production").uvicorn_options()
+        assert options["loop"] == "uvloop"
+        assert options["http"] == "httptools"
+        assert options["workers"] == SERVER_PROFILES["production"]["workers"]
+        assert options["limit_max_requests"] is None
+
+    def test_max_requests_needs_single_worker(self):
+        """Test that worker recycling is refused with several workers."""
+        with pytest.raises(ValueError, match="single worker"):
+            Settings(
+                server_profile="production", server_limit_max_requests=1000
+            ).uvicorn_options()
+        options = Settings(
+            server_profile="compat", server_limit_max_requests=1000
+        ).uvicorn_options()
+        assert options["limit_max_requests"] == 1000
+
+    def test_overrides_take_precedence(self):
+        """Test that explicit settings override profile values."""
+        options = Settings(
+            server_profile="production",
+            server_http="h11",
+            server_backlog=128,
+            port=9000,
+        ).uvicorn_options()
+        assert options["http"] == "h11"
+        assert options["backlog"] == 128
+        assert options["port"] == 9000
+
+    def test_socket_path_needs_single_worker(self):
+        """Test that a Unix socket path is refused with several workers."""
+        settings = Settings(
+            server_profile="production", socket_enabled=True, socket_path="/x.sock"
+        )
+        with pytest.raises(ValueError, match="SOCKET_PATH needs a single worker"):
+            settings.uvicorn_options()
+        settings = Settings(server_profile="production", socket_enabled=True)
+        assert settings.uvicorn_options()["workers"] > 1
+
+    def test_unknown_profile_rejected(self):
+        """Test that unknown profile names fail validation."""
+        with pytest.raises(ValidationError, match="Unknown server profile"):
+            Settings(server_profile="turbo")
+
+    def test_unknown_http_rejected(self):
+        """Test that unsupported HTTP implementations fail validation."""
+        with pytest.raises(ValidationError):
+            Settings(server_http="http3")
@@ -0,0 +1,141 @@
+"""Unit tests for reactive calculation graphs."""
+import pytest
+from domain.operations.factory import OperationFactory
+from domain.services import graph as graphs
+from domain.services.graph import (
+    CalculationGraph,
+    GraphElsewhereError,
+    GraphRegistry,
+    NodeSpec,
+)
+from domain.services.logger import StructuredLogger
+
+
+class TestCalculationGraph:
+    """Test cases for CalculationGraph."""
+
+    @pytest.fixture
+    def graph(self):
+        """Create a graph computing root = sqrt(a + b) and half = a / 2."""
+        graph = CalculationGraph(OperationFactory())
+        graph.define(
+            [
+                NodeSpec("root", operation="sqrt", args=["sum"]),
+                NodeSpec("sum", operation="add", args=["a", "b"]),
+                NodeSpec("half", operation="divide", args=["a", 2]),
+                NodeSpec("a", value=7),
+                NodeSpec("b", value=9),
+            ]
+        )
+        return graph
+
+    def test_define_computes_values(self, graph):
+        """Test that nodes defined in any order are computed."""
+        assert graph.get("root") == (4.0, None)
+        assert graph.get("half") == (3.5, None)
+        assert len(graph) == 5
+
+    def test_update_recomputes_downstream_in_order(self, graph):
+        """Test that only affected nodes are reported, in dependency order."""
+        changes = graph.set_inputs({"b": 18})
+        assert [name for name, _, _ in changes] == ["b", "sum", "root"]
+        assert graph.get("root") == (5.0, None)
+
+    def test_unchanged_value_stops_propagation(self, graph):
+        """Test early cutoff when a recomputed value is unchanged."""
+        changes = graph.set_inputs({"a": 16, "b": 0})
+        assert [name for name, _, _ in changes] == ["a", "b", "half"]
+        assert graph.set_inputs({"a": 16}) == []
+
+    def test_errors_propagate(self, graph):
+        """Test that failures are reported and downstream nodes fail too."""
+        changes = graph.set_inputs({"a": -20})
+        outcomes = {name: (value, error) for name, value, error in changes}
+        assert outcomes["sum"] == (-11.0, None)
+        assert outcomes["root"][1] == "Square root of a negative number is not allowed"
+        graph.define([NodeSpec("next", operation="exp", args=["root"])])
+        assert graph.get("next") == (None, "Depends on failed node root")
+
+    def test_cycle_is_rejected_atomically(self, graph):
+        """Test that a cycle raises and leaves the graph unchanged."""
+        with pytest.raises(ValueError, match="Cycle detected among nodes: a, sum"):
+            graph.define([NodeSpec("a", operation="sqrt", args=["sum"])])
+        assert graph.set_inputs({"a": 0})[0] == ("a", 0.0, None)
+
+    def test_invalid_definitions(self, graph):
+        """Test unknown references, arity mismatches and input updates."""
+        with pytest.raises(ValueError, match="unknown node missing"):
+            graph.define([NodeSpec("c", operation="add", args=["a", "missing"])])
+        with pytest.raises(ValueError, match="takes 1 arguments, got 2"):
+            graph.define([NodeSpec("c", operation="sqrt", args=["a", "b"])])
+        with pytest.raises(ValueError, match="Invalid operation"):
+            graph.define([NodeSpec("c", operation="modulo", args=["a", "b"])])
+        with pytest.raises(ValueError, match="computed, not an input"):
+            graph.set_inputs({"sum": 1})
+        with pytest.raises(ValueError, match="Unknown node"):
+            graph.set_inputs({"z": 1})
+
+    def test_long_chain(self):
+        """Test a deep graph updates incrementally without recursion."""
+        graph = CalculationGraph(OperationFactory())
+        specs = [NodeSpec("n0", value=0)]
+        specs += [
+            NodeSpec(f"n{i}", operation="add", args=[f"n{i - 1}", 1])
+            for i in range(1, 50_000)
+        ]
+        graph.define(specs)
+        assert graph.get("n49999") == (49999.0, None)
+        assert len(graph.set_inputs({"n0": 1})) == 50_000
+
+    def test_node_limit(self):
+        """Test that exceeding max_nodes raises."""
+        graph = CalculationGraph(OperationFactory(), max_nodes=1)
+        with pytest.raises(ValueError, match="limit of 1 nodes"):
+            graph.define([NodeSpec("a", value=1), NodeSpec("b", value=2)])
+
+
+class TestGraphRegistry:
+    """Test cases for GraphRegistry."""
+
+    def test_create_get_delete(self):
+        """Test the graph lifecycle and the graph limit."""
+        registry = GraphRegistry(OperationFactory(), StructuredLogger(), max_graphs=1)
+        graph = registry.create()
+        assert registry.get(graph.id) is graph
+        with pytest.raises(ValueError, match="Graph limit of 1 reached"):
+            registry.create()
+        registry.delete(graph.id)
+        with pytest.raises(KeyError):
+            registry.get(graph.id)
+
+    def test_idle_graphs_are_evicted(self):
+        """Test that unused graphs are evicted and make room for new ones."""
+        now = [0.0]
+        registry = GraphRegistry(
+            OperationFactory(),
+            StructuredLogger(),
+            max_graphs=2,
+            idle_timeout=60.0,
+            clock=lambda: now[0],
+        )
+        old = registry.create()
+        used = registry.create()
+        now[0] += 40
+        registry.get(used.id)
+        now[0] += 30
+        fresh = registry.create()
+        assert old.id not in registry
+        assert registry.get(used.id) is used
+        assert registry.get(fresh.id) is fresh
+
+    def test_graph_of_another_worker(self, monkeypatch):
+        """Test that another process's graph is told apart from a missing one."""
+        registry = GraphRegistry(OperationFactory(), StructuredLogger())
+        graph = registry.create()
+        registry.delete(graph.id)
+        with pytest.raises(KeyError) as missing:
+            registry.get(graph.id)
+        assert not isinstance(missing.value, GraphElsewhereError)
+        monkeypatch.setattr(graphs.os, "getpid", lambda: -1)
+        with pytest.raises(GraphElsewhereError):
+            registry.get(graph.id)
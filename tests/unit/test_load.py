@@ -0,0 +1,36 @@
+"""Unit tests for load monitoring."""
+import asyncio
+import time
+import pytest
+from app.core.load import InFlightMiddleware, LoadMonitor
+
+
+class TestLoadMonitor:
+    """Test cases for LoadMonitor."""
+
+    @pytest.mark.asyncio
+    async def test_detects_blocked_loop(self):
+        """Test that blocking the loop shows up as lag."""
+        monitor = LoadMonitor(sample_interval=0.01)
+        monitor.start()
+        await asyncio.sleep(0)
+        time.sleep(0.1)  # Block the event loop
+        await asyncio.sleep(0.001)  # Let the overdue sampler record the lag
+        lag = monitor.loop_lag
+        await monitor.stop()
+        assert lag >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_in_flight_counter(self):
+        """Test that the middleware counts requests while they run."""
+        monitor = LoadMonitor()
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append(monitor.in_flight)
+
+        middleware = InFlightMiddleware(app, monitor)
+        await middleware({"type": "http", "path": "/add"}, None, None)
+        await middleware({"type": "http", "path": "/health/ready"}, None, None)
+        assert seen == [1, 0]
+        assert monitor.in_flight == 0
@@ -0,0 +1,76 @@
+"""Unit tests for memory diagnostics."""
+import gc
+import tracemalloc
+import pytest
+from app.core.memory import MemoryDiagnostics
+
+
+class TestMemoryDiagnostics:
+    """Test cases for MemoryDiagnostics."""
+
+    @pytest.fixture
+    def diagnostics(self):
+        """Create diagnostics and make sure tracing is stopped afterwards."""
+        diagnostics = MemoryDiagnostics(default_frames=2)
+        yield diagnostics
+        diagnostics.stop_tracing()
+
+    def test_status_without_tracing(self, diagnostics):
+        """Test that status works while tracing is off."""
+        status = diagnostics.status()
+        assert status["tracing"] is False
+        assert status["traced_bytes"] == 0
+        assert status["peak_rss_bytes"] > 0
+
+    def test_top_and_diff(self, diagnostics):
+        """Test that a growing allocation shows up in top and in the diff."""
+        with pytest.raises(ValueError, match="not running"):
+            diagnostics.top()
+        diagnostics.start_tracing()
+        assert tracemalloc.get_traceback_limit() == 2
+        with pytest.raises(ValueError, match="already running"):
+            diagnostics.start_tracing()
+
+        diagnostics.take_baseline()
+        retained = [bytearray(1024) for _ in range(2000)]  # noqa: F841
+        growth = diagnostics.diff(limit=1)
+        assert growth[0]["location"].startswith(__file__)
+        assert growth[0]["size_diff_bytes"] >= 2000 * 1024
+        assert diagnostics.top(limit=5)[0]["size_bytes"] >= 2000 * 1024
+
+        traceback = diagnostics.top(limit=1, group_by="traceback")[0]["location"]
+        assert " <- " in traceback
+        with pytest.raises(ValueError, match="Unknown grouping"):
+            diagnostics.top(group_by="module")
+
+    def test_diff_requires_baseline(self, diagnostics):
+        """Test that diffing without a baseline raises."""
+        diagnostics.start_tracing()
+        with pytest.raises(ValueError, match="No baseline"):
+            diagnostics.diff()
+
+    def test_gc_thresholds(self, diagnostics):
+        """Test reading and tuning collector thresholds."""
+        original = gc.get_threshold()
+        try:
+            diagnostics.set_gc_thresholds((1000, 20, 30))
+            status = diagnostics.gc_status()
+            assert status["thresholds"] == [1000, 20, 30]
+            assert len(status["generations"]) == 3
+            with pytest.raises(ValueError, match="must not be negative"):
+                diagnostics.set_gc_thresholds((-1, 10, 10))
+        finally:
+            gc.set_threshold(*original)
+
+    def test_object_counts(self, diagnostics):
+        """Test that object counts include live instances of a type."""
+
+        class Marker:
+            pass
+
+        markers = [Marker() for _ in range(500)]  # noqa: F841
+        counts = dict(diagnostics.object_counts(limit=1000))
+        name = f"{__name__}.{Marker.__qualname__}"
+        assert counts[name] == 500
+        with pytest.raises(ValueError, match="Generation"):
+            diagnostics.collect(3)
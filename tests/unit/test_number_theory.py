@@ -0,0 +1,172 @@
+"""Unit tests for number-theory operations and the prime tables."""
+import math
+import pytest
+from domain.operations.factory import OperationFactory
+from domain.operations.number_theory import (
+    ModInverseOperation,
+    ModPowOperation,
+    PrimeTables,
+    pollard_brent,
+)
+from domain.services import number_theory
+from domain.services.logger import StructuredLogger
+from domain.services.number_theory import NumberTheoryService
+
+
+def _brute_force_factorize(n):
+    factors, p = [], 2
+    while p * p <= n:
+        exponent = 0
+        while n % p == 0:
+            n //= p
+            exponent += 1
+        if exponent:
+            factors.append([p, exponent])
+        p += 1
+    if n > 1:
+        factors.append([n, 1])
+    return factors
+
+
+class TestPrimeTables:
+    """Test cases for the sieve and smallest-prime-factor table."""
+
+    def test_sieve_matches_brute_force(self):
+        """Test primality for every number across several growth steps."""
+        tables = PrimeTables()
+        for n in range(200_000):
+            expected = n >= 2 and all(n % p for p in range(2, math.isqrt(n) + 1))
+            assert tables.is_prime(n) == expected, n
+
+    def test_factorize_matches_brute_force(self):
+        """Test SPF factorization across several growth steps."""
+        tables = PrimeTables()
+        for n in list(range(1, 3000)) + list(range(150_000, 151_000)):
+            assert tables.factorize(n) == _brute_force_factorize(n), n
+
+    def test_tables_start_empty_and_grow_lazily(self):
+        """Test that tables are only built as far as needed."""
+        tables = PrimeTables()
+        assert tables.status()["sieve_limit"] == 0
+        assert tables.status()["spf_limit"] == 0
+        tables.is_prime(100_001)
+        assert tables.sieve_limit > 100_001
+        assert tables.spf_limit == 0
+
+    def test_reserve_covers_target(self):
+        """Test that reserve grows both tables in one step."""
+        tables = PrimeTables()
+        tables.reserve(300_000, factorization=True)
+        assert tables.sieve_limit > 300_000
+        assert tables.spf_limit > 300_000
+
+    def test_ceilings_fall_back_to_miller_rabin_and_pollard(self):
+        """Test numbers beyond small ceilings are still answered exactly."""
+        tables = PrimeTables(max_sieve_bytes=1 << 15, max_spf_bytes=1 << 16)
+        big_prime = 1_000_000_007
+        assert tables.is_prime(big_prime)
+        assert not tables.is_prime(big_prime * 3)
+        assert tables.factorize(2**10 * 3 * big_prime) == [
+            [2, 10],
+            [3, 1],
+            [big_prime, 1],
+        ]
+        status = tables.status()
+        assert status["sieve_limit"] <= status["max_sieve_limit"]
+        assert status["spf_bytes"] <= 1 << 16
+
+    def test_large_semiprime(self):
+        """Test a 64-bit semiprime of the two largest 32-bit primes."""
+        p, q = 4_294_967_279, 4_294_967_291
+        assert PrimeTables().factorize(p * q) == [[p, 1], [q, 1]]
+
+    def test_pollard_brent_finds_factor(self):
+        """Test that Pollard's rho returns a proper divisor."""
+        n = 1_000_003 * 999_983
+        factor = pollard_brent(n)
+        assert factor in (1_000_003, 999_983)
+
+
+class TestIntegerOperations:
+    """Test cases for modular arithmetic operations."""
+
+    def test_modpow(self):
+        """Test modular exponentiation, including negative exponents."""
+        assert ModPowOperation().execute(3, 200, 1000) == pow(3, 200, 1000)
+        assert ModPowOperation().execute(3, -1, 7) == 5
+
+    def test_modpow_rejects_bad_modulus(self):
+        """Test that a non-positive modulus raises ValueError."""
+        with pytest.raises(ValueError, match="Modulus must be positive"):
+            ModPowOperation().execute(2, 3, 0)
+
+    def test_modinv_without_inverse(self):
+        """Test that a non-invertible value raises ValueError."""
+        assert ModInverseOperation().execute(3, 11) == 4
+        with pytest.raises(ValueError, match="no inverse"):
+            ModInverseOperation().execute(4, 8)
+
+    def test_factory_rejects_unknown_operation(self):
+        """Test that unknown integer operations raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid integer operation"):
+            OperationFactory().get_integer_operation("sqrt")
+
+
+class TestNumberTheoryService:
+    """Test cases for the number-theory service."""
+
+    @pytest.fixture
+    def service(self):
+        """Create service with small limits."""
+        return NumberTheoryService(
+            OperationFactory(PrimeTables()),
+            StructuredLogger(),
+            max_bits=128,
+            max_factor_bits=40,
+            max_batch_items=5,
+        )
+
+    def test_calculate(self, service):
+        """Test single calculations."""
+        assert service.calculate("GCD", [12, 18]) == 6
+        assert service.calculate("lcm", [4, 6]) == 12
+        assert service.calculate("factorize", [360]) == [[2, 3], [3, 2], [5, 1]]
+        assert service.calculate("is_prime", [97]) is True
+
+    def test_validation(self, service):
+        """Test arity, type and size limits."""
+        with pytest.raises(ValueError, match="takes 2 arguments, got 1"):
+            service.calculate("gcd", [1])
+        with pytest.raises(ValueError, match="must be integers"):
+            service.calculate("gcd", [True, 2])
+        with pytest.raises(ValueError, match="limited to 128 bits"):
+            service.calculate("gcd", [2**130, 2])
+        with pytest.raises(ValueError, match="limited to 40-bit"):
+            service.calculate("factorize", [2**41])
+
+    def test_batch_reports_item_errors(self, service):
+        """Test that failed items do not fail the batch."""
+        results = service.calculate_batch("factorize", [[12], [0], [7]])
+        assert results[0] == [[2, 2], [3, 1]]
+        assert isinstance(results[1], ValueError)
+        assert results[2] == [[7, 1]]
+
+    def test_batch_reserves_tables_once(self, service):
+        """Test that a batch grows the tables to its largest argument first."""
+        service.calculate_batch("factorize", [[10], [250_000]])
+        assert service.tables_status()["spf_limit"] > 250_000
+
+    def test_batch_limit(self, service):
+        """Test that oversized batches are rejected."""
+        with pytest.raises(ValueError, match="limit is 5"):
+            service.calculate_batch("gcd", [[1, 2]] * 6)
+
+    def test_batch_time_limit(self, service, monkeypatch):
+        """Test that items left after the time limit fail without running."""
+        ticks = iter([0.0, 1.0, 12.0])
+        monkeypatch.setattr(number_theory.time, "monotonic", lambda: next(ticks))
+        results = service.calculate_batch("gcd", [[4, 6], [9, 6], [5, 10]])
+        assert results[0] == 2
+        assert [str(result) for result in results[1:]] == [
+            "Batch time limit of 10s exceeded"
+        ] * 2
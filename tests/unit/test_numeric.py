@@ -0,0 +1,150 @@
+"""Unit tests for expressions and numerical integration jobs."""
+import math
+import time
+import numpy as np
+import pytest
+from domain.operations.expression import Expression
+from domain.operations.factory import OperationFactory
+from domain.services.jobs import JobRegistry, JobStatus
+from domain.services import numeric as numeric_module
+from domain.services.logger import StructuredLogger
+from domain.services.numeric import NumericJobService
+
+SIN = {"op": "sin", "args": ["x"]}
+INVERSE_SQUARE = {"op": "divide", "args": [1, {"op": "multiply", "args": ["n", "n"]}]}
+
+
+def _wait(job, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not job.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return job
+
+
+class TestExpression:
+    """Test cases for expression trees."""
+
+    @pytest.fixture
+    def factory(self):
+        """Create operation factory."""
+        return OperationFactory()
+
+    def test_scalar_and_array_evaluation_agree(self, factory):
+        """Test that both evaluation paths give the same values."""
+        tree = {"op": "add", "args": [{"op": "multiply", "args": ["x", "x"]}, 1]}
+        expression = Expression(tree, factory)
+        assert expression.variables == {"x"}
+        points = np.array([-2.0, 0.0, 3.0])
+        assert expression.evaluate_array({"x": points}).tolist() == [5.0, 1.0, 10.0]
+        assert [expression.evaluate({"x": p}) for p in points] == [5.0, 1.0, 10.0]
+
+    def test_array_error_names_point(self, factory):
+        """Test that the first failing point is reported with the scalar message."""
+        expression = Expression({"op": "divide", "args": [1, "x"]}, factory)
+        with pytest.raises(ValueError, match=r"Division by zero.*\(at x=0.0\)"):
+            expression.evaluate_array({"x": np.array([1.0, 0.0, 0.0])})
+
+    @pytest.mark.parametrize(
+        "tree, message",
+        [
+            ({"op": "modulo", "args": [1, 2]}, "Invalid operation"),
+            ({"op": "sqrt", "args": [1, 2]}, "takes 1 arguments"),
+            ({"op": "add"}, "Expression nodes"),
+            (True, "must be numbers"),
+        ],
+    )
+    def test_invalid_trees(self, factory, tree, message):
+        """Test that malformed trees are rejected when compiled."""
+        with pytest.raises(ValueError, match=message):
+            Expression(tree, factory)
+
+
+class TestNumericJobService:
+    """Test cases for NumericJobService."""
+
+    @pytest.fixture
+    def service_factory(self):
+        """Build services with small chunks and shut them down afterwards."""
+        services = []
+
+        def build(**kwargs):
+            kwargs.setdefault("chunk_panels", 64)
+            kwargs.setdefault("chunk_terms", 1000)
+            service = NumericJobService(
+                OperationFactory(), StructuredLogger(), JobRegistry(), **kwargs
+            )
+            services.append(service)
+            return service
+
+        yield build
+        for service in services:
+            service.shutdown()
+
+    def test_gauss_legendre(self, service_factory):
+        """Test Gauss-Legendre integration across several chunks."""
+        job = _wait(service_factory().submit_integral(SIN, 0, math.pi, panels=200))
+        assert job.status == JobStatus.COMPLETED
+        assert job.stats["value"] == pytest.approx(2.0, abs=1e-14)
+        assert job.stats["chunks"] == 4
+        assert job.stats["evaluations"] == 200 * 16
+        assert job.progress == 1.0
+
+    def test_adaptive_simpson_meets_tolerance(self, service_factory):
+        """Test that adaptive Simpson meets its tolerance and reports an estimate."""
+        sqrt = {"op": "sqrt", "args": ["x"]}
+        job = _wait(
+            service_factory().submit_integral(
+                sqrt, 0, 1, method="simpson", tolerance=1e-9
+            )
+        )
+        assert job.status == JobStatus.COMPLETED
+        assert job.stats["value"] == pytest.approx(2 / 3, abs=1e-9)
+        assert 0 <= job.stats["error_estimate"] <= 1e-9
+
+    def test_sum_is_independent_of_workers(self, service_factory, monkeypatch):
+        """Test that chunked parallel summation reproduces the serial bits."""
+        pools = []
+
+        def counting_pool(workers):
+            pools.append(workers)
+            return numeric_module.ProcessPoolExecutor(workers)
+
+        monkeypatch.setattr(numeric_module, "process_pool", counting_pool)
+        serial = _wait(service_factory().submit_sum(INVERSE_SQUARE, 1, 5000))
+        service = service_factory(workers=2)
+        parallel = _wait(service.submit_sum(INVERSE_SQUARE, 1, 5000))
+        again = _wait(service.submit_sum(INVERSE_SQUARE, 1, 5000))
+        expected = math.fsum(1 / (n * n) for n in range(1, 5001))
+        assert serial.stats["value"] == parallel.stats["value"]
+        assert parallel.stats["value"] == again.stats["value"]
+        assert serial.stats["value"] == pytest.approx(expected, rel=1e-15)
+        # One pool serves every job of the service
+        assert pools == [2]
+
+    def test_failing_integrand_fails_job(self, service_factory):
+        """Test that an operation error fails the job with its message."""
+        job = service_factory().submit_integral({"op": "log", "args": ["x"]}, -1, 1)
+        assert _wait(job).status == JobStatus.FAILED
+        assert "(at x=" in job.error
+
+    def test_time_budget(self, service_factory):
+        """Test that a job exceeding its time budget fails between chunks."""
+        service = service_factory(chunk_terms=1)
+        job = _wait(service.submit_sum("n", 1, 100_000, time_budget=1e-6))
+        assert job.status == JobStatus.FAILED
+        assert "Time budget" in job.error
+        assert job.progress < 1.0
+
+    def test_validation(self, service_factory):
+        """Test that invalid requests are rejected before queueing."""
+        service = service_factory(max_terms=10, max_time_budget=5)
+        with pytest.raises(ValueError, match="at most one variable"):
+            service.submit_integral({"op": "add", "args": ["x", "y"]}, 0, 1)
+        with pytest.raises(ValueError, match="Unsupported method"):
+            service.submit_integral(SIN, 0, 1, method="romberg")
+        with pytest.raises(ValueError, match="finite"):
+            service.submit_integral(SIN, 0, math.inf)
+        with pytest.raises(ValueError, match="exceed the limit"):
+            service.submit_sum("n", 1, 11)
+        with pytest.raises(ValueError, match="Time budget"):
+            service.submit_sum("n", 1, 2, time_budget=10)
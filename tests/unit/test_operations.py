@@ -1,5 +1,6 @@
 """Unit tests for arithmetic operations."""
 import pytest
+from domain.interfaces.result import ErrorCode
 from domain.operations.basic import (
     AddOperation,
     SubtractOperation,
@@ -127,6 +128,14 @@ class TestDivideOperation:
         with pytest.raises(ValueError, match="Division by zero is not allowed"):
             operation.execute(x, y)
 
+    def test_try_execute_returns_division_by_zero(self):
+        """Test that the non-raising path reports zero divisors as a code."""
+        operation = DivideOperation()
+        outcome = operation.try_execute(10, 0)
+        assert outcome.error is ErrorCode.DIVISION_BY_ZERO
+        assert outcome.message == "Division by zero is not allowed"
+        assert operation.try_execute(10, 4).value == 2.5
+
     def test_divide_operation_name(self):
         """Test operation name."""
         operation = DivideOperation()
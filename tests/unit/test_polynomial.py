@@ -0,0 +1,104 @@
+"""Unit tests for polynomial operations."""
+import numpy as np
+import pytest
+from domain.operations import polynomial
+from domain.operations.factory import OperationFactory
+from domain.services.logger import StructuredLogger
+from domain.services.polynomial import PolynomialService
+
+
+class TestPolynomialOperations:
+    """Test cases for polynomial operation strategies."""
+
+    @pytest.fixture
+    def factory(self):
+        """Create operation factory."""
+        return OperationFactory()
+
+    def test_evaluate_matches_numpy(self, factory):
+        """Test Horner evaluation across several chunks and shapes."""
+        coefficients = np.array([1.0, -2.0, 0.5, 3.0])
+        points = np.linspace(-3, 3, 3 * polynomial.EVALUATION_CHUNK + 7)
+        result = factory.get_polynomial_operation("evaluate").execute(
+            coefficients, points.reshape(-1, 1)
+        )
+        expected = np.polynomial.polynomial.polyval(points, coefficients)
+        assert result.shape == (points.size, 1)
+        np.testing.assert_allclose(result.ravel(), expected, rtol=1e-12)
+
+    def test_constant_polynomial(self, factory):
+        """Test evaluating and differentiating a constant."""
+        evaluate = factory.get_polynomial_operation("evaluate")
+        assert evaluate.execute(np.array([4.0]), np.arange(3.0)).tolist() == [4, 4, 4]
+        derivative = factory.get_polynomial_operation("derivative")
+        assert derivative.execute(np.array([4.0])).tolist() == [0.0]
+
+    def test_derivative(self, factory):
+        """Test differentiation of 1 + 2x + 3x^2."""
+        operation = factory.get_polynomial_operation("derivative")
+        assert operation.execute(np.array([1.0, 2.0, 3.0])).tolist() == [2.0, 6.0]
+
+    def test_multiply_direct_and_fft(self, factory):
+        """Test that short products convolve and long ones match via FFT."""
+        operation = factory.get_polynomial_operation("multiply")
+        product = operation.execute(np.array([1.0, 1.0]), np.array([-1.0, 1.0]))
+        assert product.tolist() == [-1.0, 0.0, 1.0]
+
+        rng = np.random.default_rng(0)
+        a, b = rng.random(300), rng.random(polynomial.FFT_THRESHOLD + 1)
+        np.testing.assert_allclose(
+            operation.execute(a, b), np.convolve(a, b), atol=1e-11
+        )
+
+    def test_real_roots(self, factory):
+        """Test distinct real roots, double roots and zero roots."""
+        operation = factory.get_polynomial_operation("roots")
+        cubic = np.array([-6.0, 11.0, -6.0, 1.0])  # (x-1)(x-2)(x-3)
+        np.testing.assert_allclose(operation.execute(cubic), [1, 2, 3], rtol=1e-12)
+        assert operation.execute(np.array([1.0, -2.0, 1.0])).tolist() == [1.0]
+        assert operation.execute(np.array([0.0, 0.0, 1.0, 0.0, 1.0])).tolist() == [0]
+        assert operation.execute(np.array([1.0, 0.0, 1.0])).size == 0
+        with pytest.raises(ValueError, match="infinitely many roots"):
+            operation.execute(np.zeros(3))
+
+
+class TestPolynomialService:
+    """Test cases for PolynomialService limits and validation."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a service with small limits."""
+        return PolynomialService(
+            OperationFactory(),
+            StructuredLogger(),
+            max_coefficients=10,
+            max_points=100,
+            max_work=200,
+            max_roots_degree=4,
+        )
+
+    def test_calculate(self, service):
+        """Test a calculation from plain lists."""
+        assert service.calculate("evaluate", [1, 1], [0, 1, 2]).tolist() == [1, 2, 3]
+
+    def test_operand_rules(self, service):
+        """Test that operands are required or rejected per operation."""
+        with pytest.raises(ValueError, match="requires an operand"):
+            service.calculate("evaluate", [1, 2])
+        with pytest.raises(ValueError, match="takes no operand"):
+            service.calculate("roots", [1, 2], [1])
+        with pytest.raises(ValueError, match="non-empty 1-D"):
+            service.calculate("derivative", [])
+        with pytest.raises(ValueError, match="finite"):
+            service.calculate("derivative", [1, float("nan")])
+
+    def test_limits(self, service):
+        """Test size, work and degree limits."""
+        with pytest.raises(ValueError, match="limit is 10"):
+            service.calculate("derivative", list(range(11)))
+        with pytest.raises(ValueError, match="limit of 200 terms"):
+            service.calculate("evaluate", list(range(5)), list(range(50)))
+        with pytest.raises(ValueError, match="root-finding limit of 4"):
+            service.calculate("roots", list(range(1, 7)))
+        with pytest.raises(ValueError, match="Invalid polynomial operation"):
+            service.calculate("integrate", [1])
@@ -0,0 +1,111 @@
+"""Unit tests for the traffic replay harness."""
+import io
+import json
+import httpx
+import pytest
+from app.main import app
+from benchmarks.replay import LatencyHistogram, read_calls, replay
+from domain.operations.factory import OperationFactory
+from domain.services.calculator import CalculatorService
+from domain.services.logger import StructuredLogger
+
+
+def _line(millis: int, message: str, operation: str, x, y, **fields) -> str:
+    entry = {
+        "timestamp": f"2024-01-01T00:00:00.{millis:03d}Z",
+        "message": message,
+        "operation": operation,
+        "x": x,
+        "y": y,
+        **fields,
+    }
+    return json.dumps(entry) + "\n"
+
+
+@pytest.fixture
+def recorded_log(capsys):
+    """Record the log of a few calculations, including a failure."""
+    service = CalculatorService(OperationFactory(), StructuredLogger())
+    service.calculate("add", 1, 2)
+    service.calculate("sqrt", 16)
+    with pytest.raises(ValueError):
+        service.calculate("divide", 1, 0)
+    service.calculate("multiply", 2.5, 4)
+    return "uvicorn started\n" + capsys.readouterr().out
+
+
+class TestReadCalls:
+    """Test cases for log parsing."""
+
+    def test_pairs_requests_with_outcomes(self, recorded_log):
+        """Test that calls come back in order with their recorded outcomes."""
+        calls = list(read_calls(io.StringIO(recorded_log)))
+        operations = [call.operation for call in calls]
+        assert operations == ["add", "sqrt", "divide", "multiply"]
+        assert calls[1].y is None and calls[1].result == 4.0
+        assert calls[2].error == "Division by zero is not allowed"
+        assert all(call.resolved for call in calls)
+
+    def test_interleaved_workers(self):
+        """Test matching when another worker's lines come in between."""
+        lines = [
+            _line(0, "Calculation requested", "add", 1, 1),
+            _line(1, "Calculation requested", "sqrt", 4, None),
+            _line(2, "Calculation completed", "sqrt", 4, None, result=2),
+            _line(5, "Calculation completed", "add", 1.0, 1.0, result=2),
+        ]
+        calls = list(read_calls(lines))
+        assert [call.operation for call in calls] == ["add", "sqrt"]
+        assert calls[0].service_time == pytest.approx(0.005, abs=1e-6)
+
+    def test_unresolved_calls_leave_window(self):
+        """Test that calls without an outcome do not pile up."""
+        lines = [_line(i, "Calculation requested", "add", i, 1) for i in range(10)]
+        calls = read_calls(lines, window=3)
+        first = next(calls)
+        assert first.x == 0.0 and not first.resolved
+        assert len(list(calls)) == 9
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    def test_percentiles_within_resolution(self):
+        """Test that percentiles are within a bucket of the exact value."""
+        histogram = LatencyHistogram()
+        for i in range(1, 1001):
+            histogram.record(i / 1000)
+        assert histogram.percentile(0.5) == pytest.approx(0.5, rel=0.05)
+        assert histogram.percentile(0.99) == pytest.approx(0.99, rel=0.05)
+        assert histogram.percentile(1.0) == 1.0
+        assert histogram.summary()["count"] == 1000
+
+
+class TestReplay:
+    """Test cases for replaying against the in-process app."""
+
+    @pytest.mark.asyncio
+    async def test_replay_matches_recording(self, recorded_log):
+        """Test that an unchanged app reproduces every recorded outcome."""
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            report = await replay(read_calls(io.StringIO(recorded_log)), c, None)
+        data = report.to_dict()
+        assert data["replayed"] == 4
+        assert data["matched"] == 4
+        assert data["statuses"] == {"200": 3, "400": 1}
+        assert data["latency"]["count"] == 4
+
+    @pytest.mark.asyncio
+    async def test_replay_reports_mismatches(self):
+        """Test that a different result is counted and shown."""
+        lines = [
+            _line(0, "Calculation requested", "add", 1, 1),
+            _line(1, "Calculation completed", "add", 1, 1, result=3),
+        ]
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            report = await replay(read_calls(lines), c, speed=100.0)
+        assert report.mismatched == 1
+        assert report.mismatches[0]["recorded"] == 3.0
+        assert report.mismatches[0]["replayed"] == 2.0
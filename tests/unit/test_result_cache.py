@@ -0,0 +1,134 @@
+"""Unit tests for result caches."""
+import math
+import multiprocessing
+import pytest
+from domain.interfaces.operations import IOperation
+from domain.operations.factory import OperationFactory
+from domain.services.cache import LocalResultCache, SharedResultCache
+from domain.services.calculator import CalculatorService
+from domain.services.logger import StructuredLogger
+
+
+def _write_from_other_process(path):
+    cache = SharedResultCache(path, slots=64)
+    cache.put("add", 2.0, 3.0, 5.0)
+    cache.close()
+
+
+class TestLocalResultCache:
+    """Test cases for LocalResultCache."""
+
+    def test_hit_and_miss(self):
+        """Test storing and retrieving a result."""
+        cache = LocalResultCache()
+        assert cache.get("add", 1, 2) is None
+        cache.put("add", 1, 2, 3)
+        assert cache.get("add", 1, 2) == 3
+
+    def test_bounded_size(self):
+        """Test that the oldest entry is evicted when full."""
+        cache = LocalResultCache(max_entries=2)
+        for x in range(3):
+            cache.put("add", x, 0, x)
+        assert cache.get("add", 0, 0) is None
+        assert cache.get("add", 2, 0) == 2
+
+
+class TestSharedResultCache:
+    """Test cases for SharedResultCache."""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        """Path of the backing file."""
+        return str(tmp_path / "results")
+
+    def test_hit_and_miss(self, path):
+        """Test storing and retrieving results by full key."""
+        cache = SharedResultCache(path, slots=64)
+        assert cache.get("add", 1.0, 2.0) is None
+        cache.put("add", 1.0, 2.0, 3.0)
+        assert cache.get("add", 1.0, 2.0) == 3.0
+        assert cache.get("add", 2.0, 1.0) is None
+        assert cache.get("subtract", 1.0, 2.0) is None
+
+    def test_unary_and_nan_keys(self, path):
+        """Test keys without y and NaN operands."""
+        cache = SharedResultCache(path, slots=64)
+        cache.put("sqrt", 4.0, None, 2.0)
+        cache.put("add", math.nan, 1.0, math.nan)
+        assert cache.get("sqrt", 4.0, None) == 2.0
+        assert math.isnan(cache.get("add", math.nan, 1.0))
+
+    def test_shared_between_instances(self, path):
+        """Test that two mappings of one file see each other's writes."""
+        writer = SharedResultCache(path, slots=64)
+        reader = SharedResultCache(path, slots=64)
+        writer.put("multiply", 6.0, 7.0, 42.0)
+        assert reader.get("multiply", 6.0, 7.0) == 42.0
+
+    def test_shared_across_processes(self, path):
+        """Test that a write from another process is visible."""
+        cache = SharedResultCache(path, slots=64)
+        process = multiprocessing.get_context("spawn").Process(
+            target=_write_from_other_process, args=(path,)
+        )
+        process.start()
+        process.join(30)
+        assert cache.get("add", 2.0, 3.0) == 5.0
+
+    def test_clock_eviction_keeps_referenced_entries(self, path):
+        """Test that recently hit entries survive eviction."""
+        cache = SharedResultCache(path, slots=4, max_probe=4)
+        for x in range(4):
+            cache.put("add", float(x), 0.0, float(x))
+        assert cache.get("add", 0.0, 0.0) == 0.0  # Sets reference bit
+        cache.put("add", 99.0, 0.0, 99.0)
+        assert cache.get("add", 99.0, 0.0) == 99.0
+        assert cache.get("add", 0.0, 0.0) == 0.0
+        stored = sum(cache.get("add", float(x), 0.0) is not None for x in range(4))
+        assert stored == 3
+
+    def test_incompatible_layout_rejected(self, path):
+        """Test that reopening with another size fails."""
+        SharedResultCache(path, slots=64)
+        with pytest.raises(ValueError, match="incompatible layout"):
+            SharedResultCache(path, slots=128)
+
+
+class CountingOperation(IOperation):
+    """Add operation that counts executions."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return "add"
+
+    def execute(self, x: float, y: float) -> float:
+        self.calls += 1
+        return x + y
+
+
+class TestCalculatorServiceCache:
+    """Test cases for CalculatorService with a result cache."""
+
+    def test_cache_hit_skips_execution(self):
+        """Test that repeated calculations are served from the cache."""
+        factory = OperationFactory()
+        operation = CountingOperation()
+        factory._operations["add"] = operation
+        service = CalculatorService(factory, StructuredLogger(), LocalResultCache())
+
+        assert service.calculate("add", 2, 3) == 5
+        assert service.calculate("add", 2, 3) == 5
+        assert operation.calls == 1
+
+    def test_errors_are_not_cached(self):
+        """Test that failing calculations still raise every time."""
+        service = CalculatorService(
+            OperationFactory(), StructuredLogger(), LocalResultCache()
+        )
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Division by zero"):
+                service.calculate("divide", 1, 0)
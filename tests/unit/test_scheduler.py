@@ -0,0 +1,147 @@
+"""Unit tests for the priority lane request scheduler."""
+import asyncio
+import pytest
+from app.core.scheduler import (
+    RequestScheduler,
+    SchedulerMiddleware,
+    SchedulerRejectedError,
+)
+
+
+async def _queue(scheduler, lane, started):
+    """Acquire a slot and record the order in which lanes start."""
+    await scheduler.acquire(lane)
+    started.append(lane)
+
+
+class TestRequestScheduler:
+    """Test cases for RequestScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_free_slot_starts_immediately(self):
+        """Test that requests start without queueing while slots are free."""
+        scheduler = RequestScheduler(max_concurrent=4, interactive_reserved=0)
+        await scheduler.acquire("bulk")
+        lanes = scheduler.metrics()["lanes"]
+        assert scheduler.running == 1
+        assert lanes["bulk"]["admitted"] == 1
+        assert lanes["bulk"]["queued"] == 0
+        scheduler.release("bulk")
+        assert scheduler.running == 0
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_dequeue(self):
+        """Test that freed slots are shared by lane weight."""
+        scheduler = RequestScheduler(
+            max_concurrent=1,
+            weights={"interactive": 8, "standard": 3, "bulk": 1},
+            interactive_reserved=0,
+        )
+        await scheduler.acquire("standard")
+        started = []
+        tasks = [
+            asyncio.create_task(_queue(scheduler, lane, started))
+            for lane in ["standard"] * 6 + ["bulk"] * 2
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.metrics()["lanes"]["standard"]["queued"] == 6
+
+        for _ in tasks:
+            scheduler.release(started[-1] if started else "standard")
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        assert started == ["standard", "standard", "bulk", "standard"] * 2
+
+    @pytest.mark.asyncio
+    async def test_interactive_pressure_defers_lower_lanes(self):
+        """Test that late interactive requests jump ahead regardless of weight."""
+        scheduler = RequestScheduler(
+            max_concurrent=1,
+            weights={"interactive": 1, "standard": 1, "bulk": 100},
+            slos={"interactive": 0.0, "standard": 1.0, "bulk": 1.0},
+            interactive_reserved=0,
+        )
+        await scheduler.acquire("standard")
+        started = []
+        bulk = asyncio.create_task(_queue(scheduler, "bulk", started))
+        interactive = asyncio.create_task(_queue(scheduler, "interactive", started))
+        await asyncio.sleep(0.01)
+        assert scheduler.under_pressure
+
+        scheduler.release("standard")
+        await interactive
+        assert started == ["interactive"]
+        assert not scheduler.under_pressure
+        scheduler.release("interactive")
+        await bulk
+        assert started == ["interactive", "bulk"]
+        assert scheduler.metrics()["lanes"]["interactive"]["slo_misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reserved_slots_and_timeout(self):
+        """Test that lower lanes leave reserved slots to interactive traffic."""
+        scheduler = RequestScheduler(
+            max_concurrent=2, interactive_reserved=1, queue_timeout=0.01
+        )
+        await scheduler.acquire("standard")
+        with pytest.raises(SchedulerRejectedError, match="Waited over"):
+            await scheduler.acquire("standard")
+        await scheduler.acquire("interactive")
+        lanes = scheduler.metrics()["lanes"]
+        assert lanes["standard"]["timed_out"] == 1
+        assert lanes["standard"]["queued"] == 0
+        assert scheduler.running == 2
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self):
+        """Test that a lane rejects requests beyond its queue depth."""
+        scheduler = RequestScheduler(
+            max_concurrent=1, interactive_reserved=0, max_queue_depth=1
+        )
+        await scheduler.acquire("bulk")
+        waiting = asyncio.create_task(scheduler.acquire("bulk"))
+        await asyncio.sleep(0)
+        with pytest.raises(SchedulerRejectedError, match="queue is full"):
+            await scheduler.acquire("bulk")
+        assert scheduler.metrics()["lanes"]["bulk"]["rejected"] == 1
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert scheduler.metrics()["lanes"]["bulk"]["queued"] == 0
+
+
+class TestSchedulerMiddleware:
+    """Test cases for lane selection."""
+
+    @pytest.mark.parametrize(
+        "path, headers, lane",
+        [
+            ("/calc", [], "standard"),
+            ("/calc/batch", [], "bulk"),
+            ("/calc/batch", [(b"x-priority", b"Interactive")], "interactive"),
+            ("/calc", [(b"x-priority", b"urgent")], "standard"),
+        ],
+    )
+    def test_lane_for(self, path, headers, lane):
+        """Test that the header wins over the route and unknown values are ignored."""
+        middleware = SchedulerMiddleware(
+            None, RequestScheduler(), bulk_routes=["/calc/batch", "/jobs"]
+        )
+        scope = {"type": "http", "path": path, "headers": headers}
+        assert middleware.lane_for(scope) == lane
+
+    @pytest.mark.asyncio
+    async def test_options_requests_are_not_queued(self):
+        """Test that OPTIONS requests pass even when no slot is free."""
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append(scope["method"])
+
+        scheduler = RequestScheduler(max_concurrent=1, interactive_reserved=0)
+        await scheduler.acquire("standard")
+        middleware = SchedulerMiddleware(app, scheduler)
+        scope = {"type": "http", "method": "OPTIONS", "path": "/add", "headers": []}
+        await middleware(scope, None, None)
+        assert calls == ["OPTIONS"]
+        assert scheduler.metrics()["running"] == 1
@@ -0,0 +1,158 @@
+"""Unit tests for scientific operations."""
+import math
+import pytest
+from domain.interfaces.result import ErrorCode
+from domain.operations.scientific import (
+    SqrtOperation,
+    PowerOperation,
+    LogOperation,
+    ExpOperation,
+    SinOperation,
+    CosOperation,
+    TanOperation,
+    FactorialOperation,
+    MAX_FLOAT_FACTORIAL,
+)
+
+
+class TestUnaryOperations:
+    """Test cases for single-operand operations."""
+
+    @pytest.mark.parametrize(
+        "operation,x,expected",
+        [
+            (SqrtOperation(), 16, 4.0),
+            (SqrtOperation(), 2, math.sqrt(2)),
+            (LogOperation(), math.e, 1.0),
+            (ExpOperation(), 0, 1.0),
+            (SinOperation(), math.pi / 2, 1.0),
+            (CosOperation(), 0, 1.0),
+            (TanOperation(), math.pi / 4, 1.0),
+        ],
+    )
+    def test_unary_operation(self, operation, x, expected):
+        """Test unary operations with various inputs."""
+        assert operation.execute(x) == pytest.approx(expected, rel=1e-9)
+
+    def test_unary_arity_ignores_second_operand(self):
+        """Test that unary operations report arity 1 and ignore y."""
+        operation = SqrtOperation()
+        assert operation.arity == 1
+        assert operation.execute(9, 123) == 3.0
+
+    @pytest.mark.parametrize(
+        "operation,x,message",
+        [
+            (SqrtOperation(), -1, "negative"),
+            (LogOperation(), 0, "positive"),
+            (ExpOperation(), 1000, "too large"),
+        ],
+    )
+    def test_unary_domain_errors(self, operation, x, message):
+        """Test that out-of-domain inputs raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            operation.execute(x)
+
+
+class TestFactorialOperation:
+    """Test cases for FactorialOperation."""
+
+    @pytest.mark.parametrize("n", [0, 1, 5, 20, 100, MAX_FLOAT_FACTORIAL])
+    def test_factorial_table(self, n):
+        """Test table lookups against math.factorial."""
+        assert FactorialOperation().execute(n) == float(math.factorial(n))
+
+    def test_factorial_beyond_table_is_exact(self):
+        """Test the range-splitting fallback with a small table."""
+        operation = FactorialOperation(table_size=10)
+        assert operation.execute(150) == float(math.factorial(150))
+
+    @pytest.mark.parametrize("n", [-1, 2.5])
+    def test_factorial_invalid_input(self, n):
+        """Test that negative or fractional inputs raise ValueError."""
+        with pytest.raises(ValueError, match="non-negative integers"):
+            FactorialOperation().execute(n)
+
+    def test_factorial_overflow(self):
+        """Test that factorials beyond float range raise ValueError."""
+        with pytest.raises(ValueError, match="too large"):
+            FactorialOperation().execute(MAX_FLOAT_FACTORIAL + 1)
+
+
+class TestPowerOperation:
+    """Test cases for PowerOperation."""
+
+    @pytest.mark.parametrize(
+        "x,y,expected",
+        [
+            (2, 10, 1024.0),  # Table hit
+            (-3, 3, -27.0),  # Negative base from table
+            (3, 100, float(3**100)),  # Exact integer fallback
+            (2, -2, 0.25),  # Negative exponent
+            (2.5, 2, 6.25),  # Float base
+            (4, 0.5, 2.0),  # Fractional exponent
+        ],
+    )
+    def test_power_operation(self, x, y, expected):
+        """Test exponentiation with various inputs."""
+        assert PowerOperation().execute(x, y) == pytest.approx(expected, rel=1e-12)
+
+    def test_power_operation_name(self):
+        """Test operation name and arity."""
+        operation = PowerOperation()
+        assert operation.name == "pow"
+        assert operation.arity == 2
+
+    @pytest.mark.parametrize(
+        "x,y,message",
+        [
+            (0, -1, "negative power"),
+            (-8, 0.5, "integer exponent"),
+            (10, 400, "too large"),
+            (1.5, 5000, "too large"),
+        ],
+    )
+    def test_power_errors(self, x, y, message):
+        """Test that undefined or overflowing powers raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            PowerOperation().execute(x, y)
+
+
+class TestTryExecute:
+    """Test cases for the non-raising execution path."""
+
+    @pytest.mark.parametrize(
+        "operation,x,y",
+        [
+            (SqrtOperation(), -1, None),
+            (LogOperation(), 0, None),
+            (ExpOperation(), 1000, None),
+            (FactorialOperation(), 2.5, None),
+            (FactorialOperation(), MAX_FLOAT_FACTORIAL + 1, None),
+            (PowerOperation(), 0, -1),
+            (PowerOperation(), -8, 0.5),
+            (PowerOperation(), 2, 1024),  # Integer just past the float range
+            (PowerOperation(), 0.5, -1100),
+            (PowerOperation(), 1.5, 5000),
+        ],
+    )
+    def test_failures_match_execute(self, operation, x, y):
+        """Test that failures carry the message execute raises."""
+        outcome = operation.try_execute(x, y)
+        assert outcome.error == ErrorCode.DOMAIN_ERROR
+        with pytest.raises(ValueError) as raised:
+            operation.execute(x, y)
+        assert str(raised.value) == outcome.message
+
+    @pytest.mark.parametrize(
+        "operation,x,y,expected",
+        [
+            (SqrtOperation(), 16, None, 4.0),
+            (FactorialOperation(), 5, None, 120.0),
+            (PowerOperation(), 3, 100, float(3**100)),
+            (PowerOperation(), math.inf, 2, math.inf),
+        ],
+    )
+    def test_success(self, operation, x, y, expected):
+        """Test that valid inputs return their value."""
+        assert operation.try_execute(x, y).value == expected
@@ -0,0 +1,217 @@
+"""Unit tests for Monte Carlo simulations."""
+import gc
+import numpy as np
+import pytest
+from domain.operations.factory import OperationFactory
+from domain.services import simulation as simulation_module
+from domain.services.logger import StructuredLogger
+from domain.services.simulation import (
+    SimulationBusyError,
+    SimulationService,
+    merge_moments,
+    simulation_chunk,
+    wilson_interval,
+)
+
+PROFIT = {
+    "op": "multiply",
+    "args": ["units", {"op": "subtract", "args": ["price", 90]}],
+}
+UNIFORM = {"dist": "uniform", "low": 0, "high": 1}
+PROFIT_DISTRIBUTIONS = {
+    "units": {"dist": "uniform", "low": 800, "high": 1200},
+    "price": {"dist": "normal", "loc": 100, "scale": 15},
+}
+
+
+@pytest.fixture
+def service_factory():
+    """Create simulation services with small chunks, shut down afterwards."""
+    services = []
+
+    def create(**kwargs):
+        kwargs.setdefault("chunk_trials", 10_000)
+        service = SimulationService(OperationFactory(), StructuredLogger(), **kwargs)
+        services.append(service)
+        return service
+
+    yield create
+    for service in services:
+        service.shutdown()
+
+
+def _run(service, *args, **kwargs):
+    return list(service.run(service.prepare(*args, **kwargs)))
+
+
+class TestMoments:
+    """Test cases for chunk statistics and their merge."""
+
+    def test_merge_matches_whole_sample(self):
+        """Test that merged chunk moments equal those of the whole sample."""
+        values = np.random.default_rng(1).lognormal(0, 1, 30_000)
+
+        def moments(part):
+            mean = float(np.mean(part))
+            m2 = float(np.sum((part - mean) ** 2))
+            below = (int(np.count_nonzero(part <= 1.0)),)
+            return len(part), mean, m2, float(part.min()), float(part.max()), below
+
+        merged = moments(values[:7_000])
+        for part in np.split(values[7_000:], [5_000, 20_000]):
+            merged = merge_moments(merged, moments(part))
+        count, mean, m2, minimum, maximum, below = merged
+        assert count == values.size
+        assert mean == pytest.approx(values.mean(), rel=1e-12)
+        assert m2 / (count - 1) == pytest.approx(values.var(ddof=1), rel=1e-12)
+        assert (minimum, maximum) == (values.min(), values.max())
+        assert below == (np.count_nonzero(values <= 1.0),)
+
+    def test_chunk_is_seeded(self):
+        """Test that a chunk depends only on its seed sequence."""
+        draws = [("x", "normal", (0.0, 1.0))]
+        seed = np.random.SeedSequence(7).spawn(3)[2]
+        first = simulation_chunk("x", draws, seed, 1000, (0.0,))
+        assert simulation_chunk("x", draws, seed, 1000, (0.0,)) == first
+
+    def test_wilson_interval_contains_estimate(self):
+        """Test the Wilson interval, including a zero proportion."""
+        low, high = wilson_interval(25, 100, 1.96)
+        assert low < 0.25 < high
+        low, high = wilson_interval(0, 100, 1.96)
+        assert low == pytest.approx(0.0, abs=1e-12) and 0 < high < 0.05
+
+
+class TestSimulationService:
+    """Test cases for the simulation service."""
+
+    def test_streams_one_summary_per_chunk(self, service_factory):
+        """Test that summaries accumulate chunk by chunk."""
+        summaries = _run(
+            service_factory(), PROFIT, PROFIT_DISTRIBUTIONS, 35_000, seed=3
+        )
+        assert [s["trials"] for s in summaries] == [10_000, 20_000, 30_000, 35_000]
+        assert [s["done"] for s in summaries] == [False, False, False, True]
+        final = summaries[-1]
+        # E[units] * E[price - 90] = 1000 * 10
+        assert final["ci"][0] < 10_000 < final["ci"][1]
+        assert final["seed"] == 3
+
+    def test_same_seed_same_bits(self, service_factory):
+        """Test that a seed reproduces a simulation exactly."""
+        first = _run(service_factory(), PROFIT, PROFIT_DISTRIBUTIONS, 30_000, seed=9)
+        again = _run(service_factory(), PROFIT, PROFIT_DISTRIBUTIONS, 30_000, seed=9)
+        other = _run(service_factory(), PROFIT, PROFIT_DISTRIBUTIONS, 30_000, seed=10)
+        assert first == again
+        assert first[-1]["mean"] != other[-1]["mean"]
+
+    def test_independent_of_workers(self, service_factory, monkeypatch):
+        """Test that the worker count does not change the result."""
+        pools = []
+
+        def counting_pool(workers):
+            pools.append(workers)
+            return simulation_module.ProcessPoolExecutor(workers)
+
+        monkeypatch.setattr(simulation_module, "process_pool", counting_pool)
+        args = (PROFIT, PROFIT_DISTRIBUTIONS, 40_000)
+        serial = _run(service_factory(workers=1), *args, seed=5)
+        service = service_factory(workers=2)
+        parallel = _run(service, *args, seed=5)
+        again = _run(service, *args, seed=5)
+        assert serial == parallel == again
+        # One pool serves every simulation of the service
+        assert pools == [2]
+
+    def test_busy_slots_are_refused(self, service_factory):
+        """Test that a simulation beyond max_concurrent is refused at once."""
+        service = service_factory(max_concurrent=1)
+        running = service.run(service.prepare("x", {"x": UNIFORM}, 100, seed=1))
+        with pytest.raises(SimulationBusyError, match="1 simulation slots"):
+            service.run(service.prepare("x", {"x": UNIFORM}, 100, seed=1))
+        list(running)
+        assert len(_run(service, "x", {"x": UNIFORM}, 100, seed=1)) == 1
+
+    def test_dropped_simulation_frees_slot(self, service_factory):
+        """Test that a stream dropped before it started frees its slot."""
+        service = service_factory(max_concurrent=1)
+        service.run(service.prepare("x", {"x": UNIFORM}, 100, seed=1))
+        gc.collect()
+        assert len(_run(service, "x", {"x": UNIFORM}, 100, seed=1)) == 1
+
+    def test_random_seed_is_reported(self, service_factory):
+        """Test that an omitted seed is chosen and can replay the run."""
+        service = service_factory()
+        first = _run(service, "x", {"x": {"dist": "exponential", "scale": 2}}, 5_000)
+        seed = first[-1]["seed"]
+        again = _run(
+            service, "x", {"x": {"dist": "exponential", "scale": 2}}, 5_000, seed=seed
+        )
+        assert again == first
+
+    def test_threshold_probabilities(self, service_factory):
+        """Test P(result <= threshold) for a uniform variable."""
+        summaries = _run(
+            service_factory(),
+            "u",
+            {"u": {"dist": "uniform", "low": 0, "high": 1}},
+            50_000,
+            seed=1,
+            confidence=0.99,
+            thresholds=[0.25, 2.0],
+        )
+        quarter, everything = summaries[-1]["probabilities"]
+        assert quarter["ci"][0] < 0.25 < quarter["ci"][1]
+        assert everything["p"] == 1.0
+
+    @pytest.mark.parametrize(
+        "distributions,trials,kwargs,message",
+        [
+            ({"units": {"dist": "uniform", "low": 0, "high": 1}}, 10, {}, "price"),
+            (
+                {**PROFIT_DISTRIBUTIONS, "z": {"dist": "beta", "a": 1, "b": 1}},
+                10,
+                {},
+                "unused variable: z",
+            ),
+            (
+                {**PROFIT_DISTRIBUTIONS, "units": {"dist": "cauchy"}},
+                10,
+                {},
+                "dist to one of",
+            ),
+            (
+                {**PROFIT_DISTRIBUTIONS, "units": {"dist": "normal", "loc": 1}},
+                10,
+                {},
+                "takes loc, scale",
+            ),
+            (
+                {
+                    **PROFIT_DISTRIBUTIONS,
+                    "units": {"dist": "gamma", "shape": -1, "scale": 1},
+                },
+                10,
+                {},
+                "shape < 0",
+            ),
+            (PROFIT_DISTRIBUTIONS, 1, {}, "Trials must be between"),
+            (PROFIT_DISTRIBUTIONS, 10, {"confidence": 1.0}, "Confidence"),
+            (PROFIT_DISTRIBUTIONS, 10, {"thresholds": [0.0] * 17}, "At most 16"),
+        ],
+    )
+    def test_validation(self, service_factory, distributions, trials, kwargs, message):
+        """Test that invalid simulations are rejected before running."""
+        with pytest.raises(ValueError, match=message):
+            service_factory().prepare(PROFIT, distributions, trials, **kwargs)
+
+    def test_failing_chunk_raises(self, service_factory):
+        """Test that a domain error in a draw fails the simulation."""
+        simulation = service_factory().prepare(
+            {"op": "log", "args": ["x"]},
+            {"x": {"dist": "normal", "loc": 0, "scale": 1}},
+            1_000,
+            seed=1,
+        )
+        with pytest.raises(ValueError, match="Logarithm"):
+            list(service_factory().run(simulation))
@@ -0,0 +1,114 @@
+"""Unit tests for the binary socket server and client."""
+import asyncio
+import contextlib
+import struct
+import pytest
+from app.core import socket_server
+from app.core.socket_server import BinaryCalculatorServer
+from client import BinaryCalculatorClient, CalculatorError
+from client import binary_client
+from domain.operations.factory import OperationFactory
+from domain.services.calculator import CalculatorService
+from domain.services.logger import StructuredLogger
+
+
+@contextlib.asynccontextmanager
+async def _serving(**address):
+    """Run a server on an ephemeral TCP port or the given Unix socket."""
+    logger = StructuredLogger()
+    server = BinaryCalculatorServer(
+        CalculatorService(OperationFactory(), logger), logger
+    )
+    await server.start(**address)
+    try:
+        yield server
+    finally:
+        await server.stop()
+
+
+async def _raw_exchange(server, payload: bytes) -> bytes:
+    reader, writer = await asyncio.open_connection(*server.address[:2])
+    writer.write(payload)
+    await writer.drain()
+    (length,) = struct.unpack("<I", await reader.readexactly(4))
+    reply = await reader.readexactly(length)
+    writer.close()
+    return reply
+
+
+class TestBinarySocketServer:
+    """Test cases for BinaryCalculatorServer."""
+
+    def test_client_mirrors_opcodes(self):
+        """Test that the client and server agree on every opcode."""
+        mirrored = {code: name for name, code in binary_client.OPCODES.items()}
+        assert mirrored == socket_server.OPCODES
+        available = OperationFactory().get_available_operations()
+        assert sorted(socket_server.OPCODES.values()) == sorted(available)
+
+    @pytest.mark.asyncio
+    async def test_calculate_and_errors(self):
+        """Test results and /calc error messages over TCP."""
+        async with _serving() as server, BinaryCalculatorClient(
+            *server.address[:2]
+        ) as calc:
+            assert await calc.calculate("add", 2, 3) == 5.0
+            assert await calc.calculate("sqrt", 16) == 4.0
+            with pytest.raises(CalculatorError, match="Division by zero"):
+                await calc.calculate("divide", 1, 0)
+            with pytest.raises(CalculatorError, match="requires two operands"):
+                await calc.calculate("pow", 2)
+
+    @pytest.mark.asyncio
+    async def test_pipelined_calls(self):
+        """Test many concurrent calls sharing one connection."""
+        async with _serving() as server, BinaryCalculatorClient(
+            *server.address[:2]
+        ) as calc:
+            results = await asyncio.gather(
+                *(calc.calculate("multiply", i, 2) for i in range(2000))
+            )
+        assert results == [i * 2.0 for i in range(2000)]
+
+    @pytest.mark.asyncio
+    async def test_unix_socket(self, tmp_path):
+        """Test serving over a Unix domain socket."""
+        path = str(tmp_path / "calc.sock")
+        async with _serving(path=path), BinaryCalculatorClient(path=path) as calc:
+            assert await calc.calculate("subtract", 5, 7) == -2.0
+        assert not (tmp_path / "calc.sock").exists()
+
+    @pytest.mark.asyncio
+    async def test_unix_socket_is_not_taken_over(self, tmp_path):
+        """Test that a second server cannot replace a listening socket."""
+        path = str(tmp_path / "calc.sock")
+        async with _serving(path=path):
+            with pytest.raises(OSError, match="already listening"):
+                async with _serving(path=path):
+                    pass
+            assert (tmp_path / "calc.sock").exists()
+
+    @pytest.mark.asyncio
+    async def test_stop_keeps_foreign_socket_file(self, tmp_path):
+        """Test that stop only removes the socket file it created."""
+        path = tmp_path / "calc.sock"
+        async with _serving(path=str(path)):
+            path.unlink()
+            path.write_bytes(b"")
+        assert path.exists()
+
+    @pytest.mark.asyncio
+    async def test_malformed_frames(self):
+        """Test bad requests are answered, and oversized frames close the link."""
+        async with _serving() as server:
+            unknown = struct.pack("<IIBBd", 14, 7, 99, 1, 1.0)
+            reply = await _raw_exchange(server, unknown)
+            assert reply[:5] == struct.pack("<IB", 7, socket_server.STATUS_BAD_REQUEST)
+            assert b"Unknown opcode 99" in reply
+
+            mismatched = struct.pack("<IIBBd", 14, 8, 1, 2, 1.0)
+            reply = await _raw_exchange(server, mismatched)
+            assert b"does not match" in reply
+
+            reply = await _raw_exchange(server, struct.pack("<I", 1 << 20))
+            assert b"Frame too large" in reply
@@ -0,0 +1,134 @@
+"""Unit tests for cross-worker calculation statistics."""
+import multiprocessing
+import os
+import pytest
+from domain.interfaces.result import ErrorCode
+from domain.services import stats
+from domain.services.logger import StructuredLogger
+from domain.services.stats import SharedStatsRecorder, prometheus_text
+
+
+def _record_in_child(path, calls):
+    recorder = SharedStatsRecorder(path, slots=4)
+    for _ in range(calls):
+        recorder.record("add", 1e-6, None)
+
+
+def _run_child(path, calls):
+    process = multiprocessing.get_context("fork").Process(
+        target=_record_in_child, args=(path, calls)
+    )
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Path of a fresh statistics file."""
+    return str(tmp_path / "stats")
+
+
+def _operations(recorder):
+    return {op["operation"]: op for op in recorder.snapshot()["operations"]}
+
+
+class TestSharedStatsRecorder:
+    """Test cases for the shared-memory statistics recorder."""
+
+    def test_counts_errors_and_histogram(self, path):
+        """Test per-operation calls, error codes and cumulative buckets."""
+        recorder = SharedStatsRecorder(path, buckets=(1e-5, 1e-3))
+        recorder.record("divide", 2e-6, None)
+        recorder.record("divide", 5e-4, ErrorCode.DIVISION_BY_ZERO)
+        recorder.record("divide", 2.0, None)
+        recorder.record(None, 1e-6, ErrorCode.INVALID_OPERATION)
+
+        operations = _operations(recorder)
+        divide = operations["divide"]
+        assert divide["calls"] == 3
+        assert divide["errors"]["division_by_zero"] == 1
+        assert divide["seconds_sum"] == pytest.approx(2.000502)
+        assert divide["buckets"] == [
+            {"le": 1e-5, "count": 1},
+            {"le": 1e-3, "count": 2},
+        ]
+        other = operations[stats.OTHER_OPERATION]
+        assert other["errors"]["invalid_operation"] == 1
+        recorder.close()
+
+    def test_aggregates_across_processes(self, path):
+        """Test that forked workers write their own slots and are summed."""
+        recorder = SharedStatsRecorder(path, slots=4)
+        recorder.record("add", 1e-6, None)
+        _run_child(path, 50)
+        # The parent's recorder must not have handed its slot to the child
+        recorder.record("add", 1e-6, None)
+        snapshot = recorder.snapshot()
+        assert snapshot["slots_claimed"] == 2
+        assert snapshot["workers"] == 1
+        assert _operations(recorder)["add"]["calls"] == 52
+        recorder.close()
+
+    def test_counts_survive_restarts(self, path):
+        """Test that a new worker takes over an exited worker's slot."""
+        _run_child(path, 10)
+        _run_child(path, 5)
+        reader = SharedStatsRecorder(path, slots=4)
+        snapshot = reader.snapshot()
+        assert snapshot["slots_claimed"] == 1
+        assert snapshot["workers"] == 0
+        assert snapshot["operations"][0]["calls"] == 15
+        reader.close()
+
+    def test_slots_held_by_running_workers(self, path, monkeypatch, capsys):
+        """Test that a worker without a slot warns once and records nothing."""
+        recorder = SharedStatsRecorder(path, slots=1)
+        recorder.record("add", 1e-6, None)
+        monkeypatch.setattr(stats.os, "getpid", os.getppid)
+        other = SharedStatsRecorder(path, slots=1, logger=StructuredLogger())
+        other.record("add", 1e-6, None)
+        other.record("divide", 1e-6, ErrorCode.DIVISION_BY_ZERO)
+        assert capsys.readouterr().out.count("Statistics slots exhausted") == 1
+        assert _operations(recorder)["add"]["calls"] == 1
+        assert "divide" not in _operations(recorder)
+
+    def test_full_name_table_uses_other_row(self, path):
+        """Test that operations beyond the name table are counted as other."""
+        recorder = SharedStatsRecorder(path, max_operations=2)
+        recorder.record("add", 1e-6, None)
+        recorder.record("subtract", 1e-6, None)
+        assert set(_operations(recorder)) == {"add", stats.OTHER_OPERATION}
+
+    def test_incompatible_layout(self, path):
+        """Test that a file with another layout is rejected."""
+        SharedStatsRecorder(path, slots=4).close()
+        with pytest.raises(ValueError, match="incompatible layout"):
+            SharedStatsRecorder(path, slots=8)
+        with pytest.raises(ValueError, match="incompatible layout"):
+            SharedStatsRecorder(path, slots=4, buckets=(1.0,))
+
+
+class TestPrometheusText:
+    """Test cases for the Prometheus exposition format."""
+
+    def test_histogram_lines(self, path):
+        """Test counter, error and histogram samples of an operation."""
+        recorder = SharedStatsRecorder(path, buckets=(1e-3,))
+        recorder.record("divide", 1e-4, None)
+        recorder.record("divide", 1.0, ErrorCode.DIVISION_BY_ZERO)
+        lines = prometheus_text(recorder.snapshot()).splitlines()
+        assert 'calculator_calculations_total{operation="divide"} 2' in lines
+        assert (
+            'calculator_calculation_errors_total{operation="divide",'
+            'code="division_by_zero"} 1'
+        ) in lines
+        assert (
+            'calculator_calculation_duration_seconds_bucket{operation="divide",'
+            'le="0.001"} 1'
+        ) in lines
+        assert (
+            'calculator_calculation_duration_seconds_bucket{operation="divide",'
+            'le="+Inf"} 2'
+        ) in lines
+        assert "# TYPE calculator_calculation_duration_seconds histogram" in lines
@@ -0,0 +1,171 @@
+"""Unit tests for streaming sessions and rolling windows."""
+import math
+import random
+import statistics
+import pytest
+from domain.services import streaming
+from domain.services.logger import StructuredLogger
+from domain.services.streaming import (
+    BYTES_PER_SLOT,
+    RollingWindow,
+    StreamCapacityError,
+    StreamElsewhereError,
+    StreamRegistry,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(clock):
+    """Create a registry with room for 100 slots and a 60 s idle timeout."""
+    return StreamRegistry(
+        StructuredLogger(),
+        max_bytes=100 * BYTES_PER_SLOT,
+        idle_timeout=60.0,
+        max_capacity=80,
+        default_time_capacity=20,
+        clock=clock,
+    )
+
+
+class TestRollingWindow:
+    """Test cases for rolling-window aggregates."""
+
+    def test_matches_recomputation(self):
+        """Test every aggregate against a brute-force recomputation."""
+        rng = random.Random(3)
+        window = RollingWindow(7)
+        history = []
+        for _ in range(200):
+            values = [rng.uniform(-50, 50) for _ in range(rng.randint(1, 4))]
+            window.push(values)
+            history.extend(values)
+            last = history[-7:]
+            stats = window.stats()
+            assert stats["count"] == len(last)
+            assert stats["sum"] == pytest.approx(math.fsum(last), abs=1e-9)
+            assert stats["mean"] == pytest.approx(statistics.fmean(last))
+            if len(last) > 1:
+                assert stats["variance"] == pytest.approx(statistics.variance(last))
+            assert (stats["min"], stats["max"]) == (min(last), max(last))
+
+    def test_empty_and_single_value(self):
+        """Test aggregates that are undefined for small windows."""
+        window = RollingWindow(3)
+        assert window.stats()["mean"] is None
+        window.push([5])
+        stats = window.stats()
+        assert (stats["mean"], stats["variance"], stats["min"]) == (5.0, None, 5.0)
+
+    def test_renormalization_bounds_drift(self):
+        """Test that a large offset does not leave drift in the variance."""
+        window = RollingWindow(4)
+        for i in range(10_000):
+            window.push([1e9 + (i % 4)])
+        # Window holds 1e9 + {0, 1, 2, 3} in some order
+        assert window.stats()["variance"] == pytest.approx(5 / 3, rel=1e-9)
+
+    def test_time_window_expires_values(self, clock):
+        """Test that values older than the window leave it."""
+        window = RollingWindow(100, seconds=10.0, clock=clock)
+        window.push([1, 2])
+        clock.now += 6
+        window.push([3])
+        clock.now += 6
+        assert window.stats()["sum"] == 3.0
+        clock.now += 6
+        assert window.stats()["count"] == 0
+
+    @pytest.mark.parametrize(
+        "value", [float("nan"), float("inf"), 10**400, True, "1"]
+    )
+    def test_rejects_invalid_values(self, value):
+        """Test that non-finite and non-numeric values are rejected."""
+        window = RollingWindow(3)
+        with pytest.raises(ValueError):
+            window.push([1, value])
+        assert window.stats()["count"] == 1
+
+
+class TestStreamRegistry:
+    """Test cases for the streaming session registry."""
+
+    def test_memory_cap(self, registry):
+        """Test that sessions are refused once their reservations exceed the cap."""
+        registry.create(window=60)
+        with pytest.raises(StreamCapacityError):
+            registry.create(window=50)
+        registry.create(seconds=5)
+        assert registry.status()["reserved_bytes"] == 80 * BYTES_PER_SLOT
+
+    def test_delete_releases_memory(self, registry):
+        """Test that deleting a session frees its reservation."""
+        session = registry.create(window=80)
+        registry.delete(session.id)
+        assert registry.status() == {
+            "sessions": 0,
+            "reserved_bytes": 0,
+            "max_bytes": 100 * BYTES_PER_SLOT,
+        }
+        with pytest.raises(KeyError):
+            registry.get(session.id)
+
+    def test_idle_sessions_are_evicted(self, registry, clock):
+        """Test that only sessions unused for the timeout are evicted."""
+        old = registry.create(window=10)
+        used = registry.create(window=10)
+        clock.now += 40
+        registry.get(used.id)
+        clock.now += 30
+        assert registry.evict_idle() == 1
+        with pytest.raises(KeyError):
+            registry.get(old.id)
+        assert registry.get(used.id) is used
+
+    def test_session_of_another_worker(self, registry, monkeypatch):
+        """Test that another process's session is told apart from a missing one."""
+        session = registry.create(window=10)
+        registry.delete(session.id)
+        with pytest.raises(KeyError) as missing:
+            registry.get(session.id)
+        assert not isinstance(missing.value, StreamElsewhereError)
+        monkeypatch.setattr(streaming.os, "getpid", lambda: -1)
+        with pytest.raises(StreamElsewhereError):
+            registry.get(session.id)
+
+    def test_eviction_makes_room(self, registry, clock):
+        """Test that creating a session first evicts idle ones."""
+        registry.create(window=80)
+        clock.now += 61
+        registry.create(window=80)
+        assert registry.status()["sessions"] == 1
+
+    @pytest.mark.parametrize(
+        "kwargs,message",
+        [
+            ({}, "exactly one"),
+            ({"window": 5, "seconds": 1.0}, "exactly one"),
+            ({"window": 5, "capacity": 5}, "only applies"),
+            ({"seconds": 0.0}, "positive"),
+            ({"window": 81}, "between 1 and 80"),
+        ],
+    )
+    def test_validation(self, registry, kwargs, message):
+        """Test that invalid windows are rejected."""
+        with pytest.raises(ValueError, match=message):
+            registry.create(**kwargs)
@@ -0,0 +1,99 @@
+"""Unit tests for vector and matrix operations."""
+import numpy as np
+import pytest
+from domain.operations.factory import OperationFactory
+from domain.services.logger import StructuredLogger
+from domain.services.tensor import TensorCalculatorService
+
+
+class TestTensorOperations:
+    """Test cases for tensor operation strategies."""
+
+    @pytest.fixture
+    def factory(self):
+        """Create operation factory."""
+        return OperationFactory()
+
+    def test_elementwise_broadcasting(self, factory):
+        """Test that element-wise operations broadcast."""
+        operation = factory.get_tensor_operation("add")
+        x, y = np.ones((2, 3)), np.arange(3.0)
+        assert operation.result_shape(x.shape, y.shape) == (2, 3)
+        assert operation.execute(x, y).tolist() == [[1, 2, 3], [1, 2, 3]]
+
+    def test_incompatible_broadcast(self, factory):
+        """Test that non-broadcastable shapes raise ValueError."""
+        with pytest.raises(ValueError, match="cannot be broadcast"):
+            factory.get_tensor_operation("multiply").result_shape((2, 3), (4,))
+
+    def test_elementwise_divide_by_zero(self, factory):
+        """Test that any zero divisor raises like the scalar strategy."""
+        with pytest.raises(ValueError, match="Division by zero is not allowed"):
+            factory.get_tensor_operation("divide").execute(
+                np.ones(3), np.array([1.0, 0.0, 2.0])
+            )
+
+    def test_dot(self, factory):
+        """Test vector dot product."""
+        operation = factory.get_tensor_operation("dot")
+        assert operation.execute(np.array([1, 2, 3]), np.array([4, 5, 6])) == 32
+        with pytest.raises(ValueError, match="equal length"):
+            operation.result_shape((3,), (4,))
+
+    @pytest.mark.parametrize(
+        "x_shape,y_shape",
+        [((3, 4), (4, 5)), ((4,), (4, 5)), ((3, 4), (4,)), ((2, 3, 4), (4, 5))],
+    )
+    def test_matmul_shape_matches_numpy(self, factory, x_shape, y_shape):
+        """Test that predicted matmul shapes match NumPy."""
+        operation = factory.get_tensor_operation("matmul")
+        result = operation.execute(np.ones(x_shape), np.ones(y_shape))
+        assert operation.result_shape(x_shape, y_shape) == result.shape
+
+    def test_matmul_inner_mismatch(self, factory):
+        """Test that mismatched inner dimensions raise ValueError."""
+        with pytest.raises(ValueError, match="inner dimensions"):
+            factory.get_tensor_operation("matmul").result_shape((3, 4), (5, 2))
+
+    def test_solve(self, factory):
+        """Test solving a small linear system."""
+        operation = factory.get_tensor_operation("solve")
+        a = np.array([[3.0, 1.0], [1.0, 2.0]])
+        b = np.array([9.0, 8.0])
+        assert operation.execute(a, b) == pytest.approx([2.0, 3.0])
+
+    def test_solve_singular(self, factory):
+        """Test that singular systems raise ValueError."""
+        with pytest.raises(ValueError, match="singular"):
+            factory.get_tensor_operation("solve").execute(np.ones((2, 2)), np.ones(2))
+
+    def test_invalid_tensor_operation(self, factory):
+        """Test that unknown tensor operations raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid tensor operation"):
+            factory.get_tensor_operation("cross")
+
+
+class TestTensorCalculatorService:
+    """Test cases for TensorCalculatorService limits."""
+
+    @pytest.fixture
+    def service(self):
+        """Create service with a small element limit."""
+        return TensorCalculatorService(
+            OperationFactory(), StructuredLogger(), max_elements=100
+        )
+
+    def test_result_size_limit(self, service):
+        """Test that broadcasting into a huge result is rejected upfront."""
+        with pytest.raises(ValueError, match="exceeds the limit"):
+            service.calculate("add", [[0]] * 50, [list(range(50))])
+
+    def test_operand_size_limit(self, service):
+        """Test that oversized operands are rejected."""
+        with pytest.raises(ValueError, match="limit is 100"):
+            service.calculate("add", list(range(101)), 1)
+
+    def test_ragged_input(self, service):
+        """Test that ragged nested lists are rejected."""
+        with pytest.raises(ValueError, match="rectangular"):
+            service.calculate("add", [[1, 2], [3]], 1)